@@ -49,6 +49,7 @@ Classes and Functions
    :toctree: generated/
 
    shape_split - Splits a shape and returns :obj:`numpy.ndarray` of :obj:`slice` elements.
+   shape_split_many - Splits a batch of shapes and returns a concatenated extents table.
    array_split - Equivalent to :func:`numpy.array_split`.
    ShapeSplitter - Array shape splitting class.
 
@@ -57,13 +58,14 @@ Attributes
 
 .. autodata:: ARRAY_BOUNDS
 .. autodata:: NO_BOUNDS
+.. autodata:: PERIODIC
 
 
 """
 from __future__ import absolute_import
 from .license import license as _license, copyright as _copyright, version as _version
 from . import split  # noqa: E402,F401
-from .split import array_split, shape_split, ShapeSplitter  # noqa: E402,F401
+from .split import array_split, shape_split, shape_split_many, ShapeSplitter  # noqa: E402,F401
 
 __author__ = "Shane J. Latham"
 __license__ = _license()
@@ -77,4 +79,7 @@ ARRAY_BOUNDS = split.ARRAY_BOUNDS
 #: See :data:`array_split.split.NO_BOUNDS`
 NO_BOUNDS = split.NO_BOUNDS
 
+#: See :data:`array_split.split.PERIODIC`
+PERIODIC = split.PERIODIC
+
 __all__ = [s for s in dir() if not s.startswith('_')]
@@ -0,0 +1,332 @@
+"""
+=================================
+The :mod:`array_split.aio` Module
+=================================
+
+.. currentmodule:: array_split.aio
+
+:mod:`asyncio` tile iteration and execution (python-3.6+ only).
+Blocking tile reads (e.g. from a :obj:`numpy.memmap`) and :mod:`numpy`
+tile computations are off-loaded to an executor (:obj:`concurrent.futures.Executor`)
+so that the event loop is not blocked. The tiles are defined by
+a :obj:`array_split.ShapeSplitter` split.
+
+Classes and Functions
+=====================
+
+.. autosummary::
+   :toctree: generated/
+
+   AsyncTileIterator - Asynchronous iterator over the tiles of an array.
+   map_tiles_async - Coroutine which applies a function to all the tiles of an array.
+
+"""
+from __future__ import absolute_import
+import asyncio as _asyncio
+import collections as _collections
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import logging as _logging
+from .split import ShapeSplitter
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+def _create_splitter(ary, splitter, split_kwargs):
+    """
+    Returns :samp:`{splitter}` if not :samp:`None`, otherwise
+    returns a :obj:`array_split.ShapeSplitter` created from :samp:`{split_kwargs}`.
+    """
+    if splitter is None:
+        split_kwargs = dict(split_kwargs)
+        split_kwargs.setdefault("array_itemsize", ary.itemsize)
+        splitter = ShapeSplitter(ary.shape, **split_kwargs)
+    elif len(split_kwargs) > 0:
+        raise ValueError(
+            "Got splitter=%s and split keyword arguments %s, should only specify one."
+            %
+            (splitter, sorted(split_kwargs.keys()))
+        )
+    return splitter
+
+
+def _get_running_loop():
+    """
+    Returns the running event loop (:func:`asyncio.get_running_loop`,
+    python-3.7+, :func:`asyncio.get_event_loop` for python-3.6).
+    """
+    if hasattr(_asyncio, "get_running_loop"):
+        return _asyncio.get_running_loop()
+    return _asyncio.get_event_loop()
+
+
+def _cancel_futures(futures):
+    """
+    Cancels the :samp:`{futures}` (executor work which has not yet started is
+    not run, running work completes but its result is discarded) and retrieves
+    the exceptions of those already done, so none are logged as never retrieved.
+    """
+    for future in futures:
+        if future.done():
+            if not future.cancelled():
+                future.exception()
+        else:
+            future.cancel()
+
+
+def _read_tile(ary, slyce):
+    """
+    Returns an in-memory copy of the :samp:`{ary}[{slyce}]` tile.
+    """
+    return _np.array(ary[slyce], copy=True)
+
+
+def _read_and_apply(func, ary, slyce):
+    """
+    Reads the :samp:`{ary}[{slyce}]` tile and returns :samp:`{func}(tile)`.
+    """
+    return func(_read_tile(ary, slyce))
+
+
+class AsyncTileIterator(object):
+
+    """
+    Asynchronous iterator (for use with :samp:`async for`) over
+    the tiles of an array. Each iteration yields a :samp:`(slice_tuple, tile)`
+    pair, where :samp:`tile` is an in-memory copy of :samp:`{ary}[slice_tuple]`.
+    Tile reads are performed in an executor, with up to :samp:`{max_in_flight}`
+    reads outstanding at any time. Each :samp:`async for` loop is an independent
+    iteration over all the tiles.
+
+    Example::
+
+       >>> import asyncio
+       >>> import numpy as np
+       >>> async def tile_sums(ary):
+       ...     return [(slyce, tile.sum()) async for slyce, tile in AsyncTileIterator(ary, 2)]
+       >>> asyncio.new_event_loop().run_until_complete(tile_sums(np.arange(0, 10)))
+       [((slice(0, 5, None),), 10), ((slice(5, 10, None),), 35)]
+
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".AsyncTileIterator")
+
+    def __init__(
+        self,
+        ary,
+        indices_or_sections=None,
+        splitter=None,
+        max_in_flight=2,
+        ordered=True,
+        executor=None,
+        **split_kwargs
+    ):
+        """
+        Initialise.
+
+        :type ary: :obj:`numpy.ndarray`
+        :param ary: Array (e.g. :obj:`numpy.memmap`) from which tiles are read.
+        :type indices_or_sections: :samp:`None`, :obj:`int` or sequence of :obj:`int`
+        :param indices_or_sections: See :meth:`array_split.ShapeSplitter.__init__`.
+        :type splitter: :samp:`None` or :obj:`array_split.ShapeSplitter`
+        :param splitter: Defines the tiles. If :samp:`None`, a splitter
+           is created from :samp:`{indices_or_sections}` and :samp:`{split_kwargs}`.
+        :type max_in_flight: :obj:`int`
+        :param max_in_flight: Maximum number of tile reads which are outstanding.
+        :type ordered: :obj:`bool`
+        :param ordered: If :samp:`True`, tiles are yielded in split (C-order) order,
+           otherwise tiles are yielded in read-completion order.
+        :type executor: :samp:`None` or :obj:`concurrent.futures.Executor`
+        :param executor: Executor for the blocking reads. If :samp:`None`,
+           the event loop default executor is used.
+        :param split_kwargs: Keyword arguments passed
+           to :meth:`array_split.ShapeSplitter.__init__`.
+        """
+        if max_in_flight < 1:
+            raise ValueError("Got max_in_flight=%s, should be positive." % max_in_flight)
+        if indices_or_sections is not None:
+            split_kwargs["indices_or_sections"] = indices_or_sections
+        self.ary = ary
+        self.splitter = _create_splitter(ary, splitter, split_kwargs)
+        self.max_in_flight = max_in_flight
+        self.ordered = ordered
+        self.executor = executor
+
+    def __aiter__(self):
+        """
+        Returns a new iteration over the tiles, so that concurrent :samp:`async for`
+        loops over the same :obj:`AsyncTileIterator` are independent.
+
+        :rtype: :obj:`_AsyncTileIteration`
+        :return: The asynchronous iteration state.
+        """
+        return _AsyncTileIteration(self)
+
+
+class _AsyncTileIteration(object):
+
+    """
+    The state of a single :samp:`async for` iteration
+    over an :obj:`AsyncTileIterator`.
+    """
+
+    def __init__(self, tile_iterator):
+        """
+        Initialise.
+
+        :type tile_iterator: :obj:`AsyncTileIterator`
+        :param tile_iterator: Defines the array, tiles and read parameters.
+        """
+        self.tile_iterator = tile_iterator
+        self.slices = \
+            _collections.deque(
+                [slyce.tolist() for slyce in tile_iterator.splitter.calculate_split().flatten()]
+            )
+        self.pending = _collections.deque()
+
+    def _submit(self, loop):
+        """
+        Submits reads to the executor until :attr:`AsyncTileIterator.max_in_flight`
+        are pending.
+        """
+        it = self.tile_iterator
+        while (len(self.pending) < it.max_in_flight) and (len(self.slices) > 0):
+            slyce = self.slices.popleft()
+            future = loop.run_in_executor(it.executor, _read_tile, it.ary, slyce)
+            self.pending.append((slyce, future))
+
+    def cancel(self):
+        """
+        Cancels the pending reads and discards the remaining tiles.
+        """
+        _cancel_futures([future for slyce, future in self.pending])
+        self.pending.clear()
+        self.slices.clear()
+
+    def __aiter__(self):
+        """
+        Returns :samp:`self`.
+        """
+        return self
+
+    async def __anext__(self):
+        """
+        Returns the next :samp:`(slice_tuple, tile)` pair.
+        """
+        loop = _get_running_loop()
+        self._submit(loop)
+        if len(self.pending) <= 0:
+            raise StopAsyncIteration
+        try:
+            if self.tile_iterator.ordered:
+                slyce, future = self.pending.popleft()
+            else:
+                done, _ = \
+                    await _asyncio.wait(
+                        [f for s, f in self.pending],
+                        return_when=_asyncio.FIRST_COMPLETED
+                    )
+                idx = [i for i in range(len(self.pending)) if self.pending[i][1] in done][0]
+                slyce, future = self.pending[idx]
+                del self.pending[idx]
+            tile = await future
+        except BaseException:
+            self.cancel()
+            raise
+        self._submit(loop)
+        return slyce, tile
+
+
+async def map_tiles_async(
+    func,
+    ary,
+    indices_or_sections=None,
+    splitter=None,
+    max_in_flight=4,
+    ordered=True,
+    executor=None,
+    **split_kwargs
+):
+    """
+    Coroutine which applies :samp:`{func}` to each tile of :samp:`{ary}`.
+    Both the tile read and the :samp:`{func}(tile)` call are performed
+    in the executor, with at most :samp:`{max_in_flight}` tiles
+    being processed at any time.
+
+    :type func: callable
+    :param func: Function called as :samp:`{func}(tile)`, where :samp:`tile` is
+       an in-memory copy of a tile of :samp:`{ary}`.
+    :type ary: :obj:`numpy.ndarray`
+    :param ary: Array (e.g. :obj:`numpy.memmap`) from which tiles are read.
+    :type indices_or_sections: :samp:`None`, :obj:`int` or sequence of :obj:`int`
+    :param indices_or_sections: See :meth:`array_split.ShapeSplitter.__init__`.
+    :type splitter: :samp:`None` or :obj:`array_split.ShapeSplitter`
+    :param splitter: Defines the tiles. If :samp:`None`, a splitter
+       is created from :samp:`{indices_or_sections}` and :samp:`{split_kwargs}`.
+    :type max_in_flight: :obj:`int`
+    :param max_in_flight: Maximum number of tiles being processed concurrently.
+    :type ordered: :obj:`bool`
+    :param ordered: If :samp:`True`, the returned list is in split (C-order) order,
+       otherwise it is in completion order.
+    :type executor: :samp:`None` or :obj:`concurrent.futures.Executor`
+    :param executor: Executor for the reads and :samp:`{func}` calls. If :samp:`None`,
+       the event loop default executor is used.
+    :param split_kwargs: Keyword arguments passed
+       to :meth:`array_split.ShapeSplitter.__init__`.
+    :rtype: :obj:`list`
+    :return: List of :samp:`(slice_tuple, {func}(tile))` pairs.
+    :raises Exception: The first exception raised by a :samp:`{func}(tile)` call,
+       the tiles which are still pending are cancelled.
+
+    Example::
+
+       >>> import asyncio
+       >>> import numpy as np
+       >>> ary = np.arange(0, 16).reshape((4, 4))
+       >>> coro = map_tiles_async(np.sum, ary, axis=[2, 1])
+       >>> asyncio.new_event_loop().run_until_complete(coro)
+       [((slice(0, 2, None), slice(0, 4, None)), 28), ((slice(2, 4, None), slice(0, 4, None)), 92)]
+
+    """
+    if max_in_flight < 1:
+        raise ValueError("Got max_in_flight=%s, should be positive." % max_in_flight)
+    if indices_or_sections is not None:
+        split_kwargs["indices_or_sections"] = indices_or_sections
+    splitter = _create_splitter(ary, splitter, split_kwargs)
+    slices = \
+        _collections.deque(
+            [slyce.tolist() for slyce in splitter.calculate_split().flatten()]
+        )
+    loop = _get_running_loop()
+    results = [None, ] * len(slices)
+    pending = {}
+    num_done = 0
+    tile_idx = 0
+    try:
+        while (len(slices) > 0) or (len(pending) > 0):
+            while (len(pending) < max_in_flight) and (len(slices) > 0):
+                slyce = slices.popleft()
+                future = loop.run_in_executor(executor, _read_and_apply, func, ary, slyce)
+                pending[future] = (tile_idx, slyce)
+                tile_idx += 1
+            done, _ = \
+                await _asyncio.wait(list(pending.keys()), return_when=_asyncio.FIRST_COMPLETED)
+            for future in done:
+                idx, slyce = pending.pop(future)
+                if not ordered:
+                    idx = num_done
+                results[idx] = (slyce, future.result())
+                num_done += 1
+    finally:
+        # On error (or cancellation), do not leave tiles queued in the executor.
+        _cancel_futures(list(pending.keys()))
+
+    return results
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
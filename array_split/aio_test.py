@@ -0,0 +1,212 @@
+"""
+======================================
+The :mod:`array_split.aio_test` Module
+======================================
+
+.. currentmodule:: array_split.aio_test
+
+Module defining :mod:`array_split.aio` unit-tests.
+Execute as::
+
+   python -m array_split.aio_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   AioTest - :obj:`unittest.TestCase` for :mod:`array_split.aio` functions.
+
+
+"""
+from __future__ import absolute_import
+import asyncio as _asyncio
+import time as _time
+import concurrent.futures as _futures
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging
+
+from .split import ShapeSplitter, shape_split
+from .aio import AsyncTileIterator, map_tiles_async
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class AioTest(_unittest.TestCase):
+
+    """
+    Tests for :mod:`array_split.aio` module.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".AioTest")
+
+    def setUp(self):
+        """
+        Creates event loop and executor.
+        """
+        self.loop = _asyncio.new_event_loop()
+        self.executor = _futures.ThreadPoolExecutor(4)
+
+    def tearDown(self):
+        """
+        Closes event loop and executor.
+        """
+        self.loop.close()
+        self.executor.shutdown()
+
+    def collect(self, tile_iter):
+        """
+        Returns list of :samp:`(slice_tuple, tile)` pairs from :samp:`{tile_iter}`.
+        """
+        async def collect():
+            ret = []
+            async for slyce, tile in tile_iter:
+                ret.append((slyce, tile))
+            return ret
+        return self.loop.run_until_complete(collect())
+
+    def test_async_tile_iterator(self):
+        """
+        Tests :obj:`array_split.aio.AsyncTileIterator`.
+        """
+        ary = _np.random.uniform(size=(50, 21))
+        split = shape_split(ary.shape, 9, halo=1)
+        for max_in_flight in [1, 3, 20]:
+            pairs = \
+                self.collect(
+                    AsyncTileIterator(
+                        ary,
+                        9,
+                        halo=1,
+                        max_in_flight=max_in_flight,
+                        executor=self.executor
+                    )
+                )
+            self.assertSequenceEqual(
+                [slyce.tolist() for slyce in split.flatten()],
+                [slyce for slyce, tile in pairs]
+            )
+            for slyce, tile in pairs:
+                self.assertTrue(_np.all(ary[slyce] == tile))
+
+        pairs = \
+            self.collect(
+                AsyncTileIterator(
+                    ary,
+                    splitter=ShapeSplitter(ary.shape, 9, halo=1),
+                    ordered=False,
+                    executor=self.executor
+                )
+            )
+        self.assertEqual(
+            sorted([str(slyce.tolist()) for slyce in split.flatten()]),
+            sorted([str(slyce) for slyce, tile in pairs])
+        )
+
+        self.assertRaises(ValueError, AsyncTileIterator, ary, 2, max_in_flight=0)
+        self.assertRaises(
+            ValueError,
+            AsyncTileIterator,
+            ary,
+            splitter=ShapeSplitter(ary.shape, 2),
+            halo=1
+        )
+
+    def test_map_tiles_async(self):
+        """
+        Tests :func:`array_split.aio.map_tiles_async`.
+        """
+        ary = _np.arange(0, 1000).reshape((10, 100))
+        split = shape_split(ary.shape, axis=[2, 5])
+
+        results = \
+            self.loop.run_until_complete(
+                map_tiles_async(_np.sum, ary, axis=[2, 5], executor=self.executor)
+            )
+        self.assertSequenceEqual(
+            [(slyce.tolist(), ary[slyce.tolist()].sum()) for slyce in split.flatten()],
+            results
+        )
+
+        def slow_first(tile):
+            if tile[0, 0] == 0:
+                _time.sleep(0.2)
+            return tile.min()
+
+        results = \
+            self.loop.run_until_complete(
+                map_tiles_async(
+                    slow_first,
+                    ary,
+                    splitter=ShapeSplitter(ary.shape, axis=[2, 5]),
+                    max_in_flight=4,
+                    ordered=False,
+                    executor=self.executor
+                )
+            )
+        self.assertEqual(split.size, len(results))
+        self.assertEqual(0, results[-1][1])
+        self.assertEqual(
+            sorted([ary[slyce.tolist()].min() for slyce in split.flatten()]),
+            sorted([r for s, r in results])
+        )
+
+        # An error cancels the tiles still queued in the executor.
+        calls = []
+
+        def fail_first(tile):
+            if tile[0, 0] == 0:
+                raise RuntimeError("first tile failed")
+            calls.append(tile[0, 0])
+            _time.sleep(0.05)
+            return tile.sum()
+
+        executor = _futures.ThreadPoolExecutor(1)
+        try:
+            self.assertRaises(
+                RuntimeError,
+                self.loop.run_until_complete,
+                map_tiles_async(fail_first, ary, axis=[10, 1], max_in_flight=4, executor=executor)
+            )
+        finally:
+            executor.shutdown(wait=True)
+        self.assertTrue(len(calls) < 3)
+
+    def test_concurrent_iterations(self):
+        """
+        Tests that concurrent :samp:`async for` loops over
+        the same :obj:`array_split.aio.AsyncTileIterator` are independent.
+        """
+        ary = _np.arange(0, 1000).reshape((10, 100))
+        tile_iter = AsyncTileIterator(ary, axis=[5, 2], max_in_flight=2, executor=self.executor)
+
+        async def tile_sums():
+            ret = []
+            async for slyce, tile in tile_iter:
+                ret.append(tile.sum())
+                await _asyncio.sleep(0)
+            return ret
+
+        async def gather():
+            return await _asyncio.gather(tile_sums(), tile_sums())
+
+        split = tile_iter.splitter.calculate_split()
+        expected = [ary[slyce.tolist()].sum() for slyce in split.flatten()]
+        sums0, sums1 = self.loop.run_until_complete(gather())
+        self.assertSequenceEqual(expected, sums0)
+        self.assertSequenceEqual(expected, sums1)
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+_unittest.main(__name__)
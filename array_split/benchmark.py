@@ -0,0 +1,553 @@
+"""
+=======================================
+The :mod:`array_split.benchmark` Module
+=======================================
+
+.. currentmodule:: array_split.benchmark
+
+Performance benchmarks for the split planning functions. Times
+:func:`array_split.shape_split`, :func:`array_split.array_split`,
+:func:`array_split.split.calculate_tile_shape_for_max_bytes`
+and :func:`array_split.split.calculate_num_slices_per_axis` over a grid of
+array dimensions, number of tiles and split criteria. Results are saved
+as JSON (the *baseline*) and a later run can be compared against the
+baseline to flag performance regressions. Execute as::
+
+   python -m array_split.benchmark run --output baseline.json
+   python -m array_split.benchmark run --output current.json
+   python -m array_split.benchmark compare baseline.json current.json --threshold 0.25
+
+The default grid is limited to :data:`DEFAULT_NUM_TILES` tiles, the (slow) large
+tile count cases are run by specifying them explicitly::
+
+   python -m array_split.benchmark run --num-tiles 100000 1000000 --output large.json
+
+The :samp:`compare` command exits with status :samp:`1` if any benchmark
+case is slower than the baseline by more than the threshold fraction.
+
+The :samp:`import array_split` time (measured in fresh interpreter processes,
+excluding the :mod:`numpy` import time) can be checked against a budget::
+
+   python -m array_split.benchmark import-time --budget 0.05
+
+which exits with status :samp:`1` if the budget is exceeded.
+
+Classes and Functions
+=====================
+
+.. autosummary::
+   :toctree: generated/
+
+   BenchmarkCase - A single named benchmark case.
+   generate_cases - Generates the grid of :obj:`BenchmarkCase` objects.
+   time_case - Times a single :obj:`BenchmarkCase`.
+   run_benchmarks - Runs benchmark cases and returns results :obj:`dict`.
+   save_results - Writes benchmark results to JSON file.
+   load_results - Reads benchmark results from JSON file.
+   compare_results - Compares benchmark results against baseline results.
+   time_import - Times the import of a module in fresh interpreter processes.
+   main - Command line entry point.
+
+Attributes
+==========
+
+.. autodata:: SPLIT_CRITERIA
+.. autodata:: DEFAULT_NDIMS
+.. autodata:: DEFAULT_NUM_TILES
+.. autodata:: DEFAULT_IMPORT_TIME_BUDGET
+
+"""
+from __future__ import absolute_import
+import sys as _sys
+import os as _os
+import re as _re
+import subprocess as _subprocess
+import json as _json
+import timeit as _timeit
+import argparse as _argparse
+import platform as _platform
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import logging as _logging
+from .split import shape_split, array_split, shape_factors
+from .split import calculate_tile_shape_for_max_bytes, calculate_num_slices_per_axis
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+#: Version of the results JSON format.
+RESULTS_FORMAT_VERSION = 1
+
+#: Split criteria benchmarked for :func:`array_split.shape_split`
+#: and :func:`array_split.array_split`.
+SPLIT_CRITERIA = ["num_tiles", "axis", "indices", "tile_shape", "max_tile_bytes"]
+
+#: Default dimensions for the benchmark grid.
+DEFAULT_NDIMS = [1, 2, 3, 4, 5, 6]
+
+#: Default number of tiles for the benchmark grid, keeps the default :samp:`run`
+#: to a few minutes. Larger cases are opt-in, e.g. :samp:`--num-tiles 100000 1000000`.
+DEFAULT_NUM_TILES = [1, 10, 100, 1000, 10000]
+
+#: Default budget (seconds) for the :samp:`import array_split` time,
+#: excluding the time to import :mod:`numpy`.
+DEFAULT_IMPORT_TIME_BUDGET = 0.05
+
+_logger = _logging.getLogger(__name__)
+
+#: Code executed in a fresh interpreter by :func:`time_import`, imports
+#: the :samp:`sys.argv[2:]` modules and then writes the time to
+#: import the :samp:`sys.argv[1]` module.
+_IMPORT_TIMER_CODE = """
+import sys, timeit
+for name in sys.argv[2:]:
+    __import__(name)
+start = timeit.default_timer()
+__import__(sys.argv[1])
+sys.stdout.write(repr(timeit.default_timer() - start))
+"""
+
+
+class BenchmarkCase(object):
+
+    """
+    A named benchmark case, :samp:`{func}(*{args}, **{kwargs})` is timed.
+    """
+
+    def __init__(self, name, func, args=(), kwargs=None):
+        """
+        Initialise.
+
+        :type name: :obj:`str`
+        :param name: Unique name of the case (used as key in results).
+        :type func: callable
+        :param func: The timed function.
+        :type args: sequence
+        :param args: Positional arguments for :samp:`{func}`.
+        :type kwargs: :obj:`dict`
+        :param kwargs: Keyword arguments for :samp:`{func}`.
+        """
+        self.name = name
+        self.func = func
+        self.args = tuple(args)
+        self.kwargs = {} if kwargs is None else kwargs
+
+    def __call__(self):
+        """
+        Calls :samp:`{self}.func(*{self}.args, **{self}.kwargs)`.
+        """
+        return self.func(*self.args, **self.kwargs)
+
+
+def _bench_array_shape(ndim, num_tiles):
+    """
+    Returns an array shape which can be evenly split into :samp:`{num_tiles}` (non-empty) tiles.
+    """
+    factors = shape_factors(num_tiles, ndim)[::-1]
+    return factors * _np.maximum(2, (16 + factors - 1) // factors)
+
+
+def _split_kwargs(criterion, array_shape, itemsize, num_tiles):
+    """
+    Returns the split keyword arguments for the :samp:`{criterion}` split criterion.
+    """
+    factors = shape_factors(num_tiles, len(array_shape))[::-1]
+    if criterion == "num_tiles":
+        kwargs = {"indices_or_sections": num_tiles, "axis": [0, ] * len(array_shape)}
+    elif criterion == "axis":
+        kwargs = {"axis": factors.tolist()}
+    elif criterion == "indices":
+        kwargs = \
+            {
+                "indices_or_sections": [
+                    (_np.arange(1, f) * (array_shape[i] // f)).tolist()
+                    for i, f in enumerate(factors)
+                ]
+            }
+    elif criterion == "tile_shape":
+        kwargs = {"tile_shape": (array_shape // factors).tolist()}
+    elif criterion == "max_tile_bytes":
+        kwargs = {"max_tile_bytes": int(_np.prod(array_shape) * itemsize // num_tiles)}
+    else:
+        raise ValueError(
+            "Got criterion=%s, should be one of %s." % (criterion, SPLIT_CRITERIA)
+        )
+    return kwargs
+
+
+def _array_split_ary(array_shape, dtype):
+    """
+    Returns a zero-memory (zero-strided, read-only) array of shape :samp:`{array_shape}`.
+    """
+    return _np.broadcast_to(_np.zeros((1,), dtype=dtype), tuple(array_shape))
+
+
+def generate_cases(ndims=None, num_tiles=None, criteria=None, itemsize=8):
+    """
+    Returns the :obj:`list` of :obj:`BenchmarkCase` objects for
+    the grid of :samp:`{ndims}`, :samp:`{num_tiles}` and :samp:`{criteria}`.
+
+    :type ndims: :samp:`None` or sequence of :obj:`int`
+    :param ndims: Array dimensions, defaults to :data:`DEFAULT_NDIMS`.
+    :type num_tiles: :samp:`None` or sequence of :obj:`int`
+    :param num_tiles: Number of tiles, defaults to :data:`DEFAULT_NUM_TILES`.
+    :type criteria: :samp:`None` or sequence of :obj:`str`
+    :param criteria: Split criteria, defaults to :data:`SPLIT_CRITERIA`.
+    :type itemsize: :obj:`int`
+    :param itemsize: Bytes per array element.
+    :rtype: :obj:`list`
+    :return: List of :obj:`BenchmarkCase` elements.
+
+    Example::
+
+       >>> cases = generate_cases([2], [4], ["tile_shape"])
+       >>> for case in cases:
+       ...     print(case.name)
+       shape_split[tile_shape,ndim=2,tiles=4]
+       array_split[tile_shape,ndim=2,tiles=4]
+       calculate_tile_shape_for_max_bytes[ndim=2,tiles=4]
+       calculate_num_slices_per_axis[ndim=2,tiles=4]
+
+    """
+    if ndims is None:
+        ndims = DEFAULT_NDIMS
+    if num_tiles is None:
+        num_tiles = DEFAULT_NUM_TILES
+    if criteria is None:
+        criteria = SPLIT_CRITERIA
+    dtype = _np.dtype("u%d" % itemsize) if itemsize in (1, 2, 4, 8) else _np.dtype(("V", itemsize))
+
+    cases = []
+    for ndim in ndims:
+        for n in num_tiles:
+            array_shape = _bench_array_shape(ndim, n)
+            for criterion in criteria:
+                kwargs = _split_kwargs(criterion, array_shape, itemsize, n)
+                suffix = "[%s,ndim=%d,tiles=%d]" % (criterion, ndim, n)
+                shape_kwargs = dict(kwargs)
+                shape_kwargs["array_itemsize"] = itemsize
+                cases.append(
+                    BenchmarkCase(
+                        "shape_split" + suffix,
+                        shape_split,
+                        (array_shape.tolist(),),
+                        shape_kwargs
+                    )
+                )
+                cases.append(
+                    BenchmarkCase(
+                        "array_split" + suffix,
+                        array_split,
+                        (_array_split_ary(array_shape, dtype),),
+                        kwargs
+                    )
+                )
+            suffix = "[ndim=%d,tiles=%d]" % (ndim, n)
+            cases.append(
+                BenchmarkCase(
+                    "calculate_tile_shape_for_max_bytes" + suffix,
+                    calculate_tile_shape_for_max_bytes,
+                    (array_shape, itemsize, int(_np.prod(array_shape) * itemsize // n))
+                )
+            )
+            cases.append(
+                BenchmarkCase(
+                    "calculate_num_slices_per_axis" + suffix,
+                    calculate_num_slices_per_axis,
+                    ([0, ] * ndim, n)
+                )
+            )
+    return cases
+
+
+def time_case(case, repeat=3, min_time=0.05):
+    """
+    Times :samp:`{case}`. The number of calls per repeat is chosen
+    so that each repeat takes at least :samp:`{min_time}` seconds.
+
+    :type case: :obj:`BenchmarkCase`
+    :param case: Case to be timed.
+    :type repeat: :obj:`int`
+    :param repeat: Number of timing repeats.
+    :type min_time: :obj:`float`
+    :param min_time: Minimum time (seconds) per repeat.
+    :rtype: :obj:`dict`
+    :return: Dictionary with :samp:`"min"`, :samp:`"median"`
+       and :samp:`"max"` per-call times (seconds) and :samp:`"number"`
+       and :samp:`"repeat"` counts.
+    """
+    timer = _timeit.Timer(case)
+    number = 1
+    elapsed = timer.timeit(number)
+    while elapsed < min_time:
+        number *= max([2, min([10, int(min_time / max([elapsed, 1.0e-9]))])])
+        elapsed = timer.timeit(number)
+    times = [elapsed / number, ] + [t / number for t in timer.repeat(repeat - 1, number)]
+    times.sort()
+    return \
+        {
+            "min": times[0],
+            "median": times[len(times) // 2],
+            "max": times[-1],
+            "number": number,
+            "repeat": repeat,
+        }
+
+
+def run_benchmarks(cases, repeat=3, min_time=0.05, name_filter=None):
+    """
+    Times each of the :samp:`{cases}` and returns results dictionary (suitable
+    for :func:`save_results`).
+
+    :type cases: sequence of :obj:`BenchmarkCase`
+    :param cases: Cases to be timed.
+    :type repeat: :obj:`int`
+    :param repeat: See :func:`time_case`.
+    :type min_time: :obj:`float`
+    :param min_time: See :func:`time_case`.
+    :type name_filter: :samp:`None` or :obj:`str`
+    :param name_filter: Regular expression, only cases with a matching name are timed.
+    :rtype: :obj:`dict`
+    :return: Results dictionary, with environment meta-data and
+       the :samp:`"results"` :obj:`dict` of per-case timings.
+    """
+    results = {}
+    for case in cases:
+        if (name_filter is None) or (_re.search(name_filter, case.name) is not None):
+            results[case.name] = time_case(case, repeat=repeat, min_time=min_time)
+            _logger.info("%s: %.6e s", case.name, results[case.name]["min"])
+    return \
+        {
+            "format_version": RESULTS_FORMAT_VERSION,
+            "array_split_version": __version__,
+            "numpy_version": _np.__version__,
+            "python_version": _platform.python_version(),
+            "platform": _platform.platform(),
+            "results": results,
+        }
+
+
+def save_results(results, file_name):
+    """
+    Writes :samp:`{results}` to JSON file :samp:`{file_name}`.
+
+    :type results: :obj:`dict`
+    :param results: Results, as returned by :func:`run_benchmarks`.
+    :type file_name: :obj:`str`
+    :param file_name: Output file path.
+    """
+    with open(file_name, "wt") as fd:
+        _json.dump(results, fd, indent=2, sort_keys=True)
+
+
+def load_results(file_name):
+    """
+    Reads results from JSON file :samp:`{file_name}`.
+
+    :type file_name: :obj:`str`
+    :param file_name: Path of file written by :func:`save_results`.
+    :rtype: :obj:`dict`
+    :return: Results dictionary.
+    :raises ValueError: If the file has an unsupported format version.
+    """
+    with open(file_name, "rt") as fd:
+        results = _json.load(fd)
+    if results.get("format_version", None) != RESULTS_FORMAT_VERSION:
+        raise ValueError(
+            "Got format_version=%s in file %s, expected %s."
+            %
+            (results.get("format_version", None), file_name, RESULTS_FORMAT_VERSION)
+        )
+    return results
+
+
+def compare_results(baseline, current, threshold=0.25, statistic="min"):
+    """
+    Compares :samp:`{current}` results against :samp:`{baseline}` results.
+    Only cases present in both are compared.
+
+    :type baseline: :obj:`dict`
+    :param baseline: Baseline results, as returned by :func:`run_benchmarks`.
+    :type current: :obj:`dict`
+    :param current: Current results, as returned by :func:`run_benchmarks`.
+    :type threshold: :obj:`float`
+    :param threshold: A case is a regression
+       if :samp:`current_time > (1 + {threshold}) * baseline_time`.
+    :type statistic: :obj:`str`
+    :param statistic: Which timing statistic is compared (:samp:`"min"` or :samp:`"median"`).
+    :rtype: :obj:`list`
+    :return: List of :samp:`(name, baseline_time, current_time, ratio, is_regression)`
+       tuples, sorted by :samp:`name`.
+
+    Example::
+
+       >>> baseline = {"results": {"a": {"min": 1.0}, "b": {"min": 2.0}}}
+       >>> current = {"results": {"a": {"min": 1.5}, "b": {"min": 2.0}}}
+       >>> compare_results(baseline, current, threshold=0.25)
+       [('a', 1.0, 1.5, 1.5, True), ('b', 2.0, 2.0, 1.0, False)]
+
+    """
+    ret = []
+    for name in sorted(set(baseline["results"].keys()) & set(current["results"].keys())):
+        base_time = baseline["results"][name][statistic]
+        cur_time = current["results"][name][statistic]
+        ratio = cur_time / base_time if base_time > 0 else float("inf")
+        ret.append((name, base_time, cur_time, ratio, ratio > (1.0 + threshold)))
+    return ret
+
+
+def time_import(module_name="array_split", repeat=5, preload=("numpy",)):
+    """
+    Times :samp:`import {module_name}` in :samp:`{repeat}` fresh interpreter
+    (:data:`sys.executable`) processes. The :samp:`{preload}` modules are imported
+    before the timed import, so their import time is excluded.
+
+    :type module_name: :obj:`str`
+    :param module_name: Name of the module whose import is timed.
+    :type repeat: :obj:`int`
+    :param repeat: Number of timed imports (processes).
+    :type preload: sequence of :obj:`str`
+    :param preload: Names of modules imported before the timed import.
+    :rtype: :obj:`dict`
+    :return: Dictionary with :samp:`"min"`, :samp:`"median"`
+       and :samp:`"max"` import times (seconds) and the :samp:`"repeat"` count.
+    """
+    env = dict(_os.environ)
+    package_parent_dir = _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__)))
+    python_path = [package_parent_dir, ]
+    if len(env.get("PYTHONPATH", "")) > 0:
+        python_path.append(env["PYTHONPATH"])
+    env["PYTHONPATH"] = _os.pathsep.join(python_path)
+    times = []
+    for i in range(repeat):
+        output = \
+            _subprocess.check_output(
+                [_sys.executable, "-c", _IMPORT_TIMER_CODE, module_name] + list(preload),
+                env=env
+            )
+        times.append(float(output.decode().strip()))
+    times.sort()
+    return \
+        {
+            "min": times[0],
+            "median": times[len(times) // 2],
+            "max": times[-1],
+            "repeat": repeat,
+        }
+
+
+def main(argv=None):
+    """
+    Command line entry point, see module documentation for usage.
+
+    :type argv: :samp:`None` or sequence of :obj:`str`
+    :param argv: Command line arguments (excluding program name),
+       defaults to :samp:`sys.argv[1:]`.
+    :rtype: :obj:`int`
+    :return: Exit status, :samp:`1` if :samp:`compare` finds regressions
+       or if the :samp:`import-time` budget is exceeded.
+    """
+    parser = _argparse.ArgumentParser(prog="python -m array_split.benchmark")
+    subparsers = parser.add_subparsers(dest="command")
+
+    run_parser = subparsers.add_parser("run", help="Run benchmarks and write JSON results.")
+    run_parser.add_argument("-o", "--output", default=None, help="Output JSON file.")
+    run_parser.add_argument(
+        "--ndims", type=int, nargs="+", default=DEFAULT_NDIMS, help="Array dimensions."
+    )
+    run_parser.add_argument(
+        "--num-tiles", type=int, nargs="+", default=DEFAULT_NUM_TILES,
+        help="Numbers of tiles (default %s)." % (DEFAULT_NUM_TILES, )
+    )
+    run_parser.add_argument(
+        "--criteria", nargs="+", default=SPLIT_CRITERIA, choices=SPLIT_CRITERIA,
+        help="Split criteria."
+    )
+    run_parser.add_argument("--filter", default=None, help="Regex filter for case names.")
+    run_parser.add_argument("--repeat", type=int, default=3, help="Timing repeats.")
+    run_parser.add_argument(
+        "--min-time", type=float, default=0.05, help="Minimum seconds per repeat."
+    )
+
+    cmp_parser = subparsers.add_parser("compare", help="Compare results against a baseline.")
+    cmp_parser.add_argument("baseline", help="Baseline JSON results file.")
+    cmp_parser.add_argument("current", help="Current JSON results file.")
+    cmp_parser.add_argument(
+        "--threshold", type=float, default=0.25,
+        help="Regression threshold as fraction of baseline time."
+    )
+    cmp_parser.add_argument("--statistic", default="min", choices=["min", "median"])
+
+    imp_parser = \
+        subparsers.add_parser("import-time", help="Check import time against a budget.")
+    imp_parser.add_argument(
+        "--budget", type=float, default=DEFAULT_IMPORT_TIME_BUDGET,
+        help="Maximum (minimum over repeats) import seconds, excluding numpy import."
+    )
+    imp_parser.add_argument("--repeat", type=int, default=5, help="Timing repeats.")
+    imp_parser.add_argument("--module", default="array_split", help="Module to import.")
+
+    args = parser.parse_args(argv)
+    status = 0
+    if args.command == "run":
+        results = \
+            run_benchmarks(
+                generate_cases(args.ndims, args.num_tiles, args.criteria),
+                repeat=args.repeat,
+                min_time=args.min_time,
+                name_filter=args.filter
+            )
+        if args.output is not None:
+            save_results(results, args.output)
+        else:
+            _json.dump(results, _sys.stdout, indent=2, sort_keys=True)
+            _sys.stdout.write("\n")
+    elif args.command == "compare":
+        comparison = \
+            compare_results(
+                load_results(args.baseline),
+                load_results(args.current),
+                threshold=args.threshold,
+                statistic=args.statistic
+            )
+        for name, base_time, cur_time, ratio, is_regression in comparison:
+            _sys.stdout.write(
+                "%-70s %12.4e %12.4e %7.3f%s\n"
+                %
+                (name, base_time, cur_time, ratio, "  REGRESSION" if is_regression else "")
+            )
+        num_regressions = len([c for c in comparison if c[-1]])
+        _sys.stdout.write(
+            "%d of %d cases regressed by more than %.1f%%.\n"
+            %
+            (num_regressions, len(comparison), 100.0 * args.threshold)
+        )
+        status = 1 if num_regressions > 0 else 0
+    elif args.command == "import-time":
+        timing = time_import(args.module, repeat=args.repeat)
+        within_budget = timing["min"] <= args.budget
+        _sys.stdout.write(
+            "import %s: min=%.4e s, median=%.4e s, budget=%.4e s%s\n"
+            %
+            (
+                args.module,
+                timing["min"],
+                timing["median"],
+                args.budget,
+                "" if within_budget else "  OVER BUDGET"
+            )
+        )
+        status = 0 if within_budget else 1
+    else:
+        parser.print_help()
+        status = 2
+    return status
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+if __name__ == "__main__":
+    _sys.exit(main())
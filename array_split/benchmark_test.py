@@ -0,0 +1,154 @@
+"""
+============================================
+The :mod:`array_split.benchmark_test` Module
+============================================
+
+.. currentmodule:: array_split.benchmark_test
+
+Module defining :mod:`array_split.benchmark` unit-tests.
+Execute as::
+
+   python -m array_split.benchmark_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   BenchmarkTest - :obj:`unittest.TestCase` for :mod:`array_split.benchmark` functions.
+
+
+"""
+from __future__ import absolute_import
+import os as _os
+import sys as _sys
+import subprocess as _subprocess
+import tempfile as _tempfile
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging
+
+from .benchmark import generate_cases, run_benchmarks, compare_results
+from .benchmark import save_results, load_results, main, SPLIT_CRITERIA
+from .benchmark import time_import
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class BenchmarkTest(_unittest.TestCase):
+
+    """
+    Tests for :mod:`array_split.benchmark` module.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".BenchmarkTest")
+
+    def test_generate_cases(self):
+        """
+        Tests :func:`array_split.benchmark.generate_cases` generates
+        splits with the requested number of tiles.
+        """
+        ndims = [1, 3, 6]
+        num_tiles = [1, 12, 100]
+        cases = generate_cases(ndims, num_tiles)
+        self.assertEqual(len(ndims) * len(num_tiles) * (2 * len(SPLIT_CRITERIA) + 2), len(cases))
+        self.assertEqual(len(cases), len(set([case.name for case in cases])))
+        for case in cases:
+            result = case()
+            n = int(case.name.split("tiles=")[1].rstrip("]"))
+            if case.name.startswith("shape_split") or case.name.startswith("array_split"):
+                num_result_tiles = len(result) if isinstance(result, list) else result.size
+                if "max_tile_bytes" in case.name:
+                    # tile shape is only bounded by bytes, so at least n tiles
+                    self.assertTrue(num_result_tiles >= n, case.name)
+                else:
+                    self.assertEqual(n, num_result_tiles, case.name)
+            elif case.name.startswith("calculate_num_slices_per_axis"):
+                self.assertEqual(n, _np.prod(result), case.name)
+
+        self.assertRaises(ValueError, generate_cases, [1], [1], ["not_a_criterion"])
+
+    def test_run_save_load_compare(self):
+        """
+        Tests :func:`array_split.benchmark.run_benchmarks`,
+        :func:`array_split.benchmark.save_results`,
+        :func:`array_split.benchmark.load_results`
+        and :func:`array_split.benchmark.compare_results`.
+        """
+        results = \
+            run_benchmarks(
+                generate_cases([2], [4]),
+                repeat=2,
+                min_time=0.0,
+                name_filter="shape_split"
+            )
+        self.assertEqual(len(SPLIT_CRITERIA), len(results["results"]))
+        for timing in results["results"].values():
+            self.assertTrue(timing["min"] <= timing["median"] <= timing["max"])
+
+        fd, file_name = _tempfile.mkstemp(suffix=".json")
+        _os.close(fd)
+        fd, slow_file_name = _tempfile.mkstemp(suffix=".json")
+        _os.close(fd)
+        try:
+            save_results(results, file_name)
+            loaded = load_results(file_name)
+            self.assertEqual(sorted(results["results"].keys()), sorted(loaded["results"].keys()))
+            comparison = compare_results(results, loaded)
+            self.assertEqual(len(SPLIT_CRITERIA), len(comparison))
+            self.assertFalse(_np.any([c[-1] for c in comparison]))
+            self.assertEqual(0, main(["compare", file_name, file_name]))
+
+            slow = load_results(file_name)
+            for timing in slow["results"].values():
+                timing["min"] *= 2.0
+            save_results(slow, slow_file_name)
+            self.assertTrue(_np.all([c[-1] for c in compare_results(results, slow, 0.5)]))
+            self.assertFalse(_np.any([c[-1] for c in compare_results(results, slow, 1.5)]))
+            self.assertEqual(1, main(["compare", file_name, slow_file_name, "--threshold", "0.5"]))
+
+            slow["format_version"] = -1
+            save_results(slow, slow_file_name)
+            self.assertRaises(ValueError, load_results, slow_file_name)
+        finally:
+            _os.remove(file_name)
+            _os.remove(slow_file_name)
+
+    def test_import_time(self):
+        """
+        Tests :func:`array_split.benchmark.time_import` and the :samp:`import-time`
+        command, also checks that :samp:`import array_split` does not
+        import :mod:`pkg_resources`.
+        """
+        timing = time_import("array_split", repeat=2)
+        self.assertEqual(2, timing["repeat"])
+        self.assertTrue(0.0 < timing["min"] <= timing["median"] <= timing["max"])
+        self.assertEqual(0, main(["import-time", "--repeat", "1", "--budget", "60"]))
+        self.assertEqual(1, main(["import-time", "--repeat", "1", "--budget", "0"]))
+
+        env = dict(_os.environ)
+        env["PYTHONPATH"] = _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__)))
+        output = \
+            _subprocess.check_output(
+                [
+                    _sys.executable,
+                    "-c",
+                    "import sys, array_split; sys.stdout.write(str('pkg_resources' in sys.modules))"
+                ],
+                env=env
+            )
+        self.assertEqual("False", output.decode().strip())
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+_unittest.main(__name__)
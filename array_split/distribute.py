@@ -0,0 +1,308 @@
+"""
+========================================
+The :mod:`array_split.distribute` Module
+========================================
+
+.. currentmodule:: array_split.distribute
+
+Assignment (distribution) of the tiles of a split to :samp:`P` workers.
+Each distribution function returns a :samp:`split_shape` shaped
+:samp:`int64` array of worker ids (*worker map*), and
+:func:`worker_tile_lists` converts a worker map to per-worker lists
+of (C-order flat) tile indices. All assignments are computed with
+vectorised :mod:`numpy` operations.
+
+Example::
+
+   >>> from array_split import ShapeSplitter
+   >>> splitter = ShapeSplitter((40, 30), axis=[4, 3])
+   >>> splitter.calculate_split().shape
+   (4, 3)
+   >>> block_distribution(splitter.split_shape, 3).tolist()
+   [[0, 0, 0], [0, 1, 1], [1, 1, 2], [2, 2, 2]]
+   >>> cyclic_distribution(splitter.split_shape, 3).tolist()
+   [[0, 1, 2], [0, 1, 2], [0, 1, 2], [0, 1, 2]]
+   >>> block_cyclic_distribution(splitter.split_shape, 4, (2, 1), grid_shape=(2, 2)).tolist()
+   [[0, 1, 0], [0, 1, 0], [2, 3, 2], [2, 3, 2]]
+   >>> worker_map, tile_lists = distribute_tiles(splitter, 3, method="cyclic")
+   >>> [tiles.tolist() for tiles in tile_lists]
+   [[0, 3, 6, 9], [1, 4, 7, 10], [2, 5, 8, 11]]
+
+Classes and Functions
+=====================
+
+.. autosummary::
+   :toctree: generated/
+
+   block_distribution - Contiguous blocks of (C-order) tiles per worker.
+   cyclic_distribution - Round-robin (C-order) tiles per worker.
+   block_cyclic_distribution - ScaLAPACK style block-cyclic distribution over a worker grid.
+   balanced_distribution - Contiguous (C-order) tile blocks balanced by tile weight.
+   calculate_tile_volumes - Returns the number of elements in each tile of a split.
+   worker_tile_lists - Converts a worker map into per-worker lists of tile indices.
+   distribute_tiles - Computes worker map and per-worker tile lists for a splitter.
+
+Attributes
+==========
+
+.. autodata:: DISTRIBUTION_METHODS
+
+"""
+from __future__ import absolute_import
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from .split import calculate_num_slices_per_axis as _calculate_num_slices_per_axis
+from .split import is_scalar as _is_scalar
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+#: The :samp:`method` names accepted by :func:`distribute_tiles`.
+DISTRIBUTION_METHODS = ("block", "cyclic", "block_cyclic", "balanced")
+
+
+def _check_num_workers(num_workers):
+    """
+    Raises :obj:`ValueError` for non-positive :samp:`{num_workers}`.
+    """
+    if num_workers < 1:
+        raise ValueError("Got num_workers=%s, should be positive." % (num_workers,))
+    return int(num_workers)
+
+
+def block_distribution(split_shape, num_workers):
+    """
+    Assigns contiguous blocks of C-order tile ranks to workers, block sizes
+    differ by at most one tile. Blocks are those of the
+    :obj:`array_split.scheduler.WorkStealingScheduler` initial deques.
+
+    :type split_shape: sequence of :obj:`int`
+    :param split_shape: Number of tiles per axis.
+    :type num_workers: :obj:`int`
+    :param num_workers: Number of workers.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The :samp:`{split_shape}` shaped array of worker ids.
+    """
+    num_workers = _check_num_workers(num_workers)
+    split_shape = tuple(split_shape)
+    num_tiles = int(_np.prod(split_shape))
+    ranks = _np.arange(num_tiles, dtype="int64")
+    return (((ranks + 1) * num_workers - 1) // max([num_tiles, 1])).reshape(split_shape)
+
+
+def cyclic_distribution(split_shape, num_workers):
+    """
+    Assigns C-order tile ranks to workers in round-robin order.
+
+    :type split_shape: sequence of :obj:`int`
+    :param split_shape: Number of tiles per axis.
+    :type num_workers: :obj:`int`
+    :param num_workers: Number of workers.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The :samp:`{split_shape}` shaped array of worker ids.
+    """
+    num_workers = _check_num_workers(num_workers)
+    split_shape = tuple(split_shape)
+    ranks = _np.arange(int(_np.prod(split_shape)), dtype="int64")
+    return (ranks % num_workers).reshape(split_shape)
+
+
+def block_cyclic_distribution(split_shape, num_workers, block_shape=1, grid_shape=None):
+    """
+    ScaLAPACK style block-cyclic distribution. Workers are arranged in
+    a :samp:`{grid_shape}` (C-order) grid and tiles are grouped into
+    :samp:`{block_shape}` blocks, along each axis :samp:`d`, block :samp:`b`
+    is assigned to worker grid coordinate :samp:`b % {grid_shape}[d]`.
+
+    :type split_shape: sequence of :obj:`int`
+    :param split_shape: Number of tiles per axis.
+    :type num_workers: :obj:`int`
+    :param num_workers: Number of workers.
+    :type block_shape: :obj:`int` or sequence of :obj:`int`
+    :param block_shape: Number of tiles per block, per axis.
+    :type grid_shape: :samp:`None` or sequence of :obj:`int`
+    :param grid_shape: Worker grid shape, :samp:`numpy.product({grid_shape})`
+       should equal :samp:`{num_workers}`. If :samp:`None`, the grid shape is
+       :samp:`calculate_num_slices_per_axis([0, ] * len({split_shape}), {num_workers})`.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The :samp:`{split_shape}` shaped array of worker ids.
+    """
+    num_workers = _check_num_workers(num_workers)
+    split_shape = tuple(split_shape)
+    ndim = len(split_shape)
+    if _is_scalar(block_shape):
+        block_shape = [block_shape, ] * ndim
+    block_shape = _np.array(block_shape, dtype="int64")
+    if (len(block_shape) != ndim) or _np.any(block_shape < 1):
+        raise ValueError(
+            "Got block_shape=%s, should be %s positive integers." % (block_shape.tolist(), ndim)
+        )
+    if grid_shape is None:
+        grid_shape = _calculate_num_slices_per_axis([0, ] * ndim, num_workers)
+    grid_shape = _np.array(grid_shape, dtype="int64")
+    if (len(grid_shape) != ndim) or (int(_np.prod(grid_shape)) != num_workers):
+        raise ValueError(
+            "Got grid_shape=%s, should be %s integers with product num_workers=%s."
+            %
+            (grid_shape.tolist(), ndim, num_workers)
+        )
+    grid_coords = \
+        [
+            (_np.arange(split_shape[d], dtype="int64") // block_shape[d]) % grid_shape[d]
+            for d in range(ndim)
+        ]
+    return \
+        _np.ravel_multi_index(
+            _np.meshgrid(*grid_coords, indexing="ij"),
+            tuple(grid_shape)
+        ).astype("int64").reshape(split_shape)
+
+
+def balanced_distribution(tile_weights, num_workers):
+    """
+    Assigns contiguous blocks of C-order tile ranks to workers such that
+    the sum of tile weights per worker is balanced. Tile :samp:`i` is
+    assigned to the worker whose (equal) share of the total weight contains
+    the weight-midpoint of tile :samp:`i`.
+
+    :type tile_weights: :obj:`numpy.ndarray`
+    :param tile_weights: The :samp:`split_shape` shaped array of non-negative
+       tile weights (e.g. :func:`calculate_tile_volumes`).
+    :type num_workers: :obj:`int`
+    :param num_workers: Number of workers.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The :samp:`split_shape` shaped array of worker ids.
+    """
+    num_workers = _check_num_workers(num_workers)
+    tile_weights = _np.asarray(tile_weights, dtype="float64")
+    if _np.any(tile_weights < 0) or (not _np.all(_np.isfinite(tile_weights))):
+        raise ValueError("Got tile_weights with negative or non-finite elements.")
+    weights = tile_weights.flatten()
+    total = _np.sum(weights)
+    if total <= 0:
+        return block_distribution(tile_weights.shape, num_workers)
+    midpoints = _np.cumsum(weights) - 0.5 * weights
+    return \
+        _np.minimum(
+            _np.floor(midpoints * (num_workers / total)).astype("int64"),
+            num_workers - 1
+        ).reshape(tile_weights.shape)
+
+
+def calculate_tile_volumes(splitter):
+    """
+    Returns the number of (non-halo) elements in each tile of the split.
+
+    :type splitter: :obj:`array_split.ShapeSplitter`
+    :param splitter: Split for which the tile volumes are calculated.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The :samp:`{splitter}.split_shape` shaped :samp:`int64` array of
+       tile element counts.
+    """
+    if splitter.split_begs is None:
+        splitter.calculate_split()
+    volumes = _np.ones((), dtype="int64")
+    for d in range(len(splitter.split_shape)):
+        volumes = \
+            _np.multiply.outer(
+                volumes,
+                _np.asarray(splitter.split_ends[d], dtype="int64")
+                -
+                _np.asarray(splitter.split_begs[d], dtype="int64")
+            )
+    return volumes
+
+
+def worker_tile_lists(worker_map, num_workers=None):
+    """
+    Converts a worker map into per-worker arrays of (C-order flat) tile indices.
+    Multi-indices are recovered with :samp:`numpy.unravel_index(tiles, {worker_map}.shape)`.
+
+    :type worker_map: :obj:`numpy.ndarray`
+    :param worker_map: The :samp:`split_shape` shaped array of worker ids.
+    :type num_workers: :samp:`None` or :obj:`int`
+    :param num_workers: Number of workers, if :samp:`None`,
+       uses :samp:`{worker_map}.max() + 1`.
+    :rtype: :obj:`list` of :obj:`numpy.ndarray`
+    :return: The :samp:`{num_workers}` length list of sorted tile index arrays.
+    """
+    worker_ids = _np.asarray(worker_map, dtype="int64").flatten()
+    if num_workers is None:
+        num_workers = int(worker_ids.max()) + 1 if worker_ids.size > 0 else 1
+    num_workers = _check_num_workers(num_workers)
+    if (worker_ids.size > 0) and ((worker_ids.min() < 0) or (worker_ids.max() >= num_workers)):
+        raise ValueError(
+            "Got worker ids in range [%s, %s], should be in range [0, %s)."
+            %
+            (worker_ids.min(), worker_ids.max(), num_workers)
+        )
+    order = _np.argsort(worker_ids, kind="mergesort")
+    counts = _np.bincount(worker_ids, minlength=num_workers)
+    return _np.split(order.astype("int64"), _np.cumsum(counts)[:-1])
+
+
+def distribute_tiles(
+    splitter,
+    num_workers,
+    method="block",
+    block_shape=1,
+    grid_shape=None,
+    tile_weights=None
+):
+    """
+    Distributes the tiles of a split over :samp:`{num_workers}` workers.
+
+    :type splitter: :obj:`array_split.ShapeSplitter`
+    :param splitter: Defines the tiles.
+    :type num_workers: :obj:`int`
+    :param num_workers: Number of workers.
+    :type method: :obj:`str`
+    :param method: One of :attr:`DISTRIBUTION_METHODS`.
+    :type block_shape: :obj:`int` or sequence of :obj:`int`
+    :param block_shape: See :func:`block_cyclic_distribution`.
+    :type grid_shape: :samp:`None` or sequence of :obj:`int`
+    :param grid_shape: See :func:`block_cyclic_distribution`.
+    :type tile_weights: :samp:`None` or :obj:`numpy.ndarray`
+    :param tile_weights: Weights for :samp:`method="balanced"`,
+       if :samp:`None`, uses :samp:`calculate_tile_volumes({splitter})`.
+    :rtype: :obj:`tuple`
+    :return: A :samp:`(worker_map, tile_lists)` pair,
+       see :func:`worker_tile_lists`.
+    """
+    if splitter.split_begs is None:
+        splitter.calculate_split()
+    split_shape = tuple(splitter.split_shape)
+    if method == "block":
+        worker_map = block_distribution(split_shape, num_workers)
+    elif method == "cyclic":
+        worker_map = cyclic_distribution(split_shape, num_workers)
+    elif method == "block_cyclic":
+        worker_map = \
+            block_cyclic_distribution(
+                split_shape,
+                num_workers,
+                block_shape=block_shape,
+                grid_shape=grid_shape
+            )
+    elif method == "balanced":
+        if tile_weights is None:
+            tile_weights = calculate_tile_volumes(splitter)
+        tile_weights = _np.asarray(tile_weights)
+        if tuple(tile_weights.shape) != split_shape:
+            raise ValueError(
+                "Got tile_weights.shape=%s, should be split_shape=%s."
+                %
+                (tuple(tile_weights.shape), split_shape)
+            )
+        worker_map = balanced_distribution(tile_weights, num_workers)
+    else:
+        raise ValueError(
+            "Got method=%s, should be one of %s." % (method, DISTRIBUTION_METHODS)
+        )
+    return worker_map, worker_tile_lists(worker_map, num_workers)
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
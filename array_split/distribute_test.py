@@ -0,0 +1,182 @@
+"""
+=============================================
+The :mod:`array_split.distribute_test` Module
+=============================================
+
+.. currentmodule:: array_split.distribute_test
+
+Module defining :mod:`array_split.distribute` unit-tests.
+Execute as::
+
+   python -m array_split.distribute_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   DistributeTest - :obj:`unittest.TestCase` for :mod:`array_split.distribute` functions.
+
+
+"""
+from __future__ import absolute_import
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging
+
+from .split import ShapeSplitter, calculate_num_slices_per_axis
+from .scheduler import WorkStealingScheduler
+from .distribute import block_distribution, cyclic_distribution, block_cyclic_distribution
+from .distribute import balanced_distribution, calculate_tile_volumes, worker_tile_lists
+from .distribute import distribute_tiles, DISTRIBUTION_METHODS
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class DistributeTest(_unittest.TestCase):
+
+    """
+    Tests for :mod:`array_split.distribute` module.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".DistributeTest")
+
+    def test_block_distribution(self):
+        """
+        Tests :func:`array_split.distribute.block_distribution`.
+        """
+        for split_shape in [(1,), (7,), (5, 3), (4, 3, 2), (2, 1, 1)]:
+            for num_workers in [1, 2, 3, 7, 40]:
+                worker_map = block_distribution(split_shape, num_workers)
+                self.assertSequenceEqual(split_shape, worker_map.shape)
+                flat = worker_map.flatten()
+                self.assertTrue(_np.all(_np.diff(flat) >= 0))
+                blocks = \
+                    WorkStealingScheduler(
+                        ShapeSplitter(split_shape, 1),
+                        num_workers
+                    ).initial_blocks(flat.size)
+                for w, (begin, end) in enumerate(blocks):
+                    self.assertTrue(_np.all(flat[begin:end] == w))
+                counts = _np.bincount(flat, minlength=num_workers)
+                self.assertTrue(counts.max() - counts.min() <= 1)
+
+    def test_cyclic_distribution(self):
+        """
+        Tests :func:`array_split.distribute.cyclic_distribution`.
+        """
+        worker_map = cyclic_distribution((5, 3), 4)
+        self.assertSequenceEqual((5, 3), worker_map.shape)
+        self.assertSequenceEqual([i % 4 for i in range(15)], worker_map.flatten().tolist())
+        self.assertRaises(ValueError, cyclic_distribution, (5, 3), 0)
+
+    def test_block_cyclic_distribution(self):
+        """
+        Tests :func:`array_split.distribute.block_cyclic_distribution` against
+        an element-wise (loop) ScaLAPACK style assignment.
+        """
+        cases = \
+            [
+                ((8, 6), 4, (2, 3), (2, 2)),
+                ((9, 7, 3), 6, (1, 2, 1), (3, 2, 1)),
+                ((10,), 3, 4, None),
+                ((8, 6), 6, 1, None),
+            ]
+        for split_shape, num_workers, block_shape, grid_shape in cases:
+            worker_map = \
+                block_cyclic_distribution(split_shape, num_workers, block_shape, grid_shape)
+            ndim = len(split_shape)
+            if grid_shape is None:
+                grid_shape = calculate_num_slices_per_axis([0, ] * ndim, num_workers)
+            grid_shape = tuple(grid_shape)
+            if _np.isscalar(block_shape):
+                block_shape = (block_shape,) * ndim
+            for multi_index in _np.ndindex(*split_shape):
+                coord = \
+                    tuple(
+                        (multi_index[d] // block_shape[d]) % grid_shape[d] for d in range(ndim)
+                    )
+                self.assertEqual(
+                    _np.ravel_multi_index(coord, grid_shape),
+                    worker_map[multi_index]
+                )
+        self.assertRaises(ValueError, block_cyclic_distribution, (8, 6), 4, 1, (3, 2))
+        self.assertRaises(ValueError, block_cyclic_distribution, (8, 6), 4, (1, 0), (2, 2))
+        self.assertRaises(ValueError, block_cyclic_distribution, (8, 6), 4, (1, 1, 1))
+
+    def test_balanced_distribution(self):
+        """
+        Tests :func:`array_split.distribute.balanced_distribution`.
+        """
+        splitter = ShapeSplitter((100, 40), axis=[10, 4])
+        splitter.calculate_split()
+        volumes = calculate_tile_volumes(splitter)
+        self.assertSequenceEqual((10, 4), volumes.shape)
+        self.assertEqual(100 * 40, volumes.sum())
+
+        weights = _np.ones((10, 4))
+        weights[0, :] = 20.0
+        worker_map = balanced_distribution(weights, 4)
+        flat = worker_map.flatten()
+        self.assertTrue(_np.all(_np.diff(flat) >= 0))
+        self.assertSequenceEqual([0, 1, 2, 3], _np.unique(flat).tolist())
+        loads = _np.bincount(flat, weights=weights.flatten(), minlength=4)
+        block_loads = \
+            _np.bincount(block_distribution((10, 4), 4).flatten(), weights=weights.flatten())
+        self.assertTrue(loads.max() < block_loads.max())
+        self.assertTrue(loads.max() <= loads.sum() / 4 + weights.max())
+
+        # Zero weights fall back to block distribution
+        self.assertTrue(
+            _np.all(balanced_distribution(_np.zeros((3, 2)), 2) == block_distribution((3, 2), 2))
+        )
+        self.assertRaises(ValueError, balanced_distribution, -weights, 4)
+
+        # Indices split with an unsplit axis
+        splitter = ShapeSplitter((10, 10), [[3, 6]])
+        volumes = calculate_tile_volumes(splitter)
+        self.assertSequenceEqual([[30], [30], [40]], volumes.tolist())
+        worker_map, tile_lists = distribute_tiles(splitter, 2, method="balanced")
+        self.assertSequenceEqual((3, 1), worker_map.shape)
+        self.assertEqual(2, len(tile_lists))
+
+    def test_distribute_tiles(self):
+        """
+        Tests :func:`array_split.distribute.distribute_tiles`
+        and :func:`array_split.distribute.worker_tile_lists`.
+        """
+        splitter = ShapeSplitter((64, 48, 8), axis=[4, 3, 2], halo=1)
+        for method in DISTRIBUTION_METHODS:
+            for num_workers in [1, 3, 5]:
+                worker_map, tile_lists = \
+                    distribute_tiles(splitter, num_workers, method=method, block_shape=(2, 1, 1))
+                self.assertSequenceEqual(tuple(splitter.split_shape), worker_map.shape)
+                self.assertEqual(num_workers, len(tile_lists))
+                self.assertSequenceEqual(
+                    list(range(worker_map.size)),
+                    sorted(_np.concatenate(tile_lists).tolist())
+                )
+                for w, tiles in enumerate(tile_lists):
+                    self.assertTrue(_np.all(worker_map.flatten()[tiles] == w))
+                    self.assertTrue(_np.all(_np.diff(tiles) > 0))
+        self.assertRaises(ValueError, distribute_tiles, splitter, 2, method="unknown")
+        self.assertRaises(
+            ValueError,
+            distribute_tiles, splitter, 2, method="balanced", tile_weights=_np.ones((2, 2))
+        )
+        self.assertEqual(3, len(worker_tile_lists(_np.array([[0, 2], [2, 0]]))))
+        self.assertRaises(ValueError, worker_tile_lists, _np.array([0, 3]), 2)
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+_unittest.main(__name__)
@@ -0,0 +1,255 @@
+"""
+==================================
+The :mod:`array_split.halo` Module
+==================================
+
+.. currentmodule:: array_split.halo
+
+Zero-copy views of the interior and the halo regions of haloed tiles.
+A :obj:`HaloRegions` wraps a (haloed) tile array and its :samp:`(ndim, 2)`
+shaped halo array (as calculated
+by :meth:`array_split.ShapeSplitter.calculate_split_halos_from_extents`)
+and provides basic-slicing (no copy) views of the tile *interior*
+and the halo *regions*. A region is identified by a *side* tuple,
+element :samp:`side[d]` is :samp:`-1` (low halo), :samp:`0` (interior)
+or :samp:`1` (high halo) along axis :samp:`d`. Regions with a single
+non-zero side element are *faces*, two non-zero elements are *edges* and
+:samp:`ndim` non-zero elements are *corners* (for 2D tiles, edges and corners
+are the same regions).
+
+Example::
+
+   >>> import numpy as np
+   >>> from array_split import ShapeSplitter
+   >>> ary = np.arange(0, 36).reshape((6, 6))
+   >>> regions = split_tile_regions(ary, ShapeSplitter(ary.shape, axis=[2, 2], halo=1))
+   >>> tile_regions = regions[3]
+   >>> tile_regions.tile.shape, tile_regions.interior.shape
+   ((4, 4), (3, 3))
+   >>> tile_regions.interior.tolist()
+   [[21, 22, 23], [27, 28, 29], [33, 34, 35]]
+   >>> [side for side, view in tile_regions.faces()]
+   [(-1, 0), (0, -1)]
+   >>> tile_regions.region((-1, 0)).tolist()
+   [[15, 16, 17]]
+   >>> [(side, view.tolist()) for side, view in tile_regions.corners()]
+   [((-1, -1), [[14]])]
+   >>> tile_regions.interior[0, 0] = -1
+   >>> int(ary[3, 3])
+   -1
+
+Classes and Functions
+=====================
+
+.. autosummary::
+   :toctree: generated/
+
+   HaloRegions - Interior and halo region views of a haloed tile.
+   split_tile_regions - Returns :obj:`HaloRegions` for each tile of a split of an array.
+
+"""
+from __future__ import absolute_import
+import itertools as _itertools
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from .split import ARRAY_BOUNDS as _ARRAY_BOUNDS
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class HaloRegions(object):
+
+    """
+    Zero-copy interior and halo region views of a haloed tile.
+    """
+
+    def __init__(self, tile, halo):
+        """
+        Initialise.
+
+        :type tile: :obj:`numpy.ndarray`
+        :param tile: The haloed tile (view).
+        :type halo: :obj:`numpy.ndarray`
+        :param halo: The :samp:`({tile}.ndim, 2)` shaped array of per-axis
+           (low, high) halo sizes included in :samp:`{tile}`.
+        :raises ValueError: If :samp:`{halo}` is inconsistent with the tile shape.
+        """
+        halo = _np.array(halo, dtype="int64").reshape((-1, 2))
+        if (
+            (halo.shape[0] != tile.ndim)
+            or
+            _np.any(halo < 0)
+            or
+            _np.any(_np.sum(halo, axis=1) > tile.shape)
+        ):
+            raise ValueError(
+                "Got halo=%s, should be (%s, 2) shaped non-negative with per-axis sums "
+                "not exceeding tile.shape=%s."
+                %
+                (halo.tolist(), tile.ndim, tile.shape)
+            )
+        #: The haloed tile.
+        self.tile = tile
+        #: The :samp:`(ndim, 2)` shaped halo array.
+        self.halo = halo
+
+    def axis_slice(self, axis, side):
+        """
+        Returns the :obj:`slice` along :samp:`{axis}` of the :samp:`{side}`
+        (:samp:`-1`, :samp:`0` or :samp:`1`) part of the tile.
+
+        :type axis: :obj:`int`
+        :param axis: The axis.
+        :type side: :obj:`int`
+        :param side: :samp:`-1` for low halo, :samp:`0` for interior
+           and :samp:`1` for high halo.
+        :rtype: :obj:`slice`
+        :return: Slice along :samp:`{axis}`.
+        """
+        size = self.tile.shape[axis]
+        lo, hi = int(self.halo[axis, 0]), int(self.halo[axis, 1])
+        if side < 0:
+            return slice(0, lo)
+        elif side > 0:
+            return slice(size - hi, size)
+        return slice(lo, size - hi)
+
+    def region_slice(self, side):
+        """
+        Returns the :obj:`tuple` of :obj:`slice` of the :samp:`{side}` region.
+
+        :type side: sequence of :obj:`int`
+        :param side: Per-axis side (:samp:`-1`, :samp:`0` or :samp:`1`) elements.
+        :rtype: :obj:`tuple`
+        :return: Slice tuple of the region.
+        """
+        if len(side) != self.tile.ndim:
+            raise ValueError("Got side=%s, should have %s elements." % (side, self.tile.ndim))
+        return tuple(self.axis_slice(d, side[d]) for d in range(self.tile.ndim))
+
+    def region(self, side):
+        """
+        Returns the (view) of the :samp:`{side}` region of the tile.
+
+        :type side: sequence of :obj:`int`
+        :param side: Per-axis side (:samp:`-1`, :samp:`0` or :samp:`1`) elements.
+        :rtype: :obj:`numpy.ndarray`
+        :return: View of the region, may be empty when there is no halo
+           on the :samp:`{side}`.
+        """
+        return self.tile[self.region_slice(side)]
+
+    @property
+    def interior(self):
+        """
+        The (view) of the tile excluding the halo.
+        """
+        return self.region((0, ) * self.tile.ndim)
+
+    def halo_regions(self, num_halo_axes=None):
+        """
+        Returns the non-empty halo regions of the tile.
+
+        :type num_halo_axes: :samp:`None` or :obj:`int`
+        :param num_halo_axes: Only return the regions with this many non-zero
+           side elements (:samp:`1` for faces, :samp:`2` for edges, ...).
+           If :samp:`None`, all halo regions are returned.
+        :rtype: :obj:`list`
+        :return: List of :samp:`(side, view)` pairs.
+        """
+        ret = []
+        for side in _itertools.product((-1, 0, 1), repeat=self.tile.ndim):
+            count = sum([s != 0 for s in side])
+            if (count == 0) or ((num_halo_axes is not None) and (count != num_halo_axes)):
+                continue
+            view = self.region(side)
+            if view.size > 0:
+                ret.append((side, view))
+        return ret
+
+    def faces(self):
+        """
+        Returns the non-empty face (single halo axis) regions.
+
+        :rtype: :obj:`list`
+        :return: List of :samp:`(side, view)` pairs.
+        """
+        return self.halo_regions(1)
+
+    def edges(self):
+        """
+        Returns the non-empty edge (two halo axes) regions.
+
+        :rtype: :obj:`list`
+        :return: List of :samp:`(side, view)` pairs.
+        """
+        return self.halo_regions(2)
+
+    def corners(self):
+        """
+        Returns the non-empty corner (all axes halo) regions.
+
+        :rtype: :obj:`list`
+        :return: List of :samp:`(side, view)` pairs.
+        """
+        return self.halo_regions(self.tile.ndim)
+
+
+def split_tile_regions(ary, splitter):
+    """
+    Returns a :obj:`HaloRegions` for each tile (in C-order) of
+    the :samp:`{splitter}` split of :samp:`{ary}`. Tiles are views of :samp:`{ary}`
+    and the halos are calculated per-axis
+    (:meth:`array_split.ShapeSplitter.calculate_axis_tile_bounds`).
+
+    :type ary: :obj:`numpy.ndarray`
+    :param ary: Array of shape :samp:`{splitter}.array_shape`.
+    :type splitter: :obj:`array_split.ShapeSplitter`
+    :param splitter: Split with :data:`array_split.ARRAY_BOUNDS` tile bounds policy.
+    :rtype: :obj:`list`
+    :return: List of :obj:`HaloRegions`.
+    :raises ValueError: If the shape of :samp:`{ary}` differs from the splitter
+       array shape or the tile bounds policy is not :data:`array_split.ARRAY_BOUNDS`.
+    """
+    if tuple(ary.shape) != tuple(splitter.array_shape.tolist()):
+        raise ValueError(
+            "Got ary.shape=%s, should be splitter.array_shape=%s."
+            %
+            (ary.shape, tuple(splitter.array_shape.tolist()))
+        )
+    if splitter.tile_bounds_policy is not _ARRAY_BOUNDS:
+        raise ValueError(
+            "Got tile_bounds_policy=%s, tile views require ARRAY_BOUNDS."
+            %
+            (splitter.tile_bounds_policy.fget(),)
+        )
+    if splitter.split_begs is None:
+        splitter.set_split_extents()
+    ndim = len(splitter.split_shape)
+    axis_bounds = []
+    for d in range(ndim):
+        starts, stops, halos = splitter.calculate_axis_tile_bounds(d)
+        start = int(splitter.array_start[d])
+        axis_bounds.append(
+            [
+                (slice(int(b) - start, int(e) - start), halo.tolist())
+                for b, e, halo in zip(starts, stops, halos)
+            ]
+        )
+    ret = []
+    for multi_index in _np.ndindex(*tuple(splitter.split_shape)):
+        bounds = [axis_bounds[d][multi_index[d]] for d in range(ndim)]
+        ret.append(
+            HaloRegions(
+                ary[tuple(slyce for slyce, _ in bounds)],
+                [halo for _, halo in bounds]
+            )
+        )
+    return ret
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
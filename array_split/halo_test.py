@@ -0,0 +1,122 @@
+"""
+=======================================
+The :mod:`array_split.halo_test` Module
+=======================================
+
+.. currentmodule:: array_split.halo_test
+
+Module defining :mod:`array_split.halo` unit-tests.
+Execute as::
+
+   python -m array_split.halo_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   HaloTest - :obj:`unittest.TestCase` for :mod:`array_split.halo` functions.
+
+
+"""
+from __future__ import absolute_import
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging
+
+from .split import ShapeSplitter, array_split, PERIODIC
+from .halo import HaloRegions, split_tile_regions
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class HaloTest(_unittest.TestCase):
+
+    """
+    Tests for :mod:`array_split.halo` module.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".HaloTest")
+
+    def test_split_tile_regions(self):
+        """
+        Tests :func:`array_split.halo.split_tile_regions` interior and halo regions
+        partition each tile and are views of the array.
+        """
+        ary = _np.arange(0, 13 * 11 * 7).reshape((13, 11, 7))
+        halo = [[1, 2], [0, 1], [2, 2]]
+        splitter = ShapeSplitter(ary.shape, axis=[3, 2, 2], halo=halo, array_start=(4, 0, -1))
+        split = splitter.calculate_split()
+        halos = splitter.calculate_split_halos_from_extents()
+        tiles = array_split(ary, axis=[3, 2, 2], halo=halo)
+        regions = split_tile_regions(ary, splitter)
+        self.assertEqual(split.size, len(regions))
+        for rank, tile_regions in enumerate(regions):
+            multi_index = _np.unravel_index(rank, split.shape)
+            self.assertTrue(_np.all(tiles[rank] == tile_regions.tile))
+            self.assertTrue(
+                _np.all(_np.array(halos[multi_index].tolist()) == tile_regions.halo)
+            )
+            counts = _np.zeros(tile_regions.tile.shape, dtype="int64")
+            count_regions = HaloRegions(counts, tile_regions.halo)
+            count_regions.interior[...] += 1
+            for side, view in count_regions.halo_regions():
+                view[...] += 1
+            self.assertTrue(_np.all(counts == 1))
+
+            self.assertTrue(_np.shares_memory(ary, tile_regions.interior))
+            num_faces = int(_np.sum(tile_regions.halo > 0))
+            self.assertEqual(num_faces, len(tile_regions.faces()))
+            for side, view in tile_regions.faces() + tile_regions.edges():
+                self.assertTrue(_np.shares_memory(ary, view))
+            for side, view in tile_regions.corners():
+                self.assertEqual(3, sum([s != 0 for s in side]))
+            self.assertEqual(
+                len(tile_regions.halo_regions()),
+                len(tile_regions.faces()) + len(tile_regions.edges())
+                +
+                len(tile_regions.corners())
+            )
+
+    def test_halo_regions(self):
+        """
+        Tests :obj:`array_split.halo.HaloRegions` region slices.
+        """
+        tile = _np.arange(0, 5 * 6).reshape((5, 6))
+        regions = HaloRegions(tile, [[1, 2], [3, 0]])
+        self.assertSequenceEqual((2, 3), regions.interior.shape)
+        self.assertTrue(_np.all(tile[1:3, 3:] == regions.interior))
+        self.assertTrue(_np.all(tile[3:, :3] == regions.region((1, -1))))
+        self.assertEqual(0, regions.region((0, 1)).size)
+        self.assertSequenceEqual(
+            [(-1, 0), (0, -1), (1, 0)],
+            [side for side, view in regions.faces()]
+        )
+        self.assertSequenceEqual(
+            [(-1, -1), (1, -1)],
+            [side for side, view in regions.corners()]
+        )
+        self.assertRaises(ValueError, HaloRegions, tile, [[1, 2]])
+        self.assertRaises(ValueError, HaloRegions, tile, [[3, 3], [0, 0]])
+        self.assertRaises(ValueError, regions.region, (0, 0, 0))
+        self.assertRaises(
+            ValueError,
+            split_tile_regions,
+            tile,
+            ShapeSplitter(tile.shape, 2, halo=1, tile_bounds_policy=PERIODIC)
+        )
+        self.assertRaises(ValueError, split_tile_regions, tile, ShapeSplitter((5, 7), 2))
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+_unittest.main(__name__)
@@ -0,0 +1,695 @@
+"""
+==================================
+The :mod:`array_split.host` Module
+==================================
+
+.. currentmodule:: array_split.host
+
+Detection of the resources of the current host which are relevant to choosing
+a split: the number of CPUs usable by this process (scheduling affinity and
+the cgroup CPU quota of the container) and the CPU cache sizes.
+The :func:`auto_split` function uses these to choose a split whose tile count
+is a multiple of the number of workers and whose tiles fit in the cache.
+All :samp:`/proc` and :samp:`/sys` reads fall back gracefully
+(e.g. on non-Linux platforms) to :func:`multiprocessing.cpu_count`
+and :data:`DEFAULT_CACHE_SIZES`.
+
+Example::
+
+   >>> host = HostInfo(num_cpus=6, cache_sizes={1: 32 * 1024, 2: 1024 * 1024})
+   >>> auto = auto_split((1000, 1000), 8, host=host)
+   >>> auto.num_workers, auto.num_tiles, auto.splitter.split_shape.tolist()
+   (6, 24, [6, 4])
+   >>> print(auto.explain())
+   num_workers=6 (host usable CPUs).
+   max_tile_bytes=1048576 (level 2 cache).
+   min_num_tiles=24 (4 tiles per worker).
+   num_tiles=24, split_shape=[6, 4] (multiple of 6 workers), largest tile 334000 bytes.
+
+Classes and Functions
+=====================
+
+.. autosummary::
+   :toctree: generated/
+
+   HostInfo - Usable CPU count and cache sizes of a host.
+   detect_host - Returns the :obj:`HostInfo` of the current host.
+   affinity_cpu_count - Returns the number of CPUs in the scheduling affinity mask.
+   cgroup_cpu_quota - Returns the cgroup (v1 or v2) CPU quota of this process.
+   usable_cpu_count - Returns the number of CPUs usable by this process.
+   cache_sizes - Returns the per-level (data/unified) CPU cache sizes.
+   parse_size - Converts a :samp:`"48K"` style size string to bytes.
+   parse_cpu_list - Converts a :samp:`"0-3,8"` style CPU list string to a list.
+   numa_nodes - Returns the CPUs of each NUMA node usable by this process.
+   set_thread_cpu_affinity - Pins the calling thread to a set of CPUs.
+   AutoSplit - The split chosen by :func:`auto_split` and the reasons.
+   auto_split - Chooses a split for the host worker count and cache size.
+
+Attributes
+==========
+
+.. autodata:: DEFAULT_CACHE_SIZES
+.. autodata:: DEFAULT_TILES_PER_WORKER
+.. autodata:: DEFAULT_MIN_TILE_BYTES
+
+"""
+from __future__ import absolute_import
+import os as _os
+import math as _math
+import multiprocessing as _multiprocessing
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import logging as _logging
+from .split import ShapeSplitter as _ShapeSplitter
+from .split import calculate_num_slices_per_axis as _calculate_num_slices_per_axis
+from .split import convert_halo_to_array_form as _convert_halo_to_array_form
+from .split import calculate_tile_shape_for_max_bytes as _calculate_tile_shape_for_max_bytes
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+#: Per-level (bytes) cache sizes assumed when the host cache sizes can not be read.
+DEFAULT_CACHE_SIZES = {1: 32 * 1024, 2: 512 * 1024, 3: 8 * 1024 * 1024}
+
+#: Default minimum number of tiles per worker for :func:`auto_split` (load balance).
+DEFAULT_TILES_PER_WORKER = 4
+
+#: Default minimum tile bytes for :func:`auto_split` (amortizes per-tile overhead).
+DEFAULT_MIN_TILE_BYTES = 64 * 1024
+
+#: Directory of the per-index CPU cache descriptions (Linux sysfs).
+_CPU_CACHE_DIR = "/sys/devices/system/cpu/cpu0/cache"
+
+#: Directory of the NUMA node descriptions (Linux sysfs).
+_NODE_DIR = "/sys/devices/system/node"
+
+#: Mount point of the cgroup file system.
+_CGROUP_ROOT = "/sys/fs/cgroup"
+
+#: The cgroup membership file of this process.
+_PROC_SELF_CGROUP = "/proc/self/cgroup"
+
+#: :func:`os.sysconf` names of the per-level cache sizes (glibc).
+_SYSCONF_CACHE_NAMES = \
+    {1: "SC_LEVEL1_DCACHE_SIZE", 2: "SC_LEVEL2_CACHE_SIZE", 3: "SC_LEVEL3_CACHE_SIZE"}
+
+
+def _read_text(file_name):
+    """
+    Returns the stripped contents of text file :samp:`{file_name}`,
+    :samp:`None` if the file can not be read.
+    """
+    try:
+        with open(file_name, "r") as f:
+            return f.read().strip()
+    except (IOError, OSError):
+        return None
+
+
+def parse_size(size):
+    """
+    Converts a sysfs style size string (e.g. :samp:`"48K"`, :samp:`"32M"`) to bytes.
+
+    :type size: :obj:`str`
+    :param size: Size string, integer with optional :samp:`K`, :samp:`M`
+       or :samp:`G` (binary) suffix.
+    :rtype: :obj:`int`
+    :return: Number of bytes.
+    :raises ValueError: If :samp:`{size}` can not be parsed.
+
+    Example::
+
+       >>> parse_size("48K"), parse_size("2M"), parse_size("512")
+       (49152, 2097152, 512)
+    """
+    multipliers = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    text = size.strip().upper()
+    if text.endswith("B"):
+        text = text[:-1]
+    multiplier = 1
+    if (len(text) > 0) and (text[-1] in multipliers):
+        multiplier = multipliers[text[-1]]
+        text = text[:-1]
+    try:
+        return int(text) * multiplier
+    except ValueError:
+        raise ValueError("Got size=%r, should be integer with optional K, M or G suffix." % size)
+
+
+def parse_cpu_list(text):
+    """
+    Converts a sysfs/cpuset style CPU list string to a sorted list of CPU indices.
+
+    :type text: :obj:`str`
+    :param text: Comma separated CPU indices and (inclusive) index ranges.
+    :rtype: :obj:`list`
+    :return: Sorted list of :obj:`int` CPU indices.
+    :raises ValueError: If :samp:`{text}` can not be parsed.
+
+    Example::
+
+       >>> parse_cpu_list("0-3,8,10-11")
+       [0, 1, 2, 3, 8, 10, 11]
+    """
+    cpus = set()
+    for item in text.strip().split(","):
+        item = item.strip()
+        if len(item) <= 0:
+            continue
+        try:
+            if "-" in item:
+                first, last = item.split("-", 1)
+                cpus.update(range(int(first), int(last) + 1))
+            else:
+                cpus.add(int(item))
+        except ValueError:
+            raise ValueError("Got CPU list %r, should be like \"0-3,8\"." % text)
+    return sorted(cpus)
+
+
+def affinity_cpu_count():
+    """
+    Returns the number of CPUs in the scheduling affinity mask of this
+    process (:func:`os.sched_getaffinity`), :samp:`None` where unsupported.
+
+    :rtype: :obj:`int`
+    :return: Number of CPUs, or :samp:`None`.
+    """
+    if hasattr(_os, "sched_getaffinity"):
+        return len(_os.sched_getaffinity(0))
+    return None
+
+
+def cgroup_cpu_quota(cgroup_root=_CGROUP_ROOT, proc_self_cgroup=_PROC_SELF_CGROUP):
+    """
+    Returns the CPU quota (bandwidth limit, in CPUs) of the cgroup of this process.
+    Reads the cgroup-v2 :samp:`cpu.max` file, or the cgroup-v1
+    :samp:`cpu.cfs_quota_us` and :samp:`cpu.cfs_period_us` files, of
+    the process cgroup (from :samp:`{proc_self_cgroup}`) and of the cgroup root.
+
+    :type cgroup_root: :obj:`str`
+    :param cgroup_root: Mount point of the cgroup file system.
+    :type proc_self_cgroup: :obj:`str`
+    :param proc_self_cgroup: The cgroup membership file of the process.
+    :rtype: :obj:`float`
+    :return: The CPU quota (e.g. :samp:`2.5` CPUs), :samp:`None` if there
+       is no quota or it can not be determined.
+    """
+    v2_paths = []
+    v1_paths = []
+    membership = _read_text(proc_self_cgroup)
+    if membership is not None:
+        for line in membership.splitlines():
+            fields = line.split(":", 2)
+            if len(fields) != 3:
+                continue
+            hierarchy_id, controllers, path = fields
+            path = path.lstrip("/")
+            if (hierarchy_id == "0") and (controllers == ""):
+                v2_paths.append(_os.path.join(cgroup_root, path))
+            elif "cpu" in controllers.split(","):
+                for mount in (controllers, "cpu", "cpu,cpuacct"):
+                    v1_paths.append(_os.path.join(cgroup_root, mount, path))
+    v2_paths.append(cgroup_root)
+    v1_paths.extend([_os.path.join(cgroup_root, "cpu"), _os.path.join(cgroup_root, "cpu,cpuacct")])
+
+    for path in v2_paths:
+        text = _read_text(_os.path.join(path, "cpu.max"))
+        if text is not None:
+            fields = text.split()
+            if (len(fields) == 2) and (fields[0] != "max") and (int(fields[1]) > 0):
+                return int(fields[0]) / float(fields[1])
+            return None
+    for path in v1_paths:
+        quota = _read_text(_os.path.join(path, "cpu.cfs_quota_us"))
+        period = _read_text(_os.path.join(path, "cpu.cfs_period_us"))
+        if (quota is not None) and (period is not None):
+            if (int(quota) > 0) and (int(period) > 0):
+                return int(quota) / float(period)
+            return None
+    return None
+
+
+def usable_cpu_count(cpu_quota=None, affinity_cpus=None):
+    """
+    Returns the number of CPUs usable by this process, the minimum of the affinity
+    mask CPU count and the (rounded up) cgroup CPU quota, falling back
+    to :func:`multiprocessing.cpu_count`.
+
+    :type cpu_quota: :samp:`None` or :obj:`float`
+    :param cpu_quota: The CPU quota, see :func:`cgroup_cpu_quota`.
+    :type affinity_cpus: :samp:`None` or :obj:`int`
+    :param affinity_cpus: The affinity CPU count, see :func:`affinity_cpu_count`.
+    :rtype: :obj:`int`
+    :return: Positive number of usable CPUs.
+
+    Example::
+
+       >>> usable_cpu_count(cpu_quota=2.5, affinity_cpus=8)
+       3
+       >>> usable_cpu_count(cpu_quota=None, affinity_cpus=8)
+       8
+    """
+    counts = []
+    if affinity_cpus is not None:
+        counts.append(affinity_cpus)
+    else:
+        counts.append(_multiprocessing.cpu_count())
+    if cpu_quota is not None:
+        counts.append(int(_math.ceil(cpu_quota)))
+    return max([1, min(counts)])
+
+
+def numa_nodes(node_dir=_NODE_DIR, affinity_cpus=None):
+    """
+    Returns the CPUs of each (online) NUMA node, restricted to the CPUs in the
+    scheduling affinity mask of this process, read from the sysfs
+    :samp:`{node_dir}/node*/cpulist` files. Nodes without usable CPUs are omitted.
+    When the topology can not be read (e.g. non-Linux platforms)
+    a single node :samp:`0` with all the usable CPUs is returned.
+
+    :type node_dir: :obj:`str`
+    :param node_dir: The sysfs directory of the node descriptions.
+    :type affinity_cpus: :samp:`None` or sequence of :obj:`int`
+    :param affinity_cpus: The usable CPU indices, if :samp:`None`
+       uses :func:`os.sched_getaffinity` (where supported).
+    :rtype: :obj:`dict`
+    :return: Dictionary of :samp:`(node_id, cpu_list)` items.
+    """
+    if (affinity_cpus is None) and hasattr(_os, "sched_getaffinity"):
+        affinity_cpus = _os.sched_getaffinity(0)
+    if affinity_cpus is None:
+        affinity_cpus = range(_multiprocessing.cpu_count())
+    affinity_cpus = set(affinity_cpus)
+
+    online = _read_text(_os.path.join(node_dir, "online"))
+    node_ids = []
+    if online is not None:
+        try:
+            node_ids = parse_cpu_list(online)
+        except ValueError:
+            node_ids = []
+    nodes = {}
+    for node_id in node_ids:
+        cpu_list = _read_text(_os.path.join(node_dir, "node%d" % node_id, "cpulist"))
+        if cpu_list is None:
+            continue
+        try:
+            cpus = [cpu for cpu in parse_cpu_list(cpu_list) if cpu in affinity_cpus]
+        except ValueError:
+            continue
+        if len(cpus) > 0:
+            nodes[node_id] = cpus
+    if len(nodes) <= 0:
+        nodes = {0: sorted(affinity_cpus)}
+    return nodes
+
+
+def set_thread_cpu_affinity(cpus):
+    """
+    Restricts the calling thread to run on :samp:`{cpus}`
+    (:func:`os.sched_setaffinity` of thread id :samp:`0`).
+
+    :type cpus: sequence of :obj:`int`
+    :param cpus: CPU indices.
+    :rtype: :obj:`bool`
+    :return: :samp:`True` if the affinity was set, :samp:`False` if unsupported or denied.
+    """
+    if hasattr(_os, "sched_setaffinity"):
+        try:
+            _os.sched_setaffinity(0, cpus)
+            return True
+        except (OSError, ValueError):
+            pass
+    return False
+
+
+def cache_sizes(cache_dir=_CPU_CACHE_DIR):
+    """
+    Returns the per-level data (or unified) cache sizes of the first CPU,
+    read from the sysfs :samp:`{cache_dir}/index*/{{level,type,size}}` files,
+    falling back to :func:`os.sysconf` values where available.
+
+    :type cache_dir: :obj:`str`
+    :param cache_dir: The sysfs directory of the cache descriptions.
+    :rtype: :obj:`dict`
+    :return: Dictionary of :samp:`(level, size_bytes)` items, empty
+       when the cache sizes can not be determined.
+    """
+    sizes = {}
+    try:
+        index_names = sorted(n for n in _os.listdir(cache_dir) if n.startswith("index"))
+    except (IOError, OSError):
+        index_names = []
+    for index_name in index_names:
+        index_dir = _os.path.join(cache_dir, index_name)
+        level = _read_text(_os.path.join(index_dir, "level"))
+        cache_type = _read_text(_os.path.join(index_dir, "type"))
+        size = _read_text(_os.path.join(index_dir, "size"))
+        if (level is None) or (size is None) or (cache_type == "Instruction"):
+            continue
+        try:
+            sizes[int(level)] = parse_size(size)
+        except ValueError:
+            continue
+    if (len(sizes) <= 0) and hasattr(_os, "sysconf"):
+        for level, name in _SYSCONF_CACHE_NAMES.items():
+            try:
+                size = _os.sysconf(name)
+            except (ValueError, OSError):
+                continue
+            if size > 0:
+                sizes[level] = size
+    return sizes
+
+
+class HostInfo(object):
+
+    """
+    The usable CPU count and the cache sizes of a host, see :func:`detect_host`.
+    """
+
+    def __init__(
+        self,
+        num_cpus,
+        cache_sizes=None,
+        affinity_cpus=None,
+        cpu_quota=None
+    ):
+        """
+        Initialise, see the attribute descriptions for the parameters.
+        """
+        if num_cpus < 1:
+            raise ValueError("Got num_cpus=%s, should be positive." % (num_cpus,))
+        #: The number of CPUs usable by this process.
+        self.num_cpus = int(num_cpus)
+        #: Dictionary of :samp:`(level, size_bytes)` data/unified cache sizes.
+        self.cache_sizes = dict(cache_sizes) if cache_sizes is not None else {}
+        #: Number of CPUs in the scheduling affinity mask (:samp:`None` if unknown).
+        self.affinity_cpus = affinity_cpus
+        #: The cgroup CPU quota (:samp:`None` if unlimited or unknown).
+        self.cpu_quota = cpu_quota
+
+    def cache_size(self, level):
+        """
+        Returns the size of the level :samp:`{level}` cache, falling back
+        to :data:`DEFAULT_CACHE_SIZES` when the size is unknown.
+
+        :type level: :obj:`int`
+        :param level: The cache level (:samp:`1`, :samp:`2` or :samp:`3`).
+        :rtype: :obj:`int`
+        :return: The cache size (bytes).
+        """
+        if level in self.cache_sizes:
+            return self.cache_sizes[level]
+        if level not in DEFAULT_CACHE_SIZES:
+            raise ValueError(
+                "Got level=%s, should be one of %s." % (level, sorted(DEFAULT_CACHE_SIZES.keys()))
+            )
+        return DEFAULT_CACHE_SIZES[level]
+
+    def __repr__(self):
+        """
+        Returns string representation.
+        """
+        return \
+            "HostInfo(num_cpus=%r, cache_sizes=%r, affinity_cpus=%r, cpu_quota=%r)" % (
+                self.num_cpus,
+                self.cache_sizes,
+                self.affinity_cpus,
+                self.cpu_quota
+            )
+
+
+def detect_host():
+    """
+    Returns the :obj:`HostInfo` of the current host (and process).
+
+    :rtype: :obj:`HostInfo`
+    :return: The detected host resources.
+    """
+    affinity_cpus = affinity_cpu_count()
+    cpu_quota = cgroup_cpu_quota()
+    return \
+        HostInfo(
+            num_cpus=usable_cpu_count(cpu_quota=cpu_quota, affinity_cpus=affinity_cpus),
+            cache_sizes=cache_sizes(),
+            affinity_cpus=affinity_cpus,
+            cpu_quota=cpu_quota
+        )
+
+
+class AutoSplit(object):
+
+    """
+    The split chosen by :func:`auto_split`, with the reasons for the choice.
+    """
+
+    def __init__(self, splitter, num_workers, max_tile_bytes, host, reasons):
+        """
+        Initialise, see the attribute descriptions for the parameters.
+        """
+        #: The :obj:`array_split.ShapeSplitter` defining the chosen split.
+        self.splitter = splitter
+        #: The number of workers the split was chosen for.
+        self.num_workers = num_workers
+        #: The (haloed) tile byte budget (cache size).
+        self.max_tile_bytes = max_tile_bytes
+        #: The :obj:`HostInfo` used for the choice.
+        self.host = host
+        #: List of :obj:`str` explaining the choice.
+        self.reasons = reasons
+
+    @property
+    def num_tiles(self):
+        """
+        The number of tiles of the chosen split.
+        """
+        return int(_np.prod(self.splitter.split_shape))
+
+    def calculate_split(self):
+        """
+        Returns :samp:`self.splitter.calculate_split()`.
+
+        :rtype: :obj:`numpy.ndarray`
+        :return: The split, see :meth:`array_split.ShapeSplitter.calculate_split`.
+        """
+        return self.splitter.calculate_split()
+
+    def explain(self):
+        """
+        Returns the (multi-line) explanation of the choice.
+
+        :rtype: :obj:`str`
+        :return: The :attr:`reasons`, one per line.
+        """
+        return "\n".join(self.reasons)
+
+
+def _largest_tile_bytes(array_shape, split_shape, array_itemsize, halo):
+    """
+    Returns the bytes of the largest (haloed) tile of a :samp:`{split_shape}` split.
+    """
+    tile_shape = ((array_shape - 1) // split_shape) + 1
+    return int(_np.prod(tile_shape + _np.sum(halo, axis=1))) * int(array_itemsize)
+
+
+def auto_split(
+    array_shape,
+    array_itemsize,
+    num_workers=None,
+    tiles_per_worker=DEFAULT_TILES_PER_WORKER,
+    max_tile_bytes=None,
+    cache_level=2,
+    min_tile_bytes=DEFAULT_MIN_TILE_BYTES,
+    halo=None,
+    host=None
+):
+    """
+    Chooses a split of :samp:`{array_shape}` for the workers (CPUs) and cache
+    of the current host. The number of tiles is a multiple of the number of workers
+    (at least :samp:`{tiles_per_worker}` tiles per worker) such that the (haloed)
+    tiles fit in the cache, without tiles smaller than :samp:`{min_tile_bytes}`.
+    When these constraints conflict, the cache budget takes precedence over
+    the minimum tile bytes, which takes precedence over the tiles per worker.
+    When no multiple of the worker count gives tiles within the cache budget
+    (e.g. thin axes), the split falls back to the tile shape resolved
+    by :func:`array_split.split.calculate_tile_shape_for_constraints`.
+
+    :type array_shape: sequence of :obj:`int`
+    :param array_shape: Shape of the array to be split.
+    :type array_itemsize: :obj:`int`
+    :param array_itemsize: Number of bytes per array element.
+    :type num_workers: :samp:`None` or :obj:`int`
+    :param num_workers: Number of workers, if :samp:`None` uses
+       the :attr:`HostInfo.num_cpus` usable CPUs of :samp:`{host}`.
+    :type tiles_per_worker: :obj:`int`
+    :param tiles_per_worker: Minimum number of tiles per worker.
+    :type max_tile_bytes: :samp:`None` or :obj:`int`
+    :param max_tile_bytes: The tile byte budget, if :samp:`None` uses the size of
+       the level :samp:`{cache_level}` cache of :samp:`{host}`.
+    :type cache_level: :obj:`int`
+    :param cache_level: The cache level which tiles should fit.
+    :type min_tile_bytes: :obj:`int`
+    :param min_tile_bytes: Minimum (non-haloed) tile bytes.
+    :type halo: :samp:`None`, :obj:`int`, sequence of :obj:`int`, or :samp:`(ndim, 2)`
+       shaped :obj:`numpy.ndarray`
+    :param halo: Tile halo, counts towards the tile bytes.
+    :type host: :samp:`None` or :obj:`HostInfo`
+    :param host: Host resources, if :samp:`None` uses :func:`detect_host`.
+    :rtype: :obj:`AutoSplit`
+    :return: The chosen split and the explanation of the choice.
+    :raises ValueError: If :samp:`{num_workers}` or :samp:`{tiles_per_worker}` is not
+       positive, or a single element (haloed) tile exceeds :samp:`{max_tile_bytes}`.
+    """
+    logger = _logging.getLogger(__name__ + ".auto_split")
+    reasons = []
+    if host is None:
+        host = detect_host()
+    if num_workers is None:
+        num_workers = host.num_cpus
+        reasons.append("num_workers=%s (host usable CPUs)." % num_workers)
+    else:
+        reasons.append("num_workers=%s (specified)." % num_workers)
+    if num_workers < 1:
+        raise ValueError("Got num_workers=%s, should be positive." % (num_workers,))
+    if tiles_per_worker < 1:
+        raise ValueError("Got tiles_per_worker=%s, should be positive." % (tiles_per_worker,))
+    if max_tile_bytes is None:
+        max_tile_bytes = host.cache_size(cache_level)
+        reasons.append("max_tile_bytes=%s (level %s cache)." % (max_tile_bytes, cache_level))
+    else:
+        reasons.append("max_tile_bytes=%s (specified)." % max_tile_bytes)
+
+    array_shape = _np.array(array_shape, dtype="int64")
+    halo = _convert_halo_to_array_form(halo, ndim=len(array_shape))
+    num_elements = int(_np.prod(array_shape))
+    array_bytes = num_elements * int(array_itemsize)
+    min_num_tiles = tiles_per_worker * num_workers
+    reasons.append("min_num_tiles=%s (%s tiles per worker)." % (min_num_tiles, tiles_per_worker))
+
+    # Tile count bounds from the cache budget and from the minimum tile bytes.
+    cache_num_tiles = max([1, -(-array_bytes // max_tile_bytes)])
+    max_num_tiles = max([1, min([num_elements, array_bytes // max([1, min_tile_bytes])])])
+    num_tiles = max([cache_num_tiles, min([min_num_tiles, max_num_tiles])])
+    if num_tiles < min_num_tiles:
+        reasons.append(
+            "num_tiles reduced to %s so tiles are at least min_tile_bytes=%s."
+            %
+            (num_tiles, min_tile_bytes)
+        )
+    if num_tiles >= num_workers:
+        up = -(-num_tiles // num_workers) * num_workers
+        down = (num_tiles // num_workers) * num_workers
+        if (up <= max_num_tiles) or (down < cache_num_tiles):
+            num_tiles = up
+        else:
+            num_tiles = down
+
+    # Smallest possible (single element, array bounded halo) tile must fit the budget.
+    halo_sizes = _np.sum(halo, axis=1)
+    min_tile_bytes_needed = \
+        int(_np.prod(_np.minimum(1 + halo_sizes, array_shape))) * int(array_itemsize)
+    if min_tile_bytes_needed > max_tile_bytes:
+        raise ValueError(
+            "Got max_tile_bytes=%s, should be at least %s (single element tile with halo=%s)."
+            %
+            (max_tile_bytes, min_tile_bytes_needed, halo.tolist())
+        )
+
+    # Upper limit on the tile count, the count of the (greedy) tile shape which fits.
+    try:
+        fit_tile_shape = \
+            _calculate_tile_shape_for_max_bytes(
+                array_shape, array_itemsize, max_tile_bytes, halo=halo
+            )
+        max_candidate = int(_np.prod(((array_shape - 1) // fit_tile_shape) + 1))
+    except ValueError:
+        max_candidate = num_elements
+    max_candidate = min([num_elements, max([num_tiles, max_candidate])])
+
+    # Increase the count (in multiples of the workers) until the tiles fit the budget,
+    # the step grows with the count so the number of steps is logarithmic.
+    split_shape = None
+    candidate = num_tiles
+    base_step = num_workers if (num_tiles % num_workers) == 0 else 1
+    while candidate <= max_candidate:
+        try:
+            shape = \
+                _calculate_num_slices_per_axis([0, ] * len(array_shape), candidate, array_shape)
+        except ValueError:
+            shape = None
+        if (
+            (shape is not None)
+            and
+            (_np.prod(shape) == candidate)
+            and
+            _np.all(shape <= array_shape)
+            and
+            (_largest_tile_bytes(array_shape, shape, array_itemsize, halo) <= max_tile_bytes)
+        ):
+            split_shape = _np.array(shape, dtype="int64")
+            break
+        candidate += max([base_step, ((candidate // 64) // base_step) * base_step])
+
+    if split_shape is not None:
+        splitter = \
+            _ShapeSplitter(
+                array_shape,
+                axis=split_shape.tolist(),
+                array_itemsize=array_itemsize,
+                halo=halo
+            )
+        splitter.set_split_shape()
+        multiple = \
+            "multiple of %s workers" % num_workers \
+            if (candidate % num_workers) == 0 else \
+            "fewer tiles than %s workers" % num_workers
+        reasons.append(
+            "num_tiles=%s, split_shape=%s (%s), largest tile %s bytes."
+            %
+            (
+                candidate,
+                split_shape.tolist(),
+                multiple,
+                _largest_tile_bytes(array_shape, split_shape, array_itemsize, halo)
+            )
+        )
+    else:
+        logger.debug("No worker multiple tile count fits max_tile_bytes=%s.", max_tile_bytes)
+        splitter = \
+            _ShapeSplitter(
+                array_shape,
+                array_itemsize=array_itemsize,
+                max_tile_bytes=max_tile_bytes,
+                min_num_tiles=min_num_tiles,
+                min_tile_bytes=min_tile_bytes,
+                halo=halo
+            )
+        splitter.set_split_shape()
+        reasons.append(
+            (
+                "num_tiles=%s, split_shape=%s (no multiple of %s workers fits max_tile_bytes, "
+                +
+                "tile_shape=%s binding %s, relaxed %s)."
+            )
+            %
+            (
+                int(_np.prod(splitter.split_shape)),
+                splitter.split_shape.tolist(),
+                num_workers,
+                splitter.tile_shape.tolist(),
+                list(splitter.binding_constraints),
+                list(splitter.relaxed_constraints)
+            )
+        )
+    for reason in reasons:
+        logger.debug(reason)
+
+    return AutoSplit(splitter, num_workers, max_tile_bytes, host, reasons)
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
@@ -0,0 +1,232 @@
+"""
+=======================================
+The :mod:`array_split.host_test` Module
+=======================================
+
+.. currentmodule:: array_split.host_test
+
+Module defining :mod:`array_split.host` unit-tests.
+Execute as::
+
+   python -m array_split.host_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   HostTest - :obj:`unittest.TestCase` for :mod:`array_split.host` functions.
+
+
+"""
+from __future__ import absolute_import
+import os as _os
+import shutil as _shutil
+import tempfile as _tempfile
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging
+
+from .host import HostInfo, detect_host, cgroup_cpu_quota, usable_cpu_count, cache_sizes
+from .host import parse_size, auto_split, parse_cpu_list, numa_nodes, set_thread_cpu_affinity
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class HostTest(_unittest.TestCase):
+
+    """
+    Tests for :mod:`array_split.host` module.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".HostTest")
+
+    def setUp(self):
+        """
+        Creates temporary directory for the fake :samp:`/sys` and :samp:`/proc` files.
+        """
+        self.tmp_dir = _tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Removes the temporary directory.
+        """
+        _shutil.rmtree(self.tmp_dir)
+
+    def write_file(self, relative_name, text):
+        """
+        Writes :samp:`{text}` to file :samp:`{relative_name}` in the temporary directory.
+        """
+        file_name = _os.path.join(self.tmp_dir, relative_name)
+        if not _os.path.exists(_os.path.dirname(file_name)):
+            _os.makedirs(_os.path.dirname(file_name))
+        with open(file_name, "w") as f:
+            f.write(text)
+        return file_name
+
+    def test_parse_size(self):
+        """
+        Test for :func:`array_split.host.parse_size`.
+        """
+        self.assertEqual(49152, parse_size("48K"))
+        self.assertEqual(110100480, parse_size("107520K\n"))
+        self.assertEqual(3 * 1024 ** 3, parse_size("3G"))
+        self.assertEqual(64, parse_size("64"))
+        self.assertRaises(ValueError, parse_size, "lots")
+
+    def test_cgroup_cpu_quota(self):
+        """
+        Test for :func:`array_split.host.cgroup_cpu_quota`, cgroup v1 and v2 layouts.
+        """
+        cgroup_root = _os.path.join(self.tmp_dir, "cgroup")
+
+        # No files, no quota.
+        self.assertEqual(None, cgroup_cpu_quota(cgroup_root, _os.path.join(self.tmp_dir, "x")))
+
+        # cgroup v2, unlimited and limited.
+        proc_self_cgroup = self.write_file("v2_cgroup", "0::/job.slice/job-1\n")
+        self.write_file("cgroup/job.slice/job-1/cpu.max", "max 100000\n")
+        self.assertEqual(None, cgroup_cpu_quota(cgroup_root, proc_self_cgroup))
+        self.write_file("cgroup/job.slice/job-1/cpu.max", "250000 100000\n")
+        self.assertAlmostEqual(2.5, cgroup_cpu_quota(cgroup_root, proc_self_cgroup))
+
+        # cgroup v1.
+        _shutil.rmtree(cgroup_root)
+        proc_self_cgroup = \
+            self.write_file("v1_cgroup", "4:memory:/docker/abc\n2:cpu,cpuacct:/docker/abc\n")
+        self.write_file("cgroup/cpu,cpuacct/docker/abc/cpu.cfs_quota_us", "-1\n")
+        self.write_file("cgroup/cpu,cpuacct/docker/abc/cpu.cfs_period_us", "100000\n")
+        self.assertEqual(None, cgroup_cpu_quota(cgroup_root, proc_self_cgroup))
+        self.write_file("cgroup/cpu,cpuacct/docker/abc/cpu.cfs_quota_us", "400000\n")
+        self.assertAlmostEqual(4.0, cgroup_cpu_quota(cgroup_root, proc_self_cgroup))
+
+    def test_usable_cpu_count(self):
+        """
+        Test for :func:`array_split.host.usable_cpu_count`.
+        """
+        self.assertEqual(3, usable_cpu_count(cpu_quota=2.1, affinity_cpus=8))
+        self.assertEqual(2, usable_cpu_count(cpu_quota=16.0, affinity_cpus=2))
+        self.assertEqual(1, usable_cpu_count(cpu_quota=0.5, affinity_cpus=2))
+        self.assertTrue(usable_cpu_count() >= 1)
+
+    def test_numa_nodes(self):
+        """
+        Test for :func:`array_split.host.numa_nodes` and :func:`array_split.host.parse_cpu_list`.
+        """
+        self.assertEqual([0, 1, 2, 5, 7, 8], parse_cpu_list("0-2, 5,7-8\n"))
+        self.assertEqual([], parse_cpu_list(""))
+        self.assertRaises(ValueError, parse_cpu_list, "0-x")
+
+        node_dir = _os.path.join(self.tmp_dir, "node")
+        self.write_file("node/online", "0-1\n")
+        self.write_file("node/node0/cpulist", "0-3,8-11\n")
+        self.write_file("node/node1/cpulist", "4-7,12-15\n")
+        self.assertEqual(
+            {0: [0, 1, 2, 3, 8, 9, 10, 11], 1: [4, 5, 6, 7, 12, 13, 14, 15]},
+            numa_nodes(node_dir, affinity_cpus=range(16))
+        )
+        self.assertEqual({0: [2, 3]}, numa_nodes(node_dir, affinity_cpus=[2, 3]))
+        self.assertEqual({0: [1], 1: [5]}, numa_nodes(node_dir, affinity_cpus=[1, 5]))
+
+        # Single node fallback.
+        self.assertEqual(
+            {0: [0, 1, 2]},
+            numa_nodes(_os.path.join(self.tmp_dir, "missing"), affinity_cpus=[2, 0, 1])
+        )
+        nodes = numa_nodes()
+        self.logger.info("numa_nodes()=%s", nodes)
+        self.assertTrue(len(nodes) >= 1)
+        self.assertTrue(set_thread_cpu_affinity([-1]) is False)
+
+    def test_cache_sizes(self):
+        """
+        Test for :func:`array_split.host.cache_sizes` and :meth:`HostInfo.cache_size`.
+        """
+        for index, (level, cache_type, size) in \
+                enumerate([(1, "Data", "48K"), (1, "Instruction", "32K"), (2, "Unified", "2048K")]):
+            self.write_file("cache/index%d/level" % index, "%d\n" % level)
+            self.write_file("cache/index%d/type" % index, cache_type + "\n")
+            self.write_file("cache/index%d/size" % index, size + "\n")
+        sizes = cache_sizes(_os.path.join(self.tmp_dir, "cache"))
+        self.assertEqual({1: 48 * 1024, 2: 2048 * 1024}, sizes)
+
+        host = HostInfo(4, cache_sizes=sizes)
+        self.assertEqual(2048 * 1024, host.cache_size(2))
+        self.assertEqual(8 * 1024 * 1024, host.cache_size(3))
+        self.assertRaises(ValueError, host.cache_size, 5)
+
+        host = detect_host()
+        self.logger.info("detect_host()=%s", host)
+        self.assertTrue(host.num_cpus >= 1)
+
+    def test_auto_split(self):
+        """
+        Test for :func:`array_split.host.auto_split`.
+        """
+        host = HostInfo(num_cpus=6, cache_sizes={2: 1024 * 1024})
+        for array_shape, itemsize, num_workers, halo in \
+                [
+                    ((1000, 1000), 8, None, None),
+                    ((1000, 1000, 3), 8, 7, None),
+                    ((1000, 1000, 3), 8, 13, 1),
+                    ((512, 512, 512), 4, 64, 2),
+                    ((1, 10 ** 7), 8, 7, None),
+                ]:
+            auto = auto_split(array_shape, itemsize, num_workers=num_workers, host=host, halo=halo)
+            self.logger.info("auto_split(%s):\n%s", array_shape, auto.explain())
+            num_workers = host.num_cpus if num_workers is None else num_workers
+            self.assertEqual(num_workers, auto.num_workers)
+            self.assertEqual(0, auto.num_tiles % num_workers)
+            self.assertTrue(auto.num_tiles >= 4 * num_workers)
+            tile_shape = \
+                ((_np.array(array_shape) - 1) // auto.splitter.split_shape) + 1
+            haloed = tile_shape + (0 if halo is None else 2 * halo)
+            self.assertTrue(_np.prod(haloed) * itemsize <= auto.max_tile_bytes)
+            self.assertTrue(len(auto.reasons) >= 4)
+            split = auto.calculate_split()
+            self.assertEqual(auto.num_tiles, split.size)
+
+        # Small array, min_tile_bytes limits the tile count.
+        auto = auto_split((100, 100), 8, num_workers=16, host=host)
+        self.assertEqual(1, auto.num_tiles)
+        self.assertTrue("min_tile_bytes" in auto.explain())
+        auto = auto_split((100, 100), 8, num_workers=4, min_tile_bytes=8 * 1000, host=host)
+        self.assertEqual(8, auto.num_tiles)
+
+        # No worker multiple fits the budget, falls back to the tile shape constraints.
+        auto = auto_split((7, ), 1, num_workers=2, max_tile_bytes=1, min_tile_bytes=1, host=host)
+        self.logger.info("auto_split((7, )):\n%s", auto.explain())
+        self.assertSequenceEqual([7], auto.splitter.split_shape.tolist())
+        self.assertTrue("no multiple of 2 workers" in auto.explain())
+
+        self.assertRaises(ValueError, auto_split, (10, 10), 1, num_workers=0, host=host)
+
+        # Haloed single element tile exceeds the budget, rejected without searching.
+        for array_shape, halo in [((100, 100), 60), ((1000, 1000), 200)]:
+            self.assertRaises(
+                ValueError,
+                auto_split,
+                array_shape, 8, num_workers=4, max_tile_bytes=64 * 1024, halo=halo, host=host
+            )
+        # Large halo relative to the budget, many tiles.
+        auto = \
+            auto_split(
+                (1000, 1000), 8, num_workers=4, max_tile_bytes=64 * 1024, halo=40, host=host
+            )
+        self.assertEqual(0, auto.num_tiles % 4)
+        tile_shape = ((_np.array((1000, 1000)) - 1) // auto.splitter.split_shape) + 1
+        self.assertTrue(_np.prod(tile_shape + 80) * 8 <= 64 * 1024)
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+_unittest.main(__name__)
@@ -3,28 +3,64 @@ To be replaced.
 """
 # pylint: disable=redefined-builtin
 from __future__ import absolute_import
-import pkg_resources as _pkg_resources
-
-__copyright__ = _pkg_resources.resource_string("array_split", "copyright.txt").decode()
-__license__ = (
-    __copyright__
-    +
-    "\n\n"
-    +
-    _pkg_resources.resource_string("array_split", "license.txt").decode()
-)
+import os as _os
+import sys as _sys
+
 __author__ = "Shane J. Latham"
-__version__ = _pkg_resources.resource_string("array_split", "version.txt").decode().strip()
+
+#: Cache of resource file contents, :samp:`(file_name, text)` items.
+_resource_cache = {}
+
+
+def _read_resource_file(file_name):
+    """
+    Returns the (decoded) contents of the :mod:`array_split` package
+    resource file :samp:`{file_name}`. The file is read from the package
+    directory, falling back to :mod:`importlib.resources` (or :func:`pkgutil.get_data`
+    for older pythons) when the package is not installed as files
+    (e.g. zip-imported). The contents are cached, so each file is read at most once.
+
+    :type file_name: :obj:`str`
+    :param file_name: Name of the resource file.
+    :rtype: :obj:`str`
+    :return: Resource file contents.
+    """
+    if file_name not in _resource_cache:
+        try:
+            with open(
+                _os.path.join(_os.path.dirname(_os.path.abspath(__file__)), file_name),
+                "rb"
+            ) as fp:
+                data = fp.read()
+        except (IOError, OSError):
+            if _sys.version_info >= (3, 9):
+                import importlib.resources as _importlib_resources
+                data = _importlib_resources.files("array_split").joinpath(file_name).read_bytes()
+            else:
+                import pkgutil as _pkgutil
+                data = _pkgutil.get_data("array_split", file_name)
+        _resource_cache[file_name] = data.decode()
+    return _resource_cache[file_name]
 
 
 def version():
     """
-    Returns :mod:`array_split` version string.
+    Returns :mod:`array_split` version string. Read from the :samp:`version.txt`
+    package resource, falling back (python-3.8+) to the installed distribution
+    metadata (:func:`importlib.metadata.version`).
 
     :rtype: :obj:`str`
     :return: Version string.
     """
-    return __version__
+    if "version.txt" not in _resource_cache:
+        try:
+            _read_resource_file("version.txt")
+        except (IOError, OSError):
+            if _sys.version_info < (3, 8):
+                raise
+            import importlib.metadata as _importlib_metadata
+            _resource_cache["version.txt"] = _importlib_metadata.version("array_split")
+    return _resource_cache["version.txt"].strip()
 
 
 def license():
@@ -34,7 +70,7 @@ def license():
     :rtype: :obj:`str`
     :return: License string.
     """
-    return __license__
+    return copyright() + "\n\n" + _read_resource_file("license.txt")
 
 
 def copyright():
@@ -44,9 +80,15 @@ def copyright():
     :rtype: :obj:`str`
     :return: Copyright string.
     """
-    return __copyright__
+    return _read_resource_file("copyright.txt")
 
 
+__copyright__ = copyright()
+__license__ = license()
+__version__ = version()
+
+# The license and copyright text are included by sphinx, rather than
+# being read (and formatted into the doc-string) at import time.
 __doc__ = \
     """
 =====================================
@@ -60,12 +102,12 @@ License and copyright info.
 License
 =======
 
-%s
+.. include:: ../../../array_split/license.txt
 
 Copyright
 =========
 
-%s
+.. include:: ../../../array_split/copyright.txt
 
 Functions
 =========
@@ -77,6 +119,6 @@ Functions
    copyright - Returns :mod:`array_split` copyright string.
    version - Returns :mod:`array_split` version string.
 
-""" % (license(), copyright())
+"""
 
 __all__ = [s for s in dir() if not s.startswith('_')]
@@ -0,0 +1,155 @@
+"""
+===================================
+The :mod:`array_split.merge` Module
+===================================
+
+.. currentmodule:: array_split.merge
+
+Assembly of (processed) tiles into a single array, the inverse
+of :func:`array_split.array_split`. The interior (non-halo) region of each
+tile is copied directly into the corresponding region of a preallocated
+output array (or :obj:`numpy.memmap`), no intermediate
+(e.g. :func:`numpy.block`/:func:`numpy.concatenate`) arrays are created.
+Tiles are copied in parallel using
+a :obj:`array_split.scheduler.WorkStealingScheduler`.
+
+Example::
+
+   >>> import numpy as np
+   >>> from array_split import ShapeSplitter
+   >>> ary = np.arange(0, 48).reshape((6, 8))
+   >>> splitter = ShapeSplitter(ary.shape, axis=[2, 3], halo=1)
+   >>> tiles = [ary[slyce.tolist()] * 10 for slyce in splitter.calculate_split().flatten()]
+   >>> [tile.shape for tile in tiles[0:3]]
+   [(4, 4), (4, 5), (4, 3)]
+   >>> out = array_merge(tiles, splitter)
+   >>> bool(np.all(out == ary * 10))
+   True
+
+Classes and Functions
+=====================
+
+.. autosummary::
+   :toctree: generated/
+
+   array_merge - Copies tile interiors into a (preallocated) array.
+   calculate_merge_slices - Returns per-axis interior slices for merging tiles.
+
+"""
+from __future__ import absolute_import
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from .scheduler import WorkStealingScheduler as _WorkStealingScheduler
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+def calculate_merge_slices(split):
+    """
+    Returns per-axis lists of :samp:`(tile_slice, out_slice, tile_size)` triples,
+    where :samp:`tile_slice` is the interior (halo stripped) region of
+    the :samp:`i`-th tile along axis :samp:`d`, :samp:`out_slice` is the corresponding
+    region of the (whole) array and :samp:`tile_size` is the axis length of
+    the tile (including halo). The halos are
+    those of :meth:`array_split.ShapeSplitter.calculate_split_halos_from_extents`,
+    calculated per-axis (:meth:`array_split.ShapeSplitter.calculate_axis_tile_bounds`).
+
+    :type split: :obj:`array_split.ShapeSplitter` or :obj:`array_split.plan.SplitPlan`
+    :param split: The split which defines the tiles.
+    :rtype: :obj:`list`
+    :return: List, :samp:`d`-th element is the list of :samp:`(tile_slice, out_slice, tile_size)`
+       for the tiles along axis :samp:`d`.
+    """
+    merge_slices = []
+    if hasattr(split, "axis_table"):
+        axis_tables = [split.axis_table(d) for d in range(split.ndim)]
+    else:
+        if split.split_begs is None:
+            split.set_split_extents()
+        axis_tables = []
+        for d in range(len(split.split_shape)):
+            starts, stops, halos = split.calculate_axis_tile_bounds(d)
+            axis_tables.append(
+                _np.column_stack(
+                    (split.split_begs[d], split.split_ends[d], starts, stops, halos)
+                ).astype("int64")
+            )
+    for axis_table in axis_tables:
+        merge_slices.append(
+            [
+                (slice(halo_lo, halo_lo + end - beg), slice(beg, end), stop - start)
+                for beg, end, start, stop, halo_lo, halo_hi in axis_table.tolist()
+            ]
+        )
+    return merge_slices
+
+
+def array_merge(tiles, split, out=None, num_workers=None):
+    """
+    Copies the interior (halo stripped) region of each tile into the
+    corresponding region of :samp:`{out}`.
+
+    :type tiles: sequence of :obj:`numpy.ndarray`
+    :param tiles: The tiles, in C-order of the split
+       (e.g. as returned by :func:`array_split.array_split`), or
+       a :samp:`split_shape` shaped :samp:`object` array of tiles. Tiles
+       must have the shape of the corresponding (halo) tile slice.
+    :type split: :obj:`array_split.ShapeSplitter` or :obj:`array_split.plan.SplitPlan`
+    :param split: The split which defines the tiles.
+    :type out: :samp:`None` or :obj:`numpy.ndarray`
+    :param out: Array (e.g. :obj:`numpy.memmap`) of shape :samp:`{split}.array_shape`,
+       if :samp:`None`, an :func:`numpy.empty` array with the dtype of the first tile
+       is allocated.
+    :type num_workers: :samp:`None` or :obj:`int`
+    :param num_workers: Number of tile copying threads,
+       see :obj:`array_split.scheduler.WorkStealingScheduler`.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The :samp:`{out}` array.
+    :raises ValueError: If the number of tiles, the shape of a tile or
+       the shape of :samp:`{out}` is inconsistent with :samp:`{split}`.
+    """
+    merge_slices = calculate_merge_slices(split)
+    split_shape = tuple(len(axis_slices) for axis_slices in merge_slices)
+    if hasattr(split, "axis_table"):
+        array_shape = tuple(split.parameters["array_shape"])
+    else:
+        array_shape = tuple(split.array_shape.tolist())
+    if isinstance(tiles, _np.ndarray) and (tiles.dtype == _np.dtype("object")):
+        tiles = tiles.flatten().tolist()
+    num_tiles = int(_np.prod(split_shape))
+    if len(tiles) != num_tiles:
+        raise ValueError(
+            "Got len(tiles)=%s, should be the number of tiles in the split %s."
+            %
+            (len(tiles), num_tiles)
+        )
+    if out is None:
+        out = _np.empty(array_shape, dtype=(tiles[0].dtype if num_tiles > 0 else "float64"))
+    elif tuple(out.shape) != array_shape:
+        raise ValueError(
+            "Got out.shape=%s, should be the split array_shape=%s." % (out.shape, array_shape)
+        )
+
+    def copy_tile(rank):
+        tile = tiles[rank]
+        multi_index = _np.unravel_index(rank, split_shape)
+        axis_slices = [merge_slices[d][multi_index[d]] for d in range(len(split_shape))]
+        if tuple(tile.shape) != tuple(tile_size for _, _, tile_size in axis_slices):
+            raise ValueError(
+                "Got tiles[%s].shape=%s, should be %s."
+                %
+                (rank, tile.shape, tuple(tile_size for _, _, tile_size in axis_slices))
+            )
+        out[tuple(out_slice for _, out_slice, _ in axis_slices)] = \
+            tile[tuple(tile_slice for tile_slice, _, _ in axis_slices)]
+
+    _WorkStealingScheduler(split, num_workers=num_workers).map_ranks(copy_tile, num_tiles)
+
+    return out
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
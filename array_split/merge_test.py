@@ -0,0 +1,149 @@
+"""
+========================================
+The :mod:`array_split.merge_test` Module
+========================================
+
+.. currentmodule:: array_split.merge_test
+
+Module defining :mod:`array_split.merge` unit-tests.
+Execute as::
+
+   python -m array_split.merge_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   MergeTest - :obj:`unittest.TestCase` for :mod:`array_split.merge` functions.
+
+
+"""
+from __future__ import absolute_import
+import os as _os
+import tempfile as _tempfile
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging
+
+from .split import ShapeSplitter, array_split, gather_periodic_tile
+from .split import NO_BOUNDS, PERIODIC, ARRAY_BOUNDS
+from .plan import SplitPlan
+from .merge import array_merge
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class MergeTest(_unittest.TestCase):
+
+    """
+    Tests for :mod:`array_split.merge` module.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".MergeTest")
+
+    def test_array_merge_inverts_array_split(self):
+        """
+        Tests :func:`array_split.merge.array_merge` is the inverse
+        of :func:`array_split.array_split`.
+        """
+        ary = _np.random.RandomState(7).uniform(size=(33, 17, 6))
+        for kwargs in \
+                [
+                    {"indices_or_sections": 7},
+                    {"axis": [4, 3, 2], "halo": 2},
+                    {"tile_shape": (8, 5, 4), "halo": [[1, 2], [0, 3], [2, 0]]},
+                    {"max_tile_bytes": 2048, "halo": 1},
+                ]:
+            tiles = array_split(ary, **kwargs)
+            splitter = ShapeSplitter(ary.shape, array_itemsize=ary.itemsize, **kwargs)
+            for num_workers in [1, 4]:
+                out = array_merge(tiles, splitter, num_workers=num_workers)
+                self.assertEqual(ary.dtype, out.dtype)
+                self.assertTrue(_np.all(ary == out))
+
+            # Tiles as split shaped object array, and a SplitPlan
+            plan = SplitPlan.from_splitter(splitter)
+            tile_array = _np.empty((len(tiles),), dtype="object")
+            tile_array[:] = tiles
+            tile_array = tile_array.reshape(plan.split_shape)
+            out = _np.zeros_like(ary)
+            self.assertTrue(out is array_merge(tile_array, plan, out=out))
+            self.assertTrue(_np.all(ary == out))
+
+    def test_array_merge_tile_bounds_policies(self):
+        """
+        Tests :func:`array_split.merge.array_merge` for tiles which extend
+        beyond the array bounds.
+        """
+        ary = _np.arange(0, 20 * 12).reshape((20, 12))
+        for tile_bounds_policy in [ARRAY_BOUNDS, NO_BOUNDS, PERIODIC]:
+            splitter = \
+                ShapeSplitter(
+                    ary.shape,
+                    axis=[3, 2],
+                    halo=2,
+                    tile_bounds_policy=tile_bounds_policy,
+                    array_start=(5, -2)
+                )
+            split = splitter.calculate_split()
+            tiles = []
+            for slyce in split.flatten():
+                slice_tuple = \
+                    tuple(
+                        slice(s.start - splitter.array_start[d], s.stop - splitter.array_start[d])
+                        for d, s in enumerate(slyce.tolist())
+                    )
+                if tile_bounds_policy is ARRAY_BOUNDS:
+                    tiles.append(ary[slice_tuple] + 1)
+                else:
+                    # Pad/wrap to the tile shape, interior is taken from the array.
+                    tiles.append(gather_periodic_tile(ary, slice_tuple) + 1)
+            out = array_merge(tiles, splitter, num_workers=3)
+            self.assertTrue(_np.all(ary + 1 == out))
+
+    def test_array_merge_memmap(self):
+        """
+        Tests :func:`array_split.merge.array_merge` into a :obj:`numpy.memmap`.
+        """
+        ary = _np.arange(0, 50 * 40, dtype="int32").reshape((50, 40))
+        splitter = ShapeSplitter(ary.shape, tile_shape=(16, 16), halo=1)
+        fd, file_name = _tempfile.mkstemp(suffix=".dat")
+        _os.close(fd)
+        try:
+            out = _np.memmap(file_name, dtype="int32", mode="w+", shape=ary.shape)
+            array_merge(array_split(ary, tile_shape=(16, 16), halo=1), splitter, out=out)
+            out.flush()
+            del out
+            self.assertTrue(
+                _np.all(ary == _np.memmap(file_name, dtype="int32", mode="r", shape=ary.shape))
+            )
+        finally:
+            _os.remove(file_name)
+
+    def test_array_merge_errors(self):
+        """
+        Tests :func:`array_split.merge.array_merge` raises :obj:`ValueError`
+        for inconsistent arguments.
+        """
+        ary = _np.zeros((10, 8))
+        splitter = ShapeSplitter(ary.shape, 4, halo=1)
+        tiles = array_split(ary, 4, halo=1)
+        self.assertRaises(ValueError, array_merge, tiles[1:], splitter)
+        self.assertRaises(ValueError, array_merge, tiles, splitter, _np.zeros((10, 9)))
+        tiles[2] = tiles[2][1:]
+        self.assertRaises(ValueError, array_merge, tiles, splitter)
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+_unittest.main(__name__)
@@ -0,0 +1,250 @@
+"""
+=======================================
+The :mod:`array_split.occupancy` Module
+=======================================
+
+.. currentmodule:: array_split.occupancy
+
+Mask (occupancy) driven splitting for sparse arrays. The number of
+occupied (:samp:`True`) mask elements of every tile is calculated by
+block-reducing (:meth:`numpy.ufunc.reduceat`) the mask over the tile grid
+of a :obj:`array_split.ShapeSplitter` split, so that empty tiles can be
+dropped, and the remaining (active) tiles optionally shrunk to the bounding
+box of their occupied elements.
+
+Example::
+
+   >>> import numpy as np
+   >>> from array_split import ShapeSplitter
+   >>> mask = np.zeros((8, 8), dtype="bool")
+   >>> mask[1, 2] = mask[6, 5:7] = True
+   >>> splitter = ShapeSplitter(mask.shape, axis=[2, 2])
+   >>> calculate_tile_occupancy(mask, splitter).tolist()
+   [[1, 0], [0, 2]]
+   >>> active = split_active_tiles(mask, splitter)
+   >>> active.multi_indices.tolist()
+   [[0, 0], [1, 1]]
+   >>> active.slices
+   [(slice(0, 4, None), slice(0, 4, None)), (slice(4, 8, None), slice(4, 8, None))]
+   >>> split_active_tiles(mask, splitter, shrink=True).slices
+   [(slice(1, 2, None), slice(2, 3, None)), (slice(6, 7, None), slice(5, 7, None))]
+
+Classes and Functions
+=====================
+
+.. autosummary::
+   :toctree: generated/
+
+   calculate_tile_occupancy - Returns the number of occupied mask elements per tile.
+   calculate_tile_bounding_boxes - Returns per-tile bounding boxes of occupied elements.
+   ActiveTiles - The compact list of active (occupied) tiles.
+   split_active_tiles - Returns the active tiles of a split for a mask.
+
+"""
+from __future__ import absolute_import
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+def _check_mask(mask, splitter):
+    """
+    Returns :samp:`{mask}` as :samp:`bool` array, calculates the split extents
+    if necessary and raises :obj:`ValueError` for inconsistent mask shape.
+    """
+    mask = _np.asarray(mask, dtype="bool")
+    if tuple(mask.shape) != tuple(splitter.array_shape.tolist()):
+        raise ValueError(
+            "Got mask.shape=%s, should be splitter.array_shape=%s."
+            %
+            (mask.shape, tuple(splitter.array_shape.tolist()))
+        )
+    if splitter.split_begs is None:
+        splitter.set_split_extents()
+    return mask
+
+
+def _axis_reduceat(ufunc, values, splitter, axis, identity, dtype=None):
+    """
+    Reduces :samp:`{values}` over the tile extents along :samp:`{axis}`,
+    empty tiles (and empty axes) are assigned :samp:`{identity}`.
+    """
+    begs = _np.asarray(splitter.split_begs[axis], dtype="int64")
+    ends = _np.asarray(splitter.split_ends[axis], dtype="int64")
+    size = values.shape[axis]
+    if dtype is None:
+        dtype = values.dtype
+    if size <= 0:
+        shape = list(values.shape)
+        shape[axis] = len(begs)
+        return _np.full(shape, identity, dtype=dtype)
+    # Reduce from the starts of the non-empty (contiguous) tiles only, the
+    # start of an empty tile would truncate the preceding tile's reduction.
+    non_empty = ends > begs
+    shape = list(values.shape)
+    shape[axis] = len(begs)
+    reduced = _np.full(shape, identity, dtype=dtype)
+    if _np.any(non_empty):
+        index = [slice(None), ] * values.ndim
+        index[axis] = non_empty
+        reduced[tuple(index)] = \
+            ufunc.reduceat(values, begs[non_empty], axis=axis, dtype=dtype)
+    return reduced
+
+
+def calculate_tile_occupancy(mask, splitter):
+    """
+    Returns the number of :samp:`True` elements of :samp:`{mask}` in
+    each tile (excluding halo) of the :samp:`{splitter}` split.
+
+    :type mask: :obj:`numpy.ndarray`
+    :param mask: Boolean array of shape :samp:`{splitter}.array_shape`.
+    :type splitter: :obj:`array_split.ShapeSplitter`
+    :param splitter: The split.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The :samp:`{splitter}.split_shape` shaped :samp:`int64` array of counts.
+    """
+    counts = _check_mask(mask, splitter)
+    for d in range(counts.ndim):
+        counts = _axis_reduceat(_np.add, counts, splitter, d, 0, dtype="int64")
+    return counts
+
+
+def calculate_tile_bounding_boxes(mask, splitter):
+    """
+    Returns the per-tile bounding box (:samp:`[lo, hi)` extents, excluding
+    halo and :samp:`array_start`) of the :samp:`True` elements
+    of :samp:`{mask}`. Empty tiles have :samp:`lo == hi`.
+
+    :type mask: :obj:`numpy.ndarray`
+    :param mask: Boolean array of shape :samp:`{splitter}.array_shape`.
+    :type splitter: :obj:`array_split.ShapeSplitter`
+    :param splitter: The split.
+    :rtype: :obj:`tuple`
+    :return: Pair :samp:`(lo, hi)` of :samp:`tuple({splitter}.split_shape) + (ndim,)`
+       shaped :samp:`int64` arrays.
+    """
+    mask = _check_mask(mask, splitter)
+    ndim = mask.ndim
+    split_shape = tuple(splitter.split_shape.tolist())
+    lo = _np.zeros(split_shape + (ndim,), dtype="int64")
+    hi = _np.zeros(split_shape + (ndim,), dtype="int64")
+    for d in range(ndim):
+        # Project the mask onto axis d, per tile of the other axes.
+        projection = mask
+        for e in range(ndim):
+            if e != d:
+                projection = _axis_reduceat(_np.logical_or, projection, splitter, e, False)
+        index_shape = [1, ] * ndim
+        index_shape[d] = mask.shape[d]
+        index = _np.arange(mask.shape[d], dtype="int64").reshape(index_shape)
+        size = mask.shape[d]
+        lo[..., d] = \
+            _axis_reduceat(_np.minimum, _np.where(projection, index, size), splitter, d, size)
+        hi[..., d] = \
+            _axis_reduceat(_np.maximum, _np.where(projection, index, -1), splitter, d, -1) + 1
+    empty = _np.any(hi <= lo, axis=-1)
+    lo[empty] = 0
+    hi[empty] = 0
+    return lo, hi
+
+
+class ActiveTiles(object):
+
+    """
+    The compact list of active (occupied) tiles of a split,
+    see :func:`split_active_tiles`.
+    """
+
+    def __init__(self, multi_indices, slices, occupancy, begs, ends):
+        """
+        Initialise, see the attribute descriptions for the parameters.
+        """
+        #: The :samp:`(num_active, ndim)` shaped array of tile split indices.
+        self.multi_indices = multi_indices
+        #: The list of tile :obj:`tuple`-of-:obj:`slice` (including halo).
+        self.slices = slices
+        #: The :samp:`(num_active,)` shaped array of per-tile occupied element counts.
+        self.occupancy = occupancy
+        #: The :samp:`(num_active, ndim)` shaped array of tile begin
+        #: extents (excluding halo and :samp:`array_start`).
+        self.begs = begs
+        #: The :samp:`(num_active, ndim)` shaped array of tile end
+        #: extents (excluding halo and :samp:`array_start`).
+        self.ends = ends
+
+    def __len__(self):
+        """
+        The number of active tiles.
+        """
+        return len(self.slices)
+
+
+def split_active_tiles(mask, splitter, shrink=False, min_occupancy=1):
+    """
+    Returns the tiles of the :samp:`{splitter}` split which contain
+    at least :samp:`{min_occupancy}` :samp:`True` elements of :samp:`{mask}`.
+
+    :type mask: :obj:`numpy.ndarray`
+    :param mask: Boolean array of shape :samp:`{splitter}.array_shape`.
+    :type splitter: :obj:`array_split.ShapeSplitter`
+    :param splitter: The split.
+    :type shrink: :obj:`bool`
+    :param shrink: If :samp:`True`, the tile extents are shrunk to the bounding box
+       of the tile occupied elements (the halo is added to the shrunk extents,
+       subject to the :attr:`array_split.ShapeSplitter.tile_bounds_policy`).
+    :type min_occupancy: :obj:`int`
+    :param min_occupancy: Tiles with fewer occupied elements are dropped.
+    :rtype: :obj:`ActiveTiles`
+    :return: The active tiles, in C-order of the split.
+    """
+    if min_occupancy < 1:
+        raise ValueError("Got min_occupancy=%s, should be positive." % (min_occupancy,))
+    counts = calculate_tile_occupancy(mask, splitter)
+    multi_indices = _np.argwhere(counts >= min_occupancy).astype("int64")
+    ndim = counts.ndim
+    if shrink:
+        lo, hi = calculate_tile_bounding_boxes(mask, splitter)
+        begs = lo[tuple(multi_indices.T)].reshape((-1, ndim))
+        ends = hi[tuple(multi_indices.T)].reshape((-1, ndim))
+    else:
+        begs = \
+            _np.array(
+                [
+                    _np.asarray(splitter.split_begs[d], dtype="int64")[multi_indices[:, d]]
+                    for d in range(ndim)
+                ],
+                dtype="int64"
+            ).T.reshape((-1, ndim))
+        ends = \
+            _np.array(
+                [
+                    _np.asarray(splitter.split_ends[d], dtype="int64")[multi_indices[:, d]]
+                    for d in range(ndim)
+                ],
+                dtype="int64"
+            ).T.reshape((-1, ndim))
+    array_start = _np.asarray(splitter.array_start, dtype="int64")
+    starts = _np.maximum(begs + array_start - splitter.halo[:, 0], splitter.tile_beg_min)
+    stops = _np.minimum(ends + array_start + splitter.halo[:, 1], splitter.tile_end_max)
+    slices = \
+        [
+            tuple(slice(start, stop) for start, stop in zip(start_row, stop_row))
+            for start_row, stop_row in zip(starts.tolist(), stops.tolist())
+        ]
+    return \
+        ActiveTiles(
+            multi_indices,
+            slices,
+            counts[tuple(multi_indices.T)].reshape((-1,)),
+            begs,
+            ends
+        )
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
@@ -0,0 +1,179 @@
+"""
+============================================
+The :mod:`array_split.occupancy_test` Module
+============================================
+
+.. currentmodule:: array_split.occupancy_test
+
+Module defining :mod:`array_split.occupancy` unit-tests.
+Execute as::
+
+   python -m array_split.occupancy_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   OccupancyTest - :obj:`unittest.TestCase` for :mod:`array_split.occupancy` functions.
+
+
+"""
+from __future__ import absolute_import
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging
+
+from .split import ShapeSplitter, NO_BOUNDS
+from .occupancy import calculate_tile_occupancy, calculate_tile_bounding_boxes
+from .occupancy import split_active_tiles
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class OccupancyTest(_unittest.TestCase):
+
+    """
+    Tests for :mod:`array_split.occupancy` module.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".OccupancyTest")
+
+    def create_mask(self, shape, fraction=0.03, seed=5):
+        """
+        Returns sparse random boolean mask.
+        """
+        return _np.random.RandomState(seed).uniform(size=shape) < fraction
+
+    def tile_interior_slice(self, splitter, multi_index):
+        """
+        Returns interior (no halo, no array_start) slice tuple of a tile.
+        """
+        return \
+            tuple(
+                slice(
+                    splitter.split_begs[d][multi_index[d]],
+                    splitter.split_ends[d][multi_index[d]]
+                )
+                for d in range(len(multi_index))
+            )
+
+    def test_tile_occupancy_and_bounding_boxes(self):
+        """
+        Tests :func:`array_split.occupancy.calculate_tile_occupancy`
+        and :func:`array_split.occupancy.calculate_tile_bounding_boxes` against
+        per-tile loops.
+        """
+        mask = self.create_mask((37, 23, 11))
+        for splitter in \
+                [
+                    ShapeSplitter(mask.shape, 24),
+                    ShapeSplitter(mask.shape, tile_shape=(8, 5, 4), halo=1),
+                    ShapeSplitter(mask.shape, [[3, 3, 30], [], [5]]),
+                    ShapeSplitter(mask.shape, axis=[40, 1, 1]),
+                ]:
+            counts = calculate_tile_occupancy(mask, splitter)
+            lo, hi = calculate_tile_bounding_boxes(mask, splitter)
+            self.assertSequenceEqual(tuple(splitter.split_shape), counts.shape)
+            self.assertEqual(int(_np.sum(mask)), int(_np.sum(counts)))
+            for multi_index in _np.ndindex(*counts.shape):
+                tile_mask = mask[self.tile_interior_slice(splitter, multi_index)]
+                self.assertEqual(int(_np.sum(tile_mask)), counts[multi_index])
+                if counts[multi_index] > 0:
+                    occupied = _np.argwhere(tile_mask)
+                    begs = _np.array([splitter.split_begs[d][multi_index[d]] for d in range(3)])
+                    self.assertSequenceEqual(
+                        (occupied.min(axis=0) + begs).tolist(),
+                        lo[multi_index].tolist()
+                    )
+                    self.assertSequenceEqual(
+                        (occupied.max(axis=0) + 1 + begs).tolist(),
+                        hi[multi_index].tolist()
+                    )
+                else:
+                    self.assertTrue(_np.all(lo[multi_index] == hi[multi_index]))
+
+    def test_empty_trailing_tile(self):
+        """
+        Tests occupancy, bounding boxes and active tiles for an indices split
+        whose last tile is empty (the preceding tile includes the last element).
+        """
+        mask = _np.zeros((5, ), dtype="bool")
+        mask[4] = True
+        splitter = ShapeSplitter((5, ), [[2, 5]])
+        self.assertSequenceEqual([0, 1, 0], calculate_tile_occupancy(mask, splitter).tolist())
+        lo, hi = calculate_tile_bounding_boxes(mask, splitter)
+        self.assertSequenceEqual([[0], [4], [0]], lo.tolist())
+        self.assertSequenceEqual([[0], [5], [0]], hi.tolist())
+        active = split_active_tiles(mask, splitter)
+        self.assertEqual(1, len(active))
+        self.assertSequenceEqual([[1]], active.multi_indices.tolist())
+
+        mask = _np.zeros((4, 6), dtype="bool")
+        mask[3, 5] = True
+        mask[0, 0] = True
+        splitter = ShapeSplitter((4, 6), [[4, 4], [3, 6, 6]])
+        self.assertSequenceEqual(
+            [[1, 1, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]],
+            calculate_tile_occupancy(mask, splitter).tolist()
+        )
+
+    def test_split_active_tiles(self):
+        """
+        Tests :func:`array_split.occupancy.split_active_tiles`.
+        """
+        mask = self.create_mask((64, 48), fraction=0.002)
+        for tile_bounds_policy in [None, NO_BOUNDS]:
+            splitter = \
+                ShapeSplitter(
+                    mask.shape,
+                    tile_shape=(8, 8),
+                    halo=1,
+                    array_start=(2, 3),
+                    tile_bounds_policy=tile_bounds_policy
+                )
+            split = splitter.calculate_split()
+            counts = calculate_tile_occupancy(mask, splitter)
+            active = split_active_tiles(mask, splitter)
+            self.assertEqual(int(_np.sum(counts > 0)), len(active))
+            self.assertTrue(len(active) < split.size)
+            self.assertEqual(int(_np.sum(mask)), int(_np.sum(active.occupancy)))
+            for i, multi_index in enumerate(active.multi_indices.tolist()):
+                self.assertTrue(counts[tuple(multi_index)] > 0)
+                self.assertSequenceEqual(split[tuple(multi_index)].tolist(), active.slices[i])
+
+            shrunk = split_active_tiles(mask, splitter, shrink=True)
+            self.assertTrue(_np.all(active.multi_indices == shrunk.multi_indices))
+            covered = _np.zeros_like(mask)
+            for i in range(len(shrunk)):
+                self.assertTrue(_np.all(shrunk.begs[i] >= active.begs[i]))
+                self.assertTrue(_np.all(shrunk.ends[i] <= active.ends[i]))
+                self.assertTrue(_np.all(shrunk.ends[i] > shrunk.begs[i]))
+                interior = tuple(slice(b, e) for b, e in zip(shrunk.begs[i], shrunk.ends[i]))
+                covered[interior] = True
+                for d in range(2):
+                    start = shrunk.begs[i][d] + splitter.array_start[d] - 1
+                    if tile_bounds_policy is None:
+                        start = max([start, splitter.array_start[d]])
+                    self.assertEqual(start, shrunk.slices[i][d].start)
+            self.assertTrue(_np.all(covered[mask]))
+
+            dense = split_active_tiles(mask, splitter, min_occupancy=2)
+            self.assertEqual(int(_np.sum(counts >= 2)), len(dense))
+
+        self.assertRaises(ValueError, split_active_tiles, mask, splitter, False, 0)
+        self.assertRaises(ValueError, calculate_tile_occupancy, mask[1:], splitter)
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+_unittest.main(__name__)
@@ -0,0 +1,547 @@
+"""
+======================================
+The :mod:`array_split.parallel` Module
+======================================
+
+.. currentmodule:: array_split.parallel
+
+Tile-parallel application of :mod:`numpy` ufuncs. The (broadcast) output
+shape is split into cache sized tiles (:obj:`array_split.ShapeSplitter`
+with :samp:`max_tile_bytes` the host cache size, see :mod:`array_split.host`)
+and the ufunc is called on each tile (:samp:`ufunc(*tiles, out=out_tile)`)
+by the threads of a :obj:`array_split.scheduler.WorkStealingScheduler`.
+:mod:`numpy` releases the GIL in the ufunc inner loops, so memory bound
+elementwise kernels scale with the number of threads. Tile shapes are chosen to
+maximise the contiguous (in memory) runs of the tiles of the operands,
+see :obj:`ContiguityCost`.
+
+Reductions (:func:`parallel_reduce`) reduce each tile
+with :meth:`numpy.ufunc.reduce` and then reduce the (small) array of per-tile
+partial results, the ufunc needs to be associative (the partial results are
+combined in order, but floating point sums may differ in the last bits
+from the serial :meth:`numpy.ufunc.reduce`).
+
+Copies and dtype conversions (:func:`copy_to`, the tile-parallel
+:func:`numpy.copyto`) choose tile shapes which are contiguous
+in both the source and destination layouts (e.g. a C-order :obj:`numpy.memmap`
+to a Fortran-order array), with a bound on the number of tile bytes
+being copied at any one time.
+
+Example::
+
+   >>> import numpy as np
+   >>> a = np.linspace(0, 1, 100000).reshape((1000, 100))
+   >>> b = np.arange(100.0)
+   >>> out = parallel_ufunc(np.add, a, b, max_tile_bytes=2 ** 16)
+   >>> bool(np.all(out == a + b))
+   True
+   >>> out = parallel_ufunc(np.exp, a, out=out, where=a > 0.5, max_tile_bytes=2 ** 16)
+   >>> bool(np.all(out[a > 0.5] == np.exp(a[a > 0.5])))
+   True
+   >>> s = parallel_reduce(np.add, a, axis=None, max_tile_bytes=2 ** 16)
+   >>> bool(np.isclose(s, a.sum()))
+   True
+   >>> parallel_reduce(np.maximum, a, axis=0, max_tile_bytes=2 ** 16).shape
+   (100,)
+   >>> f = copy_to(a, np.empty(a.shape, dtype="float32", order="F"), max_tile_bytes=2 ** 16)
+   >>> bool(np.all(f == a.astype("float32")))
+   True
+
+Classes and Functions
+=====================
+
+.. autosummary::
+   :toctree: generated/
+
+   parallel_ufunc - Tile-parallel elementwise ufunc call.
+   parallel_reduce - Tile-parallel ufunc reduction.
+   copy_to - Tile-parallel copy (and dtype conversion) between arrays.
+   ContiguityCost - Tile shape cost favouring contiguous (in memory) tiles.
+   axis_order - Returns the axes of an array ordered from fastest to slowest varying.
+   calculate_parallel_splitter - Returns the splitter for tile-parallel processing.
+
+"""
+from __future__ import absolute_import
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import logging as _logging
+from .split import ShapeSplitter as _ShapeSplitter
+from .host import detect_host as _detect_host
+from .scheduler import WorkStealingScheduler as _WorkStealingScheduler
+from .scheduler import default_num_workers as _default_num_workers
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+def axis_order(ary):
+    """
+    Returns the axes of :samp:`{ary}` ordered from the fastest to the
+    slowest varying in memory (increasing absolute stride),
+    e.g. :samp:`[1, 0]` for a 2D C-order array.
+
+    :type ary: :obj:`numpy.ndarray`
+    :param ary: Array.
+    :rtype: :obj:`list`
+    :return: List of axis indices.
+
+    Example::
+
+       >>> import numpy as np
+       >>> axis_order(np.zeros((3, 4, 5))), axis_order(np.zeros((3, 4, 5), order="F"))
+       ([2, 1, 0], [0, 1, 2])
+    """
+    strides = _np.abs(_np.array(ary.strides, dtype="int64"))
+    # Stable, ties (e.g. length-1 axes) resolved as C-order.
+    return [int(a) for a in _np.lexsort((-_np.arange(ary.ndim), strides))]
+
+
+class ContiguityCost(object):
+
+    """
+    Tile shape cost function (see :func:`array_split.split.search_tile_shape_for_max_bytes`)
+    which is the sum, over the operand memory layouts, of the number of contiguous
+    memory runs per tile element. A tile which spans whole (fastest varying) axes
+    of an operand is a single contiguous run in that operand.
+
+    Example::
+
+       >>> import numpy as np
+       >>> cost = ContiguityCost([[1, 0]])  # C-order 2D
+       >>> cost(np.array([[10, 100], [100, 10]]), (100, 100), 8, None).tolist()
+       [0.001, 0.1]
+    """
+
+    def __init__(self, axis_orders):
+        """
+        Initialise.
+
+        :type axis_orders: sequence of sequence of :obj:`int`
+        :param axis_orders: The :func:`axis_order` of each operand.
+        """
+        #: List of the (fastest to slowest) axis orders of the operands.
+        self.axis_orders = [[int(axis) for axis in order] for order in axis_orders]
+
+    def cache_key(self):
+        """
+        Returns the :obj:`str` key identifying this cost function, used in
+        the :func:`array_split.plan.plan_key` of splitters.
+
+        :rtype: :obj:`str`
+        :return: String of the :attr:`axis_orders`, e.g. :samp:`"axis_orders=[[1, 0]]"`.
+        """
+        return "axis_orders=%s" % (self.axis_orders, )
+
+    def __repr__(self):
+        """
+        Returns :samp:`"ContiguityCost(axis_orders=...)"` string.
+        """
+        return "%s(%s)" % (type(self).__name__, self.cache_key())
+
+    def __call__(self, tile_shapes, array_shape, array_itemsize, halo):
+        """
+        Returns the :samp:`(num_candidates,)` shaped array of costs
+        of the :samp:`(num_candidates, ndim)` shaped :samp:`{tile_shapes}`.
+        """
+        array_shape = _np.array(array_shape, dtype="int64")
+        tile_shapes = _np.minimum(_np.array(tile_shapes, dtype="int64"), array_shape)
+        costs = _np.zeros((tile_shapes.shape[0],), dtype="float64")
+        for order in self.axis_orders:
+            run = _np.ones_like(costs)
+            spans = _np.ones(costs.shape, dtype="bool")
+            for axis in order:
+                run = _np.where(spans, run * tile_shapes[:, axis], run)
+                spans &= tile_shapes[:, axis] >= array_shape[axis]
+            costs += 1.0 / _np.maximum(run, 1.0)
+        return costs
+
+
+def calculate_parallel_splitter(
+    shape,
+    itemsize,
+    axis_orders=None,
+    max_tile_bytes=None,
+    num_workers=None
+):
+    """
+    Returns the :obj:`array_split.ShapeSplitter` of (at least :samp:`{num_workers}`)
+    tiles of at most :samp:`{max_tile_bytes}` bytes, with tile shape
+    minimising the :obj:`ContiguityCost` of the :samp:`{axis_orders}` layouts.
+
+    :type shape: sequence of :obj:`int`
+    :param shape: Shape to be split.
+    :type itemsize: :obj:`int`
+    :param itemsize: Number of bytes per element (summed over all operands).
+    :type axis_orders: :samp:`None` or sequence of sequence of :obj:`int`
+    :param axis_orders: Operand layouts, if :samp:`None` a single C-order layout.
+    :type max_tile_bytes: :samp:`None` or :obj:`int`
+    :param max_tile_bytes: Tile byte budget, if :samp:`None` the level 2 cache size
+       of :func:`array_split.host.detect_host`.
+    :type num_workers: :samp:`None` or :obj:`int`
+    :param num_workers: Minimum number of tiles (workers),
+       if :samp:`None` uses :func:`array_split.scheduler.default_num_workers`.
+    :rtype: :obj:`array_split.ShapeSplitter`
+    :return: Splitter with :samp:`max_tile_bytes` and :samp:`min_num_tiles` constraints.
+    """
+    if max_tile_bytes is None:
+        max_tile_bytes = _detect_host().cache_size(2)
+    if num_workers is None:
+        num_workers = _default_num_workers()
+    if axis_orders is None:
+        axis_orders = [list(range(len(shape)))[::-1]]
+    return \
+        _ShapeSplitter(
+            shape,
+            array_itemsize=max([1, itemsize]),
+            max_tile_bytes=max([max_tile_bytes, itemsize]),
+            min_num_tiles=num_workers,
+            tile_shape_cost=ContiguityCost(axis_orders)
+        )
+
+
+def _tile_slices(splitter):
+    """
+    Returns the C-order list of (non-haloed) tile :obj:`tuple`-of-:obj:`slice`.
+    """
+    split = splitter.calculate_split()
+    return [tuple(slyce.tolist()) for slyce in split.flatten()]
+
+
+def _is_partial_overlap(ary, other):
+    """
+    Returns :samp:`True` if :samp:`{ary}` and :samp:`{other}` may share memory but
+    are not element-wise identical views (in which case tiles can not be processed
+    independently).
+    """
+    if not _np.may_share_memory(ary, other):
+        return False
+    return \
+        not (
+            (ary.__array_interface__["data"][0] == other.__array_interface__["data"][0])
+            and
+            (ary.shape == other.shape)
+            and
+            (ary.strides == other.strides)
+        )
+
+
+def _pop_parallel_kwargs(kwargs):
+    """
+    Removes and returns the :samp:`(num_workers, max_tile_bytes)` keyword arguments.
+    """
+    return kwargs.pop("num_workers", None), kwargs.pop("max_tile_bytes", None)
+
+
+def parallel_ufunc(ufunc, *arrays, **kwargs):
+    """
+    Tile-parallel :samp:`{ufunc}(*{arrays}, out=out, where=where, ...)`.
+    The inputs are broadcast (without copying) to the output shape and
+    the ufunc is called for each tile of the output, concurrently by worker threads.
+    Small arrays (within a single tile) and outputs partially overlapping
+    an input are processed with a single (serial) ufunc call.
+
+    :type ufunc: :obj:`numpy.ufunc`
+    :param ufunc: Elementwise function, e.g. :obj:`numpy.add`.
+    :type arrays: :obj:`numpy.ndarray` (or scalars)
+    :param arrays: The :samp:`{ufunc}.nin` input operands.
+    :type out: :samp:`None`, :obj:`numpy.ndarray` or :obj:`tuple` of :obj:`numpy.ndarray`
+    :param out: Output array(s), allocated if :samp:`None`. Keyword argument.
+    :type where: :obj:`bool` or :obj:`numpy.ndarray`
+    :param where: Elementwise mask, where :samp:`False` the output is unchanged.
+       Keyword argument.
+    :type num_workers: :samp:`None` or :obj:`int`
+    :param num_workers: Number of worker threads. Keyword argument.
+    :type max_tile_bytes: :samp:`None` or :obj:`int`
+    :param max_tile_bytes: Tile byte budget (all operands), defaults to the level 2
+       cache size. Keyword argument.
+    :param kwargs: Other keyword arguments (e.g. :samp:`casting`, :samp:`dtype`)
+       are passed to :samp:`{ufunc}`.
+    :rtype: :obj:`numpy.ndarray` or :obj:`tuple`
+    :return: The output array (:obj:`tuple` of arrays when :samp:`{ufunc}.nout > 1`).
+    :raises ValueError: For the wrong number of inputs or incorrectly shaped outputs.
+    """
+    logger = _logging.getLogger(__name__ + ".parallel_ufunc")
+    num_workers, max_tile_bytes = _pop_parallel_kwargs(kwargs)
+    out = kwargs.pop("out", None)
+    where = kwargs.pop("where", True)
+    if len(arrays) != ufunc.nin:
+        raise ValueError(
+            "Got len(arrays)=%s, should be %s.nin=%s." % (len(arrays), ufunc.__name__, ufunc.nin)
+        )
+    arrays = [_np.asanyarray(a) for a in arrays]
+    shape = _np.broadcast(*arrays).shape if len(arrays) > 1 else arrays[0].shape
+    if out is not None:
+        outs = list(out) if isinstance(out, tuple) else [out, ]
+        if len(outs) != ufunc.nout:
+            raise ValueError(
+                "Got %s outputs, should be %s.nout=%s." % (len(outs), ufunc.__name__, ufunc.nout)
+            )
+        for o in outs:
+            if o.shape != shape:
+                raise ValueError(
+                    "Got out.shape=%s, should be broadcast shape %s." % (o.shape, shape)
+                )
+    else:
+        # Zero sized (or 0-d for scalars) probe for the output dtypes.
+        probe = \
+            ufunc(
+                *[a if a.ndim == 0 else _np.empty((0,), dtype=a.dtype) for a in arrays],
+                **kwargs
+            )
+        probe = probe if isinstance(probe, tuple) else (probe, )
+        outs = [_np.empty(shape, dtype=p.dtype) for p in probe]
+    ret = tuple(outs) if ufunc.nout > 1 else outs[0]
+    where_is_array = not (isinstance(where, bool) and where)
+    if where_is_array:
+        where = _np.broadcast_to(_np.asanyarray(where, dtype="bool"), shape)
+
+    itemsize = sum([a.itemsize for a in arrays + outs])
+    size = int(_np.prod(shape))
+    if max_tile_bytes is None:
+        max_tile_bytes = _detect_host().cache_size(2)
+    overlap = _np.any([_is_partial_overlap(a, o) for a in arrays for o in outs])
+    if (size * itemsize <= max_tile_bytes) or (len(shape) == 0) or overlap:
+        logger.debug("Serial ufunc call, size=%s, overlap=%s.", size, overlap)
+        if where_is_array:
+            kwargs["where"] = where
+        ufunc(*arrays, out=tuple(outs), **kwargs)
+        return ret
+
+    inputs = [_np.broadcast_to(a, shape) for a in arrays]
+    axis_orders = \
+        [axis_order(a) for a in arrays if (a.shape == shape) and (0 not in a.strides)] \
+        + \
+        [axis_order(o) for o in outs]
+    splitter = \
+        calculate_parallel_splitter(
+            shape,
+            itemsize,
+            axis_orders=axis_orders,
+            max_tile_bytes=max_tile_bytes,
+            num_workers=num_workers
+        )
+    slices = _tile_slices(splitter)
+
+    def tile_ufunc(rank):
+        slice_tuple = slices[rank]
+        tile_kwargs = dict(kwargs)
+        if where_is_array:
+            tile_kwargs["where"] = where[slice_tuple]
+        ufunc(
+            *[a[slice_tuple] for a in inputs],
+            out=tuple(o[slice_tuple] for o in outs),
+            **tile_kwargs
+        )
+
+    _WorkStealingScheduler(splitter, num_workers).map_ranks(tile_ufunc, len(slices))
+    return ret
+
+
+def parallel_reduce(ufunc, ary, axis=0, **kwargs):
+    """
+    Tile-parallel :samp:`{ufunc}.reduce({ary}, axis={axis}, ...)`. Each tile is
+    reduced (:samp:`keepdims=True`) by a worker thread, the per-tile partial
+    results are then reduced (serially) to give the result.
+
+    :type ufunc: :obj:`numpy.ufunc`
+    :param ufunc: Associative binary ufunc, e.g. :obj:`numpy.add`.
+    :type ary: :obj:`numpy.ndarray`
+    :param ary: The array to reduce.
+    :type axis: :samp:`None`, :obj:`int` or :obj:`tuple` of :obj:`int`
+    :param axis: Axis (axes) of the reduction, :samp:`None` reduces all axes.
+    :type dtype: :obj:`numpy.dtype`
+    :param dtype: Accumulation (and result) type. Keyword argument.
+    :type out: :obj:`numpy.ndarray`
+    :param out: Result array. Keyword argument.
+    :type keepdims: :obj:`bool`
+    :param keepdims: Keep the reduced axes (with length one). Keyword argument.
+    :type initial: scalar
+    :param initial: Starting value of the reduction. Keyword argument.
+    :type where: :obj:`bool` or :obj:`numpy.ndarray`
+    :param where: Elements to include in the reduction. Keyword argument.
+    :type num_workers: :samp:`None` or :obj:`int`
+    :param num_workers: Number of worker threads. Keyword argument.
+    :type max_tile_bytes: :samp:`None` or :obj:`int`
+    :param max_tile_bytes: Tile byte budget, defaults to the level 2 cache size.
+       Keyword argument.
+    :rtype: :obj:`numpy.ndarray` or scalar
+    :return: The reduction.
+    """
+    logger = _logging.getLogger(__name__ + ".parallel_reduce")
+    num_workers, max_tile_bytes = _pop_parallel_kwargs(kwargs)
+    ary = _np.asanyarray(ary)
+    unknown = set(kwargs.keys()) - set(["dtype", "out", "keepdims", "initial", "where"])
+    if len(unknown) > 0:
+        raise TypeError("Got unexpected keyword arguments %s." % sorted(unknown))
+    if max_tile_bytes is None:
+        max_tile_bytes = _detect_host().cache_size(2)
+    if (ary.size * ary.itemsize <= max_tile_bytes) or (ary.ndim == 0):
+        logger.debug("Serial reduce, size=%s.", ary.size)
+        return ufunc.reduce(ary, axis=axis, **kwargs)
+
+    if axis is None:
+        axes = tuple(range(ary.ndim))
+    elif isinstance(axis, tuple):
+        axes = tuple(sorted(set(a % ary.ndim for a in axis)))
+    else:
+        axes = (axis % ary.ndim, )
+
+    where = kwargs.pop("where", True)
+    where_is_array = not (isinstance(where, bool) and where)
+    if where_is_array:
+        where = _np.broadcast_to(_np.asanyarray(where, dtype="bool"), ary.shape)
+    tile_kwargs = {"axis": axes, "keepdims": True}
+    if "dtype" in kwargs:
+        tile_kwargs["dtype"] = kwargs["dtype"]
+    if "initial" in kwargs:
+        # The initial value is applied once, in the reduction of the partials.
+        tile_kwargs["initial"] = \
+            ufunc.identity if ufunc.identity is not None else kwargs["initial"]
+
+    splitter = \
+        calculate_parallel_splitter(
+            ary.shape,
+            ary.itemsize,
+            axis_orders=[axis_order(ary)],
+            max_tile_bytes=max_tile_bytes,
+            num_workers=num_workers
+        )
+    slices = _tile_slices(splitter)
+
+    def tile_reduce(rank):
+        slice_tuple = slices[rank]
+        if where_is_array:
+            return ufunc.reduce(ary[slice_tuple], where=where[slice_tuple], **tile_kwargs)
+        return ufunc.reduce(ary[slice_tuple], **tile_kwargs)
+
+    partials = \
+        _WorkStealingScheduler(splitter, num_workers).map_ranks(tile_reduce, len(slices))
+
+    # Assemble the partials, tile index along the reduced axes.
+    split_shape = tuple(splitter.split_shape.tolist())
+    partials_shape = \
+        tuple(split_shape[d] if d in axes else ary.shape[d] for d in range(ary.ndim))
+    partials_ary = _np.empty(partials_shape, dtype=partials[0].dtype)
+    for rank, partial in enumerate(partials):
+        multi_index = _np.unravel_index(rank, split_shape)
+        index = \
+            tuple(
+                slice(multi_index[d], multi_index[d] + 1) if d in axes else slices[rank][d]
+                for d in range(ary.ndim)
+            )
+        partials_ary[index] = partial
+    return ufunc.reduce(partials_ary, axis=axes, **kwargs)
+
+
+def copy_to(
+    src,
+    dst,
+    casting="same_kind",
+    where=True,
+    num_workers=None,
+    max_tile_bytes=None,
+    max_bytes_in_flight=None
+):
+    """
+    Tile-parallel :samp:`numpy.copyto({dst}, {src}, casting={casting}, where={where})`.
+    Tile shapes are chosen (:obj:`ContiguityCost`) so that tiles are
+    as contiguous as possible in both the :samp:`{src}` and :samp:`{dst}` memory layouts.
+    Each worker thread copies one tile at a time, so at most :samp:`{max_bytes_in_flight}`
+    bytes (source plus destination) are being copied at any one time: the tile byte budget
+    and the number of workers are reduced to fit. A :obj:`numpy.memmap`
+    destination is flushed after the copy.
+
+    :type src: :obj:`numpy.ndarray` (e.g. :obj:`numpy.memmap`)
+    :param src: Source array, broadcast to :samp:`{dst}.shape`.
+    :type dst: :obj:`numpy.ndarray` (e.g. :obj:`numpy.memmap`)
+    :param dst: Destination array.
+    :type casting: :obj:`str`
+    :param casting: Casting rule, see :func:`numpy.copyto`.
+    :type where: :obj:`bool` or :obj:`numpy.ndarray`
+    :param where: Elementwise mask, only elements where :samp:`True` are copied.
+    :type num_workers: :samp:`None` or :obj:`int`
+    :param num_workers: Number of worker threads,
+       if :samp:`None` uses :func:`array_split.scheduler.default_num_workers`.
+    :type max_tile_bytes: :samp:`None` or :obj:`int`
+    :param max_tile_bytes: Tile byte budget (source plus destination), defaults to the level 2
+       cache size.
+    :type max_bytes_in_flight: :samp:`None` or :obj:`int`
+    :param max_bytes_in_flight: Bound on the total tile bytes concurrently being copied,
+       :samp:`None` is unbounded (:samp:`{num_workers} * {max_tile_bytes}`).
+    :rtype: :obj:`numpy.ndarray`
+    :return: The :samp:`{dst}` array.
+    :raises ValueError: If :samp:`{src}` does not broadcast to :samp:`{dst}.shape`
+       or :samp:`{max_bytes_in_flight}` is not positive.
+    :raises TypeError: If the dtype cast is not allowed by :samp:`{casting}`.
+    """
+    logger = _logging.getLogger(__name__ + ".copy_to")
+    src = _np.asanyarray(src)
+    if not _np.can_cast(src.dtype, dst.dtype, casting=casting):
+        raise TypeError(
+            "Got src.dtype=%s, dst.dtype=%s, should be castable with casting=%s."
+            %
+            (src.dtype, dst.dtype, casting)
+        )
+    try:
+        src_view = _np.broadcast_to(src, dst.shape)
+    except ValueError:
+        raise ValueError(
+            "Got src.shape=%s, should broadcast to dst.shape=%s." % (src.shape, dst.shape)
+        )
+    where_is_array = not (isinstance(where, bool) and where)
+    if where_is_array:
+        where = _np.broadcast_to(_np.asanyarray(where, dtype="bool"), dst.shape)
+    if num_workers is None:
+        num_workers = _default_num_workers()
+    if max_tile_bytes is None:
+        max_tile_bytes = _detect_host().cache_size(2)
+    if max_bytes_in_flight is not None:
+        if max_bytes_in_flight < 1:
+            raise ValueError(
+                "Got max_bytes_in_flight=%s, should be positive." % (max_bytes_in_flight, )
+            )
+        max_tile_bytes = min([max_tile_bytes, max_bytes_in_flight])
+        num_workers = max([1, min([num_workers, max_bytes_in_flight // max_tile_bytes])])
+
+    itemsize = src.itemsize + dst.itemsize
+    overlap = _is_partial_overlap(src_view, dst)
+    if (dst.size * itemsize <= max_tile_bytes) or (dst.ndim == 0) or overlap:
+        logger.debug("Serial copyto, size=%s, overlap=%s.", dst.size, overlap)
+        _np.copyto(dst, src_view, casting=casting, where=where)
+    else:
+        axis_orders = [axis_order(dst), ]
+        if 0 not in src_view.strides:
+            axis_orders.append(axis_order(src_view))
+        splitter = \
+            calculate_parallel_splitter(
+                dst.shape,
+                itemsize,
+                axis_orders=axis_orders,
+                max_tile_bytes=max_tile_bytes,
+                num_workers=num_workers
+            )
+        slices = _tile_slices(splitter)
+
+        def tile_copy(rank):
+            slice_tuple = slices[rank]
+            _np.copyto(
+                dst[slice_tuple],
+                src_view[slice_tuple],
+                casting=casting,
+                where=where[slice_tuple] if where_is_array else True
+            )
+
+        logger.debug(
+            "Parallel copyto, %s tiles, %s workers, max_tile_bytes=%s.",
+            len(slices), num_workers, max_tile_bytes
+        )
+        _WorkStealingScheduler(splitter, num_workers).map_ranks(tile_copy, len(slices))
+    if isinstance(dst, _np.memmap):
+        dst.flush()
+    return dst
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
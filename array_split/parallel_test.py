@@ -0,0 +1,243 @@
+"""
+===========================================
+The :mod:`array_split.parallel_test` Module
+===========================================
+
+.. currentmodule:: array_split.parallel_test
+
+Module defining :mod:`array_split.parallel` unit-tests.
+Execute as::
+
+   python -m array_split.parallel_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   ParallelTest - :obj:`unittest.TestCase` for :mod:`array_split.parallel` functions.
+
+
+"""
+from __future__ import absolute_import
+import os as _os
+import shutil as _shutil
+import tempfile as _tempfile
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging
+
+from .parallel import parallel_ufunc, parallel_reduce, ContiguityCost, axis_order
+from .parallel import calculate_parallel_splitter, copy_to
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class ParallelTest(_unittest.TestCase):
+
+    """
+    Tests for :mod:`array_split.parallel` module.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".ParallelTest")
+
+    #: Small tile budget so that the test arrays are split into many tiles.
+    max_tile_bytes = 4096
+
+    def test_contiguity_cost(self):
+        """
+        Test for :obj:`array_split.parallel.ContiguityCost` and
+        :func:`array_split.parallel.calculate_parallel_splitter`.
+        """
+        self.assertSequenceEqual([1, 0], axis_order(_np.zeros((4, 5))))
+        self.assertSequenceEqual([0, 1], axis_order(_np.zeros((4, 5), order="F")))
+        self.assertSequenceEqual([0, 1], axis_order(_np.zeros((4, 5)).T))
+
+        c_cost = ContiguityCost([[1, 0]])
+        costs = c_cost(_np.array([[1, 50], [2, 50], [50, 1]]), (50, 50), 8, None)
+        self.assertTrue(costs[1] < costs[0])
+        self.assertTrue(costs[0] < costs[2])
+
+        splitter = \
+            calculate_parallel_splitter(
+                (256, 256), 8, axis_orders=[[1, 0]], max_tile_bytes=8 * 1024, num_workers=2
+            )
+        splitter.calculate_split()
+        self.assertSequenceEqual([64, 1], splitter.split_shape.tolist())
+        splitter = \
+            calculate_parallel_splitter(
+                (256, 256), 8, axis_orders=[[0, 1]], max_tile_bytes=8 * 1024, num_workers=2
+            )
+        splitter.calculate_split()
+        self.assertSequenceEqual([1, 64], splitter.split_shape.tolist())
+
+    def test_parallel_ufunc(self):
+        """
+        Test for :func:`array_split.parallel.parallel_ufunc`, compared with serial ufunc calls.
+        """
+        mtb = self.max_tile_bytes
+        a = _np.random.uniform(0.5, 1.5, size=(97, 53, 3))
+        b = _np.random.uniform(0.5, 1.5, size=(53, 1))
+        self.assertTrue(
+            _np.array_equal(_np.add(a, b), parallel_ufunc(_np.add, a, b, max_tile_bytes=mtb))
+        )
+        self.assertTrue(_np.array_equal(_np.exp(a), parallel_ufunc(_np.exp, a, max_tile_bytes=mtb)))
+        self.assertTrue(
+            _np.array_equal(
+                _np.multiply(a, 2.0), parallel_ufunc(_np.multiply, a, 2.0, max_tile_bytes=mtb)
+            )
+        )
+        fa = _np.asfortranarray(a)
+        self.assertTrue(
+            _np.array_equal(
+                _np.sqrt(fa), parallel_ufunc(_np.sqrt, fa, max_tile_bytes=mtb, num_workers=3)
+            )
+        )
+
+        # Output dtype and casting.
+        i = _np.arange(10000, dtype="int32").reshape((100, 100))
+        self.assertEqual(
+            _np.dtype("int32"), parallel_ufunc(_np.add, i, i, max_tile_bytes=mtb).dtype
+        )
+        self.assertEqual(
+            _np.dtype("float64"), parallel_ufunc(_np.true_divide, i, 3, max_tile_bytes=mtb).dtype
+        )
+        out = _np.zeros((100, 100), dtype="int16")
+        parallel_ufunc(_np.add, i, i, out=out, casting="unsafe", max_tile_bytes=mtb)
+        self.assertTrue(_np.array_equal((i + i).astype("int16"), out))
+
+        # Masked.
+        where = a > 1.0
+        out = _np.zeros_like(a)
+        parallel_ufunc(_np.log, a, out=out, where=where, max_tile_bytes=mtb)
+        self.assertTrue(_np.array_equal(_np.log(a[where]), out[where]))
+        self.assertTrue(_np.all(out[~where] == 0))
+
+        # Multiple outputs.
+        q, r = parallel_ufunc(_np.divmod, i, 7, max_tile_bytes=mtb)
+        self.assertTrue(_np.array_equal(i // 7, q))
+        self.assertTrue(_np.array_equal(i % 7, r))
+
+        # In place, and partially overlapping (serial fallback).
+        c = a.copy()
+        self.assertTrue(parallel_ufunc(_np.add, c, 1.0, out=c, max_tile_bytes=mtb) is c)
+        self.assertTrue(_np.array_equal(a + 1.0, c))
+        c = _np.arange(1000.0)
+        parallel_ufunc(_np.add, c[:-1], c[1:], out=c[1:], max_tile_bytes=64)
+        self.assertTrue(_np.array_equal(_np.arange(999.0) + _np.arange(1.0, 1000.0), c[1:]))
+
+        self.assertRaises(ValueError, parallel_ufunc, _np.add, a)
+        self.assertRaises(ValueError, parallel_ufunc, _np.exp, a, out=_np.zeros((3, 3)))
+
+    def test_parallel_reduce(self):
+        """
+        Test for :func:`array_split.parallel.parallel_reduce`, compared
+        with :meth:`numpy.ufunc.reduce`.
+        """
+        mtb = self.max_tile_bytes
+        a = _np.random.randint(0, 100, size=(61, 37, 5)).astype("int64")
+        for axis in [None, 0, 1, -1, (0, 2), (1, 2)]:
+            for keepdims in [False, True]:
+                for ufunc in [_np.add, _np.maximum, _np.minimum]:
+                    expected = ufunc.reduce(a, axis=axis, keepdims=keepdims)
+                    actual = \
+                        parallel_reduce(
+                            ufunc, a, axis=axis, keepdims=keepdims, max_tile_bytes=mtb
+                        )
+                    self.assertTrue(_np.array_equal(expected, actual), "%s, %s" % (ufunc, axis))
+
+        where = a > 50
+        for axis in [None, 1]:
+            expected = _np.add.reduce(a, axis=axis, where=where, initial=10)
+            actual = \
+                parallel_reduce(
+                    _np.add, a, axis=axis, where=where, initial=10, max_tile_bytes=mtb
+                )
+            self.assertTrue(_np.array_equal(expected, actual))
+            expected = _np.maximum.reduce(a, axis=axis, where=where, initial=-1)
+            actual = \
+                parallel_reduce(
+                    _np.maximum, a, axis=axis, where=where, initial=-1, max_tile_bytes=mtb
+                )
+            self.assertTrue(_np.array_equal(expected, actual))
+
+        out = _np.zeros((37, ), dtype="float64")
+        ret = \
+            parallel_reduce(
+                _np.add, a, axis=(0, 2), dtype="float64", out=out, max_tile_bytes=mtb
+            )
+        self.assertTrue(ret is out)
+        self.assertTrue(_np.array_equal(a.sum(axis=(0, 2)), out))
+
+        f = _np.random.uniform(size=(200, 300))
+        self.assertTrue(
+            _np.allclose(f.sum(axis=0), parallel_reduce(_np.add, f, max_tile_bytes=mtb))
+        )
+        self.assertRaises(TypeError, parallel_reduce, _np.add, f, max_tile_bytes=mtb, bogus=1)
+
+    def test_copy_to(self):
+        """
+        Test for :func:`array_split.parallel.copy_to`, between memory orders,
+        dtypes and :obj:`numpy.memmap` arrays.
+        """
+        mtb = self.max_tile_bytes
+        a = _np.random.uniform(size=(67, 45, 7))
+        for order in ["C", "F"]:
+            for dtype in ["float64", "float32"]:
+                dst = _np.zeros(a.shape, dtype=dtype, order=order)
+                self.assertTrue(copy_to(a, dst, max_tile_bytes=mtb, num_workers=3) is dst)
+                self.assertTrue(_np.array_equal(a.astype(dtype), dst))
+        dst = _np.zeros((45, 67), dtype="float64")
+        copy_to(a[:, :, 3].T, dst, max_tile_bytes=mtb)
+        self.assertTrue(_np.array_equal(a[:, :, 3].T, dst))
+
+        # Broadcast source, masked and bounded bytes in flight.
+        dst = _np.zeros(a.shape)
+        copy_to(a[0], dst, where=a > 0.5, max_tile_bytes=mtb, max_bytes_in_flight=3 * mtb)
+        expected = _np.where(a > 0.5, _np.broadcast_to(a[0], a.shape), 0)
+        self.assertTrue(_np.array_equal(expected, dst))
+        dst = _np.zeros(a.shape, dtype="float32")
+        copy_to(a, dst, max_tile_bytes=mtb, max_bytes_in_flight=100)
+        self.assertTrue(_np.array_equal(a.astype("float32"), dst))
+
+        # Overlapping (serial fallback).
+        b = _np.arange(1000)
+        copy_to(b[:-10].copy(), b[10:], max_tile_bytes=64)
+        copy_to(b[:-10], b[10:], max_tile_bytes=64)
+        self.assertTrue(_np.array_equal(_np.arange(980), b[20:]))
+
+        tmp_dir = _tempfile.mkdtemp()
+        try:
+            src_file_name = _os.path.join(tmp_dir, "src.dat")
+            dst_file_name = _os.path.join(tmp_dir, "dst.dat")
+            src = _np.memmap(src_file_name, dtype="float64", mode="w+", shape=a.shape)
+            src[...] = a
+            src.flush()
+            src = _np.memmap(src_file_name, dtype="float64", mode="r", shape=a.shape)
+            dst = \
+                _np.memmap(dst_file_name, dtype="float32", mode="w+", shape=a.shape, order="F")
+            copy_to(src, dst, max_tile_bytes=mtb)
+            del dst
+            dst = _np.memmap(dst_file_name, dtype="float32", mode="r", shape=a.shape, order="F")
+            self.assertTrue(_np.array_equal(a.astype("float32"), dst))
+            del src, dst
+        finally:
+            _shutil.rmtree(tmp_dir)
+
+        self.assertRaises(TypeError, copy_to, a, _np.zeros(a.shape, dtype="float32"), "safe")
+        self.assertRaises(ValueError, copy_to, a, _np.zeros((3, 3)))
+        self.assertRaises(ValueError, copy_to, a, _np.zeros(a.shape), max_bytes_in_flight=0)
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+_unittest.main(__name__)
@@ -0,0 +1,794 @@
+"""
+==================================
+The :mod:`array_split.plan` Module
+==================================
+
+.. currentmodule:: array_split.plan
+
+Persistence of calculated splits (*plans*). A :obj:`SplitPlan` holds the
+split parameters, the :attr:`array_split.ShapeSplitter.split_shape` and
+the per-axis tile extents, slice bounds and halos. Because the tile extents
+of a split are separable (the extent of a tile along axis :samp:`a` depends only
+on the tile index along axis :samp:`a`), the plan is stored in :samp:`O(sum(split_shape))`
+space rather than :samp:`O(prod(split_shape))`. Plans are saved in a compact
+versioned binary file which can be memory mapped, so many processes can
+share one plan without recalculating the split (or pickling :obj:`slice` objects).
+
+The binary file layout (all integers little-endian) is:
+
+   =============  =========================================================
+   Bytes          Content
+   =============  =========================================================
+   :samp:`8`      Magic bytes :data:`PLAN_MAGIC`.
+   :samp:`4`      :samp:`uint32` file format version, :data:`PLAN_FORMAT_VERSION`.
+   :samp:`4`      :samp:`uint32` length of the header.
+   header         UTF-8 JSON header (parameters, split shape, axis offsets),
+                  space padded so that the table is :samp:`64` byte aligned.
+   table          :samp:`(sum(split_shape), len(PLAN_TABLE_COLUMNS))`
+                  shaped :samp:`int64` C-order table, see :data:`PLAN_TABLE_COLUMNS`.
+   =============  =========================================================
+
+Example::
+
+   >>> import os, tempfile
+   >>> from array_split import ShapeSplitter
+   >>> splitter = ShapeSplitter((10, 20), 8, axis=[0, 0], halo=1)
+   >>> fd, file_name = tempfile.mkstemp(suffix=".asplan"); os.close(fd)
+   >>> save_plan(splitter, file_name)
+   >>> plan = load_plan(file_name)
+   >>> plan.split_shape
+   array([4, 2])
+   >>> plan.tile_at((1, 1))[0] == splitter.tile_at((1, 1))[0]
+   True
+   >>> bool((plan.calculate_split() == splitter.calculate_split()).all())
+   True
+   >>> del plan
+   >>> os.remove(file_name)
+
+Plans can be cached across processes and runs using a :obj:`PlanCache`, a
+directory of plan files named by a hash of the split parameters
+and the :mod:`array_split` version (i.e. content addressed)::
+
+   >>> import shutil
+   >>> cache = PlanCache(tempfile.mkdtemp(), max_bytes=2**20)
+   >>> plan = cache.get_plan(ShapeSplitter((1000, 1000), 64))  # calculated and saved
+   >>> plan = cache.get_plan(ShapeSplitter((1000, 1000), 64))  # loaded
+   >>> cache.hits, cache.misses
+   (1, 1)
+   >>> del plan
+   >>> shutil.rmtree(cache.cache_dir)
+
+Classes and Functions
+=====================
+
+.. autosummary::
+   :toctree: generated/
+
+   SplitPlan - Calculated split (per-axis extents, slices and halos).
+   splitter_parameters - Returns JSON serialisable split parameters of a splitter.
+   save_plan - Writes a split plan to a binary file.
+   write_plan - Writes a split plan to a binary file object.
+   load_plan - Reads (memory maps) a split plan from a binary file.
+   plan_key - Returns the content hash key for the split parameters of a splitter.
+   PlanCache - On-disk, size bounded, cache of split plans.
+
+Attributes
+==========
+
+.. autodata:: PLAN_MAGIC
+.. autodata:: PLAN_FORMAT_VERSION
+.. autodata:: PLAN_TABLE_COLUMNS
+.. autodata:: PLAN_CACHE_DIR_ENV_VAR
+
+"""
+from __future__ import absolute_import
+import os as _os
+import sys as _sys
+import time as _time
+import inspect as _inspect
+import json as _json
+import errno as _errno
+import struct as _struct
+import hashlib as _hashlib
+import tempfile as _tempfile
+import itertools as _itertools
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import logging as _logging
+from .split import ShapeSplitter
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+#: Magic bytes at the start of a plan file.
+PLAN_MAGIC = b"ASPLTPLN"
+
+#: Version of the plan file format.
+PLAN_FORMAT_VERSION = 1
+
+#: Columns of the per-axis plan table. For each tile index along an axis:
+#: the tile extent (:samp:`"beg"`, :samp:`"end"`, excluding halo and array start),
+#: the tile slice bounds (:samp:`"start"`, :samp:`"stop"`, including halo and array start)
+#: and the (bounds-trimmed) halo (:samp:`"halo_lo"`, :samp:`"halo_hi"`).
+PLAN_TABLE_COLUMNS = ("beg", "end", "start", "stop", "halo_lo", "halo_hi")
+
+#: :mod:`struct` format of the fixed size file preamble (after the magic bytes).
+_PREAMBLE_FORMAT = "<II"
+
+#: Byte alignment of the table in the plan file.
+_TABLE_ALIGNMENT = 64
+
+#: Environment variable which (when set) specifies the default :obj:`PlanCache` directory.
+PLAN_CACHE_DIR_ENV_VAR = "ARRAY_SPLIT_PLAN_CACHE_DIR"
+
+#: File name suffix of plan files in a :obj:`PlanCache` directory.
+_CACHE_FILE_SUFFIX = ".asplan"
+
+#: File name prefix of (partially written) temporary files in a :obj:`PlanCache` directory.
+_CACHE_TEMP_PREFIX = ".tmp-"
+
+#: Age (seconds) after which orphaned temporary files are removed by :meth:`PlanCache.evict`.
+_CACHE_TEMP_MAX_AGE = 3600.0
+
+#: Atomic rename (:func:`os.replace` is python-3.3+).
+_replace = getattr(_os, "replace", _os.rename)
+
+
+def _to_json_value(obj):
+    """
+    Returns :samp:`{obj}` converted to :obj:`int`/:obj:`float`/:obj:`list`/:samp:`None`
+    (nested) values, i.e. :mod:`numpy` scalars and arrays converted to python types.
+    """
+    if obj is None:
+        return None
+    if _np.ndim(obj) == 0:
+        if _np.issubdtype(_np.asarray(obj).dtype, _np.integer):
+            return int(obj)
+        return float(obj)
+    return [_to_json_value(o) for o in obj]
+
+
+def _tile_bounds_policy_name(tile_bounds_policy):
+    """
+    Returns the :obj:`str` name of a tile bounds policy, e.g. :samp:`"array_bounds"`.
+    """
+    return tile_bounds_policy.fget()
+
+
+def _tile_shape_cost_name(tile_shape_cost):
+    """
+    Returns the stable :obj:`str` name of a tile shape cost function
+    (:samp:`None` for the greedy default). Module level functions are
+    named :samp:`"module.name"`, objects with a :samp:`cache_key()`
+    method (e.g. :obj:`array_split.parallel.ContiguityCost`) are named
+    :samp:`"module.ClassName(cache_key)"`.
+
+    :raises ValueError: For other cost callables (e.g. lambdas, nested
+       functions or :func:`functools.partial` objects), which have no name
+       that identifies the split they calculate.
+    """
+    if tile_shape_cost is None:
+        return None
+    if callable(getattr(tile_shape_cost, "cache_key", None)):
+        cost_type = type(tile_shape_cost)
+        return \
+            "%s.%s(%s)" % (cost_type.__module__, cost_type.__name__, tile_shape_cost.cache_key())
+    module_name = getattr(tile_shape_cost, "__module__", None)
+    name = getattr(tile_shape_cost, "__name__", None)
+    if (
+        _inspect.isfunction(tile_shape_cost)
+        and
+        (getattr(_sys.modules.get(module_name), str(name), None) is tile_shape_cost)
+    ):
+        return "%s.%s" % (module_name, name)
+    raise ValueError(
+        "Got tile_shape_cost=%r, should be None, a module level function or "
+        "an object with a cache_key() method."
+        %
+        (tile_shape_cost, )
+    )
+
+
+def _tile_bounds_policy_from_name(name):
+    """
+    Returns the tile bounds policy object with the specified :samp:`{name}`.
+    """
+    for tile_bounds_policy in ShapeSplitter.valid_tile_bounds_policies:
+        if _tile_bounds_policy_name(tile_bounds_policy) == name:
+            return tile_bounds_policy
+    raise ValueError(
+        "Got tile_bounds_policy name %s, which is not one of %s."
+        %
+        (name, [_tile_bounds_policy_name(p) for p in ShapeSplitter.valid_tile_bounds_policies])
+    )
+
+
+def splitter_parameters(splitter):
+    """
+    Returns the (current) split parameters of :samp:`{splitter}` as a JSON
+    serialisable :obj:`dict`. Sequence valued parameters are converted
+    to :obj:`list`, the :attr:`array_split.ShapeSplitter.tile_bounds_policy`
+    and :attr:`array_split.ShapeSplitter.tile_shape_cost` are converted
+    to :obj:`str` names.
+
+    :type splitter: :obj:`array_split.ShapeSplitter`
+    :param splitter: Splitter whose parameters are returned.
+    :rtype: :obj:`dict`
+    :return: Dictionary of :samp:`(parameter_name, value)` items.
+    :raises ValueError: If the :attr:`array_split.ShapeSplitter.tile_shape_cost`
+       has no stable name (e.g. a :samp:`lambda`).
+
+    Example::
+
+       >>> from array_split import ShapeSplitter
+       >>> params = splitter_parameters(ShapeSplitter((10, 20), tile_shape=(5, 5)))
+       >>> params["tile_shape"], params["halo"], params["tile_bounds_policy"]
+       ([5, 5], [[0, 0], [0, 0]], 'array_bounds')
+    """
+    indices_per_axis = splitter.indices_per_axis
+    if indices_per_axis is not None:
+        indices_per_axis = [_to_json_value(indices) for indices in indices_per_axis]
+    return \
+        {
+            "array_shape": _to_json_value(splitter.array_shape),
+            "array_start": _to_json_value(splitter.array_start),
+            "array_itemsize": _to_json_value(splitter.array_itemsize),
+            "indices_per_axis": indices_per_axis,
+            "split_size": _to_json_value(splitter.split_size),
+            "split_num_slices_per_axis": _to_json_value(splitter.split_num_slices_per_axis),
+            "tile_shape": _to_json_value(splitter.tile_shape),
+            "max_tile_bytes": _to_json_value(splitter.max_tile_bytes),
+            "max_tile_shape": _to_json_value(splitter.max_tile_shape),
+            "sub_tile_shape": _to_json_value(splitter.sub_tile_shape),
+            "halo": _to_json_value(splitter.halo),
+            "tile_bounds_policy": _tile_bounds_policy_name(splitter.tile_bounds_policy),
+            "tile_shape_cost": _tile_shape_cost_name(splitter.tile_shape_cost),
+            "min_num_tiles": _to_json_value(splitter.min_num_tiles),
+            "min_tile_bytes": _to_json_value(splitter.min_tile_bytes),
+        }
+
+
+class SplitPlan(object):
+
+    """
+    A calculated split, stored as per-axis tables (see :data:`PLAN_TABLE_COLUMNS`).
+    Provides the :obj:`array_split.ShapeSplitter` split queries
+    (:meth:`calculate_split`, :meth:`tile_at`, :meth:`tile`) without
+    recalculating the split. Create using :meth:`from_splitter` or :func:`load_plan`.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".SplitPlan")
+
+    def __init__(self, parameters, split_shape, table):
+        """
+        Initialise.
+
+        :type parameters: :obj:`dict`
+        :param parameters: Split parameters, see :func:`splitter_parameters`.
+        :type split_shape: sequence of :obj:`int`
+        :param split_shape: The shape of the split (number of tiles per axis).
+        :type table: :obj:`numpy.ndarray`
+        :param table: The :samp:`(sum({split_shape}), len(PLAN_TABLE_COLUMNS))`
+           shaped :samp:`int64` table (e.g. a :obj:`numpy.memmap`), rows
+           for axis :samp:`a` follow the rows for axis :samp:`a - 1`.
+        """
+        self.parameters = parameters
+        self.split_shape = _np.array(split_shape, dtype="int64")
+        if (len(table.shape) != 2) or (table.shape[1] != len(PLAN_TABLE_COLUMNS)):
+            raise ValueError(
+                "Got table.shape=%s, expecting (N, %s) shape."
+                %
+                (table.shape, len(PLAN_TABLE_COLUMNS))
+            )
+        if table.shape[0] != _np.sum(self.split_shape):
+            raise ValueError(
+                "Got table.shape[0]=%s, expecting sum(split_shape)=%s."
+                %
+                (table.shape[0], _np.sum(self.split_shape))
+            )
+        self.table = table
+        #: Row offset of each axis in :attr:`table`.
+        self.axis_offsets = _np.zeros((len(self.split_shape) + 1,), dtype="int64")
+        self.axis_offsets[1:] = _np.cumsum(self.split_shape)
+
+    @staticmethod
+    def from_splitter(splitter):
+        """
+        Returns the :obj:`SplitPlan` for :samp:`{splitter}`. The split extents
+        are calculated (:meth:`array_split.ShapeSplitter.set_split_extents`)
+        if they have not already been calculated.
+
+        :type splitter: :obj:`array_split.ShapeSplitter`
+        :param splitter: The splitter.
+        :rtype: :obj:`SplitPlan`
+        :return: The plan of the :samp:`{splitter}` split.
+        """
+        if splitter.split_begs is None:
+            splitter.set_split_extents()
+        parameters = splitter_parameters(splitter)
+        ndim = len(splitter.split_shape)
+        tables = []
+        for d in range(ndim):
+            axis_table = _np.zeros((splitter.split_shape[d], len(PLAN_TABLE_COLUMNS)), "int64")
+            axis_table[:, 0] = splitter.split_begs[d]
+            axis_table[:, 1] = splitter.split_ends[d]
+            axis_table[:, 2], axis_table[:, 3], axis_table[:, 4:6] = \
+                splitter.calculate_axis_tile_bounds(d)
+            tables.append(axis_table)
+        return SplitPlan(parameters, splitter.split_shape, _np.concatenate(tables, axis=0))
+
+    @property
+    def ndim(self):
+        """
+        The number of dimensions of the split.
+        """
+        return len(self.split_shape)
+
+    @property
+    def tile_bounds_policy(self):
+        """
+        The :attr:`array_split.ShapeSplitter.tile_bounds_policy` of the split.
+        """
+        return _tile_bounds_policy_from_name(self.parameters["tile_bounds_policy"])
+
+    @property
+    def num_tiles(self):
+        """
+        The number of tiles in the split.
+        """
+        return int(_np.prod(self.split_shape))
+
+    def axis_table(self, axis):
+        """
+        Returns the :samp:`(split_shape[{axis}], len(PLAN_TABLE_COLUMNS))` shaped
+        (view) of :attr:`table` for axis :samp:`{axis}`.
+        """
+        return self.table[self.axis_offsets[axis]:self.axis_offsets[axis + 1]]
+
+    @property
+    def split_begs(self):
+        """
+        List of per-axis tile start indices, equivalent
+        to :attr:`array_split.ShapeSplitter.split_begs`.
+        """
+        return [self.axis_table(d)[:, 0] for d in range(self.ndim)]
+
+    @property
+    def split_ends(self):
+        """
+        List of per-axis tile stop indices, equivalent
+        to :attr:`array_split.ShapeSplitter.split_ends`.
+        """
+        return [self.axis_table(d)[:, 1] for d in range(self.ndim)]
+
+    def tile_at(self, multi_index):
+        """
+        Returns the slice and halo for the tile at split position :samp:`{multi_index}`,
+        see :meth:`array_split.ShapeSplitter.tile_at`.
+
+        :type multi_index: sequence of :obj:`int`
+        :param multi_index: Index of the tile in the (:attr:`split_shape` shaped) split.
+        :rtype: :obj:`tuple`
+        :return: Pair :samp:`(slice_tuple, halo)`.
+        :raises ValueError: If :samp:`{multi_index}` is outside the split.
+        """
+        multi_index = tuple(int(i) for i in multi_index)
+        if (
+            (len(multi_index) != self.ndim)
+            or
+            _np.any(_np.array(multi_index) < 0)
+            or
+            _np.any(_np.array(multi_index) >= self.split_shape)
+        ):
+            raise ValueError(
+                "Got multi_index=%s, which is not in split of shape %s."
+                %
+                (multi_index, tuple(self.split_shape))
+            )
+        rows = self.table[self.axis_offsets[:-1] + multi_index]
+        return \
+            (
+                tuple(slice(int(row[2]), int(row[3])) for row in rows),
+                _np.array(rows[:, 4:6], dtype="int64")
+            )
+
+    def tile(self, rank):
+        """
+        Returns the slice and halo for the tile with (C-order) flat
+        index :samp:`{rank}`, see :meth:`array_split.ShapeSplitter.tile`.
+
+        :type rank: :obj:`int`
+        :param rank: Flat index of the tile, :samp:`0 <= {rank} < {self}.num_tiles`.
+        :rtype: :obj:`tuple`
+        :return: Pair :samp:`(slice_tuple, halo)`.
+        :raises ValueError: If :samp:`{rank}` is outside the split.
+        """
+        if (rank < 0) or (rank >= self.num_tiles):
+            raise ValueError(
+                "Got rank=%s, should be in range [0, %s)." % (rank, self.num_tiles)
+            )
+        return self.tile_at(_np.unravel_index(int(rank), tuple(self.split_shape)))
+
+    def calculate_split(self):
+        """
+        Returns the split, equal to :meth:`array_split.ShapeSplitter.calculate_split`.
+
+        :rtype: :obj:`numpy.ndarray`
+        :return:
+           A :mod:`numpy` `structured array <http://docs.scipy.org/doc/numpy/user/basics.rec.html>`_
+           where each element is a :obj:`tuple` of :obj:`slice` objects.
+        """
+        axis_slices = \
+            [
+                [slice(int(row[2]), int(row[3])) for row in self.axis_table(d)]
+                for d in range(self.ndim)
+            ]
+        return \
+            _np.array(
+                list(_itertools.product(*axis_slices)),
+                dtype=[("%d" % d, "object") for d in range(self.ndim)]
+            ).reshape(self.split_shape)
+
+    def calculate_split_halos(self):
+        """
+        Returns the per-tile halos, equal
+        to :meth:`array_split.ShapeSplitter.calculate_split_halos_from_extents`.
+
+        :rtype: :obj:`numpy.ndarray`
+        :return:
+           A :mod:`numpy` `structured array <http://docs.scipy.org/doc/numpy/user/basics.rec.html>`_
+           where each element is a :samp:`(ndim, 2)` shaped array of halo sizes.
+        """
+        ret = \
+            _np.zeros(
+                tuple(self.split_shape),
+                dtype=[("%d" % d, "2int64") for d in range(self.ndim)]
+            )
+        for d in range(self.ndim):
+            shape = [1, ] * self.ndim + [2, ]
+            shape[d] = self.split_shape[d]
+            ret["%d" % d] = self.axis_table(d)[:, 4:6].reshape(shape)
+        return ret
+
+
+def _plan_header(plan):
+    """
+    Returns the UTF-8 encoded (padded) JSON header bytes for :samp:`{plan}`.
+    """
+    header = \
+        _json.dumps(
+            {
+                "array_split_version": __version__,
+                "parameters": plan.parameters,
+                "split_shape": _to_json_value(plan.split_shape),
+                "columns": list(PLAN_TABLE_COLUMNS),
+            },
+            sort_keys=True
+        ).encode("utf-8")
+    preamble_size = len(PLAN_MAGIC) + _struct.calcsize(_PREAMBLE_FORMAT)
+    padding = (-(preamble_size + len(header))) % _TABLE_ALIGNMENT
+    return header + b" " * padding
+
+
+def write_plan(plan, fp):
+    """
+    Writes :samp:`{plan}` to the (binary) file object :samp:`{fp}`.
+
+    :type plan: :obj:`SplitPlan`
+    :param plan: Plan to be written.
+    :type fp: file-like
+    :param fp: Binary file object.
+    """
+    header = _plan_header(plan)
+    fp.write(PLAN_MAGIC)
+    fp.write(_struct.pack(_PREAMBLE_FORMAT, PLAN_FORMAT_VERSION, len(header)))
+    fp.write(header)
+    fp.write(_np.ascontiguousarray(plan.table, dtype="<i8").tobytes())
+
+
+def save_plan(splitter_or_plan, file_name):
+    """
+    Writes the split plan of :samp:`{splitter_or_plan}` to
+    binary file :samp:`{file_name}`.
+
+    :type splitter_or_plan: :obj:`array_split.ShapeSplitter` or :obj:`SplitPlan`
+    :param splitter_or_plan: The split to be saved, a :obj:`array_split.ShapeSplitter`
+       is converted using :meth:`SplitPlan.from_splitter`.
+    :type file_name: :obj:`str`
+    :param file_name: Output file path.
+    """
+    plan = splitter_or_plan
+    if not isinstance(plan, SplitPlan):
+        plan = SplitPlan.from_splitter(plan)
+    with open(file_name, "wb") as fp:
+        write_plan(plan, fp)
+
+
+def load_plan(file_name, mmap_mode="r"):
+    """
+    Reads a split plan from binary file :samp:`{file_name}` (written by :func:`save_plan`).
+
+    :type file_name: :obj:`str`
+    :param file_name: Plan file path.
+    :type mmap_mode: :samp:`None` or :obj:`str`
+    :param mmap_mode: If not :samp:`None`, the plan table is a :obj:`numpy.memmap`
+       opened with this mode, otherwise the table is read into memory.
+    :rtype: :obj:`SplitPlan`
+    :return: The plan.
+    :raises ValueError: If the file is not a plan file or has an unsupported format version.
+    """
+    preamble_size = len(PLAN_MAGIC) + _struct.calcsize(_PREAMBLE_FORMAT)
+    with open(file_name, "rb") as fp:
+        preamble = fp.read(preamble_size)
+        if (len(preamble) != preamble_size) or (preamble[0:len(PLAN_MAGIC)] != PLAN_MAGIC):
+            raise ValueError("Got file %s, which is not a split plan file." % file_name)
+        format_version, header_size = \
+            _struct.unpack(_PREAMBLE_FORMAT, preamble[len(PLAN_MAGIC):])
+        if format_version != PLAN_FORMAT_VERSION:
+            raise ValueError(
+                "Got plan format_version=%s, expecting format_version=%s."
+                %
+                (format_version, PLAN_FORMAT_VERSION)
+            )
+        header = _json.loads(fp.read(header_size).decode("utf-8"))
+        table_shape = (int(_np.sum(header["split_shape"])), len(header["columns"]))
+        table_offset = preamble_size + header_size
+        if mmap_mode is None:
+            table = \
+                _np.frombuffer(
+                    fp.read(int(_np.prod(table_shape)) * 8),
+                    dtype="<i8"
+                ).reshape(table_shape)
+    if mmap_mode is not None:
+        table = \
+            _np.memmap(
+                file_name,
+                dtype="<i8",
+                mode=mmap_mode,
+                offset=table_offset,
+                shape=table_shape
+            )
+    return SplitPlan(header["parameters"], header["split_shape"], table)
+
+
+def plan_key(splitter):
+    """
+    Returns the content hash key of the split defined by :samp:`{splitter}`. The
+    key is the SHA-256 hex digest of the canonical (sorted key, compact) JSON
+    of :func:`splitter_parameters`, the :mod:`array_split` version
+    and :data:`PLAN_FORMAT_VERSION`. Note that calculating the split canonicalises
+    some parameters (e.g. :attr:`array_split.ShapeSplitter.split_num_slices_per_axis`),
+    so the key of a splitter may change after the split has been calculated.
+
+    :type splitter: :obj:`array_split.ShapeSplitter`
+    :param splitter: Splitter defining the split.
+    :rtype: :obj:`str`
+    :return: Hexadecimal key string.
+    :raises ValueError: If the split parameters can not be keyed,
+       see :func:`splitter_parameters`.
+    """
+    canonical = \
+        _json.dumps(
+            {
+                "array_split_version": __version__,
+                "plan_format_version": PLAN_FORMAT_VERSION,
+                "parameters": splitter_parameters(splitter),
+            },
+            sort_keys=True,
+            separators=(",", ":")
+        )
+    return _hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class PlanCache(object):
+
+    """
+    On-disk cache of :obj:`SplitPlan` files, keyed by :func:`plan_key`. Safe for
+    use by concurrent processes (and threads):
+
+       * Plans are written to a temporary file in the cache directory which
+         is atomically renamed to the plan file name, so readers never see a
+         partially written plan.
+       * Plans are loaded memory mapped, evicting (unlinking) a plan file does
+         not affect processes which have already loaded it.
+       * Unreadable (e.g. concurrently evicted or corrupt) plan files are
+         treated as cache misses.
+
+    The total size of the plan files is bounded by :attr:`max_bytes`, least
+    recently used plans (by file modification time, which is updated on
+    each cache hit) are evicted first.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".PlanCache")
+
+    def __init__(self, cache_dir=None, max_bytes=2 ** 30):
+        """
+        Initialise, creates the :samp:`{cache_dir}` directory if it does not exist.
+
+        :type cache_dir: :samp:`None` or :obj:`str`
+        :param cache_dir: Cache directory. If :samp:`None`, the directory is given
+           by the :data:`PLAN_CACHE_DIR_ENV_VAR` environment variable, or if
+           that is not set, :samp:`~/.cache/array_split/plans`.
+        :type max_bytes: :samp:`None` or :obj:`int`
+        :param max_bytes: Upper bound on the total bytes of plan files
+           in the cache, :samp:`None` for no bound.
+        """
+        if cache_dir is None:
+            cache_dir = \
+                _os.environ.get(
+                    PLAN_CACHE_DIR_ENV_VAR,
+                    _os.path.join(_os.path.expanduser("~"), ".cache", "array_split", "plans")
+                )
+        if (max_bytes is not None) and (max_bytes < 0):
+            raise ValueError("Got max_bytes=%s, should be non-negative." % max_bytes)
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        #: Number of :meth:`get_plan` cache hits.
+        self.hits = 0
+        #: Number of :meth:`get_plan` cache misses.
+        self.misses = 0
+        try:
+            _os.makedirs(self.cache_dir)
+        except OSError as e:
+            if (e.errno != _errno.EEXIST) or (not _os.path.isdir(self.cache_dir)):
+                raise
+
+    def file_name(self, key):
+        """
+        Returns the plan file path for :samp:`{key}`.
+        """
+        return _os.path.join(self.cache_dir, key + _CACHE_FILE_SUFFIX)
+
+    def load(self, key):
+        """
+        Returns the (memory mapped) cached plan for :samp:`{key}`,
+        :samp:`None` if there is no (readable) cached plan.
+
+        :type key: :obj:`str`
+        :param key: Plan key, see :func:`plan_key`.
+        :rtype: :samp:`None` or :obj:`SplitPlan`
+        :return: The cached plan.
+        """
+        file_name = self.file_name(key)
+        try:
+            plan = load_plan(file_name, mmap_mode="r")
+        except (IOError, OSError, ValueError) as e:
+            if _os.path.exists(file_name):
+                self.logger.warning("Could not load cached plan %s: %s", file_name, e)
+            return None
+        try:
+            _os.utime(file_name, None)
+        except OSError:
+            pass
+        return plan
+
+    def save(self, key, plan):
+        """
+        Atomically writes :samp:`{plan}` to the cache with key :samp:`{key}`,
+        then evicts plans if the cache exceeds :attr:`max_bytes`.
+
+        :type key: :obj:`str`
+        :param key: Plan key, see :func:`plan_key`.
+        :type plan: :obj:`SplitPlan`
+        :param plan: Plan to be cached.
+        """
+        fd, temp_file_name = \
+            _tempfile.mkstemp(prefix=_CACHE_TEMP_PREFIX, suffix=".tmp", dir=self.cache_dir)
+        try:
+            with _os.fdopen(fd, "wb") as fp:
+                write_plan(plan, fp)
+                fp.flush()
+                _os.fsync(fp.fileno())
+            _replace(temp_file_name, self.file_name(key))
+        except BaseException:
+            if _os.path.exists(temp_file_name):
+                _os.remove(temp_file_name)
+            raise
+        self.evict()
+
+    def get_plan(self, splitter):
+        """
+        Returns the plan for :samp:`{splitter}`, loaded from the cache if it exists,
+        otherwise calculated (:meth:`SplitPlan.from_splitter`) and saved to the cache.
+
+        :type splitter: :obj:`array_split.ShapeSplitter`
+        :param splitter: Splitter defining the split.
+        :rtype: :obj:`SplitPlan`
+        :return: The plan.
+        :raises ValueError: If the split can not be keyed (see :func:`plan_key`),
+           e.g. a :samp:`lambda` :attr:`array_split.ShapeSplitter.tile_shape_cost`.
+        """
+        key = plan_key(splitter)
+        plan = self.load(key)
+        if plan is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            plan = SplitPlan.from_splitter(splitter)
+            self.save(key, plan)
+        return plan
+
+    def cached_files(self):
+        """
+        Returns list of :samp:`(mtime, num_bytes, file_name)` for the plan files
+        in the cache, sorted by modification time (least recently used first).
+
+        :rtype: :obj:`list`
+        :return: Plan file info.
+        """
+        files = []
+        for name in _os.listdir(self.cache_dir):
+            if name.endswith(_CACHE_FILE_SUFFIX) and not name.startswith(_CACHE_TEMP_PREFIX):
+                file_name = _os.path.join(self.cache_dir, name)
+                try:
+                    stat = _os.stat(file_name)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, file_name))
+        files.sort()
+        return files
+
+    def size_bytes(self):
+        """
+        Returns the total bytes of plan files in the cache.
+        """
+        return sum([f[1] for f in self.cached_files()])
+
+    def _remove(self, file_name):
+        """
+        Removes :samp:`{file_name}`, returns :samp:`False` if it could not be removed
+        (e.g. already removed by a concurrent eviction, or open on Windows).
+        """
+        try:
+            _os.remove(file_name)
+        except OSError:
+            return False
+        return True
+
+    def evict(self, max_bytes=None):
+        """
+        Removes least recently used plans until the total bytes of plan files
+        is no more than :samp:`{max_bytes}`. Also removes orphaned temporary
+        files (e.g. from killed writers).
+
+        :type max_bytes: :samp:`None` or :obj:`int`
+        :param max_bytes: Upper bound on cache bytes, if :samp:`None`, :attr:`max_bytes` is used.
+        :rtype: :obj:`int`
+        :return: The number of evicted plans.
+        """
+        if max_bytes is None:
+            max_bytes = self.max_bytes
+        now = _time.time()
+        for name in _os.listdir(self.cache_dir):
+            if name.startswith(_CACHE_TEMP_PREFIX):
+                file_name = _os.path.join(self.cache_dir, name)
+                try:
+                    if (now - _os.path.getmtime(file_name)) > _CACHE_TEMP_MAX_AGE:
+                        self._remove(file_name)
+                except OSError:
+                    pass
+        num_evicted = 0
+        if max_bytes is not None:
+            files = self.cached_files()
+            total_bytes = sum([f[1] for f in files])
+            for mtime, num_bytes, file_name in files:
+                if total_bytes <= max_bytes:
+                    break
+                if self._remove(file_name):
+                    num_evicted += 1
+                    total_bytes -= num_bytes
+        return num_evicted
+
+    def clear(self):
+        """
+        Removes all plans from the cache.
+        """
+        self.evict(max_bytes=0)
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
@@ -0,0 +1,247 @@
+"""
+=======================================
+The :mod:`array_split.plan_test` Module
+=======================================
+
+.. currentmodule:: array_split.plan_test
+
+Module defining :mod:`array_split.plan` unit-tests.
+Execute as::
+
+   python -m array_split.plan_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   PlanTest - :obj:`unittest.TestCase` for :mod:`array_split.plan` functions.
+
+
+"""
+from __future__ import absolute_import
+import os as _os
+import functools as _functools
+import shutil as _shutil
+import struct as _struct
+import tempfile as _tempfile
+import threading as _threading
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging
+
+from .split import ShapeSplitter, NO_BOUNDS, PERIODIC, ARRAY_BOUNDS, halo_overhead_cost
+from .parallel import ContiguityCost
+from .plan import SplitPlan, save_plan, load_plan, splitter_parameters, PLAN_MAGIC
+from .plan import plan_key, PlanCache
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class PlanTest(_unittest.TestCase):
+
+    """
+    Tests for :mod:`array_split.plan` module.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".PlanTest")
+
+    def setUp(self):
+        """
+        Creates temporary plan file name.
+        """
+        fd, self.file_name = _tempfile.mkstemp(suffix=".asplan")
+        _os.close(fd)
+
+    def tearDown(self):
+        """
+        Removes temporary plan file.
+        """
+        _os.remove(self.file_name)
+
+    def create_splitters(self):
+        """
+        Returns list of splitters covering the split criteria.
+        """
+        return \
+            [
+                ShapeSplitter((31, 17, 5), 12),
+                ShapeSplitter((31, 17, 5), axis=[3, 2, 1], halo=2, array_start=(-3, 10, 0)),
+                ShapeSplitter((31, 17, 5), [[4, 20], [], [1, 2, 3]], halo=1),
+                ShapeSplitter((31, 17, 5), tile_shape=(8, 5, 5), halo=[[1, 2], [0, 3], [1, 1]]),
+                ShapeSplitter(
+                    (31, 17, 5), tile_shape=(8, 5, 5), halo=2, tile_bounds_policy=NO_BOUNDS
+                ),
+                ShapeSplitter((31, 17, 5), 6, halo=3, tile_bounds_policy=PERIODIC),
+                ShapeSplitter((31, 17, 5), array_itemsize=8, max_tile_bytes=1024, halo=1),
+            ]
+
+    def test_save_load_plan(self):
+        """
+        Tests :func:`array_split.plan.save_plan` and :func:`array_split.plan.load_plan`
+        give plans equivalent to the :obj:`array_split.ShapeSplitter` split.
+        """
+        for mmap_mode in ["r", None]:
+            for splitter in self.create_splitters():
+                split = splitter.calculate_split()
+                halos = splitter.calculate_split_halos_from_extents()
+                save_plan(splitter, self.file_name)
+                plan = load_plan(self.file_name, mmap_mode=mmap_mode)
+                if mmap_mode is not None:
+                    self.assertTrue(isinstance(plan.table, _np.memmap))
+                self.assertSequenceEqual(tuple(split.shape), tuple(plan.split_shape))
+                self.assertEqual(split.size, plan.num_tiles)
+                self.assertEqual(splitter_parameters(splitter), plan.parameters)
+                self.assertTrue(plan.tile_bounds_policy is splitter.tile_bounds_policy)
+                self.assertTrue(_np.all(split == plan.calculate_split()))
+                self.assertTrue(_np.all(halos == plan.calculate_split_halos()))
+                for d in range(len(split.shape)):
+                    self.assertTrue(_np.all(splitter.split_begs[d] == plan.split_begs[d]))
+                    self.assertTrue(_np.all(splitter.split_ends[d] == plan.split_ends[d]))
+                for rank in [0, split.size // 2, split.size - 1]:
+                    multi_index = _np.unravel_index(rank, split.shape)
+                    slice_tuple, halo = plan.tile(rank)
+                    self.assertSequenceEqual(split[multi_index].tolist(), slice_tuple)
+                    self.assertTrue(_np.all(_np.array(halos[multi_index].tolist()) == halo))
+                del plan
+
+        plan = SplitPlan.from_splitter(ShapeSplitter((10, 20), 8))
+        self.assertRaises(ValueError, plan.tile, plan.num_tiles)
+        self.assertRaises(ValueError, plan.tile_at, (0, 5))
+        self.assertRaises(ValueError, SplitPlan, plan.parameters, (4, 3), plan.table)
+        self.assertTrue(plan.tile_bounds_policy is ARRAY_BOUNDS)
+
+    def test_load_plan_errors(self):
+        """
+        Tests :func:`array_split.plan.load_plan` raises :obj:`ValueError` for
+        invalid files.
+        """
+        with open(self.file_name, "wb") as fp:
+            fp.write(b"not a plan file")
+        self.assertRaises(ValueError, load_plan, self.file_name)
+
+        save_plan(ShapeSplitter((10, 20), 8), self.file_name)
+        with open(self.file_name, "r+b") as fp:
+            fp.seek(len(PLAN_MAGIC))
+            fp.write(_struct.pack("<I", 999))
+        self.assertRaises(ValueError, load_plan, self.file_name)
+
+    def test_plan_key(self):
+        """
+        Tests :func:`array_split.plan.plan_key`.
+        """
+        key = plan_key(ShapeSplitter((100, 50), 8, halo=1))
+        self.assertEqual(64, len(key))
+        self.assertEqual(key, plan_key(ShapeSplitter([100, 50], 8, halo=[1, 1])))
+        self.assertNotEqual(key, plan_key(ShapeSplitter((100, 50), 8, halo=2)))
+        self.assertNotEqual(key, plan_key(ShapeSplitter((100, 50), 8)))
+        self.assertNotEqual(key, plan_key(ShapeSplitter((100, 50), 8, halo=1, array_start=(1, 0))))
+        self.assertNotEqual(
+            key,
+            plan_key(ShapeSplitter((100, 50), 8, halo=1, tile_bounds_policy=NO_BOUNDS))
+        )
+
+        # Tile shape cost functions
+        def cost_splitter(tile_shape_cost):
+            return \
+                ShapeSplitter(
+                    (256, 256), 8, max_tile_bytes=8 * 1024, tile_shape_cost=tile_shape_cost
+                )
+        key = plan_key(cost_splitter(None))
+        self.assertNotEqual(key, plan_key(cost_splitter(halo_overhead_cost)))
+        c_key = plan_key(cost_splitter(ContiguityCost([[1, 0]])))
+        self.assertEqual(c_key, plan_key(cost_splitter(ContiguityCost([[1, 0]]))))
+        self.assertNotEqual(c_key, plan_key(cost_splitter(ContiguityCost([[0, 1]]))))
+        self.assertRaises(
+            ValueError,
+            plan_key,
+            cost_splitter(lambda tile_shapes, *args: -tile_shapes[:, -1])
+        )
+        self.assertRaises(
+            ValueError,
+            plan_key,
+            cost_splitter(_functools.partial(halo_overhead_cost, halo=None))
+        )
+
+    def test_plan_cache(self):
+        """
+        Tests :obj:`array_split.plan.PlanCache`.
+        """
+        cache_dir = _tempfile.mkdtemp()
+        try:
+            cache = PlanCache(_os.path.join(cache_dir, "plans"), max_bytes=None)
+            splitters = [ShapeSplitter((1000, 100 + i), 16, halo=1) for i in range(4)]
+            for splitter in splitters:
+                split = splitter.calculate_split()
+                plan = cache.get_plan(ShapeSplitter((1000, splitter.array_shape[1]), 16, halo=1))
+                self.assertTrue(_np.all(split == plan.calculate_split()))
+                plan = cache.get_plan(ShapeSplitter((1000, splitter.array_shape[1]), 16, halo=1))
+                self.assertTrue(isinstance(plan.table, _np.memmap))
+                self.assertTrue(_np.all(split == plan.calculate_split()))
+                del plan
+            self.assertEqual(len(splitters), cache.hits)
+            self.assertEqual(len(splitters), cache.misses)
+            files = cache.cached_files()
+            self.assertEqual(len(splitters), len(files))
+
+            # Size bounded eviction, least recently used first
+            file_bytes = files[0][1]
+            cache.max_bytes = 2 * file_bytes
+            cache.get_plan(ShapeSplitter((1000, 100), 16, halo=1))
+            _os.utime(cache.file_name(plan_key(splitters[0])), None)
+            self.assertEqual(2, cache.evict())
+            self.assertTrue(cache.size_bytes() <= 2 * file_bytes)
+            self.assertTrue(_os.path.exists(cache.file_name(plan_key(splitters[0]))))
+
+            # Corrupt plan files are cache misses, and are replaced
+            key = plan_key(splitters[1])
+            with open(cache.file_name(key), "wb") as fp:
+                fp.write(b"corrupt")
+            self.assertEqual(None, cache.load(key))
+            misses = cache.misses
+            cache.get_plan(splitters[1])
+            self.assertEqual(misses + 1, cache.misses)
+            self.assertNotEqual(None, cache.load(key))
+
+            # Concurrent readers and writers
+            cache.clear()
+            cache.max_bytes = None
+            self.assertEqual(0, len(cache.cached_files()))
+            errors = []
+
+            def get_plans():
+                try:
+                    for i in range(8):
+                        cache.get_plan(ShapeSplitter((500, 30 + i % 3), 12)).calculate_split()
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [_threading.Thread(target=get_plans) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual([], errors)
+            self.assertEqual(3, len(cache.cached_files()))
+            self.assertEqual(
+                [],
+                [n for n in _os.listdir(cache.cache_dir) if not n.endswith(".asplan")]
+            )
+
+            self.assertRaises(ValueError, PlanCache, cache_dir, -1)
+        finally:
+            _shutil.rmtree(cache_dir)
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+_unittest.main(__name__)
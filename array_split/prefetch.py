@@ -0,0 +1,255 @@
+"""
+======================================
+The :mod:`array_split.prefetch` Module
+======================================
+
+.. currentmodule:: array_split.prefetch
+
+Double-buffered (background thread) tile reading. Tiles of a (typically
+file-backed, e.g. :obj:`numpy.memmap`) array are copied into a small pool
+of re-usable buffers by a background thread, so that reading tile :samp:`k+1`
+(and subsequent tiles) overlaps with the processing of tile :samp:`k`.
+Tiles are read in the (C-order) split order calculated by a :obj:`array_split.ShapeSplitter`.
+
+Classes and Functions
+=====================
+
+.. autosummary::
+   :toctree: generated/
+
+   PrefetchTileReader - Iterates over tiles of an array, reading ahead in a background thread.
+   prefetch_tiles - Creates a :obj:`PrefetchTileReader` from :func:`array_split.array_split` args.
+
+"""
+from __future__ import absolute_import
+import threading as _threading
+import numpy as _np
+
+try:
+    import queue as _queue
+except ImportError:  # pragma: no cover
+    import Queue as _queue  # pylint: disable=import-error
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import logging as _logging
+from .split import ShapeSplitter, ARRAY_BOUNDS
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class _ReaderError(object):
+
+    """
+    Wraps an exception raised in the reader thread so that it can be
+    re-raised in the consuming thread.
+    """
+
+    def __init__(self, exc):
+        self.exc = exc
+
+
+_END = object()
+
+
+class PrefetchTileReader(object):
+
+    """
+    Iterates over the tiles of an array, with a background thread
+    copying upcoming tiles into a pool of re-usable buffers. Each iteration
+    yields a :samp:`(slice_tuple, tile)` pair, where :samp:`tile` is a copy
+    of :samp:`{ary}[slice_tuple]` held in one of the pool buffers.
+
+    The yielded :samp:`tile` array is only valid until the next iteration step,
+    at which point its buffer is handed back to the reader thread for re-use.
+    Copy the tile if it needs to out-live the iteration step.
+
+    Example::
+
+       >>> import numpy as np
+       >>> from array_split import ShapeSplitter
+       >>> ary = np.arange(0, 20).reshape((4, 5))
+       >>> reader = PrefetchTileReader(ary, ShapeSplitter(ary.shape, 2), num_prefetch=1)
+       >>> [(slyce, tile.sum()) for slyce, tile in reader]
+       [((slice(0, 2, None), slice(0, 5, None)), 45), ((slice(2, 4, None), slice(0, 5, None)), 145)]
+
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".PrefetchTileReader")
+
+    def __init__(self, ary, splitter, num_prefetch=1, max_prefetch_bytes=None):
+        """
+        Initialise.
+
+        :type ary: :obj:`numpy.ndarray`
+        :param ary: Array (e.g. :obj:`numpy.memmap`) from which tiles are read.
+        :type splitter: :obj:`array_split.ShapeSplitter`
+        :param splitter: Defines the tiles and the order in which they are read.
+           Should have :samp:`{splitter}.array_shape` equal to :samp:`{ary}.shape`.
+        :type num_prefetch: :obj:`int`
+        :param num_prefetch: Number of tiles which are read ahead of the tile
+           currently being processed. The buffer pool has :samp:`{num_prefetch} + 1`
+           buffers (unless limited by :samp:`{max_prefetch_bytes}`).
+        :type max_prefetch_bytes: :samp:`None` or :obj:`int`
+        :param max_prefetch_bytes: Upper bound on the total number of bytes
+           allocated for the buffer pool. The number of buffers is reduced
+           so that the pool does not exceed this limit.
+        :raises ValueError: If :samp:`{max_prefetch_bytes}` is smaller than
+           the number of bytes of the largest tile, or if :samp:`{num_prefetch}` is negative.
+        """
+        if num_prefetch < 0:
+            raise ValueError("Got num_prefetch=%s, should be non-negative." % num_prefetch)
+        self.ary = ary
+        self.splitter = splitter
+        self.split = splitter.calculate_split()
+        self.max_tile_size = \
+            max(
+                [
+                    int(_np.prod([s.stop - s.start for s in slyce.tolist()]))
+                    for slyce in self.split.flatten()
+                ] + [0, ]
+            )
+        self.max_tile_bytes = self.max_tile_size * ary.itemsize
+        num_buffers = num_prefetch + 1
+        if (max_prefetch_bytes is not None) and (self.max_tile_bytes > 0):
+            if max_prefetch_bytes < self.max_tile_bytes:
+                raise ValueError(
+                    "Got max_prefetch_bytes=%s which is less than the largest tile bytes=%s."
+                    %
+                    (max_prefetch_bytes, self.max_tile_bytes)
+                )
+            num_buffers = min([num_buffers, max_prefetch_bytes // self.max_tile_bytes])
+        self.num_buffers = int(num_buffers)
+        self.logger.debug(
+            "max_tile_bytes=%s, num_buffers=%s", self.max_tile_bytes, self.num_buffers
+        )
+
+    def __len__(self):
+        """
+        Returns the number of tiles.
+        """
+        return self.split.size
+
+    def _read(self, buffers, free_queue, full_queue, stop_event):
+        """
+        Reader thread target, copies tiles into free buffers and
+        places the :samp:`(slice_tuple, buffer_index, tile)` on the :samp:`{full_queue}`.
+        """
+        try:
+            for slyce in self.split.flatten():
+                slyce = slyce.tolist()
+                buf_idx = free_queue.get()
+                if stop_event.is_set():
+                    return
+                tile_shape = tuple(s.stop - s.start for s in slyce)
+                tile = buffers[buf_idx][0:int(_np.prod(tile_shape))].reshape(tile_shape)
+                tile[...] = self.ary[slyce]
+                full_queue.put((slyce, buf_idx, tile))
+            full_queue.put(_END)
+        except Exception as e:  # pylint: disable=broad-except
+            full_queue.put(_ReaderError(e))
+
+    def __iter__(self):
+        """
+        Generator yielding :samp:`(slice_tuple, tile)` pairs in split order.
+        """
+        buffers = \
+            [
+                _np.empty((self.max_tile_size,), dtype=self.ary.dtype)
+                for i in range(self.num_buffers)
+            ]
+        free_queue = _queue.Queue()
+        full_queue = _queue.Queue()
+        for i in range(self.num_buffers):
+            free_queue.put(i)
+        stop_event = _threading.Event()
+        thread = \
+            _threading.Thread(
+                target=self._read,
+                args=(buffers, free_queue, full_queue, stop_event)
+            )
+        thread.daemon = True
+        thread.start()
+        prev_buf_idx = None
+        try:
+            while True:
+                if prev_buf_idx is not None:
+                    # The caller is done with the previous tile, recycle its buffer.
+                    free_queue.put(prev_buf_idx)
+                    prev_buf_idx = None
+                item = full_queue.get()
+                if item is _END:
+                    break
+                if isinstance(item, _ReaderError):
+                    raise item.exc
+                slyce, prev_buf_idx, tile = item
+                yield slyce, tile
+        finally:
+            stop_event.set()
+            for i in range(self.num_buffers):
+                free_queue.put(i)
+            thread.join()
+
+
+def prefetch_tiles(
+    ary,
+    indices_or_sections=None,
+    axis=None,
+    tile_shape=None,
+    max_tile_bytes=None,
+    max_tile_shape=None,
+    sub_tile_shape=None,
+    halo=None,
+    num_prefetch=1,
+    max_prefetch_bytes=None
+):
+    """
+    Returns a :obj:`PrefetchTileReader` for the split of :samp:`{ary}`
+    defined by the :func:`array_split.array_split` parameters.
+
+    :type ary: :obj:`numpy.ndarray`
+    :param ary: Array from which tiles are read.
+    :type num_prefetch: :obj:`int`
+    :param num_prefetch: See :meth:`PrefetchTileReader.__init__`.
+    :type max_prefetch_bytes: :samp:`None` or :obj:`int`
+    :param max_prefetch_bytes: See :meth:`PrefetchTileReader.__init__`.
+    :rtype: :obj:`PrefetchTileReader`
+    :return: Iterable of :samp:`(slice_tuple, tile)` pairs.
+
+    See :func:`array_split.array_split` for remaining parameters.
+
+    Example::
+
+       >>> import numpy as np
+       >>> ary = np.arange(0, 12)
+       >>> [tile.tolist() for slyce, tile in prefetch_tiles(ary, 3)]
+       [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11]]
+
+    """
+    splitter = \
+        ShapeSplitter(
+            array_shape=ary.shape,
+            indices_or_sections=indices_or_sections,
+            axis=axis,
+            array_start=None,
+            array_itemsize=ary.itemsize,
+            tile_shape=tile_shape,
+            max_tile_bytes=max_tile_bytes,
+            max_tile_shape=max_tile_shape,
+            sub_tile_shape=sub_tile_shape,
+            halo=halo,
+            tile_bounds_policy=ARRAY_BOUNDS
+        )
+    return \
+        PrefetchTileReader(
+            ary,
+            splitter,
+            num_prefetch=num_prefetch,
+            max_prefetch_bytes=max_prefetch_bytes
+        )
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
@@ -0,0 +1,141 @@
+"""
+===========================================
+The :mod:`array_split.prefetch_test` Module
+===========================================
+
+.. currentmodule:: array_split.prefetch_test
+
+Module defining :mod:`array_split.prefetch` unit-tests.
+Execute as::
+
+   python -m array_split.prefetch_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   PrefetchTest - :obj:`unittest.TestCase` for :mod:`array_split.prefetch` functions.
+
+
+"""
+from __future__ import absolute_import
+import os as _os
+import tempfile as _tempfile
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging
+
+from .split import ShapeSplitter, shape_split
+from .prefetch import PrefetchTileReader, prefetch_tiles
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class PrefetchTest(_unittest.TestCase):
+
+    """
+    Tests for :mod:`array_split.prefetch` module.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".PrefetchTest")
+
+    def test_split_order(self):
+        """
+        Tests that :obj:`array_split.prefetch.PrefetchTileReader` yields
+        tiles in split order and with the correct values.
+        """
+        ary = _np.random.uniform(size=(31, 17, 5))
+        split = shape_split(ary.shape, 12)
+        for num_prefetch in [0, 1, 3, 100]:
+            reader = \
+                PrefetchTileReader(ary, ShapeSplitter(ary.shape, 12), num_prefetch=num_prefetch)
+            self.assertEqual(split.size, len(reader))
+            count = 0
+            for (slyce, tile), expected_slyce in zip(reader, split.flatten()):
+                self.assertSequenceEqual(expected_slyce.tolist(), slyce)
+                self.assertTrue(_np.all(ary[slyce] == tile))
+                count += 1
+            self.assertEqual(split.size, count)
+
+    def test_memmap_with_halo(self):
+        """
+        Tests :func:`array_split.prefetch.prefetch_tiles` on
+        a :obj:`numpy.memmap` with halo tiles.
+        """
+        fd, file_name = _tempfile.mkstemp(suffix=".dat")
+        _os.close(fd)
+        try:
+            ary = _np.memmap(file_name, dtype="int32", mode="w+", shape=(64, 33))
+            ary[...] = _np.arange(ary.size).reshape(ary.shape)
+            ary.flush()
+            ary = _np.memmap(file_name, dtype="int32", mode="r", shape=(64, 33))
+            tile_sums = [tile.sum() for slyce, tile in prefetch_tiles(ary, 7, halo=2)]
+            split = shape_split(ary.shape, 7, halo=2)
+            self.assertSequenceEqual(
+                [ary[slyce.tolist()].sum() for slyce in split.flatten()],
+                tile_sums
+            )
+            del ary
+        finally:
+            _os.remove(file_name)
+
+    def test_max_prefetch_bytes(self):
+        """
+        Tests the :samp:`max_prefetch_bytes` buffer pool limit.
+        """
+        ary = _np.zeros((100,), dtype="float64")
+        reader = prefetch_tiles(ary, 10, num_prefetch=5, max_prefetch_bytes=3 * 80)
+        self.assertEqual(80, reader.max_tile_bytes)
+        self.assertEqual(3, reader.num_buffers)
+        self.assertEqual(10, len([tile for slyce, tile in reader]))
+
+        self.assertRaises(
+            ValueError,
+            prefetch_tiles,
+            ary,
+            10,
+            max_prefetch_bytes=79
+        )
+        self.assertRaises(ValueError, prefetch_tiles, ary, 10, num_prefetch=-1)
+
+    def test_early_exit(self):
+        """
+        Tests that breaking out of the iteration terminates the reader thread.
+        """
+        ary = _np.arange(1000)
+        reader = prefetch_tiles(ary, 100, num_prefetch=2)
+        for i, (slyce, tile) in enumerate(reader):
+            if i >= 3:
+                break
+        # Can iterate again after early exit.
+        self.assertEqual(100, len([tile for slyce, tile in reader]))
+
+    def test_reader_error(self):
+        """
+        Tests that exceptions raised when reading are re-raised in the consumer.
+        """
+        class BadArray(object):
+            shape = (10,)
+            itemsize = 8
+            dtype = _np.dtype("float64")
+
+            def __getitem__(self, slyce):
+                raise IOError("Bad read.")
+
+        reader = PrefetchTileReader(BadArray(), ShapeSplitter((10,), 2))
+        self.assertRaises(IOError, list, reader)
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+_unittest.main(__name__)
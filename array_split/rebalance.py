@@ -0,0 +1,310 @@
+"""
+=======================================
+The :mod:`array_split.rebalance` Module
+=======================================
+
+.. currentmodule:: array_split.rebalance
+
+Dynamic load rebalancing of a split from measured per-tile execution times.
+The per-axis cut positions (:attr:`array_split.ShapeSplitter.split_begs`
+and :attr:`array_split.ShapeSplitter.split_ends`) are moved so that the
+predicted cost of each slab of tiles along each axis is equalised. The cost
+of a tile is assumed to be uniformly distributed over the tile elements, and
+cut movement is damped (to avoid oscillation from noisy timings) and constrained
+by a minimum tile shape. The rebalanced split has the same
+:attr:`array_split.ShapeSplitter.split_shape` as the original split.
+
+Example::
+
+   >>> import numpy as np
+   >>> from array_split import ShapeSplitter
+   >>> splitter = ShapeSplitter((100,), 4)
+   >>> splitter.calculate_split().tolist()
+   [(slice(0, 25, None),), (slice(25, 50, None),), (slice(50, 75, None),), (slice(75, 100, None),)]
+   >>> tile_times = np.array([1.0, 1.0, 1.0, 5.0])  # last tile is expensive
+   >>> new_splitter, movement = rebalance_split(splitter, tile_times, damping=0.0,
+   ...                                          return_movement=True)
+   >>> new_splitter.calculate_split().tolist()
+   [(slice(0, 50, None),), (slice(50, 80, None),), (slice(80, 90, None),), (slice(90, 100, None),)]
+   >>> movement  # number of bytes (elements, itemsize=1) which change tile
+   65
+   >>> predict_tile_times(splitter, tile_times, new_splitter)
+   array([2., 2., 2., 2.])
+
+Classes and Functions
+=====================
+
+.. autosummary::
+   :toctree: generated/
+
+   rebalance_split - Returns a rebalanced splitter from measured tile times.
+   predict_tile_times - Predicts tile times of a new split from measured times.
+   calculate_movement_bytes - Returns the bytes which change tile between two splits.
+
+"""
+from __future__ import absolute_import
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import logging as _logging
+from .split import ShapeSplitter, is_scalar
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+_logger = _logging.getLogger(__name__)
+
+
+def _calculated_splitter(splitter):
+    """
+    Returns :samp:`{splitter}`, calculating the split extents if they
+    have not already been calculated.
+    """
+    if splitter.split_begs is None:
+        splitter.set_split_extents()
+    return splitter
+
+
+def _axis_bounds(splitter, axis):
+    """
+    Returns the :samp:`(split_shape[axis] + 1,)` shaped array of tile boundaries
+    along :samp:`{axis}`, i.e. the tile begin indices followed by the axis size.
+    """
+    bounds = _np.zeros((int(splitter.split_shape[axis]) + 1,), dtype="int64")
+    bounds[0:-1] = splitter.split_begs[axis]
+    bounds[-1] = splitter.split_ends[axis][-1]
+    return bounds
+
+
+def _axis_overlaps(bounds_a, bounds_b):
+    """
+    Returns :samp:`(len({bounds_a}) - 1, len({bounds_b}) - 1)` shaped array of
+    overlap lengths of the :samp:`{bounds_a}` intervals with the :samp:`{bounds_b}`
+    intervals.
+    """
+    return \
+        _np.maximum(
+            _np.minimum(bounds_a[1:, _np.newaxis], bounds_b[_np.newaxis, 1:])
+            -
+            _np.maximum(bounds_a[:-1, _np.newaxis], bounds_b[_np.newaxis, :-1]),
+            0
+        )
+
+
+def _check_tile_times(splitter, tile_times):
+    """
+    Returns :samp:`{tile_times}` as a :obj:`numpy.ndarray`, raises :obj:`ValueError`
+    if it is not :samp:`{splitter}.split_shape` shaped or has negative elements.
+    """
+    tile_times = _np.asarray(tile_times, dtype="float64")
+    if tile_times.shape != tuple(splitter.split_shape):
+        raise ValueError(
+            "Got tile_times.shape=%s, should be equal to split_shape=%s."
+            %
+            (tile_times.shape, tuple(splitter.split_shape))
+        )
+    if _np.any(tile_times < 0):
+        raise ValueError("Got negative elements in tile_times, should be non-negative.")
+    return tile_times
+
+
+def predict_tile_times(splitter, tile_times, new_splitter):
+    """
+    Returns the predicted tile times for the :samp:`{new_splitter}` split,
+    assuming that each (measured) time in :samp:`{tile_times}` is uniformly
+    distributed over the elements of the corresponding :samp:`{splitter}` tile
+    (tiles which are empty, excluding halo, contribute no time).
+
+    :type splitter: :obj:`array_split.ShapeSplitter`
+    :param splitter: The split for which the times were measured.
+    :type tile_times: :obj:`numpy.ndarray`
+    :param tile_times: The :samp:`{splitter}.split_shape` shaped array of measured times.
+    :type new_splitter: :obj:`array_split.ShapeSplitter`
+    :param new_splitter: A split of the same array shape.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The :samp:`{new_splitter}.split_shape` shaped array of predicted times.
+    """
+    _calculated_splitter(splitter)
+    _calculated_splitter(new_splitter)
+    tile_density = _check_tile_times(splitter, tile_times)
+    for axis in range(len(splitter.split_shape)):
+        # Per-axis weights distributing each old tile's time to the new tiles.
+        bounds = _axis_bounds(splitter, axis)
+        widths = bounds[1:] - bounds[:-1]
+        weights = \
+            _axis_overlaps(_axis_bounds(new_splitter, axis), bounds) \
+            / \
+            _np.maximum(widths, 1)[_np.newaxis, :]
+        tile_density = \
+            _np.moveaxis(_np.tensordot(weights, tile_density, axes=([1], [axis])), 0, axis)
+    return tile_density
+
+
+def calculate_movement_bytes(splitter, new_splitter):
+    """
+    Returns the number of bytes (:samp:`{splitter}.array_itemsize` times the number
+    of elements) which change tile (excluding halos) between the :samp:`{splitter}`
+    split and the :samp:`{new_splitter}` split, where tile :samp:`i` of
+    the :samp:`{splitter}` split corresponds to tile :samp:`i` of the :samp:`{new_splitter}`
+    split. Calculated in :samp:`O(sum(split_shape))` operations, since the split
+    is separable.
+
+    :type splitter: :obj:`array_split.ShapeSplitter`
+    :param splitter: The original split.
+    :type new_splitter: :obj:`array_split.ShapeSplitter`
+    :param new_splitter: A split with the same :attr:`array_split.ShapeSplitter.split_shape`.
+    :rtype: :obj:`int`
+    :return: Number of bytes.
+    """
+    _calculated_splitter(splitter)
+    _calculated_splitter(new_splitter)
+    if tuple(splitter.split_shape) != tuple(new_splitter.split_shape):
+        raise ValueError(
+            "Got split_shape=%s and new split_shape=%s, should be equal."
+            %
+            (tuple(splitter.split_shape), tuple(new_splitter.split_shape))
+        )
+    num_unmoved = 1
+    for axis in range(len(splitter.split_shape)):
+        bounds = _axis_bounds(splitter, axis)
+        new_bounds = _axis_bounds(new_splitter, axis)
+        overlaps = \
+            _np.minimum(bounds[1:], new_bounds[1:]) - _np.maximum(bounds[:-1], new_bounds[:-1])
+        num_unmoved *= int(_np.sum(_np.maximum(overlaps, 0)))
+    return (int(_np.prod(splitter.array_shape)) - num_unmoved) * int(splitter.array_itemsize)
+
+
+def _rebalance_axis_bounds(bounds, axis_times, damping, min_size):
+    """
+    Returns the rebalanced tile boundaries for one axis.
+
+    :type bounds: :obj:`numpy.ndarray`
+    :param bounds: The :samp:`(n + 1,)` shaped tile boundaries.
+    :type axis_times: :obj:`numpy.ndarray`
+    :param axis_times: The :samp:`(n,)` shaped times of the slabs of tiles.
+    :type damping: :obj:`float`
+    :param damping: Damping factor, see :func:`rebalance_split`.
+    :type min_size: :obj:`int`
+    :param min_size: Minimum tile size along the axis.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The :samp:`(n + 1,)` shaped rebalanced tile boundaries.
+    """
+    num_tiles = len(axis_times)
+    size = bounds[-1] - bounds[0]
+    if num_tiles * min_size > size:
+        raise ValueError(
+            "Got min_tile_shape element %s, too large for %s tiles along axis of size %s."
+            %
+            (min_size, num_tiles, size)
+        )
+    axis_times = _np.where(bounds[1:] > bounds[:-1], axis_times, 0.0)
+    cumulative_times = _np.zeros((num_tiles + 1,), dtype="float64")
+    cumulative_times[1:] = _np.cumsum(axis_times)
+    total_time = cumulative_times[-1]
+    new_bounds = bounds.astype("float64")
+    if total_time > 0:
+        targets = total_time * _np.arange(1, num_tiles) / num_tiles
+        ideal_cuts = _np.interp(targets, cumulative_times, bounds.astype("float64"))
+        new_bounds[1:-1] = bounds[1:-1] + (1.0 - damping) * (ideal_cuts - bounds[1:-1])
+    new_bounds = _np.round(new_bounds).astype("int64")
+
+    # Enforce the minimum tile size, forward then backward sweeps.
+    for i in range(1, num_tiles):
+        new_bounds[i] = max([new_bounds[i], new_bounds[i - 1] + min_size])
+    for i in range(num_tiles - 1, 0, -1):
+        new_bounds[i] = min([new_bounds[i], new_bounds[i + 1] - min_size])
+    return new_bounds
+
+
+def rebalance_split(
+    splitter,
+    tile_times,
+    damping=0.5,
+    min_tile_shape=None,
+    return_movement=False
+):
+    """
+    Returns a rebalanced split (with the same split shape) calculated
+    from measured per-tile times. For each axis, the tile times are summed
+    over the other axes and the cut positions are moved towards the positions
+    which equalise the (predicted) time of the slabs of tiles along the axis.
+
+    :type splitter: :obj:`array_split.ShapeSplitter`
+    :param splitter: The current split, the split extents are calculated
+       if they have not already been calculated.
+    :type tile_times: :obj:`numpy.ndarray`
+    :param tile_times: The :samp:`{splitter}.split_shape` shaped array
+       of measured execution times (or other costs) for the tiles.
+    :type damping: :obj:`float`
+    :param damping: In range :samp:`[0, 1]`, the fraction of the cut movement
+       which is suppressed: :samp:`0` moves the cuts to the balanced positions,
+       :samp:`1` does not move the cuts.
+    :type min_tile_shape: :samp:`None`, :obj:`int` or sequence of :obj:`int`
+    :param min_tile_shape: Minimum per-axis tile shape (excluding halo)
+       of the rebalanced split. If :samp:`None`, tiles are non-empty
+       where the axis has at least as many elements as tiles (otherwise
+       empty tiles are allowed).
+    :raises ValueError: If an explicit :samp:`{min_tile_shape}` can not be
+       satisfied by the split shape.
+    :type return_movement: :obj:`bool`
+    :param return_movement: If :samp:`True`, also return
+       the data movement, see :func:`calculate_movement_bytes`.
+    :rtype: :obj:`array_split.ShapeSplitter` or :obj:`tuple`
+    :return: A :obj:`array_split.ShapeSplitter` (with calculated split extents)
+       defined by the rebalanced per-axis cut indices, with the same
+       array shape, start, itemsize, halo and tile bounds policy as :samp:`{splitter}`.
+       If :samp:`{return_movement}` is :samp:`True`, returns
+       the :samp:`(new_splitter, movement_bytes)` pair.
+    """
+    _calculated_splitter(splitter)
+    tile_times = _check_tile_times(splitter, tile_times)
+    if (damping < 0) or (damping > 1):
+        raise ValueError("Got damping=%s, should be in range [0, 1]." % damping)
+    ndim = len(splitter.split_shape)
+    default_min_tile_shape = min_tile_shape is None
+    if default_min_tile_shape:
+        min_tile_shape = 1
+    if is_scalar(min_tile_shape):
+        min_tile_shape = [min_tile_shape, ] * ndim
+    min_tile_shape = _np.array(min_tile_shape, dtype="int64")
+    if min_tile_shape.shape != (ndim,):
+        raise ValueError(
+            "Got len(min_tile_shape)=%s, should be %s." % (len(min_tile_shape), ndim)
+        )
+
+    indices_per_axis = []
+    for axis in range(ndim):
+        other_axes = tuple(a for a in range(ndim) if a != axis)
+        min_size = max([int(min_tile_shape[axis]), 1 if splitter.array_shape[axis] > 0 else 0])
+        if default_min_tile_shape:
+            # More tiles than elements, keep (some) tiles empty.
+            min_size = \
+                min([min_size, int(splitter.array_shape[axis] // splitter.split_shape[axis])])
+        new_bounds = \
+            _rebalance_axis_bounds(
+                _axis_bounds(splitter, axis),
+                _np.sum(tile_times, axis=other_axes),
+                damping,
+                min_size
+            )
+        _logger.debug("axis=%s, rebalanced tile bounds=%s", axis, new_bounds)
+        indices_per_axis.append(new_bounds[1:-1].tolist())
+
+    new_splitter = \
+        ShapeSplitter(
+            splitter.array_shape,
+            indices_per_axis,
+            array_start=splitter.array_start,
+            array_itemsize=splitter.array_itemsize,
+            halo=splitter.halo,
+            tile_bounds_policy=splitter.tile_bounds_policy
+        )
+    new_splitter.set_split_extents()
+    if return_movement:
+        return new_splitter, calculate_movement_bytes(splitter, new_splitter)
+    return new_splitter
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
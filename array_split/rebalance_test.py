@@ -0,0 +1,199 @@
+"""
+============================================
+The :mod:`array_split.rebalance_test` Module
+============================================
+
+.. currentmodule:: array_split.rebalance_test
+
+Module defining :mod:`array_split.rebalance` unit-tests.
+Execute as::
+
+   python -m array_split.rebalance_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   RebalanceTest - :obj:`unittest.TestCase` for :mod:`array_split.rebalance` functions.
+
+
+"""
+from __future__ import absolute_import
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging
+
+from .split import ShapeSplitter
+from .rebalance import rebalance_split, predict_tile_times, calculate_movement_bytes
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class RebalanceTest(_unittest.TestCase):
+
+    """
+    Tests for :mod:`array_split.rebalance` module.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".RebalanceTest")
+
+    def measure_tile_times(self, splitter, cost):
+        """
+        Returns the :samp:`{splitter}.split_shape` shaped array of summed
+        per-element :samp:`{cost}` over each tile (excluding halo).
+        """
+        split = splitter.calculate_split()
+        tile_times = _np.zeros(split.shape, dtype="float64")
+        for multi_index in _np.ndindex(*split.shape):
+            slice_tuple = \
+                tuple(
+                    slice(
+                        splitter.split_begs[d][multi_index[d]],
+                        splitter.split_ends[d][multi_index[d]]
+                    )
+                    for d in range(len(split.shape))
+                )
+            tile_times[multi_index] = _np.sum(cost[slice_tuple])
+        return tile_times
+
+    def element_owners(self, splitter):
+        """
+        Returns array of tile (flat) index for each array element.
+        """
+        owners = _np.zeros(tuple(splitter.array_shape), dtype="int64")
+        for rank, multi_index in enumerate(_np.ndindex(*tuple(splitter.split_shape))):
+            slice_tuple = \
+                tuple(
+                    slice(
+                        splitter.split_begs[d][multi_index[d]],
+                        splitter.split_ends[d][multi_index[d]]
+                    )
+                    for d in range(len(splitter.split_shape))
+                )
+            owners[slice_tuple] = rank
+        return owners
+
+    def test_rebalance_split(self):
+        """
+        Tests :func:`array_split.rebalance.rebalance_split` reduces imbalance.
+        """
+        array_shape = (200, 120)
+        cost = \
+            _np.outer(
+                1.0 + _np.arange(array_shape[0]) ** 2,
+                1.0 + 3.0 * (_np.arange(array_shape[1]) >= 100)
+            )
+        splitter = ShapeSplitter(array_shape, axis=[4, 3], halo=1, array_itemsize=4)
+        tile_times = self.measure_tile_times(splitter, cost)
+        imbalance = _np.max(tile_times) / _np.mean(tile_times)
+
+        new_splitter, movement = \
+            rebalance_split(splitter, tile_times, damping=0.0, return_movement=True)
+        self.assertSequenceEqual(tuple(splitter.split_shape), tuple(new_splitter.split_shape))
+        self.assertTrue(_np.all(splitter.halo == new_splitter.halo))
+        new_tile_times = self.measure_tile_times(new_splitter, cost)
+        self.assertTrue(_np.max(new_tile_times) / _np.mean(new_tile_times) < 0.5 * imbalance)
+        self.assertTrue(
+            _np.allclose(
+                predict_tile_times(splitter, tile_times, splitter),
+                tile_times
+            )
+        )
+        self.assertAlmostEqual(
+            _np.sum(tile_times),
+            _np.sum(predict_tile_times(splitter, tile_times, new_splitter))
+        )
+        self.assertEqual(
+            4 * int(_np.sum(self.element_owners(splitter) != self.element_owners(new_splitter))),
+            movement
+        )
+
+        # Damping reduces cut movement, damping=1 leaves the split unchanged
+        damped_splitter, damped_movement = \
+            rebalance_split(splitter, tile_times, damping=0.75, return_movement=True)
+        self.assertTrue(0 < damped_movement < movement)
+        same_splitter, same_movement = \
+            rebalance_split(splitter, tile_times, damping=1.0, return_movement=True)
+        self.assertEqual(0, same_movement)
+        self.assertArraySplitEqual(splitter.calculate_split(), same_splitter.calculate_split())
+
+        # Repeated damped rebalancing converges towards the balanced split
+        for i in range(12):
+            damped_splitter = \
+                rebalance_split(
+                    damped_splitter,
+                    self.measure_tile_times(damped_splitter, cost),
+                    damping=0.5
+                )
+        damped_tile_times = self.measure_tile_times(damped_splitter, cost)
+        self.assertTrue(
+            _np.max(damped_tile_times) / _np.mean(damped_tile_times) < 0.5 * imbalance
+        )
+
+        # Minimum tile shape
+        min_splitter = rebalance_split(splitter, tile_times, damping=0.0, min_tile_shape=(30, 5))
+        for d in range(2):
+            self.assertTrue(
+                _np.all(
+                    (min_splitter.split_ends[d] - min_splitter.split_begs[d])
+                    >=
+                    (30, 5)[d]
+                )
+            )
+
+    def test_rebalance_split_more_tiles_than_elements(self):
+        """
+        Tests :func:`array_split.rebalance.rebalance_split` for splits with empty tiles.
+        """
+        splitter = ShapeSplitter((3, ), 5)
+        tile_times = _np.array([1.0, 4.0, 0.0, 2.0, 0.0])
+        new_splitter = rebalance_split(splitter, tile_times, damping=0.0)
+        self.assertSequenceEqual((5, ), tuple(new_splitter.split_shape))
+        sizes = _np.array(new_splitter.split_ends[0]) - _np.array(new_splitter.split_begs[0])
+        self.assertEqual(3, sizes.sum())
+        self.assertTrue(_np.all(sizes >= 0))
+
+        splitter = ShapeSplitter((3, 40), axis=[5, 4])
+        new_splitter = rebalance_split(splitter, _np.ones((5, 4)))
+        self.assertSequenceEqual((5, 4), tuple(new_splitter.split_shape))
+        sizes = _np.array(new_splitter.split_ends[1]) - _np.array(new_splitter.split_begs[1])
+        self.assertTrue(_np.all(sizes >= 1))
+
+        # An explicit minimum which can not be satisfied is an error.
+        self.assertRaises(
+            ValueError, rebalance_split, ShapeSplitter((3, ), 5), tile_times, min_tile_shape=1
+        )
+
+    def test_rebalance_split_errors(self):
+        """
+        Tests :func:`array_split.rebalance.rebalance_split` raises :obj:`ValueError`
+        for invalid arguments.
+        """
+        splitter = ShapeSplitter((20, 12), axis=[4, 3])
+        tile_times = _np.ones((4, 3))
+        self.assertRaises(ValueError, rebalance_split, splitter, _np.ones((3, 4)))
+        self.assertRaises(ValueError, rebalance_split, splitter, -tile_times)
+        self.assertRaises(ValueError, rebalance_split, splitter, tile_times, damping=1.5)
+        self.assertRaises(ValueError, rebalance_split, splitter, tile_times, min_tile_shape=6)
+        self.assertRaises(ValueError, rebalance_split, splitter, tile_times, min_tile_shape=[1])
+        self.assertRaises(
+            ValueError,
+            calculate_movement_bytes,
+            splitter,
+            ShapeSplitter((20, 12), axis=[2, 3])
+        )
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+_unittest.main(__name__)
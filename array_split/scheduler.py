@@ -0,0 +1,454 @@
+"""
+=======================================
+The :mod:`array_split.scheduler` Module
+=======================================
+
+.. currentmodule:: array_split.scheduler
+
+Work-stealing (thread) execution over the tiles of a split. Each worker
+thread starts with a contiguous (C-order) block of tiles in its own deque,
+processing tiles from the front of the deque. An idle worker steals tiles
+from the back of the deque of the worker with the most remaining tiles, so
+that variable tile costs do not leave workers idle at the end of a sweep.
+Per-worker statistics (:obj:`WorkerStats`) record the tile counts and
+the steals, for tuning tile granularity.
+
+The tile function is called from multiple threads, :mod:`numpy`
+releases the GIL for many operations so compute on (large) tiles runs
+in parallel.
+
+In NUMA mode (:samp:`numa=True`) the workers are distributed over the
+NUMA nodes (:func:`array_split.host.numa_nodes`) in proportion to the node CPU counts
+and pinned to the CPUs of their node, so that each node processes
+a contiguous block of tiles (:meth:`WorkStealingScheduler.node_blocks`) and idle
+workers steal from workers of the same node before stealing across nodes.
+The :func:`first_touch_array` initializer allocates an array whose pages
+are first written (and hence physically placed) by the node which processes
+each tile. On single node hosts the NUMA mode reduces to the default mode.
+
+Example::
+
+   >>> import numpy as np
+   >>> from array_split import ShapeSplitter
+   >>> ary = np.arange(0, 1000).reshape((10, 100))
+   >>> scheduler = WorkStealingScheduler(ShapeSplitter(ary.shape, 8), num_workers=3)
+   >>> sums = scheduler.map(lambda slice_tuple: ary[slice_tuple].sum())
+   >>> sums.shape
+   (8, 1)
+   >>> int(sums.sum()) == int(ary.sum())
+   True
+   >>> sum([stats.num_tiles for stats in scheduler.worker_stats])
+   8
+
+Classes and Functions
+=====================
+
+.. autosummary::
+   :toctree: generated/
+
+   WorkerStats - Per-worker tile and steal counts.
+   WorkStealingScheduler - Work-stealing thread execution over the tiles of a split.
+   work_stealing_map - Applies a function to all the tiles of a split (work-stealing).
+   first_touch_array - Allocates an array with pages placed on the processing NUMA node.
+   default_num_workers - Returns the default number of worker threads.
+
+"""
+from __future__ import absolute_import
+import threading as _threading
+import collections as _collections
+import timeit as _timeit
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import logging as _logging
+from . import host as _host
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+def default_num_workers():
+    """
+    Returns the number of CPUs available to this process (the scheduling
+    affinity, where supported, otherwise :func:`multiprocessing.cpu_count`,
+    limited by the cgroup CPU quota), see :func:`array_split.host.usable_cpu_count`.
+
+    :rtype: :obj:`int`
+    :return: Default number of worker threads.
+    """
+    return \
+        _host.usable_cpu_count(
+            cpu_quota=_host.cgroup_cpu_quota(),
+            affinity_cpus=_host.affinity_cpu_count()
+        )
+
+
+class WorkerStats(object):
+
+    """
+    Statistics of a single :obj:`WorkStealingScheduler` worker.
+    """
+
+    def __init__(self, worker_id, numa_node=None):
+        """
+        Initialise, all counts zero.
+
+        :type worker_id: :obj:`int`
+        :param worker_id: The worker index.
+        :type numa_node: :samp:`None` or :obj:`int`
+        :param numa_node: The NUMA node of the worker (NUMA mode).
+        """
+        #: The worker index.
+        self.worker_id = worker_id
+        #: The NUMA node of the worker, :samp:`None` when not in NUMA mode.
+        self.numa_node = numa_node
+        #: Number of tiles initially assigned to (the deque of) the worker.
+        self.num_assigned = 0
+        #: Number of tiles processed by the worker (own and stolen).
+        self.num_tiles = 0
+        #: Number of tiles the worker stole from other workers.
+        self.num_stolen = 0
+        #: Number of tiles stolen from this worker by other workers.
+        self.num_stolen_from = 0
+        #: Number of steal attempts which found no tile to steal, i.e. all victim
+        #: deques empty or the victim deque emptied concurrently (lost race).
+        self.num_failed_steals = 0
+        #: Total wall-clock time (seconds) spent calling the tile function.
+        self.busy_time = 0.0
+
+    def as_dict(self):
+        """
+        Returns the statistics as a :obj:`dict`.
+
+        :rtype: :obj:`dict`
+        :return: Dictionary of :samp:`(attribute_name, value)` items.
+        """
+        return \
+            {
+                "worker_id": self.worker_id,
+                "numa_node": self.numa_node,
+                "num_assigned": self.num_assigned,
+                "num_tiles": self.num_tiles,
+                "num_stolen": self.num_stolen,
+                "num_stolen_from": self.num_stolen_from,
+                "num_failed_steals": self.num_failed_steals,
+                "busy_time": self.busy_time,
+            }
+
+    def __repr__(self):
+        """
+        Returns string representation.
+        """
+        return "WorkerStats(%s)" % ", ".join(["%s=%r" % i for i in sorted(self.as_dict().items())])
+
+
+class WorkStealingScheduler(object):
+
+    """
+    Work-stealing execution of a function over the tiles of a split. See
+    the :mod:`array_split.scheduler` module documentation.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".WorkStealingScheduler")
+
+    def __init__(self, splitter, num_workers=None, numa=False, nodes=None):
+        """
+        Initialise.
+
+        :type splitter: :obj:`array_split.ShapeSplitter`
+        :param splitter: Defines the tiles for :meth:`map`, may be :samp:`None`
+           when only :meth:`map_ranks` is used.
+        :type num_workers: :samp:`None` or :obj:`int`
+        :param num_workers: Number of worker threads,
+           if :samp:`None`, uses :func:`default_num_workers`
+           (in NUMA mode, the number of node CPUs, at most :func:`default_num_workers`).
+        :type numa: :obj:`bool`
+        :param numa: If :samp:`True`, workers are assigned to (and, on multi-node hosts,
+           pinned to) NUMA nodes, see the :mod:`array_split.scheduler` module documentation.
+        :type nodes: :samp:`None` or :obj:`dict`
+        :param nodes: NUMA mode :samp:`(node_id, cpu_list)` topology,
+           if :samp:`None` uses :func:`array_split.host.numa_nodes`.
+        """
+        if numa and (nodes is None):
+            nodes = _host.numa_nodes()
+        if num_workers is None:
+            if numa:
+                # Node CPUs (affinity) capped by the cgroup CPU quota.
+                num_node_cpus = sum([len(cpus) for cpus in nodes.values()])
+                num_workers = max([1, min([num_node_cpus, default_num_workers()])])
+            else:
+                num_workers = default_num_workers()
+        if num_workers < 1:
+            raise ValueError("Got num_workers=%s, should be positive." % num_workers)
+        self.splitter = splitter
+        self.num_workers = int(num_workers)
+        #: The NUMA mode :samp:`(node_id, cpu_list)` topology, :samp:`None` when not NUMA mode.
+        self.nodes = None
+        #: The NUMA node of each worker (:samp:`None` elements when not NUMA mode).
+        self.worker_nodes = [None, ] * self.num_workers
+        #: Whether worker threads are pinned to the CPUs of their NUMA node.
+        self.pin_workers = False
+        if numa:
+            self.nodes = dict((int(node), list(cpus)) for node, cpus in nodes.items())
+            self.worker_nodes = self.assign_worker_nodes(self.num_workers, self.nodes)
+            self.pin_workers = len(self.nodes) > 1
+        #: List of :obj:`WorkerStats` from the most recent :meth:`map_ranks` call.
+        self.worker_stats = []
+
+    @staticmethod
+    def assign_worker_nodes(num_workers, nodes):
+        """
+        Returns the NUMA node of each worker, the workers are distributed
+        over the nodes in proportion to the number of node CPUs (largest remainder),
+        workers of the same node are consecutive.
+
+        :type num_workers: :obj:`int`
+        :param num_workers: Number of workers.
+        :type nodes: :obj:`dict`
+        :param nodes: The :samp:`(node_id, cpu_list)` topology.
+        :rtype: :obj:`list`
+        :return: The :samp:`{num_workers}` length list of node ids.
+
+        Example::
+
+           >>> WorkStealingScheduler.assign_worker_nodes(6, {0: [0, 1, 2, 3], 1: [4, 5]})
+           [0, 0, 0, 0, 1, 1]
+           >>> WorkStealingScheduler.assign_worker_nodes(3, {0: [0, 1], 1: [2, 3]})
+           [0, 0, 1]
+        """
+        node_ids = sorted(nodes.keys())
+        cpu_counts = _np.array([len(nodes[node]) for node in node_ids], dtype="float64")
+        quotas = num_workers * cpu_counts / _np.sum(cpu_counts)
+        counts = _np.floor(quotas).astype("int64")
+        remainders = quotas - counts
+        for i in _np.argsort(-remainders, kind="mergesort")[:num_workers - _np.sum(counts)]:
+            counts[i] += 1
+        return [int(node) for node, count in zip(node_ids, counts) for _ in range(count)]
+
+    def initial_blocks(self, num_tiles):
+        """
+        Returns the list of :samp:`(begin, end)` contiguous (C-order) tile rank
+        ranges initially assigned to each worker.
+
+        :type num_tiles: :obj:`int`
+        :param num_tiles: Total number of tiles.
+        :rtype: :obj:`list`
+        :return: List of :attr:`num_workers` :samp:`(begin, end)` pairs.
+        """
+        bounds = (_np.arange(self.num_workers + 1) * num_tiles) // self.num_workers
+        return [(int(bounds[w]), int(bounds[w + 1])) for w in range(self.num_workers)]
+
+    def node_blocks(self, num_tiles):
+        """
+        Returns the contiguous (C-order) tile rank range initially assigned
+        to (the workers of) each NUMA node.
+
+        :type num_tiles: :obj:`int`
+        :param num_tiles: Total number of tiles.
+        :rtype: :obj:`dict`
+        :return: Dictionary of :samp:`(node_id, (begin, end))` items,
+           the node id is :samp:`None` when not in NUMA mode.
+        """
+        blocks = {}
+        for node, (begin, end) in zip(self.worker_nodes, self.initial_blocks(num_tiles)):
+            if node in blocks:
+                begin = min([begin, blocks[node][0]])
+                end = max([end, blocks[node][1]])
+            blocks[node] = (begin, end)
+        return blocks
+
+    def _steal(self, deques, worker_id, stats, stats_lock):
+        """
+        Steals a tile rank from the back of the deque of the worker with
+        the most remaining tiles, returns :samp:`None` if all deques are empty.
+        """
+        node = self.worker_nodes[worker_id]
+        others = [w for w in range(len(deques)) if w != worker_id]
+        # Same NUMA node victims first (all victims when not NUMA mode).
+        victim_groups = \
+            [
+                [w for w in others if self.worker_nodes[w] == node],
+                [w for w in others if self.worker_nodes[w] != node]
+            ]
+        for victims in victim_groups:
+            while len(victims) > 0:
+                victim = max(victims, key=lambda w: len(deques[w]))
+                if len(deques[victim]) <= 0:
+                    break
+                try:
+                    rank = deques[victim].pop()
+                except IndexError:
+                    stats[worker_id].num_failed_steals += 1
+                    continue
+                stats[worker_id].num_stolen += 1
+                with stats_lock:
+                    stats[victim].num_stolen_from += 1
+                return rank
+        stats[worker_id].num_failed_steals += 1
+        return None
+
+    def _work(self, func, results, deques, worker_id, stats, stats_lock, errors, steal):
+        """
+        Worker thread target.
+        """
+        if self.pin_workers:
+            _host.set_thread_cpu_affinity(self.nodes[self.worker_nodes[worker_id]])
+        own_deque = deques[worker_id]
+        worker_stats = stats[worker_id]
+        while len(errors) <= 0:
+            try:
+                rank = own_deque.popleft()
+            except IndexError:
+                rank = None
+                if steal:
+                    rank = self._steal(deques, worker_id, stats, stats_lock)
+                if rank is None:
+                    break
+            start = _timeit.default_timer()
+            try:
+                results[rank] = func(rank)
+            except Exception as e:
+                errors.append(e)
+                break
+            finally:
+                worker_stats.busy_time += _timeit.default_timer() - start
+            worker_stats.num_tiles += 1
+
+    def map_ranks(self, func, num_tiles, steal=True):
+        """
+        Calls :samp:`{func}(rank)` for each :samp:`rank in range({num_tiles})`,
+        using :attr:`num_workers` work-stealing threads. Worker :samp:`w`
+        starts with the ranks of block :samp:`w` of :meth:`initial_blocks`.
+
+        :type func: callable
+        :param func: Function of the (C-order flat) tile index.
+        :type num_tiles: :obj:`int`
+        :param num_tiles: Number of tiles.
+        :type steal: :obj:`bool`
+        :param steal: If :samp:`False`, each worker only processes its
+           own (:meth:`initial_blocks`) ranks, e.g. for first-touch placement.
+        :rtype: :obj:`list`
+        :return: The :samp:`{num_tiles}` length list of :samp:`{func}` return values.
+        :raises Exception: The first exception raised by :samp:`{func}`, remaining
+           tiles are not processed once an exception has been raised.
+        """
+        results = [None, ] * num_tiles
+        stats = [WorkerStats(w, self.worker_nodes[w]) for w in range(self.num_workers)]
+        deques = []
+        for w, (begin, end) in enumerate(self.initial_blocks(num_tiles)):
+            deques.append(_collections.deque(range(begin, end)))
+            stats[w].num_assigned = end - begin
+        stats_lock = _threading.Lock()
+        errors = []
+        threads = \
+            [
+                _threading.Thread(
+                    target=self._work,
+                    args=(func, results, deques, w, stats, stats_lock, errors, steal)
+                )
+                for w in range(self.num_workers)
+            ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.worker_stats = stats
+        if len(errors) > 0:
+            raise errors[0]
+        return results
+
+    def map(self, func, steal=True):
+        """
+        Calls :samp:`{func}(slice_tuple)` for the :samp:`slice_tuple` of each tile
+        of the split, using :attr:`num_workers` work-stealing threads.
+
+        :type func: callable
+        :param func: Function of the tile :obj:`tuple` of :obj:`slice` objects.
+        :type steal: :obj:`bool`
+        :param steal: See :meth:`map_ranks`.
+        :rtype: :obj:`numpy.ndarray`
+        :return: The :attr:`array_split.ShapeSplitter.split_shape` shaped
+           :samp:`object` array of :samp:`{func}` return values.
+        :raises Exception: The first exception raised by :samp:`{func}`, remaining
+           tiles are not processed once an exception has been raised.
+        """
+        split = self.splitter.calculate_split()
+        slices = [slyce.tolist() for slyce in split.flatten()]
+        results = self.map_ranks(lambda rank: func(slices[rank]), len(slices), steal=steal)
+        ret = _np.empty((len(results),), dtype="object")
+        ret[:] = results
+        return ret.reshape(split.shape)
+
+
+def work_stealing_map(func, splitter, num_workers=None):
+    """
+    Returns :samp:`WorkStealingScheduler({splitter}, {num_workers}).map({func})`.
+
+    :type func: callable
+    :param func: Function of the tile :obj:`tuple` of :obj:`slice` objects.
+    :type splitter: :obj:`array_split.ShapeSplitter`
+    :param splitter: Defines the tiles.
+    :type num_workers: :samp:`None` or :obj:`int`
+    :param num_workers: Number of worker threads.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The :samp:`{splitter}.split_shape` shaped :samp:`object` array
+       of :samp:`{func}` return values.
+    """
+    return WorkStealingScheduler(splitter, num_workers=num_workers).map(func)
+
+
+def first_touch_array(splitter, dtype="float64", fill_value=0, scheduler=None):
+    """
+    Returns a new :samp:`{splitter}.array_shape` shaped array, initialised
+    to :samp:`{fill_value}` in parallel such that each tile (excluding halo) is
+    first written by the worker which is initially assigned the tile
+    by :samp:`{scheduler}` (no stealing). With the (Linux default) first-touch
+    page placement policy the pages of each tile are then allocated on the
+    NUMA node of that worker. Tiles which are contiguous in memory (e.g. splits
+    along axis :samp:`0` only) give the best page placement.
+
+    :type splitter: :obj:`array_split.ShapeSplitter`
+    :param splitter: Defines the tiles.
+    :type dtype: :obj:`numpy.dtype`
+    :param dtype: Element type of the array.
+    :type fill_value: scalar
+    :param fill_value: Initial value of the array elements.
+    :type scheduler: :samp:`None` or :obj:`WorkStealingScheduler`
+    :param scheduler: The scheduler which subsequently processes the tiles,
+       if :samp:`None` uses a NUMA mode :samp:`WorkStealingScheduler({splitter}, numa=True)`.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The initialised array.
+
+    Example::
+
+       >>> from array_split import ShapeSplitter
+       >>> splitter = ShapeSplitter((100, 10), 4)
+       >>> ary = first_touch_array(splitter, dtype="int32", fill_value=7)
+       >>> ary.shape, ary.dtype.name, int(ary.min()), int(ary.max())
+       ((100, 10), 'int32', 7, 7)
+    """
+    if scheduler is None:
+        scheduler = WorkStealingScheduler(splitter, numa=True)
+    if splitter.split_begs is None:
+        splitter.set_split_extents()
+    # Pages are untouched (for large allocations) until written by the workers.
+    ary = _np.empty(tuple(splitter.array_shape.tolist()), dtype=dtype)
+    split_shape = tuple(splitter.split_shape.tolist())
+    axis_slices = \
+        [
+            [slice(int(b), int(e)) for b, e in zip(splitter.split_begs[d], splitter.split_ends[d])]
+            for d in range(len(split_shape))
+        ]
+
+    def touch(rank):
+        multi_index = _np.unravel_index(rank, split_shape)
+        ary[tuple(axis_slices[d][i] for d, i in enumerate(multi_index))] = fill_value
+
+    scheduler.map_ranks(touch, int(_np.prod(split_shape)), steal=False)
+    return ary
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
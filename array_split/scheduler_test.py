@@ -0,0 +1,226 @@
+"""
+============================================
+The :mod:`array_split.scheduler_test` Module
+============================================
+
+.. currentmodule:: array_split.scheduler_test
+
+Module defining :mod:`array_split.scheduler` unit-tests.
+Execute as::
+
+   python -m array_split.scheduler_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   SchedulerTest - :obj:`unittest.TestCase` for :mod:`array_split.scheduler` functions.
+
+
+"""
+from __future__ import absolute_import
+import time as _time
+import threading as _threading
+import collections as _collections
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging
+
+from .split import ShapeSplitter
+from . import scheduler as _scheduler
+from .scheduler import WorkStealingScheduler, WorkerStats, work_stealing_map, first_touch_array
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class SchedulerTest(_unittest.TestCase):
+
+    """
+    Tests for :mod:`array_split.scheduler` module.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".SchedulerTest")
+
+    def test_map(self):
+        """
+        Tests :meth:`array_split.scheduler.WorkStealingScheduler.map` processes
+        every tile exactly once and returns results in split order.
+        """
+        ary = _np.zeros((61, 37), dtype="int64")
+        splitter = ShapeSplitter(ary.shape, axis=[7, 5], halo=1)
+        split = splitter.calculate_split()
+
+        def func(slice_tuple):
+            ary[slice_tuple] += 1
+            return tuple((s.start, s.stop) for s in slice_tuple)
+
+        for num_workers in [1, 3, 8, 50]:
+            ary[...] = 0
+            scheduler = WorkStealingScheduler(splitter, num_workers=num_workers)
+            results = scheduler.map(func)
+            self.assertSequenceEqual(split.shape, results.shape)
+            for multi_index in _np.ndindex(*split.shape):
+                self.assertEqual(
+                    tuple((s.start, s.stop) for s in split[multi_index].tolist()),
+                    results[multi_index]
+                )
+            # Every element covered by the (halo) tiles the expected number of times
+            counts = _np.zeros_like(ary)
+            for slyce in split.flatten():
+                counts[slyce.tolist()] += 1
+            self.assertTrue(_np.all(counts == ary))
+
+            stats = scheduler.worker_stats
+            self.assertEqual(num_workers, len(stats))
+            self.assertEqual(split.size, sum([s.num_assigned for s in stats]))
+            self.assertEqual(split.size, sum([s.num_tiles for s in stats]))
+            self.assertEqual(
+                sum([s.num_stolen for s in stats]),
+                sum([s.num_stolen_from for s in stats])
+            )
+            for s in stats:
+                self.assertEqual(s.num_assigned - s.num_stolen_from + s.num_stolen, s.num_tiles)
+                self.assertTrue(s.busy_time >= 0.0)
+                # Each worker stops after a steal attempt finds no tiles.
+                self.assertTrue(s.num_failed_steals >= 1)
+                self.assertEqual(s.worker_id, s.as_dict()["worker_id"])
+
+        self.assertRaises(ValueError, WorkStealingScheduler, splitter, 0)
+
+    def test_initial_blocks(self):
+        """
+        Tests :meth:`array_split.scheduler.WorkStealingScheduler.initial_blocks`
+        gives contiguous balanced blocks.
+        """
+        scheduler = WorkStealingScheduler(ShapeSplitter((10,), 1), num_workers=4)
+        self.assertEqual([(0, 2), (2, 5), (5, 7), (7, 10)], scheduler.initial_blocks(10))
+        self.assertEqual([(0, 0), (0, 1), (1, 1), (1, 2)], scheduler.initial_blocks(2))
+
+    def test_stealing(self):
+        """
+        Tests that idle workers steal tiles from a worker with expensive tiles.
+        """
+        splitter = ShapeSplitter((32,), 32)
+        scheduler = WorkStealingScheduler(splitter, num_workers=4)
+
+        def func(slice_tuple):
+            if slice_tuple[0].start < 8:
+                _time.sleep(0.02)
+            return slice_tuple[0].start
+
+        results = scheduler.map(func)
+        self.assertSequenceEqual(list(range(32)), results.tolist())
+        stats = scheduler.worker_stats
+        self.assertTrue(stats[0].num_stolen_from > 0)
+        self.assertTrue(stats[0].num_tiles < 8)
+        self.assertEqual(0, stats[0].num_stolen)
+
+    def test_numa(self):
+        """
+        Tests the NUMA mode of :obj:`array_split.scheduler.WorkStealingScheduler`,
+        node assignment, per-node blocks and same-node stealing.
+        """
+        nodes = {0: [0], 1: [0]}
+        splitter = ShapeSplitter((40, 10), 8)
+        scheduler = WorkStealingScheduler(splitter, num_workers=4, numa=True, nodes=nodes)
+        self.assertEqual([0, 0, 1, 1], scheduler.worker_nodes)
+        self.assertTrue(scheduler.pin_workers)
+        self.assertEqual({0: (0, 4), 1: (4, 8)}, scheduler.node_blocks(8))
+        results = scheduler.map(lambda slice_tuple: slice_tuple[0].start)
+        self.assertSequenceEqual(list(range(0, 40, 5)), results.flatten().tolist())
+        self.assertEqual(
+            [0, 0, 1, 1],
+            [stats.numa_node for stats in scheduler.worker_stats]
+        )
+
+        # Default number of workers is the number of node CPUs, capped by the
+        # (cgroup quota) usable CPU count.
+        default_num_workers = _scheduler.default_num_workers
+        try:
+            _scheduler.default_num_workers = lambda: 8
+            scheduler = \
+                WorkStealingScheduler(splitter, numa=True, nodes={0: [0, 1], 3: [2, 3, 4]})
+            self.assertEqual([0, 0, 3, 3, 3], scheduler.worker_nodes)
+            _scheduler.default_num_workers = lambda: 3
+            scheduler = \
+                WorkStealingScheduler(splitter, numa=True, nodes={0: [0, 1], 3: [2, 3, 4]})
+            self.assertEqual(3, scheduler.num_workers)
+            self.assertEqual([0, 3, 3], scheduler.worker_nodes)
+        finally:
+            _scheduler.default_num_workers = default_num_workers
+        scheduler = WorkStealingScheduler(splitter, numa=True, nodes={0: [0, 1], 3: [2, 3, 4]})
+        self.assertEqual(min([5, default_num_workers()]), scheduler.num_workers)
+
+        # Single node, no pinning and the same blocks as the default mode.
+        scheduler = WorkStealingScheduler(splitter, num_workers=3, numa=True, nodes={0: [0]})
+        self.assertFalse(scheduler.pin_workers)
+        self.assertEqual({0: (0, 8)}, scheduler.node_blocks(8))
+        self.assertEqual({None: (0, 8)}, WorkStealingScheduler(splitter, 3).node_blocks(8))
+
+        # Idle worker steals from the same node victim before the longer remote deque.
+        scheduler = WorkStealingScheduler(None, num_workers=3, numa=True, nodes={0: [0], 1: [1]})
+        scheduler.worker_nodes = [0, 0, 1]
+        deques = \
+            [
+                _collections.deque([]),
+                _collections.deque([1, 2]),
+                _collections.deque([3, 4, 5, 6, 7])
+            ]
+        stats = [WorkerStats(w, scheduler.worker_nodes[w]) for w in range(3)]
+        lock = _threading.Lock()
+        self.assertEqual(2, scheduler._steal(deques, 0, stats, lock))
+        self.assertEqual(1, scheduler._steal(deques, 0, stats, lock))
+        self.assertEqual(7, scheduler._steal(deques, 0, stats, lock))
+        self.assertEqual(2, stats[1].num_stolen_from)
+        self.assertEqual(1, stats[2].num_stolen_from)
+
+    def test_first_touch_array(self):
+        """
+        Tests :func:`array_split.scheduler.first_touch_array` initialises every
+        element and each worker only touches its own tiles.
+        """
+        splitter = ShapeSplitter((50, 6, 3), axis=[5, 2, 1], halo=1)
+        scheduler = WorkStealingScheduler(splitter, num_workers=3, numa=True, nodes={0: [0]})
+        ary = first_touch_array(splitter, dtype="float32", fill_value=2.5, scheduler=scheduler)
+        self.assertEqual((50, 6, 3), ary.shape)
+        self.assertEqual(_np.dtype("float32"), ary.dtype)
+        self.assertTrue(_np.all(ary == 2.5))
+        for stats in scheduler.worker_stats:
+            self.assertEqual(stats.num_assigned, stats.num_tiles)
+            self.assertEqual(0, stats.num_stolen)
+            self.assertEqual(0, stats.num_failed_steals)
+
+        ary = first_touch_array(ShapeSplitter((10, 4), 3))
+        self.assertTrue(_np.all(ary == 0))
+
+    def test_map_exception(self):
+        """
+        Tests exceptions raised by the tile function propagate to the caller.
+        """
+        splitter = ShapeSplitter((100, 10), 20)
+
+        def func(slice_tuple):
+            if slice_tuple[0].start >= 50:
+                raise RuntimeError("tile error")
+            return 0
+
+        self.assertRaises(RuntimeError, work_stealing_map, func, splitter, 4)
+        self.assertEqual(
+            20,
+            work_stealing_map(lambda slice_tuple: 1, splitter, num_workers=4).sum()
+        )
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+_unittest.main(__name__)
@@ -16,9 +16,16 @@ Classes and Functions
    shape_factors - Compute *largest* factors of a given integer.
    calculate_num_slices_per_axis - Computes per-axis divisions for a multi-dimensional shape.
    calculate_tile_shape_for_max_bytes - Calculate a tile shape subject to max bytes restriction.
+   search_tile_shape_for_max_bytes - Minimum cost tile shape subject to max bytes restriction.
+   halo_overhead_cost - Relative halo overhead tile shape cost function.
+   calculate_tile_shape_for_constraints - Tile shape for combined count and bytes constraints.
    convert_halo_to_array_form - converts halo argument to :samp:`(ndim, 2)` shaped array.
+   calculate_periodic_sub_slices - Splits a periodic tile slice into in-bounds sub-slices.
+   gather_periodic_tile - Copies a periodic tile from an array.
+   SplitPhaseTimings - Accumulates per-phase wall-clock times of split calculations.
    ShapeSplitter - Splits a given shape into slices.
    shape_split - Splits a specified shape and returns :obj:`numpy.ndarray` of :obj:`slice` elements.
+   shape_split_many - Splits a batch of shapes and returns a concatenated extents table.
    array_split - Equivalent to :func:`numpy.array_split`.
 
 Attributes
@@ -26,6 +33,8 @@ Attributes
 
 .. autodata:: ARRAY_BOUNDS
 .. autodata:: NO_BOUNDS
+.. autodata:: PERIODIC
+.. autodata:: MAX_TILE_SHAPE_CANDIDATES
 
 Utilities
 =========
@@ -41,6 +50,8 @@ Utilities
 
 """
 from __future__ import absolute_import
+import threading as _threading
+import timeit as _timeit
 import numpy as _np
 from .license import license as _license, copyright as _copyright, version as _version
 from . import logging as _logging
@@ -221,7 +232,8 @@ def calculate_tile_shape_for_max_bytes(
     max_tile_bytes,
     max_tile_shape=None,
     sub_tile_shape=None,
-    halo=None
+    halo=None,
+    tile_shape_cost=None
 ):
     """
     Returns a tile shape :samp:`tile_shape`
@@ -246,6 +258,12 @@ def calculate_tile_shape_for_max_bytes(
        shaped :obj:`numpy.ndarray`
     :param halo: How tiles are extended in each axis direction with *halo*
        elements. See :ref:`the-halo-parameter-examples` for meaning of :samp:`{halo}` values.
+    :type tile_shape_cost: :samp:`None` or callable
+    :param tile_shape_cost: If :samp:`None`, the tile shape is calculated
+       by (fast) greedy reduction of the per-axis tile lengths (axis :samp:`0` first).
+       Otherwise, the tile shape is the minimum cost tile shape
+       found by :func:`search_tile_shape_for_max_bytes` using this cost function
+       (e.g. :func:`halo_overhead_cost`).
     :rtype: :obj:`numpy.ndarray`
     :return: A 1D array of shape :samp:`(len(array_shape),)` indicating a *tile shape*
        which will (approximately) uniformly divide the given :samp:`{array_shape}` into
@@ -276,6 +294,18 @@ def calculate_tile_shape_for_max_bytes(
 
     """
 
+    if tile_shape_cost is not None:
+        return \
+            search_tile_shape_for_max_bytes(
+                array_shape=array_shape,
+                array_itemsize=array_itemsize,
+                max_tile_bytes=max_tile_bytes,
+                max_tile_shape=max_tile_shape,
+                sub_tile_shape=sub_tile_shape,
+                halo=halo,
+                tile_shape_cost=tile_shape_cost
+            )
+
     logger = _logging.getLogger(__name__ + ".calculate_tile_shape_for_max_bytes")
     logger.debug("calculate_tile_shape_for_max_bytes: enter:")
     logger.debug("array_shape=%s", array_shape)
@@ -395,6 +425,481 @@ def calculate_tile_shape_for_max_bytes(
     return tile_shape
 
 
+def halo_overhead_cost(tile_shapes, array_shape, array_itemsize=1, halo=None):
+    """
+    Returns the relative halo overhead for splitting :samp:`{array_shape}`
+    into tiles of shape :samp:`{tile_shapes}`, i.e. the total number of
+    (:data:`ARRAY_BOUNDS` haloed) tile elements divided by the number of
+    array elements, minus one. The tile cost function
+    for :func:`search_tile_shape_for_max_bytes`.
+
+    :type tile_shapes: :obj:`numpy.ndarray`
+    :param tile_shapes: The :samp:`(num_candidates, len({array_shape}))` shaped
+       array of candidate tile shapes.
+    :type array_shape: sequence of :obj:`int`
+    :param array_shape: Shape of the array which is to be split into tiles.
+    :type array_itemsize: :obj:`int`
+    :param array_itemsize: The number of bytes per element (unused, the overhead is relative).
+    :type halo: :samp:`None`, :obj:`int`, sequence of :obj:`int`, or :samp:`(ndim, 2)`
+       shaped :obj:`numpy.ndarray`
+    :param halo: The tile halo.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The :samp:`(num_candidates,)` shaped array of costs.
+
+    Example::
+
+       >>> import numpy as np
+       >>> costs = halo_overhead_cost([[100, 10], [10, 100], [20, 50]], (100, 100), halo=1)
+       >>> np.round(costs, 4).tolist()
+       [0.18, 0.18, 0.1016]
+    """
+    array_shape = _np.array(array_shape, dtype="int64")
+    ndim = len(array_shape)
+    tile_shapes = _np.array(tile_shapes, dtype="int64").reshape((-1, ndim))
+    halo = convert_halo_to_array_form(halo=halo, ndim=ndim)
+    num_tiles = ((array_shape - 1) // _np.maximum(tile_shapes, 1)) + 1
+    lengths = array_shape + _np.maximum(num_tiles - 1, 0) * _np.sum(halo, axis=1)
+    return _np.prod(lengths / _np.maximum(array_shape, 1).astype("float64"), axis=1) - 1.0
+
+
+#: Upper bound on the number of candidate tile shapes evaluated
+#: by :func:`search_tile_shape_for_max_bytes`
+#: and :func:`calculate_tile_shape_for_constraints`, bounds the search
+#: time and memory for high dimensional arrays.
+MAX_TILE_SHAPE_CANDIDATES = 2 ** 17
+
+
+def _thin_axis_lengths(axis_lengths, max_candidates):
+    """
+    Thins the (sorted) per-axis candidate lengths, in place, until the size of
+    their Cartesian product is at most :samp:`{max_candidates}`. The axis with the
+    most candidates has every second length dropped, the smallest and largest
+    lengths are always kept. Returns :samp:`True` if any lengths were dropped.
+    """
+    thinned = False
+    while _np.prod([float(len(lengths)) for lengths in axis_lengths]) > max_candidates:
+        d = int(_np.argmax([len(lengths) for lengths in axis_lengths]))
+        lengths = axis_lengths[d]
+        if len(lengths) <= 2:
+            break
+        axis_lengths[d] = _np.unique(_np.concatenate((lengths[::2], lengths[-1:])))
+        thinned = True
+    return thinned
+
+
+def _calculate_tile_shape_candidates(
+    array_shape,
+    array_itemsize,
+    max_tile_bytes,
+    max_tile_shape,
+    sub_tile_shape,
+    halo,
+    max_candidates=None
+):
+    """
+    Returns :samp:`(array_shape, array_itemsize, halo, tile_shapes)`, where
+    :samp:`tile_shapes` is the :samp:`(num_candidates, ndim)` shaped array of the
+    (canonical) multiples of :samp:`{sub_tile_shape}` which do not exceed
+    :samp:`{max_tile_shape}` and (when not :samp:`None`) the :samp:`{max_tile_bytes}`
+    haloed tile bytes. Per-axis lengths which can not satisfy :samp:`{max_tile_bytes}`
+    are dropped before forming the Cartesian product, if the product still exceeds
+    :samp:`{max_candidates}` (default :data:`MAX_TILE_SHAPE_CANDIDATES`)
+    candidates, the per-axis lengths are thinned (see :func:`_thin_axis_lengths`).
+    """
+    if max_candidates is None:
+        max_candidates = MAX_TILE_SHAPE_CANDIDATES
+    array_shape = _np.array(array_shape, dtype="int64")
+    ndim = len(array_shape)
+    array_itemsize = _np.sum(array_itemsize, dtype="int64")
+    if max_tile_shape is None:
+        max_tile_shape = array_shape.copy()
+    max_tile_shape = _np.minimum(_np.array(max_tile_shape, dtype="int64"), array_shape)
+    if sub_tile_shape is None:
+        sub_tile_shape = _np.ones((ndim,), dtype="int64")
+    sub_tile_shape = _np.array(sub_tile_shape, dtype="int64")
+    halo = convert_halo_to_array_form(halo=halo, ndim=ndim)
+    if _np.any(array_shape < sub_tile_shape):
+        raise ValueError(
+            "Got array_shape=%s element less than corresponding sub_tile_shape=%s element."
+            %
+            (array_shape, sub_tile_shape)
+        )
+
+    # Per-axis candidate (canonical) tile lengths.
+    halo_sizes = _np.sum(halo, axis=1)
+    axis_lengths = []
+    for d in range(ndim):
+        num_sub_tiles = ((array_shape[d] - 1) // sub_tile_shape[d]) + 1
+        num_tiles = _np.arange(1, num_sub_tiles + 1, dtype="int64")
+        lengths = _np.unique((((num_sub_tiles - 1) // num_tiles) + 1) * sub_tile_shape[d])
+        axis_lengths.append(lengths[_np.minimum(lengths, array_shape[d]) <= max_tile_shape[d]])
+    if _np.any([len(lengths) <= 0 for lengths in axis_lengths]):
+        raise ValueError(
+            "Got max_tile_shape=%s, no multiple of sub_tile_shape=%s satisfies the constraint."
+            %
+            (max_tile_shape, sub_tile_shape)
+        )
+
+    # Drop per-axis lengths which exceed the byte budget with the
+    # smallest lengths on all other axes.
+    max_tile_elements = _np.inf
+    if max_tile_bytes is not None:
+        max_tile_elements = max_tile_bytes / float(array_itemsize)
+    min_haloed = \
+        _np.array(
+            [
+                _np.minimum(axis_lengths[d][0], array_shape[d]) + halo_sizes[d]
+                for d in range(ndim)
+            ],
+            dtype="float64"
+        )
+    for d in range(ndim):
+        others = _np.prod(min_haloed) / min_haloed[d] if min_haloed[d] > 0 else 0.0
+        haloed = _np.minimum(axis_lengths[d], array_shape[d]) + halo_sizes[d]
+        axis_lengths[d] = axis_lengths[d][haloed * others <= max_tile_elements]
+    if _np.any([len(lengths) <= 0 for lengths in axis_lengths]):
+        return array_shape, array_itemsize, halo, _np.zeros((0, ndim), dtype="int64")
+    if _thin_axis_lengths(axis_lengths, max_candidates):
+        _logging.getLogger(__name__ + "._calculate_tile_shape_candidates").debug(
+            "Thinned per-axis tile lengths to %s candidates.",
+            [len(lengths) for lengths in axis_lengths]
+        )
+
+    # Cartesian product of candidates, pruned (per axis) by the byte budget.
+    min_remaining = _np.ones((ndim + 1,), dtype="float64")
+    for d in range(ndim - 1, -1, -1):
+        min_remaining[d] = min_remaining[d + 1] * min_haloed[d]
+    tile_shapes = _np.zeros((1, 0), dtype="int64")
+    haloed_elements = _np.ones((1,), dtype="float64")
+    for d in range(ndim):
+        lengths = axis_lengths[d]
+        haloed = _np.minimum(lengths, array_shape[d]) + halo_sizes[d]
+        tile_shapes = \
+            _np.column_stack(
+                (
+                    _np.repeat(tile_shapes, len(lengths), axis=0),
+                    _np.tile(lengths, len(tile_shapes))
+                )
+            ).astype("int64")
+        haloed_elements = _np.outer(haloed_elements, haloed).reshape((-1,))
+        feasible = haloed_elements * min_remaining[d + 1] <= max_tile_elements
+        tile_shapes = tile_shapes[feasible]
+        haloed_elements = haloed_elements[feasible]
+    return array_shape, array_itemsize, halo, tile_shapes
+
+
+def search_tile_shape_for_max_bytes(
+    array_shape,
+    array_itemsize,
+    max_tile_bytes,
+    max_tile_shape=None,
+    sub_tile_shape=None,
+    halo=None,
+    tile_shape_cost=halo_overhead_cost
+):
+    """
+    Returns the minimum cost tile shape, found by (vectorised) exhaustive search
+    of the tile shapes which satisfy the constraints
+    of :func:`calculate_tile_shape_for_max_bytes`. Candidate per-axis tile lengths
+    are the (canonical, evenly dividing) multiples of :samp:`{sub_tile_shape}` which
+    do not exceed :samp:`{max_tile_shape}`, and candidate tile shapes are those whose
+    haloed tile bytes do not exceed :samp:`{max_tile_bytes}`. Ties (equal cost) are
+    resolved in favour of the larger tile volume. When there are more
+    than :data:`MAX_TILE_SHAPE_CANDIDATES` candidates (e.g. high dimensional arrays)
+    the search is over a subset of the per-axis lengths, which always includes
+    the smallest and the whole-axis lengths.
+
+    :type array_shape: sequence of :obj:`int`
+    :param array_shape: Shape of the array which is to be split into tiles.
+    :type array_itemsize: :obj:`int`
+    :param array_itemsize: The number of bytes per element of the array to be tiled.
+    :type max_tile_bytes: :obj:`int`
+    :param max_tile_bytes: The maximum number of bytes for the returned :samp:`tile_shape`.
+    :type max_tile_shape: sequence of :obj:`int`
+    :param max_tile_shape: Per axis maximum shapes for the returned :samp:`tile_shape`.
+    :type sub_tile_shape: sequence of :obj:`int`
+    :param sub_tile_shape: The returned :samp:`tile_shape` will be an even multiple
+       of this sub-tile shape.
+    :type halo: :obj:`int`, sequence of :obj:`int`, or :samp:`(len({array_shape}), 2)`
+       shaped :obj:`numpy.ndarray`
+    :param halo: How tiles are extended in each axis direction with *halo* elements.
+    :type tile_shape_cost: callable
+    :param tile_shape_cost: Function
+       :samp:`tile_shape_cost(tile_shapes, array_shape, array_itemsize, halo)` returning
+       the :samp:`(num_candidates,)` shaped array of costs for
+       the :samp:`(num_candidates, ndim)` shaped :samp:`tile_shapes` candidates,
+       see :func:`halo_overhead_cost`.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The minimum cost tile shape.
+    :raises ValueError: If no tile shape satisfies the constraints.
+
+    Example::
+
+       >>> calculate_tile_shape_for_max_bytes((100, 100), 1, 1200, halo=1).tolist()
+       [3, 100]
+       >>> search_tile_shape_for_max_bytes((100, 100), 1, 1200, halo=1).tolist()
+       [20, 50]
+    """
+    array_shape, array_itemsize, halo, tile_shapes = \
+        _calculate_tile_shape_candidates(
+            array_shape,
+            array_itemsize,
+            max_tile_bytes,
+            max_tile_shape,
+            sub_tile_shape,
+            halo
+        )
+    if len(tile_shapes) <= 0:
+        raise ValueError(
+            "Got max_tile_bytes=%s, too small for sub_tile_shape=%s with halo=%s."
+            %
+            (max_tile_bytes, sub_tile_shape, halo.tolist())
+        )
+
+    costs = _np.asarray(tile_shape_cost(tile_shapes, array_shape, array_itemsize, halo))
+    volumes = _np.prod(_np.minimum(tile_shapes, array_shape).astype("float64"), axis=1)
+    return tile_shapes[_np.lexsort((-volumes, costs))[0]]
+
+
+def _resolve_tile_shape_constraints(active, feasible, num_tiles, min_tile_elements, order):
+    """
+    Returns :samp:`(index, relaxed)`, the index of the first (in :samp:`{order}`)
+    candidate satisfying the :samp:`{active}` constraints and the tuple of the
+    relaxed (unsatisfiable) constraints. The :samp:`"max_tile_bytes"` constraint
+    is never relaxed, :samp:`"min_num_tiles"` is relaxed before :samp:`"min_tile_bytes"`,
+    and a relaxed constraint is satisfied as closely as possible.
+    """
+    hard = _np.ones(order.shape, dtype="bool")
+    if "max_tile_bytes" in active:
+        hard = feasible["max_tile_bytes"]
+    soft = [name for name in ("min_tile_bytes", "min_num_tiles") if name in active]
+    relaxations = \
+        [(), ("min_num_tiles", ), ("min_tile_bytes", ), ("min_tile_bytes", "min_num_tiles")]
+    for relaxed in relaxations:
+        if _np.any([name not in soft for name in relaxed]):
+            continue
+        mask = hard.copy()
+        for name in soft:
+            if name not in relaxed:
+                mask &= feasible[name]
+        if not _np.any(mask):
+            continue
+        # Closest to the relaxed constraints, min_tile_bytes takes precedence.
+        if "min_tile_bytes" in relaxed:
+            mask &= min_tile_elements == _np.max(min_tile_elements[mask])
+        if "min_num_tiles" in relaxed:
+            mask &= num_tiles == _np.max(num_tiles[mask])
+        return order[mask[order]][0], tuple(relaxed)
+    return None, ()
+
+
+def calculate_tile_shape_for_constraints(
+    array_shape,
+    array_itemsize,
+    max_tile_bytes=None,
+    min_num_tiles=None,
+    min_tile_bytes=None,
+    max_tile_shape=None,
+    sub_tile_shape=None,
+    halo=None,
+    tile_shape_cost=None
+):
+    """
+    Returns a tile shape which simultaneously satisfies the :samp:`{max_tile_bytes}`
+    (haloed tile bytes upper bound), :samp:`{min_num_tiles}` (lower bound on the number
+    of tiles) and :samp:`{min_tile_bytes}` (lower bound on the bytes of the smallest,
+    non-haloed, tile) constraints, e.g. *at least 4 tiles per core, each tile fits in
+    cache but is no smaller than 64KiB*. When only :samp:`{max_tile_bytes}` is specified
+    the result is that of :func:`calculate_tile_shape_for_max_bytes`, otherwise
+    the minimum cost (see :func:`search_tile_shape_for_max_bytes`) tile shape
+    satisfying the constraints is returned, equal cost tile shapes are ordered by
+    the number of tiles and then by the size of the smallest (remainder) tile.
+
+    When the constraints can not all be satisfied, :samp:`{min_num_tiles}` is relaxed
+    first (the tile count is maximised subject to the other constraints),
+    then :samp:`{min_tile_bytes}` (the smallest tile bytes is maximised).
+    The :samp:`{max_tile_bytes}` constraint is never relaxed.
+    A constraint is reported as *binding* when dropping it changes the returned tile shape.
+
+    :type array_shape: sequence of :obj:`int`
+    :param array_shape: Shape of the array which is to be split into tiles.
+    :type array_itemsize: :obj:`int`
+    :param array_itemsize: The number of bytes per element of the array to be tiled.
+    :type max_tile_bytes: :samp:`None` or :obj:`int`
+    :param max_tile_bytes: The maximum number of bytes for a (haloed) tile.
+    :type min_num_tiles: :samp:`None` or :obj:`int`
+    :param min_num_tiles: The minimum number of tiles.
+    :type min_tile_bytes: :samp:`None` or :obj:`int`
+    :param min_tile_bytes: The minimum number of bytes for a (non-haloed) tile.
+    :type max_tile_shape: sequence of :obj:`int`
+    :param max_tile_shape: Per axis maximum shapes for the returned :samp:`tile_shape`.
+    :type sub_tile_shape: sequence of :obj:`int`
+    :param sub_tile_shape: The returned :samp:`tile_shape` will be an even multiple
+       of this sub-tile shape.
+    :type halo: :obj:`int`, sequence of :obj:`int`, or :samp:`(len({array_shape}), 2)`
+       shaped :obj:`numpy.ndarray`
+    :param halo: How tiles are extended in each axis direction with *halo* elements.
+    :type tile_shape_cost: :samp:`None` or callable
+    :param tile_shape_cost: Cost function, see :func:`search_tile_shape_for_max_bytes`.
+       If :samp:`None`, :func:`halo_overhead_cost` is used for the search.
+    :rtype: :obj:`tuple`
+    :return: A :samp:`(tile_shape, binding, relaxed)` tuple, :samp:`tile_shape`
+       is the 1D :obj:`numpy.ndarray` tile shape, :samp:`binding` is the
+       :obj:`tuple` of binding constraint names and :samp:`relaxed` is the :obj:`tuple`
+       of names of the constraints which could not be satisfied.
+    :raises ValueError: For invalid constraint values or
+       when no tile satisfies :samp:`{max_tile_bytes}`.
+
+    Example::
+
+       >>> tile_shape, binding, relaxed = \\
+       ...     calculate_tile_shape_for_constraints(
+       ...         (1024, 1024), 8, max_tile_bytes=2 ** 20, min_num_tiles=32
+       ...     )
+       >>> tile_shape.tolist(), binding, relaxed
+       ([32, 1024], ('min_num_tiles',), ())
+       >>> tile_shape, binding, relaxed = \\
+       ...     calculate_tile_shape_for_constraints(
+       ...         (1024, 1024), 8, min_num_tiles=1024, min_tile_bytes=2 ** 16
+       ...     )
+       >>> tile_shape.tolist(), binding, relaxed
+       ([8, 1024], ('min_tile_bytes',), ('min_num_tiles',))
+    """
+    if (max_tile_bytes is not None) and (max_tile_bytes <= 0):
+        raise ValueError("Got max_tile_bytes=%s, should be positive." % (max_tile_bytes,))
+    if (min_num_tiles is not None) and (min_num_tiles < 1):
+        raise ValueError("Got min_num_tiles=%s, should be positive." % (min_num_tiles,))
+    if (min_tile_bytes is not None) and (min_tile_bytes < 0):
+        raise ValueError("Got min_tile_bytes=%s, should be non-negative." % (min_tile_bytes,))
+    if (
+        (max_tile_bytes is not None)
+        and
+        (min_tile_bytes is not None)
+        and
+        (min_tile_bytes > max_tile_bytes)
+    ):
+        raise ValueError(
+            "Got min_tile_bytes=%s greater than max_tile_bytes=%s, should be less or equal."
+            %
+            (min_tile_bytes, max_tile_bytes)
+        )
+    active = \
+        tuple(
+            name
+            for name, value in
+            (
+                ("max_tile_bytes", max_tile_bytes),
+                ("min_num_tiles", min_num_tiles),
+                ("min_tile_bytes", min_tile_bytes)
+            )
+            if value is not None
+        )
+    if len(active) <= 0:
+        raise ValueError(
+            "Got max_tile_bytes=None, min_num_tiles=None and min_tile_bytes=None, "
+            +
+            "should specify at least one constraint."
+        )
+
+    if active == ("max_tile_bytes", ):
+        tile_shape = \
+            calculate_tile_shape_for_max_bytes(
+                array_shape=array_shape,
+                array_itemsize=array_itemsize,
+                max_tile_bytes=max_tile_bytes,
+                max_tile_shape=max_tile_shape,
+                sub_tile_shape=sub_tile_shape,
+                halo=halo,
+                tile_shape_cost=tile_shape_cost
+            )
+        shape = _np.array(array_shape, dtype="int64")
+        if max_tile_shape is not None:
+            shape = _np.minimum(shape, max_tile_shape)
+        binding = ()
+        if _np.any(_np.minimum(tile_shape, array_shape) < shape):
+            binding = ("max_tile_bytes", )
+        return tile_shape, binding, ()
+
+    if tile_shape_cost is None:
+        tile_shape_cost = halo_overhead_cost
+
+    def evaluate(max_tile_bytes):
+        """
+        Returns the (optionally :samp:`max_tile_bytes` pruned) candidate
+        tile shapes and their constraint values.
+        """
+        shape, itemsize, halo_ary, tile_shapes = \
+            _calculate_tile_shape_candidates(
+                array_shape,
+                array_itemsize,
+                max_tile_bytes,
+                max_tile_shape,
+                sub_tile_shape,
+                halo
+            )
+        clipped = _np.minimum(tile_shapes, shape)
+        haloed_elements = _np.prod((clipped + _np.sum(halo_ary, axis=1)).astype("float64"), axis=1)
+        num_tiles = _np.prod(((shape - 1) // tile_shapes) + 1, axis=1)
+        # Smallest tile is the last tile (remainder) along each axis.
+        min_tile_elements = \
+            _np.prod(
+                (shape - (((shape - 1) // tile_shapes) * tile_shapes)).astype("float64"),
+                axis=1
+            )
+        feasible = \
+            {
+                "max_tile_bytes":
+                    haloed_elements * itemsize <= (max_tile_bytes or 0),
+                "min_num_tiles":
+                    num_tiles >= (min_num_tiles or 0),
+                "min_tile_bytes":
+                    min_tile_elements * itemsize >= (min_tile_bytes or 0),
+            }
+        # Minimum cost, then fewest tiles, then largest smallest (remainder) tile.
+        order = _np.zeros((0,), dtype="int64")
+        if len(tile_shapes) > 0:
+            costs = _np.asarray(tile_shape_cost(tile_shapes, shape, itemsize, halo_ary))
+            order = _np.lexsort((-min_tile_elements, num_tiles, costs))
+        return halo_ary, tile_shapes, feasible, num_tiles, min_tile_elements, order
+
+    halo_ary, tile_shapes, feasible, num_tiles, min_tile_elements, order = \
+        evaluate(max_tile_bytes)
+    if ("max_tile_bytes" in active) and (not _np.any(feasible["max_tile_bytes"])):
+        raise ValueError(
+            "Got max_tile_bytes=%s, too small for sub_tile_shape=%s with halo=%s."
+            %
+            (max_tile_bytes, sub_tile_shape, halo_ary.tolist())
+        )
+
+    index, relaxed = \
+        _resolve_tile_shape_constraints(active, feasible, num_tiles, min_tile_elements, order)
+    binding = []
+    for name in active:
+        if name in relaxed:
+            continue
+        others = tuple(other for other in active if other != name)
+        if name == "max_tile_bytes":
+            # The byte budget binds when the best tile shape without it exceeds the budget
+            # (the candidates above are pruned by the budget).
+            unpruned = evaluate(None)
+            other_index, _ = _resolve_tile_shape_constraints(others, *unpruned[2:])
+            other_haloed = \
+                _np.prod(
+                    _np.minimum(unpruned[1][other_index], array_shape)
+                    +
+                    _np.sum(halo_ary, axis=1)
+                )
+            if other_haloed * _np.sum(array_itemsize) > max_tile_bytes:
+                binding.append(name)
+            continue
+        other_index, _ = \
+            _resolve_tile_shape_constraints(others, feasible, num_tiles, min_tile_elements, order)
+        if (other_index is None) or _np.any(tile_shapes[other_index] != tile_shapes[index]):
+            binding.append(name)
+
+    return tile_shapes[index], tuple(binding), relaxed
+
+
 def calculate_num_slices_per_axis(num_slices_per_axis, num_slices, max_slices_per_axis=None):
     """
     Returns a :obj:`numpy.ndarray` (:samp:`return_array` say) where non-positive elements of
@@ -514,7 +1019,11 @@ _array_tile_bounds_policy_param_doc =\
    If :samp:`{tile_bounds_policy}` is :data:`NO_BOUNDS`
    then the returned tiles will extend beyond
    the :samp:`{array_start}` and :samp:`{array_start} + {array_shape}` extend
-   for positive :samp:`{halo}` values. See :ref:`the-halo-parameter-examples` examples.
+   for positive :samp:`{halo}` values. If :samp:`{tile_bounds_policy}`
+   is :data:`PERIODIC` the returned tiles extend beyond the array extents
+   (as for :data:`NO_BOUNDS`) and the out-of-bounds halo elements are interpreted
+   as wrapping around to the opposite side of the array, see :func:`gather_periodic_tile`.
+   See :ref:`the-halo-parameter-examples` examples.
 """
 
 _ShapeSplitter__init__params_doc =\
@@ -550,7 +1059,21 @@ _ShapeSplitter__init__params_doc =\
 :param sub_tile_shape: When not :samp:`None`, the calculated :samp:`tile_shape` will
     be an even multiple of this sub-tile shape. Only relevant when :samp:`{max_tile_bytes}`
     is specified. Should be same length as :samp:`{array_shape}`.
-    See :ref:`splitting-by-maximum-bytes-per-tile-examples` examples.%s%s
+    See :ref:`splitting-by-maximum-bytes-per-tile-examples` examples.
+:type tile_shape_cost: :samp:`None` or callable
+:param tile_shape_cost: When not :samp:`None`, the calculated :samp:`tile_shape` is
+    the minimum cost tile shape (e.g. :func:`halo_overhead_cost`) found by
+    :func:`search_tile_shape_for_max_bytes`, otherwise the (fast) greedy tile shape
+    of :func:`calculate_tile_shape_for_max_bytes`. Only relevant
+    when :samp:`{max_tile_bytes}` is specified.
+:type min_num_tiles: :samp:`None` or :obj:`int`
+:param min_num_tiles: When not :samp:`None`, the calculated :samp:`tile_shape` results
+    in at least this many tiles. May be combined with :samp:`{max_tile_bytes}`
+    and :samp:`{min_tile_bytes}`, see :func:`calculate_tile_shape_for_constraints`.
+:type min_tile_bytes: :samp:`None` or :obj:`int`
+:param min_tile_bytes: When not :samp:`None`, the calculated :samp:`tile_shape` results
+    in tiles of at least this many bytes. May be combined with :samp:`{max_tile_bytes}`
+    and :samp:`{min_num_tiles}`, see :func:`calculate_tile_shape_for_constraints`.%s%s
 """
 _halo_param_doc =\
     """
@@ -589,6 +1112,22 @@ def NO_BOUNDS():  # pylint: disable=invalid-name
     return __NO_BOUNDS
 
 
+#: Indicates that tile halos wrap around the array bounds (periodic domain).
+#: See :ref:`the-halo-parameter-examples` examples.
+__PERIODIC = "periodic"
+
+
+@property
+def PERIODIC():  # pylint: disable=invalid-name
+    """
+    Indicates that tiles may have halos which extend beyond the array bounds,
+    with the out-of-bounds halo elements wrapping around to the opposite side
+    of the array (periodic boundary).
+    See :ref:`the-halo-parameter-examples` examples.
+    """
+    return __PERIODIC
+
+
 def convert_halo_to_array_form(halo, ndim):
     """
     Converts the :samp:`{halo}` argument to a :samp:`(ndim, 2)`
@@ -642,6 +1181,244 @@ def convert_halo_to_array_form(halo, ndim):
     return halo
 
 
+def calculate_periodic_sub_slices(tile_slice, array_shape, array_start=None):
+    """
+    Splits the (possibly out-of-bounds) :samp:`{tile_slice}` into
+    sub-slices which lie within the bounds of a periodic array.
+    Returns a :obj:`list` of :samp:`(tile_sub_slice, array_sub_slice)` pairs,
+    where :samp:`tile_sub_slice` is a :obj:`tuple` of :obj:`slice` indexing
+    the (:samp:`{tile_slice}` shaped) tile and :samp:`array_sub_slice` is the
+    corresponding (in-bounds) :obj:`tuple` of :obj:`slice` indexing the array.
+    Each pair can be copied with a single bulk copy. There are at most :samp:`3**ndim`
+    pairs when halo widths do not exceed the array shape.
+
+    :type tile_slice: sequence of :obj:`slice`
+    :param tile_slice: The tile extents, e.g. an element of a :data:`PERIODIC` split.
+    :type array_shape: sequence of :obj:`int`
+    :param array_shape: Shape of the periodic array.
+    :type array_start: :samp:`None` or sequence of :obj:`int`
+    :param array_start: The start index of the array indexing,
+       defaults to :samp:`[0, ]*len({array_shape})`.
+    :rtype: :obj:`list`
+    :return: List of :samp:`(tile_sub_slice, array_sub_slice)` pairs.
+
+    Example::
+
+       >>> calculate_periodic_sub_slices((slice(-2, 3),), (10,))
+       [((slice(0, 2, None),), (slice(8, 10, None),)), ((slice(2, 5, None),), (slice(0, 3, None),))]
+
+    """
+    if array_start is None:
+        array_start = [0, ] * len(array_shape)
+    axis_pieces = []
+    for d in range(len(array_shape)):
+        size = int(array_shape[d])
+        beg = int(tile_slice[d].start) - int(array_start[d])
+        end = int(tile_slice[d].stop) - int(array_start[d])
+        pieces = []
+        pos = beg
+        while (pos < end) and (size > 0):
+            src_beg = pos % size
+            length = min([size - src_beg, end - pos])
+            pieces.append(
+                (
+                    slice(pos - beg, pos - beg + length),
+                    slice(src_beg + int(array_start[d]), src_beg + int(array_start[d]) + length)
+                )
+            )
+            pos += length
+        if len(pieces) <= 0:
+            pieces = [(slice(0, 0), slice(int(array_start[d]), int(array_start[d])))]
+        axis_pieces.append(pieces)
+
+    ret = [((), ())]
+    for pieces in axis_pieces:
+        ret = \
+            [
+                (tile_sub + (tile_piece,), array_sub + (array_piece,))
+                for tile_sub, array_sub in ret
+                for tile_piece, array_piece in pieces
+            ]
+    return ret
+
+
+def gather_periodic_tile(ary, tile_slice, out=None):
+    """
+    Returns a copy of the (possibly out-of-bounds) :samp:`{tile_slice}` tile
+    of the periodic array :samp:`{ary}`, i.e. equivalent
+    to :samp:`numpy.pad({ary}, halo, mode="wrap")[shifted_tile_slice]` but without
+    padding the whole array. Uses :func:`calculate_periodic_sub_slices` so that
+    the tile is gathered using a small number of bulk copies.
+
+    :type ary: :obj:`numpy.ndarray`
+    :param ary: The periodic array.
+    :type tile_slice: sequence of :obj:`slice`
+    :param tile_slice: The tile extents, e.g. an element of a :data:`PERIODIC` split
+       of :samp:`{ary}.shape`.
+    :type out: :samp:`None` or :obj:`numpy.ndarray`
+    :param out: Output tile array, allocated if :samp:`None`.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The gathered tile.
+
+    Example::
+
+       >>> import numpy as np
+       >>> ary = np.arange(0, 10)
+       >>> split = shape_split(ary.shape, 2, halo=2, tile_bounds_policy=PERIODIC)
+       >>> [gather_periodic_tile(ary, slyce.tolist()) for slyce in split]
+       [array([8, 9, 0, 1, 2, 3, 4, 5, 6]), array([3, 4, 5, 6, 7, 8, 9, 0, 1])]
+
+    """
+    tile_shape = tuple(int(s.stop) - int(s.start) for s in tile_slice)
+    if out is None:
+        out = _np.empty(tile_shape, dtype=ary.dtype)
+    elif tuple(out.shape) != tile_shape:
+        raise ValueError(
+            "Got out.shape=%s, expecting shape=%s." % (out.shape, tile_shape)
+        )
+    for tile_sub_slice, array_sub_slice in calculate_periodic_sub_slices(tile_slice, ary.shape):
+        out[tile_sub_slice] = ary[array_sub_slice]
+    return out
+
+
+class SplitPhaseTimings(object):
+
+    """
+    Accumulates per-phase wall-clock times and call counts for :obj:`ShapeSplitter`
+    split calculations. Instrumentation is enabled by assigning an instance
+    to :attr:`ShapeSplitter.phase_timings`, a single instance can be shared
+    between multiple :obj:`ShapeSplitter` objects (and threads) to aggregate
+    over many splits. The timed phases are:
+
+       :samp:`"check_split_parameters"`
+          Validation of the split parameters (:meth:`ShapeSplitter.check_split_parameters`).
+       :samp:`"calculate_num_slices_per_axis"`
+          Factorisation of the number of tiles (:func:`calculate_num_slices_per_axis`).
+       :samp:`"calculate_tile_shape_for_constraints"`
+          Tile shape calculation from the :samp:`max_tile_bytes`, :samp:`min_num_tiles`
+          and :samp:`min_tile_bytes` constraints
+          (:meth:`ShapeSplitter.calculate_tile_shape_for_constraints`).
+       :samp:`"set_split_extents"`
+          Calculation of the per-axis tile extents, the :samp:`"time"` of this phase
+          includes the time of the two phases above, the :samp:`"self_time"` excludes it.
+       :samp:`"calculate_split_from_extents"`
+          Construction of the returned array of slice tuples
+          (:meth:`ShapeSplitter.calculate_split_from_extents`).
+
+    Example::
+
+       >>> timings = SplitPhaseTimings()
+       >>> splitter = ShapeSplitter((100, 50), 8)
+       >>> splitter.phase_timings = timings
+       >>> split = splitter.calculate_split()
+       >>> split = splitter.calculate_split()
+       >>> timings.num_splits
+       2
+       >>> sorted(timings.counts.items())
+       [('calculate_num_slices_per_axis', 2), ('calculate_split_from_extents', 2), \
+('check_split_parameters', 2), ('set_split_extents', 2)]
+       >>> splitter.split_phase_timings.num_splits  # timings of the most recent split
+       1
+       >>> sorted(timings.as_dict()["phases"]["set_split_extents"].keys())
+       ['count', 'self_time', 'time']
+
+    """
+
+    def __init__(self):
+        """
+        Initialise, all counts and times are zero.
+        """
+        self.__lock = _threading.Lock()
+        self.__child_times = []
+        self.reset()
+
+    def reset(self):
+        """
+        Resets all counts and times to zero.
+        """
+        #: Number of splits accumulated in this object.
+        self.num_splits = 0
+        #: :obj:`dict` of :samp:`(phase_name, call_count)` items.
+        self.counts = {}
+        #: :obj:`dict` of :samp:`(phase_name, seconds)` items, inclusive of nested phases.
+        self.times = {}
+        #: :obj:`dict` of :samp:`(phase_name, seconds)` items, exclusive of nested phases.
+        self.self_times = {}
+
+    def time_phase(self, phase, func, *args, **kwargs):
+        """
+        Returns :samp:`{func}(*{args}, **{kwargs})`, recording the call count
+        and elapsed wall-clock time for phase :samp:`{phase}`.
+        Not thread safe, each split should time phases using its own object
+        and :meth:`merge` the result into a shared object.
+
+        :type phase: :obj:`str`
+        :param phase: Name of the phase.
+        :type func: callable
+        :param func: The phase function.
+        :return: The :samp:`{func}` return value.
+        """
+        child_times = self.__child_times
+        child_times.append(0.0)
+        start = _timeit.default_timer()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = _timeit.default_timer() - start
+            child_time = child_times.pop()
+            if len(child_times) > 0:
+                child_times[-1] += elapsed
+            self.counts[phase] = self.counts.get(phase, 0) + 1
+            self.times[phase] = self.times.get(phase, 0.0) + elapsed
+            self.self_times[phase] = self.self_times.get(phase, 0.0) + elapsed - child_time
+
+    def merge(self, other):
+        """
+        Adds the counts and times of :samp:`{other}` to this object (thread safe).
+
+        :type other: :obj:`SplitPhaseTimings`
+        :param other: Timings which are added to this object.
+        :rtype: :obj:`SplitPhaseTimings`
+        :return: :samp:`{self}`.
+        """
+        with self.__lock:
+            self.num_splits += other.num_splits
+            for phase in other.counts.keys():
+                self.counts[phase] = self.counts.get(phase, 0) + other.counts[phase]
+                self.times[phase] = self.times.get(phase, 0.0) + other.times[phase]
+                self.self_times[phase] = self.self_times.get(phase, 0.0) + other.self_times[phase]
+        return self
+
+    def as_dict(self):
+        """
+        Returns the timings as a (JSON serialisable) :obj:`dict`
+        of the form::
+
+           {
+               "num_splits": int,
+               "phases": {phase_name: {"count": int, "time": float, "self_time": float}, ...}
+           }
+
+        :rtype: :obj:`dict`
+        :return: The timings.
+        """
+        with self.__lock:
+            return {
+                "num_splits": self.num_splits,
+                "phases": dict(
+                    (
+                        phase,
+                        {
+                            "count": self.counts[phase],
+                            "time": self.times[phase],
+                            "self_time": self.self_times[phase]
+                        }
+                    )
+                    for phase in self.counts.keys()
+                )
+            }
+
+
 class ShapeSplitter(object):
 
     """
@@ -686,8 +1463,8 @@ class ShapeSplitter(object):
     logger = _logging.getLogger(__name__ + ".ShapeSplitter")
 
     #: Class attribute indicating list of valid values for :attr:`tile_bound_policy`.
-    #: See :data:`ARRAY_BOUNDS` and :data:`NO_BOUNDS`.
-    valid_tile_bounds_policies = [ARRAY_BOUNDS, NO_BOUNDS]
+    #: See :data:`ARRAY_BOUNDS`, :data:`NO_BOUNDS` and :data:`PERIODIC`.
+    valid_tile_bounds_policies = [ARRAY_BOUNDS, NO_BOUNDS, PERIODIC]
 
     def __init__(
         self,
@@ -701,7 +1478,10 @@ class ShapeSplitter(object):
         max_tile_shape=None,
         sub_tile_shape=None,
         halo=None,
-        tile_bounds_policy=ARRAY_BOUNDS
+        tile_bounds_policy=ARRAY_BOUNDS,
+        tile_shape_cost=None,
+        min_num_tiles=None,
+        min_tile_bytes=None
     ):
         # Initialise *private* attributes.
         self.__array_shape = None
@@ -714,6 +1494,11 @@ class ShapeSplitter(object):
         self.__max_tile_bytes = None
         self.__max_tile_shape = None
         self.__sub_tile_shape = None
+        self.__tile_shape_cost = None
+        self.__min_num_tiles = None
+        self.__min_tile_bytes = None
+        self.__binding_constraints = None
+        self.__relaxed_constraints = None
         self.__halo = None
         self.__tile_bounds_policy = None
         self.__tile_beg_min = None
@@ -721,6 +1506,9 @@ class ShapeSplitter(object):
         self.__split_shape = None
         self.__split_begs = None
         self.__split_ends = None
+        self.__phase_timings = None
+        self.__split_phase_timings = None
+        self.__active_phase_timings = None
 
         # Now set properties from arguments
         self.array_shape = _np.array(array_shape)
@@ -774,6 +1562,12 @@ class ShapeSplitter(object):
 
         self.sub_tile_shape = sub_tile_shape
 
+        self.tile_shape_cost = tile_shape_cost
+
+        self.min_num_tiles = min_num_tiles
+
+        self.min_tile_bytes = min_tile_bytes
+
         halo = self.convert_halo_to_array_form(halo)
         self.halo = halo
 
@@ -919,6 +1713,115 @@ class ShapeSplitter(object):
     def max_tile_shape(self, max_tile_shape):
         self.__max_tile_shape = max_tile_shape
 
+    @property
+    def tile_shape_cost(self):
+        """
+        The cost function for the :attr:`max_tile_bytes` tile shape search,
+        see :func:`search_tile_shape_for_max_bytes`. If :samp:`None`, the
+        greedy :func:`calculate_tile_shape_for_max_bytes` tile shape is used.
+        """
+        return self.__tile_shape_cost
+
+    @tile_shape_cost.setter
+    def tile_shape_cost(self, tile_shape_cost):
+        self.__tile_shape_cost = tile_shape_cost
+
+    @property
+    def min_num_tiles(self):
+        """
+        The minimum number of tiles for the calculated tile shape
+        (combined with :attr:`max_tile_bytes` and :attr:`min_tile_bytes`),
+        see :func:`calculate_tile_shape_for_constraints`.
+        """
+        return self.__min_num_tiles
+
+    @min_num_tiles.setter
+    def min_num_tiles(self, min_num_tiles):
+        self.__min_num_tiles = min_num_tiles
+
+    @property
+    def min_tile_bytes(self):
+        """
+        The minimum number of bytes of the (smallest, non-haloed) tile
+        for the calculated tile shape,
+        see :func:`calculate_tile_shape_for_constraints`.
+        """
+        return self.__min_tile_bytes
+
+    @min_tile_bytes.setter
+    def min_tile_bytes(self, min_tile_bytes):
+        self.__min_tile_bytes = min_tile_bytes
+
+    @property
+    def binding_constraints(self):
+        """
+        The :obj:`tuple` of names (of :samp:`"max_tile_bytes"`, :samp:`"min_num_tiles"`
+        and :samp:`"min_tile_bytes"`) of the constraints which determined the
+        most recently calculated tile shape, :samp:`None` when the tile shape
+        was not calculated from these constraints.
+        """
+        return self.__binding_constraints
+
+    @property
+    def relaxed_constraints(self):
+        """
+        The :obj:`tuple` of names of the constraints which could not be satisfied
+        for the most recently calculated tile shape (:samp:`None` when the tile shape
+        was not calculated from the :attr:`max_tile_bytes`, :attr:`min_num_tiles`
+        and :attr:`min_tile_bytes` constraints).
+        """
+        return self.__relaxed_constraints
+
+    def has_tile_bytes_constraints(self):
+        """
+        Returns :samp:`True` when the tile shape is to be calculated from the
+        :attr:`max_tile_bytes`, :attr:`min_num_tiles` and :attr:`min_tile_bytes` constraints.
+
+        :rtype: :obj:`bool`
+        :return: :samp:`True` if any of the constraints is not :samp:`None`.
+        """
+        return \
+            (
+                (self.max_tile_bytes is not None)
+                or
+                (self.min_num_tiles is not None)
+                or
+                (self.min_tile_bytes is not None)
+            )
+
+    def calculate_tile_shape_for_constraints(self):
+        """
+        Returns the tile shape calculated
+        by :func:`calculate_tile_shape_for_constraints` from :attr:`max_tile_bytes`,
+        :attr:`min_num_tiles` and :attr:`min_tile_bytes`
+        (and :attr:`max_tile_shape`, :attr:`sub_tile_shape`, :attr:`halo`,
+        :attr:`tile_shape_cost`), sets :attr:`binding_constraints`
+        and :attr:`relaxed_constraints`.
+
+        :rtype: :obj:`numpy.ndarray`
+        :return: The tile shape.
+        """
+        tile_shape, self.__binding_constraints, self.__relaxed_constraints = \
+            calculate_tile_shape_for_constraints(
+                array_shape=self.array_shape,
+                array_itemsize=self.array_itemsize,
+                max_tile_bytes=self.max_tile_bytes,
+                min_num_tiles=self.min_num_tiles,
+                min_tile_bytes=self.min_tile_bytes,
+                max_tile_shape=self.max_tile_shape,
+                sub_tile_shape=self.sub_tile_shape,
+                halo=self.halo,
+                tile_shape_cost=self.tile_shape_cost
+            )
+        if len(self.relaxed_constraints) > 0:
+            self.logger.warning(
+                "Relaxed unsatisfiable tile constraints %s for array_shape=%s, tile_shape=%s.",
+                self.relaxed_constraints,
+                self.array_shape.tolist(),
+                tile_shape.tolist()
+            )
+        return tile_shape
+
     @property
     def sub_tile_shape(self):
         """
@@ -1019,10 +1922,41 @@ class ShapeSplitter(object):
     def split_ends(self, split_ends):
         self.__split_ends = split_ends
 
+    @property
+    def phase_timings(self):
+        """
+        A :obj:`SplitPhaseTimings` object (or :samp:`None`) into which
+        the per-phase timings of each :meth:`calculate_split` call are accumulated.
+        Defaults to :samp:`None`, i.e. no instrumentation.
+        """
+        return self.__phase_timings
+
+    @phase_timings.setter
+    def phase_timings(self, phase_timings):
+        self.__phase_timings = phase_timings
+
+    @property
+    def split_phase_timings(self):
+        """
+        The :obj:`SplitPhaseTimings` for the most recent :meth:`calculate_split` call,
+        :samp:`None` if :attr:`phase_timings` was :samp:`None` for that call.
+        """
+        return self.__split_phase_timings
+
+    def time_phase(self, phase, func, *args, **kwargs):
+        """
+        Returns :samp:`{func}(*{args}, **{kwargs})`. When called during an
+        instrumented :meth:`calculate_split`, the call is timed as
+        phase :samp:`{phase}`, see :meth:`SplitPhaseTimings.time_phase`.
+        """
+        if self.__active_phase_timings is None:
+            return func(*args, **kwargs)
+        return self.__active_phase_timings.time_phase(phase, func, *args, **kwargs)
+
     def check_tile_bounds_policy(self):
         """
         Raises :obj:`ValueError` if :attr:`tile_bounds_policy`
-        is not in :samp:`[{self}.ARRAY_BOUNDS, {self}.NO_BOUNDS]`.
+        is not in :attr:`valid_tile_bounds_policies`.
         """
         if self.tile_bounds_policy not in self.valid_tile_bounds_policies:
             raise ValueError(
@@ -1110,6 +2044,12 @@ class ShapeSplitter(object):
         if self.max_tile_bytes is not None:
             parameter_groups["max_tile_bytes"] = \
                 {"self.max_tile_bytes": self.max_tile_bytes}
+        for name, value in \
+                (("min_num_tiles", self.min_num_tiles), ("min_tile_bytes", self.min_tile_bytes)):
+            if value is not None:
+                if "max_tile_bytes" not in parameter_groups.keys():
+                    parameter_groups["max_tile_bytes"] = {}
+                parameter_groups["max_tile_bytes"]["self." + name] = value
         if self.max_tile_shape is not None:
             if "max_tile_bytes" not in parameter_groups.keys():
                 parameter_groups["max_tile_bytes"] = {}
@@ -1118,6 +2058,10 @@ class ShapeSplitter(object):
             if "max_tile_bytes" not in parameter_groups.keys():
                 parameter_groups["max_tile_bytes"] = {}
             parameter_groups["max_tile_bytes"]["self.sub_tile_shape"] = self.sub_tile_shape
+        if self.tile_shape_cost is not None:
+            if "max_tile_bytes" not in parameter_groups.keys():
+                parameter_groups["max_tile_bytes"] = {}
+            parameter_groups["max_tile_bytes"]["self.tile_shape_cost"] = self.tile_shape_cost
 
         self.logger.debug("parameter_groups=%s", parameter_groups)
 
@@ -1165,7 +2109,7 @@ class ShapeSplitter(object):
         data members according to :attr:`tile_bounds_policy`.
         """
 
-        if self.tile_bounds_policy == NO_BOUNDS:
+        if self.tile_bounds_policy in (NO_BOUNDS, PERIODIC):
             self.tile_beg_min = self.array_start - self.halo[:, 0]
             self.tile_end_max = self.array_start + self.array_shape + self.halo[:, 1]
         elif self.tile_bounds_policy == ARRAY_BOUNDS:
@@ -1284,13 +2228,17 @@ class ShapeSplitter(object):
                         tuple(
                             (
                                 min([
-                                    self.split_begs[d][idx[d]] - self.tile_beg_min[d],
+                                    self.split_begs[d][idx[d]]
+                                    + self.array_start[d]
+                                    - self.tile_beg_min[d],
                                     self.halo[d, 0]
                                     *
                                     (self.split_ends[d][idx[d]] > self.split_begs[d][idx[d]])
                                 ]),
                                 min([
-                                    self.tile_end_max[d] - self.split_ends[d][idx[d]],
+                                    self.tile_end_max[d]
+                                    - self.split_ends[d][idx[d]]
+                                    - self.array_start[d],
                                     self.halo[d, 1]
                                     *
                                     (self.split_ends[d][idx[d]] > self.split_begs[d][idx[d]])
@@ -1367,6 +2315,21 @@ class ShapeSplitter(object):
         from values in :attr:`split_size` and :attr:`split_num_slices_per_axis`.
         """
 
+        self.set_split_shape_by_split_size()
+        self.split_begs = [[], ] * len(self.array_shape)
+        self.split_ends = [[], ] * len(self.array_shape)
+        for i in range(len(self.array_shape)):
+            self.split_begs[i], self.split_ends[i] = \
+                self.calculate_axis_split_extents(
+                    self.split_shape[i],
+                    self.array_shape[i]
+            )
+
+    def set_split_shape_by_split_size(self):
+        """
+        Sets split shape :attr:`split_shape` (and canonicalises :attr:`split_num_slices_per_axis`)
+        from values in :attr:`split_size` and :attr:`split_num_slices_per_axis`.
+        """
         if self.split_size is None:
             if (
                 _np.all([s is not None for s in self.split_num_slices_per_axis])
@@ -1388,7 +2351,9 @@ class ShapeSplitter(object):
             "Pre  cannonicalise: self.split_num_slices_per_axis=%s",
             self.split_num_slices_per_axis)
         self.split_num_slices_per_axis = \
-            calculate_num_slices_per_axis(
+            self.time_phase(
+                "calculate_num_slices_per_axis",
+                calculate_num_slices_per_axis,
                 self.split_num_slices_per_axis,
                 self.split_size,
                 self.array_shape
@@ -1396,16 +2361,7 @@ class ShapeSplitter(object):
         self.logger.debug(
             "Post cannonicalise: self.split_num_slices_per_axis=%s",
             self.split_num_slices_per_axis)
-        # Define the start and stop indices (extents) for each axis slice
         self.split_shape = self.split_num_slices_per_axis.copy()
-        self.split_begs = [[], ] * len(self.array_shape)
-        self.split_ends = [[], ] * len(self.array_shape)
-        for i in range(len(self.array_shape)):
-            self.split_begs[i], self.split_ends[i] = \
-                self.calculate_axis_split_extents(
-                    self.split_shape[i],
-                    self.array_shape[i]
-            )
 
     def calculate_split_by_split_size(self):
         """
@@ -1452,18 +2408,15 @@ class ShapeSplitter(object):
         """
         Sets split extents (:attr:`split_begs`
         and :attr:`split_ends`) calculated using
-        from :attr:`max_tile_bytes`
-        (and :attr:`max_tile_shape`, :attr:`sub_tile_shape`, :attr:`halo`).
+        from :attr:`max_tile_bytes`, :attr:`min_num_tiles` and :attr:`min_tile_bytes`
+        (and :attr:`max_tile_shape`, :attr:`sub_tile_shape`, :attr:`halo`),
+        see :meth:`calculate_tile_shape_for_constraints`.
 
         """
         self.tile_shape = \
-            calculate_tile_shape_for_max_bytes(
-                array_shape=self.array_shape,
-                array_itemsize=self.array_itemsize,
-                max_tile_bytes=self.max_tile_bytes,
-                max_tile_shape=self.max_tile_shape,
-                sub_tile_shape=self.sub_tile_shape,
-                halo=self.halo
+            self.time_phase(
+                "calculate_tile_shape_for_constraints",
+                self.calculate_tile_shape_for_constraints
             )
         self.set_split_extents_by_tile_shape()
 
@@ -1489,7 +2442,7 @@ class ShapeSplitter(object):
         selected attributes set from :meth:`__init__`.
         """
 
-        self.check_split_parameters()
+        self.time_phase("check_split_parameters", self.check_split_parameters)
         self.update_tile_extent_bounds()
 
         if self.indices_per_axis is not None:
@@ -1498,9 +2451,338 @@ class ShapeSplitter(object):
             self.set_split_extents_by_split_size()
         elif self.tile_shape is not None:
             self.set_split_extents_by_tile_shape()
-        elif self.max_tile_bytes is not None:
+        elif self.has_tile_bytes_constraints():
             self.set_split_extents_by_tile_max_bytes()
 
+    def set_split_shape(self):
+        """
+        Sets the split shape :attr:`split_shape` calculated using
+        selected attributes set from :meth:`__init__`, without calculating
+        the per-axis extents (:attr:`split_begs` and :attr:`split_ends`).
+        For the :attr:`split_size` and :attr:`tile_shape` (and :attr:`max_tile_bytes`)
+        cases this is :samp:`O(len({self}.array_shape))` work.
+        """
+
+        self.check_split_parameters()
+        self.update_tile_extent_bounds()
+
+        if self.indices_per_axis is not None:
+            self.indices_per_axis = \
+                pad_with_none(self.indices_per_axis, len(self.array_shape))
+            self.split_shape = \
+                _np.array(
+                    [
+                        (len(indices) + 1) if ((indices is not None) and (len(indices) > 0)) else 1
+                        for indices in self.indices_per_axis
+                    ],
+                    dtype="int64"
+                )
+        elif (self.split_size is not None) or (self.split_num_slices_per_axis is not None):
+            self.set_split_shape_by_split_size()
+        else:
+            if (self.tile_shape is None) and self.has_tile_bytes_constraints():
+                self.tile_shape = self.calculate_tile_shape_for_constraints()
+            self.split_shape = ((self.array_shape - 1) // self.tile_shape) + 1
+
+    def calculate_axis_tile_extent(self, axis, index):
+        """
+        Returns the :samp:`(beg, end)` extent (excluding halo and :attr:`array_start`)
+        of the :samp:`{index}`-th tile along axis :samp:`{axis}`. Uses
+        the :attr:`split_begs` and :attr:`split_ends` when these have been calculated,
+        otherwise calculates the extent in closed form (:samp:`O(1)`) from the split
+        parameters. Requires :attr:`split_shape` to have been set,
+        see :meth:`set_split_shape`.
+
+        :type axis: :obj:`int`
+        :param axis: The axis.
+        :type index: :obj:`int`
+        :param index: The tile index along :samp:`{axis}`,
+           :samp:`0 <= {index} < {self}.split_shape[{axis}]`.
+        :rtype: :obj:`tuple`
+        :return: Two element :samp:`(beg, end)` tuple.
+        """
+        size = int(self.array_shape[axis])
+        if self.split_begs is not None:
+            beg = self.split_begs[axis][index]
+            end = self.split_ends[axis][index]
+        elif self.indices_per_axis is not None:
+            indices = self.indices_per_axis[axis]
+            if (indices is None) or (len(indices) <= 0):
+                beg, end = 0, size
+            else:
+                beg = 0 if index == 0 else indices[index - 1]
+                end = size if index == len(indices) else indices[index]
+        elif self.split_num_slices_per_axis is not None:
+            num_sections = int(self.split_shape[axis])
+            section_size = size // num_sections
+            if section_size >= 1:
+                rem = size - section_size * num_sections
+                beg = index * section_size + min([index, rem])
+                end = beg + section_size + (1 if index < rem else 0)
+            else:
+                beg = min([index, size])
+                end = min([index + 1, size])
+        else:
+            beg = index * int(self.tile_shape[axis])
+            end = min([beg + int(self.tile_shape[axis]), size])
+
+        return int(beg), int(end)
+
+    def calculate_axis_tile_bounds(self, axis):
+        """
+        Returns the per-tile slice bounds and halos along axis :samp:`{axis}`, calculated
+        (vectorised) from the :attr:`split_begs` and :attr:`split_ends` extents, so
+        that :samp:`slice(starts[i], stops[i])` is the :samp:`{axis}` element of
+        the slice tuple of any tile with index :samp:`i` along :samp:`{axis}`.
+        Requires the split extents to have been calculated (:meth:`set_split_extents`).
+
+        :type axis: :obj:`int`
+        :param axis: The axis.
+        :rtype: :obj:`tuple`
+        :return: Triple :samp:`(starts, stops, halos)` of :samp:`({self}.split_shape[{axis}],)`
+           shaped :samp:`starts` and :samp:`stops` arrays and
+           a :samp:`({self}.split_shape[{axis}], 2)` shaped :samp:`halos` array.
+        """
+        beg = _np.asarray(self.split_begs[axis], dtype="int64")
+        end = _np.asarray(self.split_ends[axis], dtype="int64")
+        non_empty = (end > beg).astype("int64")
+        start = self.array_start[axis]
+        starts = _np.maximum(beg + start - self.halo[axis, 0] * non_empty, self.tile_beg_min[axis])
+        stops = _np.minimum(end + start + self.halo[axis, 1] * non_empty, self.tile_end_max[axis])
+        halos = _np.zeros((len(beg), 2), dtype="int64")
+        halos[:, 0] = \
+            _np.minimum(beg + start - self.tile_beg_min[axis], self.halo[axis, 0] * non_empty)
+        halos[:, 1] = \
+            _np.minimum(self.tile_end_max[axis] - end - start, self.halo[axis, 1] * non_empty)
+        return starts.astype("int64"), stops.astype("int64"), halos
+
+    def tile_at(self, multi_index):
+        """
+        Returns the slice and halo for the single tile at split
+        position :samp:`{multi_index}`. Only the per-axis extents of the specified
+        tile are calculated, so, for the :attr:`split_size`, :attr:`tile_shape`
+        and :attr:`max_tile_bytes` cases, this is :samp:`O(len({self}.array_shape))` work
+        and the :attr:`split_begs`/:attr:`split_ends` arrays are not constructed.
+
+        :type multi_index: sequence of :obj:`int`
+        :param multi_index: Index of the tile in the (:attr:`split_shape` shaped) split.
+        :rtype: :obj:`tuple`
+        :return: Pair :samp:`(slice_tuple, halo)` where :samp:`slice_tuple` is equal
+           to :samp:`{self}.calculate_split()[{multi_index}]` and :samp:`halo` is
+           the :samp:`(len({self}.array_shape), 2)` shaped array equal
+           to :samp:`{self}.calculate_split_halos_from_extents()[{multi_index}]`.
+        :raises ValueError: If :samp:`{multi_index}` is outside the split.
+
+        Example::
+
+           >>> splitter = ShapeSplitter((10, 20), 8, axis=[0, 0], halo=1)
+           >>> slice_tuple, halo = splitter.tile_at((1, 1))
+           >>> slice_tuple
+           (slice(2, 7, None), slice(9, 20, None))
+           >>> halo
+           array([[1, 1],
+                  [1, 0]])
+           >>> splitter.split_shape
+           array([4, 2])
+        """
+        if self.split_shape is None:
+            self.set_split_shape()
+        multi_index = tuple(int(i) for i in multi_index)
+        if (
+            (len(multi_index) != len(self.split_shape))
+            or
+            _np.any(_np.array(multi_index) < 0)
+            or
+            _np.any(_np.array(multi_index) >= self.split_shape)
+        ):
+            raise ValueError(
+                "Got multi_index=%s, which is not in split of shape %s."
+                %
+                (multi_index, tuple(self.split_shape))
+            )
+        slyces = []
+        halo = _np.zeros((len(self.split_shape), 2), dtype="int64")
+        for d in range(len(self.split_shape)):
+            beg, end = self.calculate_axis_tile_extent(d, multi_index[d])
+            non_empty = end > beg
+            halo[d, 0] = \
+                min([beg + self.array_start[d] - self.tile_beg_min[d], self.halo[d, 0] * non_empty])
+            halo[d, 1] = \
+                min([self.tile_end_max[d] - end - self.array_start[d], self.halo[d, 1] * non_empty])
+            slyces.append(
+                slice(
+                    int(max([
+                        beg + self.array_start[d] - self.halo[d, 0] * non_empty,
+                        self.tile_beg_min[d]
+                    ])),
+                    int(min([
+                        end + self.array_start[d] + self.halo[d, 1] * non_empty,
+                        self.tile_end_max[d]
+                    ]))
+                )
+            )
+        return tuple(slyces), halo
+
+    def calculate_periodic_sub_slices(self, tile_slice):
+        """
+        Returns :samp:`calculate_periodic_sub_slices({tile_slice}, {self}.array_shape,
+        {self}.array_start)`, the in-bounds sub-slices of a (:data:`PERIODIC`)
+        tile. See :func:`calculate_periodic_sub_slices`.
+
+        :type tile_slice: sequence of :obj:`slice`
+        :param tile_slice: Tile extents, e.g. an element of the split
+           returned by :meth:`calculate_split`.
+        :rtype: :obj:`list`
+        :return: List of :samp:`(tile_sub_slice, array_sub_slice)` pairs.
+        """
+        return calculate_periodic_sub_slices(tile_slice, self.array_shape, self.array_start)
+
+    def tile(self, rank):
+        """
+        Returns the slice and halo for the single tile with (C-order) flat
+        index :samp:`{rank}`, i.e. the tile :samp:`{self}.calculate_split().flatten()[{rank}]`.
+        See :meth:`tile_at`.
+
+        :type rank: :obj:`int`
+        :param rank: Flat index of the tile, :samp:`0 <= {rank} < numpy.prod({self}.split_shape)`.
+        :rtype: :obj:`tuple`
+        :return: Pair :samp:`(slice_tuple, halo)`, see :meth:`tile_at`.
+        :raises ValueError: If :samp:`{rank}` is outside the split.
+
+        Example::
+
+           >>> ShapeSplitter((10, 20), 8, axis=[0, 0]).tile(6)
+           ((slice(8, 10, None), slice(0, 10, None)), array([[0, 0],
+                  [0, 0]]))
+        """
+        if self.split_shape is None:
+            self.set_split_shape()
+        num_tiles = int(_np.prod(self.split_shape))
+        if (rank < 0) or (rank >= num_tiles):
+            raise ValueError(
+                "Got rank=%s, should be in range [0, %s)." % (rank, num_tiles)
+            )
+        return self.tile_at(_np.unravel_index(int(rank), tuple(self.split_shape)))
+
+    def grow_array_shape(self, array_shape):
+        """
+        Incrementally updates the split for an :attr:`array_shape` which has grown
+        along (at most) one axis, e.g. an array which is appended to along a
+        time axis. The :attr:`tile_shape` is kept fixed (for the :attr:`max_tile_bytes`
+        case, the tile shape calculated for the original shape is used), so
+        existing tiles are stable: new tiles are appended along the grown axis
+        and only the tiles at the end of the original axis (partial tiles and
+        tiles whose halos were trimmed, or wrapped for :data:`PERIODIC`, at
+        the original array bound) change. The split extents are calculated
+        for the original shape first, if they have not already been calculated.
+
+        :type array_shape: sequence of :obj:`int`
+        :param array_shape: The new array shape, equal to :attr:`array_shape`
+           except for (growth along) one axis.
+        :rtype: :obj:`tuple`
+        :return: Pair :samp:`(added, changed)` of :samp:`(N, len(array_shape))` shaped
+           arrays of split (:attr:`split_shape` shaped) multi-indices, :samp:`added`
+           indicates the new tiles and :samp:`changed` indicates the existing tiles
+           whose slice or halo has changed. All other tiles are unchanged.
+        :raises ValueError: If the split is not a :attr:`tile_shape`
+           (or :attr:`max_tile_bytes`) split, or if :samp:`{array_shape}` differs
+           from :attr:`array_shape` by more than growth along one axis.
+
+        Example::
+
+           >>> splitter = ShapeSplitter((10, 4), tile_shape=(4, 4), halo=1)
+           >>> splitter.calculate_split()[:, 0]
+           array([(slice(0, 5, None), slice(0, 4, None)),
+                  (slice(3, 9, None), slice(0, 4, None)),
+                  (slice(7, 10, None), slice(0, 4, None))],
+                 dtype=[('0', 'O'), ('1', 'O')])
+           >>> added, changed = splitter.grow_array_shape((16, 4))
+           >>> added.tolist(), changed.tolist()
+           ([[3, 0]], [[2, 0]])
+           >>> splitter.calculate_split_from_extents()[:, 0]
+           array([(slice(0, 5, None), slice(0, 4, None)),
+                  (slice(3, 9, None), slice(0, 4, None)),
+                  (slice(7, 13, None), slice(0, 4, None)),
+                  (slice(11, 16, None), slice(0, 4, None))],
+                 dtype=[('0', 'O'), ('1', 'O')])
+        """
+        if (self.tile_shape is None) and (not self.has_tile_bytes_constraints()):
+            raise ValueError(
+                "Got tile_shape=None and max_tile_bytes=None, grow_array_shape requires "
+                +
+                "a tile_shape or max_tile_bytes split."
+            )
+        if self.split_begs is None:
+            self.set_split_extents()
+        array_shape = _np.array(array_shape, dtype="int64")
+        if array_shape.shape != _np.shape(self.array_shape):
+            raise ValueError(
+                "Got array_shape=%s, should have len(array_shape)=%s."
+                %
+                (array_shape, len(self.array_shape))
+            )
+        grown_axes = _np.where(array_shape != self.array_shape)[0]
+        if (len(grown_axes) > 1) or _np.any(array_shape < self.array_shape):
+            raise ValueError(
+                (
+                    "Got array_shape=%s, should differ from self.array_shape=%s "
+                    +
+                    "only by growth along a single axis."
+                )
+                %
+                (array_shape, self.array_shape)
+            )
+        ndim = len(self.array_shape)
+        if len(grown_axes) == 0:
+            return _np.zeros((0, ndim), dtype="int64"), _np.zeros((0, ndim), dtype="int64")
+        axis = grown_axes[0]
+
+        def axis_tile_bounds():
+            starts, stops, halos = self.calculate_axis_tile_bounds(axis)
+            wraps = _np.zeros_like(starts, dtype="bool")
+            if self.tile_bounds_policy == PERIODIC:
+                wraps = \
+                    (
+                        (starts < self.array_start[axis])
+                        |
+                        (stops > (self.array_start[axis] + self.array_shape[axis]))
+                    )
+            return _np.column_stack((starts, stops, halos)), wraps
+
+        old_bounds, old_wraps = axis_tile_bounds()
+        old_num_tiles = len(old_bounds)
+
+        self.array_shape = _np.array(self.array_shape)
+        self.array_shape[axis] = array_shape[axis]
+        self.update_tile_extent_bounds()
+        split_begs, split_ends = self.split_begs, self.split_ends
+        self.set_split_extents_by_tile_shape()
+        # Extents along the non-grown axes are unchanged (keep the existing arrays)
+        for d in range(ndim):
+            if d != axis:
+                self.split_begs[d] = split_begs[d]
+                self.split_ends[d] = split_ends[d]
+
+        new_bounds, new_wraps = axis_tile_bounds()
+        changed_axis_indices = \
+            _np.where(
+                _np.any(old_bounds != new_bounds[0:old_num_tiles], axis=1)
+                |
+                old_wraps
+                |
+                new_wraps[0:old_num_tiles]
+            )[0]
+        added_axis_indices = _np.arange(old_num_tiles, len(new_bounds))
+
+        def axis_multi_indices(axis_indices):
+            shape = self.split_shape.copy()
+            shape[axis] = len(axis_indices)
+            multi_indices = _np.indices(tuple(shape), dtype="int64").reshape((ndim, -1)).T
+            multi_indices[:, axis] = axis_indices[multi_indices[:, axis]]
+            return multi_indices
+
+        return axis_multi_indices(added_axis_indices), axis_multi_indices(changed_axis_indices)
+
     def calculate_split(self):
         """
         Computes the split.
@@ -1514,13 +2796,35 @@ class ShapeSplitter(object):
            being a :obj:`slice` object. Each :obj:`tuple` defines a slice within
            the bounds :samp:`{self}.array_start - {self}.halo[:, 0]`
            to :samp:`{self}.array_start + {self}.array_shape + {self}.halo[:, 1]`.
+
+        When :attr:`phase_timings` is not :samp:`None`, the per-phase times
+        of this split are recorded in :attr:`split_phase_timings` and
+        merged into :attr:`phase_timings`.
         """
 
-        self.set_split_extents()
-        return self.calculate_split_from_extents()
+        if self.phase_timings is None:
+            self.__split_phase_timings = None
+            self.set_split_extents()
+            return self.calculate_split_from_extents()
+
+        split_phase_timings = SplitPhaseTimings()
+        self.__active_phase_timings = split_phase_timings
+        try:
+            self.time_phase("set_split_extents", self.set_split_extents)
+            split = \
+                self.time_phase(
+                    "calculate_split_from_extents",
+                    self.calculate_split_from_extents
+                )
+        finally:
+            self.__active_phase_timings = None
+        split_phase_timings.num_splits = 1
+        self.__split_phase_timings = split_phase_timings
+        self.phase_timings.merge(split_phase_timings)
+        return split
 
 
-ShapeSplitter([0, ]).__init__.__func__.__doc__ = \
+getattr(ShapeSplitter.__init__, "__func__", ShapeSplitter.__init__).__doc__ = \
     """
 Initialises parameters which define a split.
 
@@ -1585,6 +2889,182 @@ Splits specified :samp:`{array_shape}` in tiles, returns array of :obj:`slice` t
     )
 
 
+def shape_split_many(shapes, **common_kwargs):
+    """
+    Splits a batch of (same dimension) array shapes using common split parameters,
+    returns the per-axis tile extents of all the splits in a single
+    concatenated table. Equivalent to calling
+    :samp:`ShapeSplitter(shape, **{common_kwargs})` for each :samp:`shape`
+    in :samp:`{shapes}`, but only a single :obj:`ShapeSplitter` is
+    created (to validate the parameters) and the extents
+    of all splits are calculated with vectorised operations.
+    Split shapes which depend on the array shape (split by number of tiles
+    and by :samp:`max_tile_bytes`) are calculated once per *unique* shape.
+
+    The rows of :samp:`table` for axis :samp:`d` of :samp:`{shapes}[i]`
+    are :samp:`table[offsets[i, d]:offsets[i, d] + split_shapes[i, d]]` and
+    the rows for :samp:`{shapes}[i]` are contiguous, in the row layout
+    (columns :samp:`beg, end, start, stop, halo_lo, halo_hi`)
+    of :attr:`array_split.plan.SplitPlan.table`. The :samp:`start`
+    and :samp:`stop` columns are the tile :obj:`slice` bounds (including
+    halo and :samp:`array_start`), :samp:`beg` and :samp:`end` are the
+    tile extents excluding halo and :samp:`array_start`.
+
+    :type shapes: sequence of sequence of :obj:`int`
+    :param shapes: The :samp:`(num_arrays, ndim)` shaped sequence of array shapes.
+    :type common_kwargs: :obj:`dict`
+    :param common_kwargs: Split parameters (keyword arguments
+       of :meth:`ShapeSplitter.__init__`) common to all shapes.
+    :rtype: :obj:`tuple`
+    :return: Triple :samp:`(split_shapes, offsets, table)` of
+       :samp:`(num_arrays, ndim)` shaped :samp:`split_shapes` and :samp:`offsets`
+       arrays and the :samp:`(split_shapes.sum(), 6)` shaped :samp:`table` array.
+
+    Example::
+
+       >>> shapes = [(10, 4), (7, 4)]
+       >>> split_shapes, offsets, table = shape_split_many(shapes, axis=[2, 1], halo=1)
+       >>> split_shapes.tolist()
+       [[2, 1], [2, 1]]
+       >>> offsets.tolist()
+       [[0, 2], [3, 5]]
+       >>> table[offsets[1, 0]:offsets[1, 0] + split_shapes[1, 0]].tolist()
+       [[0, 4, 0, 5, 0, 1], [4, 7, 3, 7, 1, 0]]
+       >>> table[offsets[1, 1]:offsets[1, 1] + split_shapes[1, 1]].tolist()
+       [[0, 4, 0, 4, 0, 0]]
+    """
+    shapes = _np.array(shapes, dtype="int64")
+    if (shapes.ndim != 2) or (shapes.shape[1] < 1):
+        raise ValueError(
+            "Got shapes.shape=%s, should be a (num_arrays, ndim) sequence of shapes."
+            %
+            (shapes.shape,)
+        )
+    num_arrays, ndim = shapes.shape
+    splitter = \
+        ShapeSplitter(
+            shapes[0] if num_arrays > 0 else _np.ones((ndim,), dtype="int64"),
+            **common_kwargs
+        )
+    splitter.check_split_parameters()
+
+    split_shapes = _np.ones((num_arrays, ndim), dtype="int64")
+    tile_shapes = None
+    axis_begs = None
+    if splitter.indices_per_axis is not None:
+        indices_per_axis = pad_with_none(splitter.indices_per_axis, ndim)
+        axis_begs = \
+            [
+                _np.array([0, ] + list(indices), dtype="int64")
+                if (indices is not None) and (len(indices) > 0) else
+                _np.zeros((1,), dtype="int64")
+                for indices in indices_per_axis
+            ]
+        split_shapes[:, :] = [len(begs) for begs in axis_begs]
+    elif (splitter.split_size is not None) or (splitter.split_num_slices_per_axis is not None):
+        split_size = splitter.split_size
+        if split_size is None:
+            num_slices_per_axis = splitter.split_num_slices_per_axis
+            if not _np.all([(s is not None) and (s > 0) for s in num_slices_per_axis]):
+                raise ValueError(
+                    (
+                        "Got invalid split_num_slices_per_axis=%s, all elements "
+                        +
+                        "need to be integers greater than zero when split_size is None."
+                    )
+                    %
+                    (splitter.split_num_slices_per_axis,)
+                )
+            split_size = _np.prod(splitter.split_num_slices_per_axis)
+        unique_shapes, inverse = _np.unique(shapes, axis=0, return_inverse=True)
+        split_shapes = \
+            _np.array(
+                [
+                    calculate_num_slices_per_axis(
+                        list(splitter.split_num_slices_per_axis),
+                        split_size,
+                        shape
+                    )
+                    for shape in unique_shapes
+                ],
+                dtype="int64"
+            ).reshape((len(unique_shapes), ndim))[inverse.reshape(-1)]
+    else:
+        if splitter.tile_shape is not None:
+            tile_shapes = _np.zeros_like(shapes) + _np.array(splitter.tile_shape, dtype="int64")
+        else:
+            unique_shapes, inverse = _np.unique(shapes, axis=0, return_inverse=True)
+            tile_shapes = \
+                _np.array(
+                    [
+                        calculate_tile_shape_for_constraints(
+                            array_shape=shape,
+                            array_itemsize=splitter.array_itemsize,
+                            max_tile_bytes=splitter.max_tile_bytes,
+                            min_num_tiles=splitter.min_num_tiles,
+                            min_tile_bytes=splitter.min_tile_bytes,
+                            max_tile_shape=splitter.max_tile_shape,
+                            sub_tile_shape=splitter.sub_tile_shape,
+                            halo=splitter.halo,
+                            tile_shape_cost=splitter.tile_shape_cost
+                        )[0]
+                        for shape in unique_shapes
+                    ],
+                    dtype="int64"
+                ).reshape((len(unique_shapes), ndim))[inverse.reshape(-1)]
+        split_shapes = ((shapes - 1) // tile_shapes) + 1
+
+    # One row per (array, axis, tile index), arrays major and axes minor.
+    counts = split_shapes.flatten()
+    offsets = _np.zeros((num_arrays * ndim,), dtype="int64")
+    offsets[1:] = _np.cumsum(counts)[:-1]
+    array_axis = _np.repeat(_np.arange(num_arrays * ndim, dtype="int64"), counts)
+    index = _np.arange(len(array_axis), dtype="int64") - offsets[array_axis]
+    axis = array_axis % ndim
+    size = shapes.flatten()[array_axis]
+    if axis_begs is not None:
+        axis_base = _np.zeros((ndim + 1,), dtype="int64")
+        axis_base[1:] = _np.cumsum([len(begs) for begs in axis_begs])
+        all_begs = _np.concatenate(axis_begs + [_np.zeros((1,), dtype="int64"), ])
+        beg = all_begs[axis_base[axis] + index]
+        end = \
+            _np.where(
+                index == counts[array_axis] - 1,
+                size,
+                all_begs[axis_base[axis] + index + 1]
+            )
+    elif tile_shapes is None:
+        num_sections = counts[array_axis]
+        section_size = size // num_sections
+        rem = size - section_size * num_sections
+        beg = index * section_size + _np.minimum(index, rem)
+        end = beg + section_size + (index < rem)
+    else:
+        tile_size = tile_shapes.flatten()[array_axis]
+        beg = index * tile_size
+        end = _np.minimum(beg + tile_size, size)
+
+    array_start = _np.asarray(splitter.array_start, dtype="int64")[axis]
+    halo_lo = splitter.halo[axis, 0] * (end > beg)
+    halo_hi = splitter.halo[axis, 1] * (end > beg)
+    if splitter.tile_bounds_policy in (NO_BOUNDS, PERIODIC):
+        tile_beg_min = array_start - splitter.halo[axis, 0]
+        tile_end_max = array_start + size + splitter.halo[axis, 1]
+    else:
+        tile_beg_min = array_start
+        tile_end_max = array_start + size
+
+    table = _np.zeros((len(array_axis), 6), dtype="int64")
+    table[:, 0] = beg
+    table[:, 1] = end
+    table[:, 2] = _np.maximum(beg + array_start - halo_lo, tile_beg_min)
+    table[:, 3] = _np.minimum(end + array_start + halo_hi, tile_end_max)
+    table[:, 4] = _np.minimum(beg + array_start - tile_beg_min, halo_lo)
+    table[:, 5] = _np.minimum(tile_end_max - end - array_start, halo_hi)
+
+    return split_shapes, offsets.reshape((num_arrays, ndim)), table
+
+
 def array_split(
     ary,
     indices_or_sections=None,
@@ -1593,11 +3073,14 @@ def array_split(
     max_tile_bytes=None,
     max_tile_shape=None,
     sub_tile_shape=None,
-    halo=None
+    halo=None,
+    tile_shape_cost=None,
+    min_num_tiles=None,
+    min_tile_bytes=None
 ):
     "To be replaced."
     return [
-        ary[slyce]
+        ary[slyce.tolist()]
         for slyce in
         shape_split(
             array_shape=ary.shape,
@@ -1610,7 +3093,10 @@ def array_split(
             max_tile_shape=max_tile_shape,
             sub_tile_shape=sub_tile_shape,
             halo=halo,
-            tile_bounds_policy=ARRAY_BOUNDS
+            tile_bounds_policy=ARRAY_BOUNDS,
+            tile_shape_cost=tile_shape_cost,
+            min_num_tiles=min_num_tiles,
+            min_tile_bytes=min_tile_bytes
         ).flatten()
     ]
 
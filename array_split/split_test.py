@@ -31,10 +31,13 @@ from .license import license as _license, copyright as _copyright, version as _v
 from . import unittest as _unittest
 from . import logging as _logging
 
-from .split import ShapeSplitter, array_split, shape_split
+from .split import ShapeSplitter, array_split, shape_split, shape_split_many
 from .split import calculate_num_slices_per_axis, shape_factors
 from .split import calculate_tile_shape_for_max_bytes, pad_with_object, convert_halo_to_array_form
-from .split import ARRAY_BOUNDS, NO_BOUNDS
+from .split import ARRAY_BOUNDS, NO_BOUNDS, PERIODIC, is_scalar
+from .split import calculate_periodic_sub_slices, gather_periodic_tile, SplitPhaseTimings
+from .split import search_tile_shape_for_max_bytes, halo_overhead_cost
+from .split import calculate_tile_shape_for_constraints, _calculate_tile_shape_candidates
 
 __author__ = "Shane J. Latham"
 __license__ = _license()
@@ -390,6 +393,314 @@ class SplitTest(_unittest.TestCase):
             )
         self.assertSequenceEqual((32, 64), tile_shape.tolist())
 
+    def test_search_tile_shape_for_max_bytes(self):
+        """
+        Test for :func:`array_split.split.search_tile_shape_for_max_bytes`,
+        compares with brute-force enumeration of all the sub-tile multiples.
+        """
+        cases = \
+            [
+                ((100, 100), 1, 1200, None, None, 1),
+                ((100, 100), 4, 4 * 1200, None, None, 1),
+                ((64, 48), 2, 2 * 300, None, (4, 2), 2),
+                ((31, 17, 9), 1, 400, (16, 17, 9), None, [[1, 0], [1, 1], [0, 0]]),
+                ((50, 50), 1, 2500, None, None, 0),
+            ]
+        for array_shape, itemsize, max_tile_bytes, max_tile_shape, sub_tile_shape, halo in cases:
+            ndim = len(array_shape)
+            halo_ary = convert_halo_to_array_form(halo, ndim)
+            sub = _np.ones((ndim,), dtype="int64") if sub_tile_shape is None else sub_tile_shape
+            sub = _np.array(sub, dtype="int64")
+            max_shape = _np.array(array_shape if max_tile_shape is None else max_tile_shape)
+            tile_shape = \
+                search_tile_shape_for_max_bytes(
+                    array_shape,
+                    itemsize,
+                    max_tile_bytes,
+                    max_tile_shape=max_tile_shape,
+                    sub_tile_shape=sub_tile_shape,
+                    halo=halo
+                )
+            self.logger.info("array_shape=%s, tile_shape=%s", array_shape, tile_shape)
+
+            # Constraints.
+            self.assertTrue(_np.all(tile_shape % sub == 0))
+            self.assertTrue(_np.all(_np.minimum(tile_shape, array_shape) <= max_shape))
+            haloed = _np.minimum(tile_shape, array_shape) + _np.sum(halo_ary, axis=1)
+            self.assertTrue(_np.prod(haloed) * itemsize <= max_tile_bytes)
+
+            # Brute force: every feasible multiple of the sub-tile shape.
+            axis_candidates = \
+                [
+                    _np.arange(sub[d], ((array_shape[d] - 1) // sub[d] + 1) * sub[d] + 1, sub[d])
+                    for d in range(ndim)
+                ]
+            candidates = \
+                _np.array(
+                    _np.meshgrid(*axis_candidates, indexing="ij")
+                ).reshape((ndim, -1)).T
+            clipped = _np.minimum(candidates, array_shape)
+            feasible = \
+                (
+                    _np.all(clipped <= max_shape, axis=1)
+                    &
+                    (
+                        _np.prod(clipped + _np.sum(halo_ary, axis=1), axis=1) * itemsize
+                        <=
+                        max_tile_bytes
+                    )
+                )
+            brute_costs = halo_overhead_cost(candidates[feasible], array_shape, itemsize, halo)
+            cost = halo_overhead_cost([tile_shape, ], array_shape, itemsize, halo)[0]
+            self.assertAlmostEqual(_np.min(brute_costs), cost)
+
+            # The greedy (default) result is never better than the searched one.
+            greedy_tile_shape = \
+                calculate_tile_shape_for_max_bytes(
+                    array_shape,
+                    itemsize,
+                    max_tile_bytes,
+                    max_tile_shape=max_tile_shape,
+                    sub_tile_shape=sub_tile_shape,
+                    halo=halo
+                )
+            greedy_cost = halo_overhead_cost([greedy_tile_shape, ], array_shape, itemsize, halo)[0]
+            self.assertTrue(cost <= greedy_cost + 1.0e-12)
+
+        # No halo, the whole array fits in the budget.
+        self.assertSequenceEqual(
+            [50, 50],
+            search_tile_shape_for_max_bytes((50, 50), 1, 2500).tolist()
+        )
+
+        # Infeasible budget.
+        self.assertRaises(
+            ValueError,
+            search_tile_shape_for_max_bytes,
+            (100, 100), 1, 8, sub_tile_shape=(4, 4)
+        )
+
+        # Pluggable cost, prefer tiles which are long along the last axis.
+        tile_shape = \
+            search_tile_shape_for_max_bytes(
+                (100, 100),
+                1,
+                1000,
+                tile_shape_cost=lambda tile_shapes, *args: -tile_shapes[:, -1]
+            )
+        self.assertSequenceEqual([10, 100], tile_shape.tolist())
+
+        # High dimensional arrays, the number of candidates is bounded.
+        for array_shape, itemsize, max_tile_bytes, halo in \
+                [((200, ) * 5, 8, 2 ** 24, 1), ((100, ) * 6, 8, 2 ** 26, None)]:
+            tile_shape = \
+                search_tile_shape_for_max_bytes(array_shape, itemsize, max_tile_bytes, halo=halo)
+            halo_ary = convert_halo_to_array_form(halo, len(array_shape))
+            haloed = _np.minimum(tile_shape, array_shape) + _np.sum(halo_ary, axis=1)
+            self.assertTrue(_np.prod(haloed) * itemsize <= max_tile_bytes)
+            greedy_tile_shape = \
+                calculate_tile_shape_for_max_bytes(array_shape, itemsize, max_tile_bytes, halo=halo)
+            self.assertTrue(
+                halo_overhead_cost([tile_shape, ], array_shape, itemsize, halo)[0]
+                <=
+                halo_overhead_cost([greedy_tile_shape, ], array_shape, itemsize, halo)[0]
+            )
+        tile_shapes = \
+            _calculate_tile_shape_candidates(
+                (200, ) * 5, 8, None, None, None, None, max_candidates=1000
+            )[3]
+        self.assertTrue(len(tile_shapes) <= 1000)
+        self.assertTrue(_np.any(_np.all(tile_shapes == 1, axis=1)))
+        self.assertTrue(_np.any(_np.all(tile_shapes == 200, axis=1)))
+
+    def test_calculate_split_by_tile_max_bytes_with_tile_shape_cost(self):
+        """
+        Test for :samp:`ShapeSplitter(..., tile_shape_cost=...)` and that the greedy
+        tile shape remains the default.
+        """
+        splitter = ShapeSplitter((100, 100), max_tile_bytes=1200, halo=1)
+        splitter.calculate_split()
+        self.assertSequenceEqual([3, 100], splitter.tile_shape.tolist())
+
+        splitter = \
+            ShapeSplitter(
+                (100, 100),
+                max_tile_bytes=1200,
+                halo=1,
+                tile_shape_cost=halo_overhead_cost
+            )
+        split = splitter.calculate_split()
+        self.assertSequenceEqual([20, 50], splitter.tile_shape.tolist())
+        self.assertSequenceEqual([5, 2], list(split.shape))
+
+        tiles = \
+            array_split(
+                _np.zeros((100, 100)),
+                max_tile_bytes=8 * 1200,
+                halo=1,
+                tile_shape_cost=halo_overhead_cost
+            )
+        self.assertEqual(10, len(tiles))
+
+        splitter = \
+            ShapeSplitter((100, 100), tile_shape=(10, 10), tile_shape_cost=halo_overhead_cost)
+        self.assertRaises(
+            ValueError,
+            splitter.calculate_split
+        )
+
+    def test_calculate_tile_shape_for_constraints(self):
+        """
+        Test for :func:`array_split.split.calculate_tile_shape_for_constraints`.
+        """
+        array_shape = _np.array((1024, 1024))
+        itemsize = 8
+
+        def num_tiles(tile_shape):
+            return int(_np.prod(((array_shape - 1) // tile_shape) + 1))
+
+        def min_tile_bytes(tile_shape):
+            return \
+                int(_np.prod(array_shape - ((array_shape - 1) // tile_shape) * tile_shape)) \
+                * itemsize
+
+        # Only max_tile_bytes, same as the greedy calculation.
+        tile_shape, binding, relaxed = \
+            calculate_tile_shape_for_constraints(array_shape, itemsize, max_tile_bytes=2 ** 18)
+        self.assertSequenceEqual(
+            calculate_tile_shape_for_max_bytes(array_shape, itemsize, 2 ** 18).tolist(),
+            tile_shape.tolist()
+        )
+        self.assertEqual(("max_tile_bytes", ), binding)
+        self.assertEqual((), relaxed)
+        tile_shape, binding, relaxed = \
+            calculate_tile_shape_for_constraints(array_shape, itemsize, max_tile_bytes=2 ** 30)
+        self.assertSequenceEqual([1024, 1024], tile_shape.tolist())
+        self.assertEqual((), binding)
+
+        # All constraints satisfied.
+        cases = \
+            [
+                (2 ** 20, 64, 2 ** 16, ("min_num_tiles", )),
+                (2 ** 17, 4, 2 ** 16, ("max_tile_bytes", )),
+                (2 ** 20, 4, 2 ** 19, ("max_tile_bytes", )),
+                (None, 1000, 2 ** 13, ("min_num_tiles", "min_tile_bytes")),
+                (2 ** 22, 4, 0, ("min_num_tiles", )),
+            ]
+        for max_bytes, min_tiles, min_bytes, expected_binding in cases:
+            tile_shape, binding, relaxed = \
+                calculate_tile_shape_for_constraints(
+                    array_shape,
+                    itemsize,
+                    max_tile_bytes=max_bytes,
+                    min_num_tiles=min_tiles,
+                    min_tile_bytes=min_bytes
+                )
+            self.logger.info("tile_shape=%s, binding=%s", tile_shape, binding)
+            self.assertEqual((), relaxed)
+            self.assertEqual(expected_binding, binding)
+            if max_bytes is not None:
+                self.assertTrue(_np.prod(tile_shape) * itemsize <= max_bytes)
+            self.assertTrue(num_tiles(tile_shape) >= min_tiles)
+            self.assertTrue(min_tile_bytes(tile_shape) >= min_bytes)
+
+        # Conflicting counts and bytes, min_num_tiles is relaxed.
+        tile_shape, binding, relaxed = \
+            calculate_tile_shape_for_constraints(
+                array_shape,
+                itemsize,
+                max_tile_bytes=2 ** 20,
+                min_num_tiles=1024,
+                min_tile_bytes=2 ** 16
+            )
+        self.assertEqual(("min_num_tiles", ), relaxed)
+        self.assertEqual(("min_tile_bytes", ), binding)
+        self.assertEqual(128, num_tiles(tile_shape))
+        self.assertTrue(min_tile_bytes(tile_shape) >= 2 ** 16)
+
+        # The min_tile_bytes is relaxed when no tile of the sub-tile multiples fits.
+        tile_shape, binding, relaxed = \
+            calculate_tile_shape_for_constraints(
+                (100, ),
+                1,
+                max_tile_bytes=40,
+                min_tile_bytes=35,
+                sub_tile_shape=(25, )
+            )
+        self.assertSequenceEqual([25], tile_shape.tolist())
+        self.assertEqual(("min_tile_bytes", ), relaxed)
+
+        # Halo counts towards max_tile_bytes.
+        tile_shape, binding, relaxed = \
+            calculate_tile_shape_for_constraints(
+                (64, 64), 1, max_tile_bytes=18 * 18, min_num_tiles=2, halo=1
+            )
+        self.assertTrue(_np.prod(tile_shape + 2) <= 18 * 18)
+
+        self.assertRaises(ValueError, calculate_tile_shape_for_constraints, (10, ), 1)
+        self.assertRaises(
+            ValueError,
+            calculate_tile_shape_for_constraints,
+            (10, ), 1, max_tile_bytes=4, min_tile_bytes=5
+        )
+        self.assertRaises(
+            ValueError,
+            calculate_tile_shape_for_constraints,
+            (10, ), 1, min_num_tiles=0
+        )
+        self.assertRaises(
+            ValueError,
+            calculate_tile_shape_for_constraints,
+            (10, ), 1, max_tile_bytes=2, min_num_tiles=2, sub_tile_shape=(3, )
+        )
+
+        # High dimensional arrays, candidates pruned by the byte budget.
+        for high_dim_shape in [(512, ) * 4, (128, ) * 5]:
+            tile_shape, binding, relaxed = \
+                calculate_tile_shape_for_constraints(
+                    high_dim_shape,
+                    itemsize,
+                    max_tile_bytes=2 ** 21,
+                    min_num_tiles=16,
+                    min_tile_bytes=2 ** 16
+                )
+            self.assertEqual((), relaxed)
+            self.assertTrue("max_tile_bytes" in binding)
+            self.assertTrue(_np.prod(_np.minimum(tile_shape, high_dim_shape)) * itemsize <= 2 ** 21)
+            self.assertTrue(
+                _np.prod(((_np.array(high_dim_shape) - 1) // tile_shape) + 1) >= 16
+            )
+
+    def test_calculate_split_by_combined_constraints(self):
+        """
+        Test for :samp:`ShapeSplitter(..., min_num_tiles=..., min_tile_bytes=...)`.
+        """
+        splitter = \
+            ShapeSplitter(
+                (1024, 1024),
+                array_itemsize=8,
+                max_tile_bytes=2 ** 18,
+                min_num_tiles=64,
+                min_tile_bytes=2 ** 16
+            )
+        self.assertEqual(None, splitter.binding_constraints)
+        split = splitter.calculate_split()
+        self.assertEqual(64, split.size)
+        self.assertEqual(("min_num_tiles", ), splitter.binding_constraints)
+        self.assertEqual((), splitter.relaxed_constraints)
+
+        splitter = ShapeSplitter((100, ), min_num_tiles=7)
+        splitter.set_split_shape()
+        self.assertSequenceEqual([7], splitter.split_shape.tolist())
+        self.assertEqual(7, len(array_split(_np.zeros((100, )), min_num_tiles=7)))
+
+        splitter = ShapeSplitter((100, ), axis=[2], min_num_tiles=7)
+        self.assertRaises(ValueError, splitter.calculate_split)
+
+        split_shapes, offsets, table = \
+            shape_split_many([(100, ), (20, )], min_num_tiles=4, min_tile_bytes=10)
+        self.assertSequenceEqual([[4], [2]], split_shapes.tolist())
+
     def test_multiple_parameter_groups_error(self):
         """
         Test for case for inconsistent parameter group arguments.
@@ -1511,6 +1822,313 @@ class SplitTest(_unittest.TestCase):
             self.assertSequenceEqual([5, 4], tuple(splt_halos[i, 1][1]))
             self.assertSequenceEqual([5, 0], tuple(splt_halos[i, 2][1]))
 
+    def test_tile_and_tile_at(self):
+        """
+        Tests :meth:`array_split.split.ShapeSplitter.tile`
+        and :meth:`array_split.split.ShapeSplitter.tile_at` against
+        the :meth:`array_split.split.ShapeSplitter.calculate_split`
+        and :meth:`array_split.split.ShapeSplitter.calculate_split_halos_from_extents` results.
+        """
+        split_kwargs_list = [
+            {"indices_or_sections": 7},
+            {"indices_or_sections": 24},
+            {"indices_or_sections": 12, "axis": [3, 0, 2]},
+            {"axis": [7, 1, 20]},
+            {"indices_or_sections": [[2, 5], [], [1, 3, 14]]},
+            {"tile_shape": [4, 3, 5]},
+            {"max_tile_bytes": 512, "array_itemsize": 4},
+        ]
+        for split_kwargs in split_kwargs_list:
+            for halo in [0, 1, [[2, 0], [0, 1], [3, 3]]]:
+                for tile_bounds_policy in [ARRAY_BOUNDS, NO_BOUNDS]:
+                    kwargs = dict(split_kwargs)
+                    kwargs.update(
+                        {
+                            "array_start": [-2, 0, 3],
+                            "halo": halo,
+                            "tile_bounds_policy": tile_bounds_policy
+                        }
+                    )
+                    self.logger.debug("kwargs=%s", kwargs)
+                    splitter = ShapeSplitter((17, 4, 15), **kwargs)
+                    split = splitter.calculate_split()
+                    halos = splitter.calculate_split_halos_from_extents()
+
+                    lookup_splitter = ShapeSplitter((17, 4, 15), **kwargs)
+                    for rank in range(split.size):
+                        multi_index = _np.unravel_index(rank, split.shape)
+                        slyce, tile_halo = lookup_splitter.tile(rank)
+                        self.assertSequenceEqual(split[multi_index].tolist(), slyce)
+                        self.assertTrue(
+                            _np.all(_np.array(halos[multi_index].tolist()) == tile_halo)
+                        )
+                        self.assertSequenceEqual(
+                            slyce,
+                            lookup_splitter.tile_at(multi_index)[0]
+                        )
+                    self.assertSequenceEqual(split.shape, tuple(lookup_splitter.split_shape))
+                    if is_scalar(kwargs.get("indices_or_sections", 0)):
+                        self.assertEqual(None, lookup_splitter.split_begs)
+                        self.assertEqual(None, lookup_splitter.split_ends)
+
+                    self.assertRaises(ValueError, lookup_splitter.tile, -1)
+                    self.assertRaises(ValueError, lookup_splitter.tile, split.size)
+                    self.assertRaises(ValueError, lookup_splitter.tile_at, split.shape)
+
+        # Lookup after the split has been calculated uses the calculated extents.
+        splitter = ShapeSplitter((10, 9), axis=[3, 2], halo=1)
+        split = splitter.calculate_split()
+        self.assertSequenceEqual(split[2, 1].tolist(), splitter.tile_at((2, 1))[0])
+
+        # Empty tiles.
+        splitter = ShapeSplitter((3,), 5, halo=2)
+        split = splitter.calculate_split()
+        for rank in range(5):
+            self.assertSequenceEqual(
+                split[rank].tolist(),
+                ShapeSplitter((3,), 5, halo=2).tile(rank)[0]
+            )
+
+    def test_periodic_tile_bounds_policy(self):
+        """
+        Tests :data:`array_split.split.PERIODIC` tile bounds policy,
+        :func:`array_split.split.calculate_periodic_sub_slices`
+        and :func:`array_split.split.gather_periodic_tile`.
+        """
+        for array_shape, halo in \
+                [
+                    ((17,), 3),
+                    ((17,), [[0, 20]]),
+                    ((11, 13), [[1, 2], [3, 0]]),
+                    ((5, 6, 7), 2),
+                ]:
+            ary = _np.random.uniform(size=array_shape)
+            splitter = \
+                ShapeSplitter(
+                    array_shape,
+                    2 ** len(array_shape),
+                    axis=[0, ] * len(array_shape),
+                    halo=halo,
+                    tile_bounds_policy=PERIODIC
+                )
+            split = splitter.calculate_split()
+            halo = splitter.halo
+            halos = splitter.calculate_split_halos_from_extents()
+            padded = _np.pad(ary, [tuple(h) for h in halo], mode="wrap")
+            for idx in range(split.size):
+                multi_index = _np.unravel_index(idx, split.shape)
+                tile_slice = split[multi_index].tolist()
+                self.assertTrue(_np.all(_np.array(halos[multi_index].tolist()) == halo))
+                padded_slice = \
+                    tuple(
+                        slice(s.start + halo[d, 0], s.stop + halo[d, 0])
+                        for d, s in enumerate(tile_slice)
+                    )
+                tile = gather_periodic_tile(ary, tile_slice)
+                self.assertTrue(_np.all(padded[padded_slice] == tile))
+                sub_slices = calculate_periodic_sub_slices(tile_slice, array_shape)
+                if _np.all(halo <= _np.array(array_shape)[:, _np.newaxis]):
+                    self.assertTrue(len(sub_slices) <= 3 ** len(array_shape))
+                for tile_sub_slice, array_sub_slice in sub_slices:
+                    self.assertTrue(_np.all(tile[tile_sub_slice] == ary[array_sub_slice]))
+
+                out = _np.zeros_like(tile)
+                self.assertTrue(out is gather_periodic_tile(ary, tile_slice, out=out))
+                self.assertTrue(_np.all(tile == out))
+
+        self.assertRaises(
+            ValueError,
+            gather_periodic_tile,
+            _np.zeros((10,)),
+            (slice(-1, 5),),
+            _np.zeros((5,))
+        )
+
+        # Non-zero array_start
+        splitter = ShapeSplitter((10,), 2, array_start=(5,), halo=1, tile_bounds_policy=PERIODIC)
+        split = splitter.calculate_split()
+        self.assertSequenceEqual([slice(4, 11), ], split[0].tolist())
+        self.assertSequenceEqual(
+            [((slice(0, 1),), (slice(14, 15),)), ((slice(1, 7),), (slice(5, 11),))],
+            splitter.calculate_periodic_sub_slices(split[0].tolist())
+        )
+
+    def test_split_phase_timings(self):
+        """
+        Tests :attr:`array_split.split.ShapeSplitter.phase_timings`
+        and :obj:`array_split.split.SplitPhaseTimings`.
+        """
+        splitter = ShapeSplitter((64, 32, 16), 12)
+        self.assertEqual(None, splitter.phase_timings)
+        split = splitter.calculate_split()
+        self.assertEqual(None, splitter.split_phase_timings)
+
+        timings = SplitPhaseTimings()
+        splitter.phase_timings = timings
+        self.assertTrue(_np.all(split == splitter.calculate_split()))
+        splitter.calculate_split()
+        self.assertEqual(2, timings.num_splits)
+        self.assertEqual(1, splitter.split_phase_timings.num_splits)
+        for phase in [
+            "check_split_parameters",
+            "calculate_num_slices_per_axis",
+            "set_split_extents",
+            "calculate_split_from_extents"
+        ]:
+            self.assertEqual(2, timings.counts[phase], phase)
+            self.assertEqual(1, splitter.split_phase_timings.counts[phase], phase)
+            self.assertTrue(timings.self_times[phase] <= timings.times[phase], phase)
+            self.assertTrue(timings.self_times[phase] >= 0.0, phase)
+        self.assertTrue(
+            timings.times["set_split_extents"]
+            >=
+            (
+                timings.times["check_split_parameters"]
+                +
+                timings.times["calculate_num_slices_per_axis"]
+            )
+        )
+
+        # Aggregate over multiple splitters (and split modes)
+        splitter = ShapeSplitter((64, 32, 16), array_itemsize=4, max_tile_bytes=512)
+        splitter.phase_timings = timings
+        splitter.calculate_split()
+        self.assertEqual(3, timings.num_splits)
+        self.assertEqual(1, timings.counts["calculate_tile_shape_for_constraints"])
+        self.assertEqual(3, timings.counts["calculate_split_from_extents"])
+
+        timings_dict = timings.as_dict()
+        self.assertEqual(3, timings_dict["num_splits"])
+        self.assertEqual(
+            sorted(timings.counts.keys()),
+            sorted(timings_dict["phases"].keys())
+        )
+        self.assertEqual(
+            timings.times["set_split_extents"],
+            timings_dict["phases"]["set_split_extents"]["time"]
+        )
+
+        merged = SplitPhaseTimings().merge(timings).merge(timings)
+        self.assertEqual(6, merged.num_splits)
+        self.assertEqual(6, merged.counts["calculate_split_from_extents"])
+        timings.reset()
+        self.assertEqual(0, timings.num_splits)
+        self.assertEqual({}, timings.as_dict()["phases"])
+
+        # Failed splits do not leave the splitter instrumented
+        splitter = ShapeSplitter((64, 32, 16), 12, tile_shape=(4, 4, 4))
+        splitter.phase_timings = timings
+        self.assertRaises(ValueError, splitter.calculate_split)
+        self.assertEqual(0, timings.num_splits)
+        splitter.phase_timings = None
+        self.assertRaises(ValueError, splitter.calculate_split)
+
+    def test_grow_array_shape(self):
+        """
+        Tests :meth:`array_split.split.ShapeSplitter.grow_array_shape` against
+        splits calculated from scratch for the grown shape.
+        """
+        for tile_bounds_policy in [ARRAY_BOUNDS, NO_BOUNDS, PERIODIC]:
+            for halo in [0, 1, [[2, 1], [0, 3], [1, 1]]]:
+                for axis, new_size in [(0, 23), (0, 24), (1, 40), (2, 6)]:
+                    old_shape = (21, 17, 5)
+                    new_shape = list(old_shape)
+                    new_shape[axis] = new_size
+                    splitter = \
+                        ShapeSplitter(
+                            old_shape,
+                            tile_shape=(4, 5, 2),
+                            halo=halo,
+                            tile_bounds_policy=tile_bounds_policy
+                        )
+                    old_split = splitter.calculate_split()
+                    old_halos = splitter.calculate_split_halos_from_extents()
+                    added, changed = splitter.grow_array_shape(new_shape)
+                    new_split = splitter.calculate_split_from_extents()
+                    new_halos = splitter.calculate_split_halos_from_extents()
+                    expected_split = \
+                        ShapeSplitter(
+                            new_shape,
+                            tile_shape=(4, 5, 2),
+                            halo=halo,
+                            tile_bounds_policy=tile_bounds_policy
+                        ).calculate_split()
+                    self.assertSequenceEqual(new_shape, splitter.array_shape.tolist())
+                    self.assertArraySplitEqual(expected_split, new_split)
+
+                    old_slab = tuple(slice(0, n) for n in old_split.shape)
+                    added_set = set(tuple(i) for i in added.tolist())
+                    changed_set = set(tuple(i) for i in changed.tolist())
+                    self.assertEqual(new_split.size - old_split.size, len(added_set))
+                    for multi_index in added_set:
+                        self.assertTrue(multi_index[axis] >= old_split.shape[axis])
+                    differs = \
+                        (old_split != new_split[old_slab]) | (old_halos != new_halos[old_slab])
+                    for multi_index in zip(*_np.where(differs)):
+                        self.assertTrue(tuple(multi_index) in changed_set)
+                    if tile_bounds_policy != PERIODIC:
+                        self.assertEqual(int(_np.sum(differs)), len(changed_set))
+
+        splitter = ShapeSplitter((10, 10), array_itemsize=8, max_tile_bytes=160)
+        split = splitter.calculate_split()
+        added, changed = splitter.grow_array_shape((10, 10))
+        self.assertSequenceEqual((0, 2), added.shape)
+        self.assertSequenceEqual((0, 2), changed.shape)
+        added, changed = splitter.grow_array_shape((30, 10))
+        self.assertEqual(2 * split.size, len(added))
+        self.assertEqual(0, len(changed))
+
+        self.assertRaises(ValueError, splitter.grow_array_shape, (30, 12, 1))
+        self.assertRaises(ValueError, splitter.grow_array_shape, (31, 11))
+        self.assertRaises(ValueError, splitter.grow_array_shape, (20, 10))
+        self.assertRaises(ValueError, ShapeSplitter((10, 10), 4).grow_array_shape, (20, 10))
+
+    def test_shape_split_many(self):
+        """
+        Tests :func:`array_split.split.shape_split_many` extents are those
+        of the per-shape :obj:`array_split.split.ShapeSplitter` splits.
+        """
+        random_state = _np.random.RandomState(1234)
+        shapes = random_state.randint(1, 40, size=(60, 3))
+        shapes[30:40] = shapes[0:10]
+        shapes[-1] = (1, 2, 3)
+        kwargs_list = \
+            [
+                {"indices_or_sections": 6},
+                {"indices_or_sections": 8, "axis": [0, 2, 0], "halo": 1},
+                {"axis": [3, 1, 2], "halo": [[1, 2], [0, 0], [3, 1]]},
+                {"tile_shape": (7, 3, 16), "halo": 2, "tile_bounds_policy": NO_BOUNDS},
+                {"tile_shape": (5, 5, 5), "halo": 1, "tile_bounds_policy": PERIODIC},
+                {"array_itemsize": 4, "max_tile_bytes": 512, "halo": 1},
+                {"indices_or_sections": [[2, 5], [], [1]], "array_start": (10, -3, 0)},
+            ]
+        for kwargs in kwargs_list:
+            split_shapes, offsets, table = shape_split_many(shapes, **kwargs)
+            self.assertSequenceEqual(shapes.shape, split_shapes.shape)
+            self.assertSequenceEqual(shapes.shape, offsets.shape)
+            self.assertSequenceEqual((split_shapes.sum(), 6), table.shape)
+            for i, shape in enumerate(shapes):
+                splitter = ShapeSplitter(shape, **kwargs)
+                splitter.set_split_extents()
+                self.assertSequenceEqual(splitter.split_shape.tolist(), split_shapes[i].tolist())
+                for d in range(shapes.shape[1]):
+                    rows = table[offsets[i, d]:offsets[i, d] + split_shapes[i, d]]
+                    starts, stops, halos = splitter.calculate_axis_tile_bounds(d)
+                    self.assertTrue(_np.all(rows[:, 0] == splitter.split_begs[d]))
+                    self.assertTrue(_np.all(rows[:, 1] == splitter.split_ends[d]))
+                    self.assertTrue(_np.all(rows[:, 2] == starts))
+                    self.assertTrue(_np.all(rows[:, 3] == stops))
+                    self.assertTrue(_np.all(rows[:, 4:6] == halos))
+
+        split_shapes, offsets, table = shape_split_many(_np.zeros((0, 2)), tile_shape=(2, 2))
+        self.assertSequenceEqual((0, 2), split_shapes.shape)
+        self.assertSequenceEqual((0, 6), table.shape)
+        self.assertRaises(ValueError, shape_split_many, [10, 20], tile_shape=(2, 2))
+        self.assertRaises(
+            ValueError,
+            shape_split_many, [[10, 20]], indices_or_sections=4, tile_shape=(2, 2)
+        )
+
 
 __all__ = [s for s in dir() if not s.startswith('_')]
 
@@ -0,0 +1,527 @@
+"""
+===================================
+The :mod:`array_split.store` Module
+===================================
+
+.. currentmodule:: array_split.store
+
+Chunked, compressed, on-disk array storage where the chunk grid is defined
+by a :obj:`array_split.ShapeSplitter` split (the tile extents, excluding halo).
+The store is a directory containing a JSON :samp:`.zarray` metadata
+file and one (compressed) file per tile, in
+the `Zarr (version 2) <https://zarr.readthedocs.io/en/stable/spec/v2.html>`_
+directory layout. Each tile file contains the C-order bytes of
+the tile padded (with :samp:`fill_value`) to the :samp:`chunks` shape
+(the maximum tile shape), compressed with the :mod:`zlib` or :mod:`lzma`
+standard library compressors (:samp:`numcodecs` compatible).
+
+When the split is a *regular* grid (e.g. split by :samp:`tile_shape`)
+the store is a Zarr version 2 array. Otherwise the per-axis tile begin
+indices are recorded under the (non-Zarr) :samp:`"array_split"` key
+of the :samp:`.zarray` metadata and the store can only be read
+by :obj:`TiledArrayStore`.
+
+Tiles are compressed (:meth:`TiledArrayStore.write`) and decompressed
+(:meth:`TiledArrayStore.read`) in parallel threads, only the tiles which
+intersect a region are read and decompressed.
+
+Example::
+
+   >>> import numpy as np, tempfile, shutil, os
+   >>> from array_split import ShapeSplitter
+   >>> ary = np.arange(0, 20 * 30, dtype="int32").reshape((20, 30))
+   >>> tmp_dir = tempfile.mkdtemp()
+   >>> store = \\
+   ...     TiledArrayStore.create(
+   ...         os.path.join(tmp_dir, "ary.zarr"),
+   ...         ShapeSplitter(ary.shape, tile_shape=(8, 16)),
+   ...         ary.dtype
+   ...     )
+   >>> store.is_zarr_compatible, store.chunks, store.split_shape
+   (True, (8, 16), (3, 2))
+   >>> store.write(ary)
+   >>> sorted(os.listdir(store.path))
+   ['.zarray', '0.0', '0.1', '1.0', '1.1', '2.0', '2.1']
+   >>> store.read_tile((2, 1)).shape
+   (4, 14)
+   >>> bool(np.all(store[3:12, 15:17] == ary[3:12, 15:17]))
+   True
+   >>> shutil.rmtree(tmp_dir)
+
+Classes and Functions
+=====================
+
+.. autosummary::
+   :toctree: generated/
+
+   TiledArrayStore - Chunked compressed array store with split defined chunks.
+
+Attributes
+==========
+
+.. autodata:: COMPRESSORS
+
+"""
+from __future__ import absolute_import
+import json as _json
+import math as _math
+import os as _os
+import shutil as _shutil
+import zlib as _zlib
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import logging as _logging
+from .scheduler import WorkStealingScheduler as _WorkStealingScheduler
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+#: Atomic rename (:func:`os.replace` is python-3.3+).
+_replace = getattr(_os, "replace", _os.rename)
+
+#: The supported :samp:`compressor` names, :samp:`None` for uncompressed tiles.
+COMPRESSORS = ("zlib", "lzma", None)
+
+#: Name of the store metadata file.
+ZARRAY_FILE_NAME = ".zarray"
+
+
+def _compressor_config(compressor, compression_level):
+    """
+    Returns the (:samp:`numcodecs` compatible) compressor configuration :obj:`dict`.
+    """
+    if compressor is None:
+        return None
+    elif compressor == "zlib":
+        return {"id": "zlib", "level": 1 if compression_level is None else compression_level}
+    elif compressor == "lzma":
+        return \
+            {
+                "id": "lzma",
+                "format": 1,
+                "check": -1,
+                "preset": compression_level,
+                "filters": None
+            }
+    raise ValueError("Got compressor=%s, should be one of %s." % (compressor, COMPRESSORS))
+
+
+def _encode(config, buf):
+    """
+    Compresses :samp:`{buf}` bytes according to compressor :samp:`{config}`.
+    """
+    if config is None:
+        return buf
+    elif config["id"] == "zlib":
+        return _zlib.compress(buf, config["level"])
+    import lzma as _lzma
+    return \
+        _lzma.compress(
+            buf,
+            format=config["format"],
+            check=config["check"],
+            preset=config["preset"],
+            filters=config["filters"]
+        )
+
+
+def _decode(config, buf):
+    """
+    Decompresses :samp:`{buf}` bytes according to compressor :samp:`{config}`.
+    """
+    if config is None:
+        return buf
+    elif config["id"] == "zlib":
+        return _zlib.decompress(buf)
+    elif config["id"] == "lzma":
+        import lzma as _lzma
+        return _lzma.decompress(buf, format=config["format"], filters=config["filters"])
+    raise ValueError("Got unsupported compressor config %s." % (config,))
+
+
+def _fill_value_to_json(fill_value):
+    """
+    Converts :samp:`{fill_value}` to the Zarr JSON encoding.
+    """
+    if fill_value is None:
+        return None
+    fill_value = _np.asarray(fill_value).item()
+    if isinstance(fill_value, float):
+        if _math.isnan(fill_value):
+            return "NaN"
+        elif _math.isinf(fill_value):
+            return "Infinity" if fill_value > 0 else "-Infinity"
+    return fill_value
+
+
+def _fill_value_from_json(fill_value):
+    """
+    Converts Zarr JSON encoded :samp:`{fill_value}`.
+    """
+    return \
+        {"NaN": float("nan"), "Infinity": float("inf"), "-Infinity": -float("inf")}.get(
+            fill_value,
+            fill_value
+        ) if isinstance(fill_value, str) else fill_value
+
+
+class TiledArrayStore(object):
+
+    """
+    Chunked compressed array store (directory), see :mod:`array_split.store`.
+    Open an existing store with :samp:`TiledArrayStore(path)` and create
+    a store with :meth:`create`.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".TiledArrayStore")
+
+    def __init__(self, path):
+        """
+        Opens existing store.
+
+        :type path: :obj:`str`
+        :param path: Store directory.
+        :raises ValueError: If the :samp:`.zarray` metadata is not
+           a supported Zarr version 2 array.
+        """
+        self.path = path
+        with open(_os.path.join(path, ZARRAY_FILE_NAME), "r") as fp:
+            metadata = _json.load(fp)
+        if (
+            (metadata.get("zarr_format") != 2)
+            or
+            (metadata.get("order", "C") != "C")
+            or
+            (metadata.get("filters") is not None)
+        ):
+            raise ValueError(
+                "Got unsupported .zarray metadata %s, require zarr_format=2, order='C' "
+                "and filters=None."
+                %
+                (metadata,)
+            )
+        #: The :samp:`.zarray` metadata :obj:`dict`.
+        self.metadata = metadata
+        #: The array shape.
+        self.shape = tuple(metadata["shape"])
+        #: The array :obj:`numpy.dtype`.
+        self.dtype = _np.dtype(metadata["dtype"])
+        #: The chunk shape (maximum tile shape).
+        self.chunks = tuple(metadata["chunks"])
+        #: Value of elements in unwritten tiles (and chunk padding).
+        self.fill_value = _fill_value_from_json(metadata.get("fill_value"))
+        #: The compressor configuration (:samp:`None` for no compression).
+        self.compressor = metadata.get("compressor")
+        #: The chunk key dimension separator.
+        self.dimension_separator = metadata.get("dimension_separator", ".")
+        if "array_split" in metadata:
+            self.split_begs = \
+                [_np.array(begs, dtype="int64") for begs in metadata["array_split"]["split_begs"]]
+        else:
+            self.split_begs = \
+                [
+                    _np.arange(0, max([size, 1]), chunk, dtype="int64")
+                    for size, chunk in zip(self.shape, self.chunks)
+                ]
+        self.split_ends = \
+            [
+                _np.append(begs[1:], size).astype("int64")
+                for begs, size in zip(self.split_begs, self.shape)
+            ]
+
+    @staticmethod
+    def create(
+        path,
+        splitter,
+        dtype,
+        compressor="zlib",
+        compression_level=None,
+        fill_value=0,
+        overwrite=False
+    ):
+        """
+        Creates a new (empty) store with chunk grid defined by the :samp:`{splitter}` split.
+
+        :type path: :obj:`str`
+        :param path: Store directory, created if it does not exist.
+        :type splitter: :obj:`array_split.ShapeSplitter`
+        :param splitter: Defines the chunk grid (tile extents, excluding halo).
+        :type dtype: :obj:`numpy.dtype`
+        :param dtype: Array element type (non-structured, non-object).
+        :type compressor: :obj:`str`
+        :param compressor: One of :attr:`COMPRESSORS`.
+        :type compression_level: :samp:`None` or :obj:`int`
+        :param compression_level: The :mod:`zlib` level or :mod:`lzma` preset.
+        :type fill_value: scalar
+        :param fill_value: Value of unwritten elements.
+        :type overwrite: :obj:`bool`
+        :param overwrite: If :samp:`True`, an existing store at :samp:`{path}` is removed.
+        :rtype: :obj:`TiledArrayStore`
+        :return: The store.
+        :raises ValueError: For an unsupported :samp:`{dtype}` or :samp:`{compressor}`,
+           or if a store exists and :samp:`{overwrite}` is :samp:`False`.
+        """
+        dtype = _np.dtype(dtype)
+        if (dtype.fields is not None) or dtype.hasobject or (dtype.itemsize <= 0):
+            raise ValueError("Got dtype=%s, should be a fixed size non-structured type." % dtype)
+        config = _compressor_config(compressor, compression_level)
+        if splitter.split_begs is None:
+            splitter.set_split_extents()
+        shape = [int(s) for s in splitter.array_shape]
+        split_begs = [_np.asarray(begs, dtype="int64") for begs in splitter.split_begs]
+        split_ends = [_np.asarray(ends, dtype="int64") for ends in splitter.split_ends]
+        chunks = [max([1, int(_np.max(e - b))]) for b, e in zip(split_begs, split_ends)]
+        metadata = \
+            {
+                "zarr_format": 2,
+                "shape": shape,
+                "chunks": chunks,
+                "dtype": dtype.str,
+                "compressor": config,
+                "fill_value": _fill_value_to_json(fill_value),
+                "order": "C",
+                "filters": None,
+                "dimension_separator": ".",
+            }
+        regular = \
+            all(
+                [
+                    _np.array_equal(begs, _np.arange(0, max([size, 1]), chunk))
+                    for begs, size, chunk in zip(split_begs, shape, chunks)
+                ]
+            )
+        if not regular:
+            metadata["array_split"] = {"split_begs": [begs.tolist() for begs in split_begs]}
+
+        metadata_file_name = _os.path.join(path, ZARRAY_FILE_NAME)
+        if _os.path.exists(metadata_file_name):
+            if not overwrite:
+                raise ValueError("Got existing store path=%s and overwrite=False." % (path,))
+            _shutil.rmtree(path)
+        if not _os.path.exists(path):
+            _os.makedirs(path)
+        with open(metadata_file_name, "w") as fp:
+            _json.dump(metadata, fp, indent=4, sort_keys=True)
+
+        return TiledArrayStore(path)
+
+    @property
+    def is_zarr_compatible(self):
+        """
+        :samp:`True` when the chunk grid is regular (and the store is a Zarr version 2 array).
+        """
+        return "array_split" not in self.metadata
+
+    @property
+    def split_shape(self):
+        """
+        The number of tiles per axis.
+        """
+        return tuple(len(begs) for begs in self.split_begs)
+
+    @property
+    def num_tiles(self):
+        """
+        The number of tiles.
+        """
+        return int(_np.prod(self.split_shape))
+
+    def tile_slice(self, multi_index):
+        """
+        Returns the :obj:`tuple` of :obj:`slice` of the tile at :samp:`{multi_index}`.
+
+        :type multi_index: sequence of :obj:`int`
+        :param multi_index: The tile index in the chunk grid.
+        :rtype: :obj:`tuple`
+        :return: Tile slice tuple.
+        """
+        multi_index = tuple(int(i) for i in multi_index)
+        if (
+            (len(multi_index) != len(self.shape))
+            or
+            _np.any(_np.array(multi_index) < 0)
+            or
+            _np.any(_np.array(multi_index) >= self.split_shape)
+        ):
+            raise ValueError(
+                "Got multi_index=%s, should be index into split_shape=%s."
+                %
+                (multi_index, self.split_shape)
+            )
+        return \
+            tuple(
+                slice(int(self.split_begs[d][i]), int(self.split_ends[d][i]))
+                for d, i in enumerate(multi_index)
+            )
+
+    def chunk_file_name(self, multi_index):
+        """
+        Returns the file name of the tile at :samp:`{multi_index}`.
+
+        :type multi_index: sequence of :obj:`int`
+        :param multi_index: The tile index in the chunk grid.
+        :rtype: :obj:`str`
+        :return: Chunk file path.
+        """
+        key = self.dimension_separator.join(["%d" % i for i in multi_index])
+        return _os.path.join(self.path, key if len(key) > 0 else "0")
+
+    def write_tile(self, multi_index, data):
+        """
+        Compresses and writes the tile at :samp:`{multi_index}`.
+
+        :type multi_index: sequence of :obj:`int`
+        :param multi_index: The tile index in the chunk grid.
+        :type data: :obj:`numpy.ndarray`
+        :param data: The tile data, shape of the tile slice.
+        """
+        slice_tuple = self.tile_slice(multi_index)
+        tile_shape = tuple(s.stop - s.start for s in slice_tuple)
+        if tuple(_np.shape(data)) != tile_shape:
+            raise ValueError(
+                "Got data.shape=%s, should be tile shape %s." % (_np.shape(data), tile_shape)
+            )
+        if tile_shape == self.chunks:
+            chunk = _np.ascontiguousarray(data, dtype=self.dtype)
+        else:
+            chunk = _np.full(self.chunks, self.fill_value or 0, dtype=self.dtype)
+            chunk[tuple(slice(0, n) for n in tile_shape)] = data
+        file_name = self.chunk_file_name(multi_index)
+        temp_file_name = file_name + ".tmp"
+        with open(temp_file_name, "wb") as fp:
+            fp.write(_encode(self.compressor, chunk.tobytes()))
+        _replace(temp_file_name, file_name)
+
+    def read_tile(self, multi_index):
+        """
+        Reads and decompresses the tile at :samp:`{multi_index}`.
+
+        :type multi_index: sequence of :obj:`int`
+        :param multi_index: The tile index in the chunk grid.
+        :rtype: :obj:`numpy.ndarray`
+        :return: The tile data (the :samp:`fill_value` for unwritten tiles).
+        """
+        slice_tuple = self.tile_slice(multi_index)
+        tile_shape = tuple(s.stop - s.start for s in slice_tuple)
+        file_name = self.chunk_file_name(multi_index)
+        if not _os.path.exists(file_name):
+            return _np.full(tile_shape, self.fill_value or 0, dtype=self.dtype)
+        with open(file_name, "rb") as fp:
+            buf = _decode(self.compressor, fp.read())
+        chunk = _np.frombuffer(buf, dtype=self.dtype).reshape(self.chunks)
+        return chunk[tuple(slice(0, n) for n in tile_shape)].copy()
+
+    def write(self, ary, num_workers=None):
+        """
+        Writes all tiles of :samp:`{ary}`, compressing tiles in parallel.
+
+        :type ary: :obj:`numpy.ndarray`
+        :param ary: Array of shape :attr:`shape`.
+        :type num_workers: :samp:`None` or :obj:`int`
+        :param num_workers: Number of compression threads.
+        """
+        if tuple(ary.shape) != self.shape:
+            raise ValueError("Got ary.shape=%s, should be %s." % (ary.shape, self.shape))
+
+        def write_rank(rank):
+            multi_index = _np.unravel_index(rank, self.split_shape)
+            self.write_tile(multi_index, ary[self.tile_slice(multi_index)])
+
+        _WorkStealingScheduler(None, num_workers).map_ranks(write_rank, self.num_tiles)
+
+    def intersecting_tiles(self, region):
+        """
+        Returns the per-axis ranges of tile indices which intersect :samp:`{region}`.
+
+        :type region: :obj:`tuple` of :obj:`slice`
+        :param region: Unit step region of the array.
+        :rtype: :obj:`list`
+        :return: List of per-axis :obj:`range` of tile indices.
+        """
+        return \
+            [
+                range(
+                    int(_np.searchsorted(self.split_ends[d], region[d].start, side="right")),
+                    int(_np.searchsorted(self.split_begs[d], region[d].stop, side="left"))
+                )
+                for d in range(len(self.shape))
+            ]
+
+    def _canonical_region(self, region):
+        """
+        Returns :samp:`{region}` as a :obj:`tuple` of unit step :obj:`slice` objects
+        (and the axes of :obj:`int` indices which are removed from the result).
+        """
+        if region is None:
+            region = ()
+        if not isinstance(region, tuple):
+            region = (region,)
+        if len(region) > len(self.shape):
+            raise ValueError("Got region=%s, too many indices for shape %s." % (region, self.shape))
+        region = region + (slice(None),) * (len(self.shape) - len(region))
+        slices = []
+        int_axes = []
+        for d, r in enumerate(region):
+            if isinstance(r, slice):
+                start, stop, step = r.indices(self.shape[d])
+                if step != 1:
+                    raise ValueError("Got region=%s, only unit step slices supported." % (region,))
+                slices.append(slice(start, max([start, stop])))
+            else:
+                i = int(r)
+                i = i + self.shape[d] if i < 0 else i
+                if (i < 0) or (i >= self.shape[d]):
+                    raise IndexError("Got index %s out of range for axis %s." % (r, d))
+                slices.append(slice(i, i + 1))
+                int_axes.append(d)
+        return tuple(slices), tuple(int_axes)
+
+    def read(self, region=None, num_workers=None):
+        """
+        Reads a region of the array, only the intersecting tiles are
+        read and decompressed (in parallel).
+
+        :type region: :samp:`None`, :obj:`slice`, :obj:`int` or :obj:`tuple` of these
+        :param region: Basic (unit step) index of the region, :samp:`None` for the
+           whole array.
+        :type num_workers: :samp:`None` or :obj:`int`
+        :param num_workers: Number of decompression threads.
+        :rtype: :obj:`numpy.ndarray`
+        :return: The region data.
+        """
+        region, int_axes = self._canonical_region(region)
+        out = _np.empty(tuple(s.stop - s.start for s in region), dtype=self.dtype)
+        tile_ranges = self.intersecting_tiles(region)
+        tile_range_shape = tuple(len(r) for r in tile_ranges)
+
+        def read_rank(rank):
+            range_index = _np.unravel_index(rank, tile_range_shape)
+            multi_index = tuple(tile_ranges[d][i] for d, i in enumerate(range_index))
+            tile_slice = self.tile_slice(multi_index)
+            los = [max([t.start, r.start]) for t, r in zip(tile_slice, region)]
+            his = [min([t.stop, r.stop]) for t, r in zip(tile_slice, region)]
+            out_slice = \
+                tuple(slice(lo - r.start, hi - r.start) for lo, hi, r in zip(los, his, region))
+            in_slice = \
+                tuple(slice(lo - t.start, hi - t.start) for lo, hi, t in zip(los, his, tile_slice))
+            out[out_slice] = self.read_tile(multi_index)[in_slice]
+
+        num_tiles = int(_np.prod(tile_range_shape))
+        if num_tiles > 0:
+            _WorkStealingScheduler(None, num_workers).map_ranks(read_rank, num_tiles)
+        if len(int_axes) > 0:
+            out = out.reshape(tuple(n for d, n in enumerate(out.shape) if d not in int_axes))
+        return out
+
+    def __getitem__(self, region):
+        """
+        Returns :samp:`{self}.read({region})`.
+        """
+        return self.read(region)
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
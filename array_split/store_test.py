@@ -0,0 +1,215 @@
+"""
+========================================
+The :mod:`array_split.store_test` Module
+========================================
+
+.. currentmodule:: array_split.store_test
+
+Module defining :mod:`array_split.store` unit-tests.
+Execute as::
+
+   python -m array_split.store_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   StoreTest - :obj:`unittest.TestCase` for :mod:`array_split.store` functions.
+
+
+"""
+from __future__ import absolute_import
+import json as _json
+import os as _os
+import shutil as _shutil
+import tempfile as _tempfile
+import threading as _threading
+import zlib as _zlib
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging
+
+from .split import ShapeSplitter
+from .store import TiledArrayStore
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class CountingTiledArrayStore(TiledArrayStore):
+
+    """
+    Store which counts :meth:`read_tile` calls.
+    """
+
+    def __init__(self, path):
+        """
+        Opens store, zero read count.
+        """
+        TiledArrayStore.__init__(self, path)
+        self.lock = _threading.Lock()
+        self.num_tile_reads = 0
+
+    def read_tile(self, multi_index):
+        """
+        Counts and reads tile.
+        """
+        with self.lock:
+            self.num_tile_reads += 1
+        return TiledArrayStore.read_tile(self, multi_index)
+
+
+class StoreTest(_unittest.TestCase):
+
+    """
+    Tests for :mod:`array_split.store` module.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".StoreTest")
+
+    def setUp(self):
+        """
+        Creates temporary directory.
+        """
+        self.tmp_dir = _tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Removes temporary directory.
+        """
+        _shutil.rmtree(self.tmp_dir)
+
+    def test_write_read(self):
+        """
+        Tests :meth:`array_split.store.TiledArrayStore.write`
+        and :meth:`array_split.store.TiledArrayStore.read` round trip.
+        """
+        ary = _np.random.RandomState(3).randint(0, 5, size=(41, 23, 7)).astype("float32")
+        for compressor in ["zlib", "lzma", None]:
+            for splitter in \
+                    [
+                        ShapeSplitter(ary.shape, tile_shape=(8, 10, 7)),
+                        ShapeSplitter(ary.shape, axis=[5, 3, 1], halo=2),
+                        ShapeSplitter(ary.shape, [[10, 11, 30], [], [2]]),
+                    ]:
+                path = _os.path.join(self.tmp_dir, "ary.zarr")
+                store = \
+                    TiledArrayStore.create(
+                        path, splitter, ary.dtype, compressor=compressor, overwrite=True
+                    )
+                store.write(ary, num_workers=3)
+                store = TiledArrayStore(path)
+                self.assertEqual(ary.dtype, store.dtype)
+                self.assertSequenceEqual(ary.shape, store.shape)
+                self.assertSequenceEqual(tuple(splitter.split_shape), store.split_shape)
+                self.assertTrue(_np.all(ary == store.read()))
+                for multi_index in [(0, 0, 0), tuple(n - 1 for n in store.split_shape)]:
+                    slice_tuple = store.tile_slice(multi_index)
+                    self.assertTrue(_np.all(ary[slice_tuple] == store.read_tile(multi_index)))
+                for region in \
+                        [
+                            (slice(3, 17), slice(5, 6), slice(None)),
+                            (5, slice(2, -2)),
+                            (-1, -1, -1),
+                            (slice(30, 20),),
+                            slice(0, 100),
+                        ]:
+                    self.assertTrue(_np.all(ary[region] == store[region]))
+                    self.assertSequenceEqual(ary[region].shape, store[region].shape)
+
+    def test_zarr_layout(self):
+        """
+        Tests regular splits produce a Zarr version 2 :samp:`.zarray`
+        and (padded, zlib compressed) chunk files.
+        """
+        ary = _np.arange(0, 20 * 30, dtype="<i4").reshape((20, 30))
+        path = _os.path.join(self.tmp_dir, "ary.zarr")
+        store = \
+            TiledArrayStore.create(
+                path,
+                ShapeSplitter(ary.shape, tile_shape=(8, 16)),
+                ary.dtype,
+                fill_value=-1
+            )
+        store.write(ary)
+        self.assertTrue(store.is_zarr_compatible)
+        with open(_os.path.join(path, ".zarray"), "r") as fp:
+            metadata = _json.load(fp)
+        self.assertEqual(2, metadata["zarr_format"])
+        self.assertEqual([20, 30], metadata["shape"])
+        self.assertEqual([8, 16], metadata["chunks"])
+        self.assertEqual("<i4", metadata["dtype"])
+        self.assertEqual("zlib", metadata["compressor"]["id"])
+        self.assertEqual(-1, metadata["fill_value"])
+        self.assertEqual("C", metadata["order"])
+        with open(_os.path.join(path, "2.1"), "rb") as fp:
+            chunk = _np.frombuffer(_zlib.decompress(fp.read()), dtype="<i4").reshape((8, 16))
+        self.assertTrue(_np.all(ary[16:, 16:] == chunk[:4, :14]))
+        self.assertTrue(_np.all(chunk[4:, :] == -1))
+        self.assertTrue(_np.all(chunk[:, 14:] == -1))
+
+        # Irregular split records extents, not Zarr compatible
+        irregular = \
+            TiledArrayStore.create(
+                _os.path.join(self.tmp_dir, "irregular.zarr"),
+                ShapeSplitter(ary.shape, axis=[6, 1]),
+                ary.dtype
+            )
+        self.assertFalse(irregular.is_zarr_compatible)
+        split_begs = irregular.metadata["array_split"]["split_begs"]
+        self.assertEqual([[0, 4, 8, 11, 14, 17], [0]], split_begs)
+
+    def test_region_reads_intersecting_tiles(self):
+        """
+        Tests :meth:`array_split.store.TiledArrayStore.read` decodes only
+        the tiles which intersect the region, and unwritten tiles are fill value.
+        """
+        ary = _np.arange(0, 64 * 64, dtype="int64").reshape((64, 64))
+        path = _os.path.join(self.tmp_dir, "ary.zarr")
+        TiledArrayStore.create(path, ShapeSplitter(ary.shape, tile_shape=(16, 16)), ary.dtype)
+        store = CountingTiledArrayStore(path)
+        store.write_tile((1, 2), ary[16:32, 32:48])
+        region = store[20:30, 30:40]
+        self.assertEqual(2, store.num_tile_reads)
+        self.assertTrue(_np.all(region[:, 2:] == ary[20:30, 32:40]))
+        self.assertTrue(_np.all(region[:, :2] == 0))
+        store.num_tile_reads = 0
+        self.assertTrue(_np.all(ary[17, 33] == store[17, 33]))
+        self.assertEqual(1, store.num_tile_reads)
+
+    def test_store_errors(self):
+        """
+        Tests :obj:`array_split.store.TiledArrayStore` raises :obj:`ValueError`
+        for invalid arguments.
+        """
+        path = _os.path.join(self.tmp_dir, "ary.zarr")
+        splitter = ShapeSplitter((10, 10), tile_shape=(4, 4))
+        store = TiledArrayStore.create(path, splitter, "uint8")
+        self.assertRaises(ValueError, TiledArrayStore.create, path, splitter, "uint8")
+        self.assertRaises(
+            ValueError,
+            TiledArrayStore.create, path, splitter, "uint8", compressor="bz2", overwrite=True
+        )
+        self.assertRaises(
+            ValueError,
+            TiledArrayStore.create, path, splitter, [("a", "f4")], overwrite=True
+        )
+        self.assertRaises(ValueError, store.write_tile, (0, 0), _np.zeros((4, 3)))
+        self.assertRaises(ValueError, store.tile_slice, (3, 0))
+        self.assertRaises(ValueError, store.write, _np.zeros((10, 11)))
+        self.assertRaises(ValueError, store.read, (slice(0, 10, 2),))
+        self.assertRaises(IndexError, store.read, (10,))
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+_unittest.main(__name__)
@@ -32,9 +32,35 @@ import doctest as _doctest
 import os.path
 import array_split as _array_split
 from array_split import split as _split
+from array_split import prefetch as _prefetch
+from array_split import topology as _topology
+from array_split import benchmark as _benchmark
+from array_split import plan as _plan
+from array_split import rebalance as _rebalance
+from array_split import scheduler as _scheduler
+from array_split import distribute as _distribute
+from array_split import merge as _merge
+from array_split import halo as _halo
+from array_split import occupancy as _occupancy
+from array_split import store as _store
+from array_split import host as _host
+from array_split import parallel as _parallel
 
 from .license import license as _license, copyright as _copyright, version as _version
 from .split_test import SplitTest  # noqa: F401,F403
+from .prefetch_test import PrefetchTest  # noqa: F401,F403
+from .topology_test import TopologyTest  # noqa: F401,F403
+from .benchmark_test import BenchmarkTest  # noqa: F401,F403
+from .plan_test import PlanTest  # noqa: F401,F403
+from .rebalance_test import RebalanceTest  # noqa: F401,F403
+from .scheduler_test import SchedulerTest  # noqa: F401,F403
+from .distribute_test import DistributeTest  # noqa: F401,F403
+from .merge_test import MergeTest  # noqa: F401,F403
+from .halo_test import HaloTest  # noqa: F401,F403
+from .occupancy_test import OccupancyTest  # noqa: F401,F403
+from .store_test import StoreTest  # noqa: F401,F403
+from .host_test import HostTest  # noqa: F401,F403
+from .parallel_test import ParallelTest  # noqa: F401,F403
 
 __author__ = "Shane J. Latham"
 __license__ = _license()
@@ -69,6 +95,48 @@ class MultiPlatformAnd23Checker(_doctest_OuputChecker):
 
 _doctest.OutputChecker = MultiPlatformAnd23Checker
 
+#: Modules whose doc-strings are run as :mod:`doctest` tests.
+_doctest_modules = [
+    _array_split,
+    _split,
+    _prefetch,
+    _topology,
+    _benchmark,
+    _plan,
+    _rebalance,
+    _scheduler,
+    _distribute,
+    _merge,
+    _halo,
+    _occupancy,
+    _store,
+    _host,
+    _parallel,
+]
+
+#: Names of the :mod:`unittest` test-case modules.
+_unittest_module_names = [
+    "array_split.split_test",
+    "array_split.prefetch_test",
+    "array_split.topology_test",
+    "array_split.benchmark_test",
+    "array_split.plan_test",
+    "array_split.rebalance_test",
+    "array_split.scheduler_test",
+    "array_split.distribute_test",
+    "array_split.merge_test",
+    "array_split.halo_test",
+    "array_split.occupancy_test",
+    "array_split.store_test",
+    "array_split.host_test",
+    "array_split.parallel_test",
+]
+
+if _sys.version_info >= (3, 6):
+    from array_split import aio as _aio
+    _doctest_modules.append(_aio)
+    _unittest_module_names.append("array_split.aio_test")
+
 
 class DocTestTestSuite(_unittest.TestSuite):
 
@@ -113,28 +181,23 @@ class DocTestTestSuite(_unittest.TestSuite):
                     optionflags=_doctest.NORMALIZE_WHITESPACE
                 )
             )
-        suite.addTests(
-            _doctest.DocTestSuite(
-                _array_split,
-                optionflags=_doctest.NORMALIZE_WHITESPACE
-            )
-        )
-        suite.addTests(
-            _doctest.DocTestSuite(
-                _split,
-                optionflags=_doctest.NORMALIZE_WHITESPACE
+        for module in _doctest_modules:
+            suite.addTests(
+                _doctest.DocTestSuite(
+                    module,
+                    optionflags=_doctest.NORMALIZE_WHITESPACE
+                )
             )
-        )
 
         _unittest.TestSuite.__init__(self, suite)
 
 
 def load_tests(loader, tests, pattern):  # pylint: disable=unused-argument
     """
-    Loads :mod:`array_split.split_test` tests and :obj:`DocTestTestSuite`
-    tests.
+    Loads :mod:`array_split.split_test` (and other :samp:`*_test` module)
+    tests and :obj:`DocTestTestSuite` tests.
     """
-    suite = loader.loadTestsFromNames(["array_split.split_test", ])
+    suite = loader.loadTestsFromNames(_unittest_module_names)
     suite.addTests(DocTestTestSuite())
     return suite
 
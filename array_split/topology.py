@@ -0,0 +1,202 @@
+"""
+======================================
+The :mod:`array_split.topology` Module
+======================================
+
+.. currentmodule:: array_split.topology
+
+Cartesian (process-grid) topology queries for the tile grid of a split,
+analogous to the MPI :samp:`Cart_create` topology functions
+(:samp:`Cart_coords`, :samp:`Cart_rank` and :samp:`Cart_shift`).
+Tile *ranks* are the (C-order) flat indices of the tiles
+in the :attr:`array_split.ShapeSplitter.split_shape` shaped split.
+All queries are local :samp:`O(ndim)` calculations, they do not require
+the split (or split extents) to be calculated.
+
+Classes and Functions
+=====================
+
+.. autosummary::
+   :toctree: generated/
+
+   CartesianTopology - Rank/coordinate/neighbour queries for a tile grid.
+
+Attributes
+==========
+
+.. autodata:: PROC_NULL
+
+"""
+from __future__ import absolute_import
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from .split import is_scalar
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+#: Rank value indicating *no neighbour*, returned for shifts which
+#: go beyond a non-periodic boundary (c.f. :samp:`MPI.PROC_NULL`).
+PROC_NULL = -1
+
+
+class CartesianTopology(object):
+
+    """
+    Cartesian topology of a tile grid (split shape) with optional
+    per-axis periodicity.
+
+    Example::
+
+       >>> from array_split import ShapeSplitter
+       >>> splitter = ShapeSplitter((100, 60), 6, axis=[0, 0])
+       >>> topo = CartesianTopology(splitter, periods=[False, True])
+       >>> topo.dims
+       array([3, 2])
+       >>> topo.coords(3)
+       array([1, 1])
+       >>> topo.rank([1, 2])  # periodic axis 1 wraps
+       2
+       >>> topo.shift(3, axis=0, disp=1)
+       (1, 5)
+       >>> topo.neighbours(0)
+       array([[-1,  2],
+              [ 1,  1]])
+
+    """
+
+    def __init__(self, split_shape, periods=None):
+        """
+        Initialise.
+
+        :type split_shape: sequence of :obj:`int` or :obj:`array_split.ShapeSplitter`
+        :param split_shape: The shape of the tile grid. If
+           a :obj:`array_split.ShapeSplitter`, the :attr:`array_split.ShapeSplitter.split_shape`
+           is used (and is calculated using :meth:`array_split.ShapeSplitter.set_split_shape`
+           if it has not already been calculated).
+        :type periods: :samp:`None`, :obj:`bool` or sequence of :obj:`bool`
+        :param periods: Per-axis periodicity. If :samp:`None` no axes are periodic.
+           A scalar value applies to all axes.
+        """
+        if hasattr(split_shape, "set_split_shape"):
+            if split_shape.split_shape is None:
+                split_shape.set_split_shape()
+            split_shape = split_shape.split_shape
+        self.dims = _np.array(split_shape, dtype="int64")
+        if _np.any(self.dims <= 0):
+            raise ValueError("Got split_shape=%s, all elements should be positive." % self.dims)
+        if periods is None:
+            periods = False
+        if is_scalar(periods):
+            periods = [periods, ] * len(self.dims)
+        self.periods = _np.array(periods, dtype="bool")
+        if self.periods.shape != self.dims.shape:
+            raise ValueError(
+                "Got len(periods)=%s, should be equal to len(split_shape)=%s."
+                %
+                (len(self.periods), len(self.dims))
+            )
+        # C-order strides for rank <-> coordinate conversion
+        self.strides = _np.ones_like(self.dims)
+        self.strides[0:-1] = _np.cumprod(self.dims[:0:-1])[::-1]
+
+    @property
+    def ndim(self):
+        """
+        The number of dimensions (axes) of the tile grid.
+        """
+        return len(self.dims)
+
+    @property
+    def size(self):
+        """
+        The number of tiles (ranks) in the tile grid.
+        """
+        return int(_np.prod(self.dims))
+
+    def check_rank(self, rank):
+        """
+        Raises :obj:`ValueError` if :samp:`{rank}` is not a valid rank.
+        """
+        if (rank < 0) or (rank >= self.size):
+            raise ValueError("Got rank=%s, should be in range [0, %s)." % (rank, self.size))
+
+    def coords(self, rank):
+        """
+        Returns the tile grid coordinates of :samp:`{rank}`.
+
+        :type rank: :obj:`int`
+        :param rank: Rank of the tile.
+        :rtype: :obj:`numpy.ndarray`
+        :return: A :samp:`(ndim,)` shaped array of grid coordinates.
+        """
+        self.check_rank(rank)
+        return (int(rank) // self.strides) % self.dims
+
+    def rank(self, coords):
+        """
+        Returns the rank of the tile at tile grid coordinates :samp:`{coords}`.
+        Coordinates along periodic axes are wrapped, coordinates outside
+        a non-periodic axis return :data:`PROC_NULL`.
+
+        :type coords: sequence of :obj:`int`
+        :param coords: Tile grid coordinates.
+        :rtype: :obj:`int`
+        :return: Rank of the tile (or :data:`PROC_NULL`).
+        """
+        coords = _np.array(coords, dtype="int64")
+        if coords.shape != self.dims.shape:
+            raise ValueError(
+                "Got len(coords)=%s, should be equal to ndim=%s." % (len(coords), self.ndim)
+            )
+        coords = _np.where(self.periods, coords % self.dims, coords)
+        if _np.any(coords < 0) or _np.any(coords >= self.dims):
+            return PROC_NULL
+        return int(_np.sum(coords * self.strides))
+
+    def shift(self, rank, axis, disp=1):
+        """
+        Returns the :samp:`(source, dest)` ranks for a shift of :samp:`{disp}`
+        along axis :samp:`{axis}` (c.f. :samp:`MPI.Cartcomm.Shift`), i.e. :samp:`dest`
+        is the rank at :samp:`coords({rank}) + {disp}` and :samp:`source` is the rank
+        at :samp:`coords({rank}) - {disp}` (in the :samp:`{axis}` direction).
+
+        :type rank: :obj:`int`
+        :param rank: Rank of the tile.
+        :type axis: :obj:`int`
+        :param axis: Axis along which the shift occurs.
+        :type disp: :obj:`int`
+        :param disp: Displacement of the shift.
+        :rtype: :obj:`tuple`
+        :return: Pair of ranks :samp:`(source, dest)`, either may be :data:`PROC_NULL`.
+        """
+        coords = self.coords(rank)
+        dest_coords = coords.copy()
+        dest_coords[axis] += disp
+        source_coords = coords.copy()
+        source_coords[axis] -= disp
+        return self.rank(source_coords), self.rank(dest_coords)
+
+    def neighbours(self, rank):
+        """
+        Returns the ranks of the face neighbours of :samp:`{rank}`.
+
+        :type rank: :obj:`int`
+        :param rank: Rank of the tile.
+        :rtype: :obj:`numpy.ndarray`
+        :return: A :samp:`(ndim, 2)` shaped array where element :samp:`[a, 0]` is
+           the neighbour rank in the -ve :samp:`a` axis direction and :samp:`[a, 1]`
+           is the neighbour rank in the +ve :samp:`a` axis direction
+           (elements may be :data:`PROC_NULL`).
+        """
+        return \
+            _np.array(
+                [self.shift(rank, axis, 1) for axis in range(self.ndim)],
+                dtype="int64"
+            )
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
@@ -0,0 +1,120 @@
+"""
+===========================================
+The :mod:`array_split.topology_test` Module
+===========================================
+
+.. currentmodule:: array_split.topology_test
+
+Module defining :mod:`array_split.topology` unit-tests.
+Execute as::
+
+   python -m array_split.topology_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   TopologyTest - :obj:`unittest.TestCase` for :mod:`array_split.topology` functions.
+
+
+"""
+from __future__ import absolute_import
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging
+
+from .split import ShapeSplitter
+from .topology import CartesianTopology, PROC_NULL
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class TopologyTest(_unittest.TestCase):
+
+    """
+    Tests for :mod:`array_split.topology` module.
+    """
+
+    #: Class attribute for :obj:`logging.Logger` logging.
+    logger = _logging.getLogger(__name__ + ".TopologyTest")
+
+    def test_coords_and_rank(self):
+        """
+        Tests :meth:`array_split.topology.CartesianTopology.coords`
+        and :meth:`array_split.topology.CartesianTopology.rank` against
+        the structured array returned
+        by :meth:`array_split.split.ShapeSplitter.calculate_split`.
+        """
+        splitter = ShapeSplitter((30, 20, 10), 24)
+        split = splitter.calculate_split()
+        topo = CartesianTopology(ShapeSplitter((30, 20, 10), 24))
+        self.assertSequenceEqual(split.shape, tuple(topo.dims))
+        self.assertEqual(split.size, topo.size)
+        self.assertEqual(3, topo.ndim)
+        for rank in range(topo.size):
+            coords = topo.coords(rank)
+            self.assertSequenceEqual(
+                _np.unravel_index(rank, split.shape),
+                tuple(coords)
+            )
+            self.assertEqual(rank, topo.rank(coords))
+
+        self.assertRaises(ValueError, topo.coords, -1)
+        self.assertRaises(ValueError, topo.coords, topo.size)
+        self.assertRaises(ValueError, topo.rank, [0, 0])
+        self.assertRaises(ValueError, CartesianTopology, [2, 0])
+        self.assertRaises(ValueError, CartesianTopology, [2, 3], [True, ])
+
+    def test_shift_and_neighbours(self):
+        """
+        Tests :meth:`array_split.topology.CartesianTopology.shift`
+        and :meth:`array_split.topology.CartesianTopology.neighbours`.
+        """
+        topo = CartesianTopology([4, 3])
+        self.assertSequenceEqual((PROC_NULL, 3), topo.shift(0, 0, 1))
+        self.assertSequenceEqual((PROC_NULL, PROC_NULL), topo.shift(0, 0, 4))
+        self.assertSequenceEqual((PROC_NULL, 10), topo.shift(11, 1, -1))
+        self.assertTrue(
+            _np.all(
+                [[1, 7], [3, 5]]
+                ==
+                topo.neighbours(4)
+            )
+        )
+
+        topo = CartesianTopology([4, 3], periods=True)
+        self.assertSequenceEqual((9, 3), topo.shift(0, 0, 1))
+        self.assertSequenceEqual((0, 0), topo.shift(0, 0, 4))
+        self.assertSequenceEqual((2, 1), topo.shift(0, 1, 1))
+        self.assertTrue(
+            _np.all(
+                [[9, 3], [2, 1]]
+                ==
+                topo.neighbours(0)
+            )
+        )
+
+        topo = CartesianTopology([4, 3], periods=[False, True])
+        self.assertTrue(
+            _np.all(
+                [[PROC_NULL, 3], [2, 1]]
+                ==
+                topo.neighbours(0)
+            )
+        )
+        self.assertEqual(PROC_NULL, topo.rank([4, 0]))
+        self.assertEqual(9, topo.rank([3, -3]))
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
+
+_unittest.main(__name__)